@@ -0,0 +1,69 @@
+"""
+Benchmark: full vs incremental behavior aggregation per tick.
+
+Registers a town of NPCs with tagged memories and times engine ticks
+two ways: recomputing every NPC's modifier from all of its memories
+with update_npc_behavior, and advancing the running aggregates that
+PropagationEngine.update now keeps between prunes.
+
+Usage:
+    python benchmarks/bench_behavior_aggregation.py [npcs] [memories] [ticks]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from shadowengine.npc_intelligence import PropagationEngine, MEMORY_TAG_BEHAVIORS
+from shadowengine.npc_intelligence.npc_memory import NPCMemory
+
+TAGS = list(MEMORY_TAG_BEHAVIORS) + ["weather", "gossip", "market"]
+
+
+def build_engine(npcs: int, memories: int, seed: int = 9) -> PropagationEngine:
+    rng = random.Random(seed)
+    engine = PropagationEngine()
+    for i in range(npcs):
+        bank = engine.register_npc(f"npc_{i}", "mob_boss").memory_bank
+        for _ in range(memories):
+            bank.add_memory(NPCMemory(
+                confidence=rng.uniform(0.5, 1.0),
+                decay_rate=0.001,
+                timestamp=-rng.uniform(0.0, 5.0),
+                tags=rng.sample(TAGS, rng.randrange(1, 3)),
+            ))
+    return engine
+
+
+def main() -> None:
+    npcs = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    memories = int(sys.argv[2]) if len(sys.argv) > 2 else 40
+    ticks = int(sys.argv[3]) if len(sys.argv) > 3 else 20
+
+    engine = build_engine(npcs, memories)
+    behavior = engine.behavior_system
+    states = list(engine.npc_states.values())
+
+    start = time.perf_counter()
+    for tick in range(ticks):
+        now = float(tick + 1)
+        for state in states:
+            behavior.mapping.aggregate_modifiers(state.memory_bank.memories, now)
+    full_ms = (time.perf_counter() - start) * 1000 / ticks
+
+    engine.update(1.0)  # Start the running aggregates
+    start = time.perf_counter()
+    for _ in range(ticks):
+        engine.update(1.0)
+    tick_ms = (time.perf_counter() - start) * 1000 / ticks
+
+    print(f"{npcs} NPCs x {memories} memories, {ticks} ticks")
+    print(f"full recompute (aggregation only): {full_ms:.0f} ms per tick")
+    print(f"incremental engine tick:           {tick_ms:.0f} ms per tick")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Benchmark: region labeling and early rejection of unreachable queries.
+
+Times a full ConnectivityMap labeling pass, incremental relabeling as a
+door in a wall is opened and closed and as a boulder is dropped in the
+open, and unreachable path queries with
+and without the label check in front of the indexed A*.
+
+Usage:
+    python benchmarks/bench_connectivity.py [size] [toggles]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from shadowengine.grid import ConnectivityMap, Position, TerrainType, find_path
+from bench_pathfinding import build_map
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 256
+    toggles = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+
+    grid = build_map(size)
+    # Seal off the right third of the map behind a wall with one door
+    wall = size * 2 // 3
+    grid.fill_rect(wall, 0, wall, size - 1, TerrainType.ROCK)
+    door = size // 2
+    field = grid.get_cost_field()
+
+    start = time.perf_counter()
+    cmap = ConnectivityMap(grid)
+    label_ms = (time.perf_counter() - start) * 1000
+    print(f"{size}x{size}: full labeling {label_ms:.1f} ms "
+          f"({'numpy' if cmap.use_numpy else 'pure Python'}), {cmap.region_count} regions")
+
+    cmap.attach()
+    start = time.perf_counter()
+    for _ in range(toggles):
+        grid.fill_rect(wall, door, wall, door, TerrainType.SOIL)
+        cmap.region_count
+        grid.fill_rect(wall, door, wall, door, TerrainType.ROCK)
+        cmap.region_count
+    toggle_ms = (time.perf_counter() - start) / (2 * toggles) * 1000
+    print(f"door open/close: {toggle_ms:.2f} ms per change (incremental)")
+
+    # A boulder dropped in the open splits nothing
+    rock = Position(size // 3, size // 3, 0)
+    grid.fill_rect(rock.x - 1, rock.y - 1, rock.x + 1, rock.y + 1, TerrainType.SOIL)
+    cmap.region_count
+    start = time.perf_counter()
+    for _ in range(toggles):
+        grid.fill_rect(rock.x, rock.y, rock.x, rock.y, TerrainType.ROCK)
+        cmap.region_count
+        grid.fill_rect(rock.x, rock.y, rock.x, rock.y, TerrainType.SOIL)
+        cmap.region_count
+    rock_us = (time.perf_counter() - start) / (2 * toggles) * 1e6
+    print(f"boulder place/remove: {rock_us:.1f} us per change (incremental)")
+    cmap.detach()
+
+    a = Position(2, 2, 0)
+    b = Position(size - 3, size - 3, 0)
+    for pos in (a, b):
+        grid.fill_rect(pos.x, pos.y, pos.x, pos.y, TerrainType.SOIL)
+
+    start = time.perf_counter()
+    result = find_path(grid, a, b, cost_field=field)
+    search_ms = (time.perf_counter() - start) * 1000
+
+    grid._connectivity = cmap
+    cmap.attach()
+    start = time.perf_counter()
+    rejected = find_path(grid, a, b, cost_field=field)
+    check_us = (time.perf_counter() - start) * 1e6
+    assert result is None and rejected is None
+    print(f"unreachable query: A* {search_ms:.1f} ms, label check {check_us:.1f} us")
+
+
+if __name__ == "__main__":
+    main()
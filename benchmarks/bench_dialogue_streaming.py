@@ -0,0 +1,116 @@
+"""
+Benchmark: time to the first word of NPC dialogue, streamed vs not.
+
+Starts a local stub that behaves like a model running on Ollama: it
+waits before the first token (prompt evaluation), then produces one
+token at a time at a fixed rate. Each reply is fetched with chat(),
+which shows nothing until the whole reply is in, and with
+chat_stream() cleaned the way DialogueHandler cleans it, and the time
+until the player could see the first word is printed for both.
+
+Usage:
+    python benchmarks/bench_dialogue_streaming.py [replies] [tokens] [ms_per_token]
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from shadowengine.llm import LLMConfig, OllamaClient
+from shadowengine.generation.dialogue_handler import DialogueHandler
+
+PROMPT_EVAL_S = 0.15
+REPLY = ("Joe: I was behind the bar all night, detective, same as every night. "
+         "Ask anyone who was drinking here. The rain kept the regulars in, "
+         "and nobody left before the last call, not even the man you're asking about.")
+
+
+class SlowModel(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True  # As real servers do
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        request = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+        words = REPLY.split(" ")[:self.server.tokens]
+        tokens = [word if i == 0 else " " + word for i, word in enumerate(words)]
+        time.sleep(PROMPT_EVAL_S)
+
+        if not request.get("stream"):
+            time.sleep(self.server.token_s * len(tokens))
+            body = json.dumps({"model": request["model"], "eval_count": len(tokens),
+                               "message": {"role": "assistant", "content": "".join(tokens)}}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        chunks = [{"model": request["model"], "done": False,
+                   "message": {"role": "assistant", "content": token}} for token in tokens]
+        chunks.append({"model": request["model"], "done": True, "eval_count": len(tokens),
+                       "message": {"role": "assistant", "content": ""}})
+        for chunk in chunks:
+            time.sleep(self.server.token_s)
+            line = json.dumps(chunk).encode() + b"\n"
+            self.wfile.write(b"%x\r\n%s\r\n" % (len(line), line))
+            self.wfile.flush()
+        self.wfile.write(b"0\r\n\r\n")
+
+
+def main() -> None:
+    replies = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    tokens = int(sys.argv[2]) if len(sys.argv) > 2 else 40
+    ms_per_token = float(sys.argv[3]) if len(sys.argv) > 3 else 25.0
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SlowModel)
+    server.daemon_threads = True
+    server.tokens = tokens
+    server.token_s = ms_per_token / 1000
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    client = OllamaClient(LLMConfig(base_url=f"http://127.0.0.1:{server.server_address[1]}"))
+    messages = [{"role": "user", "content": "Where were you last night?"}]
+
+    whole_ms = []
+    for _ in range(replies):
+        start = time.perf_counter()
+        text = DialogueHandler._clean_response(client.chat(messages).text, "Joe")
+        whole_ms.append((time.perf_counter() - start) * 1000)
+
+    first_ms, total_ms = [], []
+    for _ in range(replies):
+        start = time.perf_counter()
+        shown = []
+        for piece in DialogueHandler._clean_stream(client.chat_stream(messages), "Joe"):
+            if not shown:
+                first_ms.append((time.perf_counter() - start) * 1000)
+            shown.append(piece)
+        total_ms.append((time.perf_counter() - start) * 1000)
+        assert "".join(shown) == text
+
+    def mean(values):
+        return sum(values) / len(values)
+
+    print(f"{replies} replies of {tokens} tokens, {PROMPT_EVAL_S * 1000:.0f} ms to the "
+          f"first token then {ms_per_token:.0f} ms/token")
+    print(f"chat():        first word at {mean(whole_ms):7.1f} ms (whole reply)")
+    print(f"chat_stream(): first word at {mean(first_ms):7.1f} ms, "
+          f"whole reply at {mean(total_ms):7.1f} ms")
+    client.close()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Benchmark: witness selection, per-pair line of sight vs shadowcasting.
+
+Scatters observers over a walled map and, for a series of event cells,
+asks which observers within sight radius can see the event: once with
+has_line_of_sight per observer, once with FieldOfView.who_can_see (cold
+cache, then warm as observers stay put between events).
+
+Usage:
+    python benchmarks/bench_fov.py [observers] [events] [size]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from shadowengine.grid import Position
+from bench_pathfinding import build_map
+
+SIGHT = 12
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    events = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    size = int(sys.argv[3]) if len(sys.argv) > 3 else 128
+
+    grid = build_map(size)
+    rng = random.Random(4)
+    observers = [Position(rng.randrange(size), rng.randrange(size)) for _ in range(count)]
+    targets = [Position(rng.randrange(size), rng.randrange(size)) for _ in range(events)]
+
+    def bresenham(target):
+        target_tile = grid.get_tile_at_position(target)
+        return [
+            o for o in observers
+            if o.distance_to(target, include_z=False) <= SIGHT
+            and grid.has_line_of_sight(grid.get_tile_at_position(o), target_tile)
+        ]
+
+    fov = grid.get_field_of_view()
+    print(f"{count} observers, {events} events on {size}x{size}, sight {SIGHT}")
+    for label, fn in [("line of sight", bresenham),
+                      ("shadowcast cold", lambda t: fov.who_can_see(t, observers, SIGHT)),
+                      ("shadowcast warm", lambda t: fov.who_can_see(t, observers, SIGHT))]:
+        start = time.perf_counter()
+        for target in targets:
+            fn(target)
+        elapsed = (time.perf_counter() - start) / events * 1000
+        print(f"{label:<18}{elapsed:8.2f} ms/event")
+
+
+if __name__ == "__main__":
+    main()
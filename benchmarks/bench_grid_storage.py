@@ -0,0 +1,83 @@
+"""
+Benchmark: sparse vs dense TileGrid storage.
+
+Measures memory held after touching every cell and the throughput of
+terrain reads and rectangle fills.
+
+Usage:
+    python benchmarks/bench_grid_storage.py [size] [depth]
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from shadowengine.grid import TileGrid, TerrainType
+
+
+def build_grid(size: int, depth: int, dense: bool) -> TileGrid:
+    """Build a grid with every cell populated.
+
+    Sparse grids only hold state once a tile is created, so every cell is
+    touched; dense grids hold all cells from construction.
+    """
+    grid = TileGrid(width=size, height=size, depth=depth, dense=dense)
+    if not dense:
+        for z in range(depth):
+            for y in range(size):
+                for x in range(size):
+                    grid.get_tile(x, y, z)
+    return grid
+
+
+def measure_memory(size: int, depth: int, dense: bool) -> int:
+    """Bytes allocated by a fully populated grid."""
+    tracemalloc.start()
+    grid = build_grid(size, depth, dense)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del grid
+    return current
+
+
+def measure_reads(grid: TileGrid) -> float:
+    """Cell reads per second over the whole grid."""
+    start = time.perf_counter()
+    cells = 0
+    for z in range(grid.depth):
+        for y in range(grid.height):
+            for x in range(grid.width):
+                grid.get_terrain_at(x, y, z)
+                cells += 1
+    return cells / (time.perf_counter() - start)
+
+
+def measure_fill(grid: TileGrid) -> float:
+    """Filled cells per second for a full-plane fill_rect."""
+    start = time.perf_counter()
+    count = grid.fill_rect(0, 0, grid.width - 1, grid.height - 1, TerrainType.WOOD)
+    return count / (time.perf_counter() - start)
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 256
+    depth = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+    cells = size * size * depth
+
+    print(f"Grid {size}x{size}x{depth} ({cells:,} cells)")
+    print(f"{'mode':<8}{'memory':>14}{'bytes/cell':>12}{'reads/s':>14}{'fill/s':>14}")
+    for dense in (False, True):
+        memory = measure_memory(size, depth, dense)
+        grid = build_grid(size, depth, dense)
+        reads = measure_reads(grid)
+        fill = measure_fill(grid)
+        label = "dense" if dense else "sparse"
+        print(f"{label:<8}{memory / 1e6:>11.1f} MB{memory / cells:>12.0f}"
+              f"{reads:>14,.0f}{fill:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Benchmark: hierarchical (HPA*) vs exact pathfinding across map sizes.
+
+For each size, runs the same long queries through the tile-based A*,
+the indexed A* over a CostField, and find_path_hierarchical (a cold pass
+that links clusters as it goes, then a warm pass). Reports time per query
+and the HPA* path cost relative to the exact optimum.
+
+Usage:
+    python benchmarks/bench_hierarchical.py [queries] [sizes...]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from shadowengine.grid import find_path, find_path_hierarchical
+from shadowengine.grid.pathfinding import calculate_path_cost
+from bench_pathfinding import build_map, make_queries
+
+# Tile-based A* gets slow past this size; it is skipped above it
+TILE_ASTAR_LIMIT = 256
+
+
+def timed(fn, queries) -> tuple:
+    """Mean milliseconds per query and the paths found."""
+    start = time.perf_counter()
+    paths = [fn(a, b) for a, b in queries]
+    return (time.perf_counter() - start) / len(queries) * 1000, paths
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    sizes = [int(s) for s in sys.argv[2:]] or [64, 128, 256, 512]
+
+    print(f"{'size':>6}{'tile A*':>10}{'indexed':>10}{'HPA cold':>10}{'HPA warm':>10}"
+          f"{'cost mean':>11}{'cost max':>10}")
+    for size in sizes:
+        grid = build_map(size)
+        queries = make_queries(grid, count)
+        field = grid.get_cost_field()
+
+        tile_ms = "-"
+        if size <= TILE_ASTAR_LIMIT:
+            tile_ms = f"{timed(lambda a, b: find_path(grid, a, b), queries)[0]:.1f}"
+        exact_ms, exact = timed(lambda a, b: find_path(grid, a, b, cost_field=field), queries)
+        cold_ms, _ = timed(lambda a, b: find_path_hierarchical(grid, a, b), queries)
+        warm_ms, paths = timed(lambda a, b: find_path_hierarchical(grid, a, b), queries)
+
+        ratios = [
+            calculate_path_cost(p) / calculate_path_cost(e)
+            for p, e in zip(paths, exact) if p and e
+        ]
+        print(f"{size:>6}{tile_ms:>10}{exact_ms:>10.1f}{cold_ms:>10.1f}{warm_ms:>10.1f}"
+              f"{sum(ratios) / len(ratios):>11.3f}{max(ratios):>10.3f}")
+    print("times in ms/query; cost = HPA* path cost / optimal path cost")
+
+
+if __name__ == "__main__":
+    main()
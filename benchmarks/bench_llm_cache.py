@@ -0,0 +1,110 @@
+"""
+Benchmark: repeated LLM requests with and without the response cache.
+
+Sends a session of detail-layer style requests, in which common objects
+come up again and again, to a mock backend that takes a fixed time per
+reply, standing in for a local model. The session runs uncached, then
+through CachingLLMClient backed by an SQLite file, and then again,
+offline, against the reopened file, as a seeded replay would. Prints
+the wall time, the hit rate, and the cost of a memory and a file hit.
+
+Usage:
+    python benchmarks/bench_llm_cache.py [requests] [distinct] [backend_ms]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from shadowengine.llm import (
+    CachingLLMClient,
+    LLMBackend,
+    LLMConfig,
+    MockLLMClient,
+    ResponseCache,
+)
+from shadowengine.llm.cache import request_key
+
+
+class SlowBackend(MockLLMClient):
+    """Mock that takes backend_ms per reply."""
+
+    def __init__(self, config, backend_ms):
+        super().__init__(config)
+        self.backend_s = backend_ms / 1000
+
+    def generate(self, prompt, system=None):
+        time.sleep(self.backend_s)
+        return super().generate(prompt, system)
+
+
+def session(requests: int, distinct: int) -> list:
+    """Requests drawn with a skew towards common objects."""
+    rng = random.Random(42)
+    objects = [f"object {i}" for i in range(distinct)]
+    weights = [1 / (rank + 1) for rank in range(distinct)]
+    return [
+        [{"role": "system", "content": "Describe a detail layer as JSON."},
+         {"role": "user", "content": f"Inspect the {name} at zoom 2."}]
+        for name in rng.choices(objects, weights, k=requests)
+    ]
+
+
+def run(client, messages) -> float:
+    start = time.perf_counter()
+    for request in messages:
+        client.chat(request)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    distinct = int(sys.argv[2]) if len(sys.argv) > 2 else 40
+    backend_ms = float(sys.argv[3]) if len(sys.argv) > 3 else 20.0
+    config = LLMConfig(backend=LLMBackend.MOCK, temperature=0.0)
+    messages = session(requests, distinct)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "responses.db")
+
+        uncached_s = run(SlowBackend(config, backend_ms), messages)
+
+        client = CachingLLMClient(SlowBackend(config, backend_ms), ResponseCache(path))
+        cached_s = run(client, messages)
+        stats = client.stats()
+        client.close()
+
+        replay = CachingLLMClient(SlowBackend(config, backend_ms), ResponseCache(path),
+                                  offline=True)
+        replay_s = run(replay, messages)
+        replay_stats = replay.stats()
+
+        # Per-hit cost: alternating keys with a one-entry memory LRU
+        # always go to the file, then one key stays in memory
+        cold = ResponseCache(path, memory_entries=1)
+        key = request_key("chat", config, {"messages": messages[0]})
+        start = time.perf_counter()
+        for i in range(1000):
+            cold.get(key if i % 2 else request_key("chat", config, {"messages": messages[i % 7 + 1]}))
+        file_us = (time.perf_counter() - start) * 1e6 / 1000
+        start = time.perf_counter()
+        for _ in range(1000):
+            cold.get(key)
+        memory_us = (time.perf_counter() - start) * 1e6 / 1000
+        cold.close()
+        replay.close()
+
+    print(f"{requests} requests, {distinct} distinct, {backend_ms:.0f} ms per backend reply")
+    print(f"uncached:        {uncached_s * 1000:8.1f} ms")
+    print(f"cached:          {cached_s * 1000:8.1f} ms, hit rate {stats['hit_rate']:.0%} "
+          f"({stats['entries']} entries on file)")
+    print(f"offline replay:  {replay_s * 1000:8.1f} ms, hit rate {replay_stats['hit_rate']:.0%}")
+    print(f"hit cost: memory {memory_us:.1f} us, file {file_us:.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Benchmark: a turn's independent LLM requests, one at a time vs fanned out.
+
+Starts a local stub that answers like Ollama's /api/chat after a delay
+read from the request, standing in for a local model, so replies take
+different times as real ones do. A real OllamaClient sends batches of
+requests one at a time with chat() and all at once with chat_many(),
+and the script prints the time per batch against the slowest single
+reply in it. It then does the same with pool_size 2, where at most two
+requests are in flight.
+
+Usage:
+    python benchmarks/bench_llm_fanout.py [batches] [batch_size] [max_ms]
+"""
+
+import json
+import os
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from shadowengine.llm import LLMBackend, LLMConfig, OllamaClient
+
+
+class Stub(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True  # As real servers do
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        request = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+        delay_ms = float(request["messages"][-1]["content"])
+        time.sleep(delay_ms / 1000)
+        body = json.dumps({
+            "message": {"role": "assistant", "content": "Nobody saw a thing."},
+            "eval_count": 5,
+        }).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def run(client, batches) -> tuple:
+    """Returns seconds sequential, seconds fanned out, seconds of slowest replies."""
+    sequential = fanned = slowest = 0.0
+    for delays in batches:
+        requests = [[{"role": "user", "content": str(ms)}] for ms in delays]
+        start = time.perf_counter()
+        for messages in requests:
+            client.chat(messages)
+        sequential += time.perf_counter() - start
+
+        start = time.perf_counter()
+        replies = client.chat_many(requests)
+        fanned += time.perf_counter() - start
+        assert all(reply.success for reply in replies)
+        slowest += max(delays) / 1000
+    return sequential, fanned, slowest
+
+
+def main() -> None:
+    batches = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    batch_size = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    max_ms = float(sys.argv[3]) if len(sys.argv) > 3 else 200.0
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Stub)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    rng = random.Random(42)
+    work = [[round(rng.uniform(max_ms / 4, max_ms)) for _ in range(batch_size)]
+            for _ in range(batches)]
+
+    print(f"{batches} batches of {batch_size} requests, replies {max_ms / 4:.0f}-{max_ms:.0f} ms")
+    for pool_size in (batch_size, 2):
+        client = OllamaClient(LLMConfig(
+            backend=LLMBackend.OLLAMA, base_url=base_url, pool_size=pool_size,
+        ))
+        sequential, fanned, slowest = run(client, work)
+        print(f"pool_size {pool_size}:")
+        print(f"  one at a time: {sequential * 1000 / batches:7.1f} ms/batch")
+        print(f"  chat_many:     {fanned * 1000 / batches:7.1f} ms/batch "
+              f"(slowest reply {slowest * 1000 / batches:.1f} ms), "
+              f"{client.transport.connections_opened} connections opened")
+        client.close()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
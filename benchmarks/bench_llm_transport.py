@@ -0,0 +1,80 @@
+"""
+Benchmark: urlopen per call vs the pooled keep-alive transport.
+
+Starts a local stub that answers like Ollama's /api/generate, then
+sends the same requests with a fresh urllib.request.urlopen connection
+each time and through PooledTransport, and prints the time per request
+and the transport's latency histogram. The stub answers instantly, so
+the difference is connection setup; over the network, and with TLS
+for OpenAI, each new connection costs more.
+
+Usage:
+    python benchmarks/bench_llm_transport.py [requests]
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from shadowengine.llm.transport import PooledTransport
+
+
+class Stub(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True  # As real servers do
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        body = json.dumps({"response": "The rain never stops.", "eval_count": 4}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def main() -> None:
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Stub)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/api/generate"
+    payload = json.dumps({"model": "llama3.2", "prompt": "Describe the street."}).encode()
+    headers = {"Content-Type": "application/json"}
+
+    start = time.perf_counter()
+    for _ in range(requests):
+        request = urllib.request.Request(url, data=payload, headers=headers, method="POST")
+        with urllib.request.urlopen(request, timeout=5) as response:
+            json.loads(response.read())
+    urlopen_ms = (time.perf_counter() - start) * 1000 / requests
+
+    transport = PooledTransport()
+    start = time.perf_counter()
+    for _ in range(requests):
+        json.loads(transport.request("POST", url, body=payload, headers=headers).body)
+    pooled_ms = (time.perf_counter() - start) * 1000 / requests
+
+    print(f"{requests} requests to a local stub")
+    print(f"urlopen: {urlopen_ms:.3f} ms/request")
+    print(f"pooled:  {pooled_ms:.3f} ms/request, "
+          f"{transport.connections_opened} connection(s) opened")
+    for phase, stats in transport.histogram.summary().items():
+        print(f"  {phase:10s} n={stats['count']:4d} mean={stats['mean_ms']:.3f} ms "
+              f"p50<={stats['p50_ms']} ms p95<={stats['p95_ms']} ms")
+    transport.close()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Benchmark: PropagationEngine ticks with and without NPC level of detail.
+
+Spreads NPCs over a chain of locations, puts the player at one end, and
+times engine ticks with every NPC at full detail and then with LOD tiers
+assigned from location distances. Prints the per-tier timings the
+engine collects.
+
+Usage:
+    python benchmarks/bench_lod.py [npcs] [locations] [ticks]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from shadowengine.npc_intelligence import PropagationEngine, MEMORY_TAG_BEHAVIORS
+from shadowengine.npc_intelligence.npc_memory import NPCMemory
+
+TAGS = list(MEMORY_TAG_BEHAVIORS)
+
+
+def build_engine(npcs: int, memories: int = 15, seed: int = 4) -> PropagationEngine:
+    rng = random.Random(seed)
+    engine = PropagationEngine()
+    for i in range(npcs):
+        bank = engine.register_npc(f"npc_{i}", "mob_boss").memory_bank
+        for _ in range(memories):
+            bank.add_memory(NPCMemory(
+                confidence=rng.uniform(0.5, 1.0),
+                decay_rate=0.001,
+                tags=rng.sample(TAGS, rng.randrange(1, 3)),
+            ))
+    return engine
+
+
+def ms_per_tick(engine: PropagationEngine, ticks: int) -> float:
+    start = time.perf_counter()
+    for _ in range(ticks):
+        engine.update(1.0)
+    return (time.perf_counter() - start) * 1000 / ticks
+
+
+def main() -> None:
+    npcs = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    locations = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    ticks = int(sys.argv[3]) if len(sys.argv) > 3 else 8
+
+    distances = {f"loc_{i}": i for i in range(locations)}
+    npc_locations = {f"npc_{i}": f"loc_{i % locations}" for i in range(npcs)}
+
+    print(f"{npcs} NPCs over {locations} locations, {ticks} ticks")
+    full = build_engine(npcs)
+    print(f"full detail: {ms_per_tick(full, ticks):.1f} ms per tick")
+
+    lod = build_engine(npcs)
+    lod.enable_lod()
+    lod.assign_lod_tiers("loc_0", npc_locations, distances)
+    print(f"LOD tiers:   {ms_per_tick(lod, ticks):.1f} ms per tick")
+    for tier, timing in lod.lod.get_tier_timings().items():
+        print(f"  {tier:8} {timing['npcs']:5} NPCs, {timing['updates']:6} updates, "
+              f"{timing['seconds'] * 1000:7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
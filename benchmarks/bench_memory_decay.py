@@ -0,0 +1,82 @@
+"""
+Benchmark: eager vs lazy NPC memory decay.
+
+Gives a town of NPCs full memory banks and runs a stretch of game ticks
+two ways: decaying every memory every tick with decay_all_memories (the
+old NPCMemoryBank.update), and with the lazy bank, which only pops
+memories whose forget time has passed. A final read of every bank is
+timed separately, since that is where the lazy path pays for decay.
+
+Usage:
+    python benchmarks/bench_memory_decay.py [npcs] [ticks]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from shadowengine.npc_intelligence.npc_memory import (
+    NPCMemory, NPCMemoryBank, MemoryDecaySystem
+)
+
+
+def make_memories(count: int, rng: random.Random) -> list[NPCMemory]:
+    return [
+        NPCMemory(
+            confidence=rng.uniform(0.3, 1.0),
+            decay_rate=rng.choice([0.001, 0.002, 0.005]),
+            emotional_weight=rng.random(),
+        )
+        for _ in range(count)
+    ]
+
+
+def timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return (time.perf_counter() - start) * 1000
+
+
+def main() -> None:
+    npcs = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    ticks = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+    capacity = 50
+
+    rng = random.Random(3)
+    system = MemoryDecaySystem()
+    eager = [make_memories(capacity, rng) for _ in range(npcs)]
+    banks = []
+    for memories in (make_memories(capacity, rng) for _ in range(npcs)):
+        bank = NPCMemoryBank("npc", "mob_boss")
+        for memory in memories:
+            bank.add_memory(memory)
+        banks.append(bank)
+
+    def run_eager():
+        for _ in range(ticks):
+            for i, memories in enumerate(eager):
+                eager[i] = system.decay_all_memories(memories, 1.0)
+
+    def run_lazy():
+        for _ in range(ticks):
+            for bank in banks:
+                bank.update(1.0)
+
+    def read_all():
+        for bank in banks:
+            bank.memories
+
+    eager_ms = timed(run_eager)
+    lazy_ms = timed(run_lazy)
+    read_ms = timed(read_all)
+    remaining = sum(len(bank) for bank in banks)
+    print(f"{npcs} NPCs x {capacity} memories, {ticks} ticks ({remaining} left)")
+    print(f"eager: {eager_ms / ticks:.2f} ms per tick")
+    print(f"lazy:  {lazy_ms / ticks:.3f} ms per tick, settling every bank once {read_ms:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
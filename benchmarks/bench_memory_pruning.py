@@ -0,0 +1,67 @@
+"""
+Benchmark: sort-based vs heap-based capacity pruning.
+
+Streams witnessed events into a full memory bank, ticking decay between
+inserts, two ways: bringing every memory's confidence up to date and
+sorting with MemoryDecaySystem.prune_memories on each insert over
+capacity (the old NPCMemoryBank.add_memory), and the bank's lazy
+priority heap.
+
+Usage:
+    python benchmarks/bench_memory_pruning.py [capacity] [inserts]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from shadowengine.npc_intelligence.npc_memory import NPCMemory, NPCMemoryBank
+
+
+def make_memory(rng: random.Random) -> NPCMemory:
+    return NPCMemory(
+        confidence=rng.uniform(0.3, 1.0),
+        decay_rate=rng.choice([0.001, 0.002, 0.005]),
+        emotional_weight=rng.random(),
+        fear=rng.random() * 0.5,
+    )
+
+
+def run(capacity: int, inserts: int, sort_based: bool) -> float:
+    rng = random.Random(8)
+    bank = NPCMemoryBank("npc", "mob_boss")
+    bank.capacity = capacity
+    for _ in range(capacity):
+        bank.add_memory(make_memory(rng))
+    incoming = [make_memory(rng) for _ in range(inserts)]
+    system = bank.decay_system
+    held = list(bank.memories)
+
+    start = time.perf_counter()
+    for memory in incoming:
+        if sort_based:
+            for old in held:
+                system.decay_memory(old, 0.5)
+            held.append(memory)
+            held = system.prune_memories(held, capacity)
+        else:
+            bank.update(0.5)
+            bank.add_memory(memory)
+    return (time.perf_counter() - start) * 1e6 / inserts
+
+
+def main() -> None:
+    inserts = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    capacities = [int(sys.argv[1])] if len(sys.argv) > 1 else [60, 500, 5000]
+
+    for capacity in capacities:
+        sort_us = run(capacity, inserts, True)
+        heap_us = run(capacity, inserts, False)
+        print(f"capacity {capacity}: sort {sort_us:.0f} us, heap {heap_us:.0f} us per insert")
+
+
+if __name__ == "__main__":
+    main()
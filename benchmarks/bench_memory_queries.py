@@ -0,0 +1,94 @@
+"""
+Benchmark: scanned vs indexed NPCMemoryBank lookups.
+
+Fills memory banks to capacity and runs the lookups a dialogue turn
+makes (memories about a subject, by tag, at a location, recent, and
+shareable) two ways: the old list scans over bank.memories, and the
+bank's inverted indexes.
+
+Usage:
+    python benchmarks/bench_memory_queries.py [npcs] [queries]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from shadowengine.npc_intelligence.npc_memory import NPCMemory, NPCMemoryBank
+
+WORDS = ("docks body shot gun rain alley cop money boat night bar knife car "
+         "warehouse fire blood deal boss rat debt card truck crate pier smoke "
+         "badge bribe witness lawyer cash shipment fog siren lamp coat hat "
+         "ledger safe key door window roof").split()
+TAGS = ["danger", "water", "death", "crime", "money", "police", "gossip"]
+PLACES = ["docks", "bar", "alley", "warehouse", "office", "station"]
+
+
+def build_banks(npcs: int, rng: random.Random) -> list[NPCMemoryBank]:
+    banks = []
+    for i in range(npcs):
+        bank = NPCMemoryBank(f"npc_{i}", "mob_boss")
+        for j in range(bank.capacity):
+            bank.add_memory(NPCMemory(
+                summary=" ".join(rng.choice(WORDS) for _ in range(8)),
+                tags=rng.sample(TAGS, 2),
+                actors=[f"npc_{rng.randrange(npcs)}"],
+                location=rng.choice(PLACES),
+                timestamp=float(j),
+                confidence=rng.uniform(0.3, 1.0),
+                decay_rate=0.001,
+                emotional_weight=rng.random(),
+            ))
+        banks.append(bank)
+    return banks
+
+
+def scan(bank: NPCMemoryBank, subject: str, tag: str, place: str) -> None:
+    memories = bank.memories
+    [m for m in memories
+     if subject in m.tags or subject in m.actors or subject in m.summary.lower()]
+    [m for m in memories if tag in m.tags]
+    [m for m in memories if m.location == place]
+    sorted(memories, key=lambda m: m.timestamp, reverse=True)[:5]
+    [m for m in memories if m.get_share_probability() >= 0.3]
+
+
+def indexed(bank: NPCMemoryBank, subject: str, tag: str, place: str) -> None:
+    bank.get_memories_about(subject)
+    bank.get_memories_by_tag(tag)
+    bank.get_memories_at_location(place)
+    bank.get_recent_memories(5)
+    bank.get_shareable_memories()
+
+
+def main() -> None:
+    npcs = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    queries = int(sys.argv[2]) if len(sys.argv) > 2 else 5000
+
+    rng = random.Random(4)
+    banks = build_banks(npcs, rng)
+    plan = [
+        (rng.choice(banks), rng.choice(WORDS), rng.choice(TAGS), rng.choice(PLACES))
+        for _ in range(queries)
+    ]
+    for bank in banks:
+        bank.update(1.0)
+        bank.memories  # Settle decay up front so both runs start level
+
+    timings = {}
+    for name, fn in (("scan", scan), ("indexed", indexed)):
+        start = time.perf_counter()
+        for bank, subject, tag, place in plan:
+            fn(bank, subject, tag, place)
+        timings[name] = (time.perf_counter() - start) * 1e6 / queries
+
+    print(f"{npcs} banks x {banks[0].capacity} memories, {queries} dialogue turns")
+    print(f"scan:    {timings['scan']:.1f} us per turn")
+    print(f"indexed: {timings['indexed']:.1f} us per turn")
+
+
+if __name__ == "__main__":
+    main()
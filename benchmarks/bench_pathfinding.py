@@ -0,0 +1,92 @@
+"""
+Benchmark: Tile-based A* vs indexed A* over a precomputed cost field.
+
+Builds a grid with scattered walls and water, then times the same set of
+long queries through find_path with and without a CostField.
+
+Usage:
+    python benchmarks/bench_pathfinding.py [size] [queries]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from shadowengine.grid import TileGrid, TerrainType, Position
+from shadowengine.grid.pathfinding import find_path, calculate_path_cost
+
+
+def build_map(size: int, seed: int = 7) -> TileGrid:
+    """A grid with wall segments and water pools."""
+    rng = random.Random(seed)
+    grid = TileGrid(width=size, height=size)
+    for _ in range(size // 4):
+        x, y = rng.randrange(size), rng.randrange(size)
+        length = rng.randrange(5, size // 4)
+        if rng.random() < 0.5:
+            grid.fill_rect(x, y, min(size - 1, x + length), y, TerrainType.ROCK)
+        else:
+            grid.fill_rect(x, y, x, min(size - 1, y + length), TerrainType.ROCK)
+    for _ in range(size // 16):
+        x, y = rng.randrange(size - 8), rng.randrange(size - 8)
+        grid.fill_rect(x, y, x + 6, y + 6, TerrainType.WATER)
+    return grid
+
+
+def make_queries(grid: TileGrid, count: int, seed: int = 11) -> list:
+    """Random start/end pairs on passable cells at least half a map apart."""
+    rng = random.Random(seed)
+    size = grid.width
+    queries = []
+    while len(queries) < count:
+        a = Position(rng.randrange(size), rng.randrange(size))
+        b = Position(rng.randrange(size), rng.randrange(size))
+        if a.distance_to(b) < size / 2:
+            continue
+        if grid.get_tile_at_position(a).is_passable() and grid.get_tile_at_position(b).is_passable():
+            queries.append((a, b))
+    return queries
+
+
+def run(grid: TileGrid, queries: list, cost_field=None) -> tuple:
+    """Total seconds and path costs for a query set."""
+    paths = []
+    start = time.perf_counter()
+    for a, b in queries:
+        paths.append(find_path(grid, a, b, cost_field=cost_field))
+    elapsed = time.perf_counter() - start
+    return elapsed, [calculate_path_cost(path) if path else None for path in paths]
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 256
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+
+    grid = build_map(size)
+    queries = make_queries(grid, count)
+
+    start = time.perf_counter()
+    field = grid.get_cost_field()
+    build_time = time.perf_counter() - start
+
+    # Best of three runs to smooth out timer noise
+    tile_time, tile_costs = min(run(grid, queries) for _ in range(3))
+    field_time, field_costs = min(run(grid, queries, field) for _ in range(3))
+
+    mismatches = sum(
+        1 for a, b in zip(tile_costs, field_costs)
+        if (a is None) != (b is None) or (a is not None and abs(a - b) > 1e-6)
+    )
+    print(f"Grid {size}x{size}, {count} queries")
+    print(f"cost field build:   {build_time * 1000:8.1f} ms")
+    print(f"tile A*:            {tile_time / count * 1000:8.1f} ms/query")
+    print(f"indexed A*:         {field_time / count * 1000:8.1f} ms/query")
+    print(f"speedup:            {tile_time / field_time:8.1f}x")
+    print(f"cost mismatches:    {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
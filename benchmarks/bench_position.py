@@ -0,0 +1,118 @@
+"""
+Benchmark: Position memory, hashing, and neighbor iteration.
+
+Compares the slotted Position with a copy of the original dict-backed
+dataclass: bytes per instance, dict lookups keyed by position, and the
+cost of visiting every neighbor of every cell the old way (one Position
+per neighbor) against the shared offset tables.
+
+Usage:
+    python benchmarks/bench_position.py [size]
+"""
+
+import math
+import os
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from shadowengine.grid import Position, TileGrid
+
+
+@dataclass(frozen=True)
+class LegacyPosition:
+    """The Position layout before slots and hash caching."""
+    x: int
+    y: int
+    z: int = 0
+
+    def __post_init__(self):
+        if not isinstance(self.x, int) or not isinstance(self.y, int) or not isinstance(self.z, int):
+            raise TypeError("Position coordinates must be integers")
+
+    def get_adjacent_positions(self):
+        offsets = [(1, 0), (-1, 0), (0, 1), (0, -1)]
+        offsets.extend([(1, 1), (1, -1), (-1, 1), (-1, -1)])
+        return [LegacyPosition(self.x + dx, self.y + dy, self.z) for dx, dy in offsets]
+
+    def distance_to(self, other, include_z=True):
+        dx = self.x - other.x
+        dy = self.y - other.y
+        return math.sqrt(dx * dx + dy * dy)
+
+
+def bytes_per_instance(cls, size: int) -> float:
+    count = size * size
+    tracemalloc.start()
+    items = [cls(x, y, 0) for y in range(size) for x in range(size)]
+    used, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del items
+    # Subtract the list itself
+    return (used - 8 * count) / count
+
+
+def timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return (time.perf_counter() - start) * 1000
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    count = size * size
+
+    legacy_bytes = bytes_per_instance(LegacyPosition, size)
+    slotted_bytes = bytes_per_instance(Position, size)
+    print(f"memory: {legacy_bytes:.0f} B per legacy Position, {slotted_bytes:.0f} B slotted")
+
+    legacy_keys = [LegacyPosition(x, y) for y in range(size) for x in range(size)]
+    slotted_keys = [Position(x, y) for y in range(size) for x in range(size)]
+    legacy_table = dict.fromkeys(legacy_keys, 1)
+    slotted_table = dict.fromkeys(slotted_keys, 1)
+    legacy_ms = timed(lambda: [legacy_table[key] for key in legacy_keys for _ in range(5)])
+    slotted_ms = timed(lambda: [slotted_table[key] for key in slotted_keys for _ in range(5)])
+    print(f"dict lookups ({5 * count}): legacy {legacy_ms:.1f} ms, slotted {slotted_ms:.1f} ms")
+
+    def legacy_neighbors():
+        for pos in legacy_keys:
+            for adj in pos.get_adjacent_positions():
+                adj.distance_to(pos)
+
+    def position_neighbors():
+        for pos in slotted_keys:
+            for adj in pos.get_adjacent_positions():
+                adj.distance_to(pos)
+
+    def offset_neighbors():
+        for pos in slotted_keys:
+            x, y = pos.x, pos.y
+            for nx, ny, _ in pos.iter_neighbor_coords():
+                math.hypot(nx - x, ny - y)
+
+    print(f"neighbor walk ({8 * count} neighbors): legacy {timed(legacy_neighbors):.1f} ms, "
+          f"slotted {timed(position_neighbors):.1f} ms, "
+          f"offsets {timed(offset_neighbors):.1f} ms")
+
+    grid = TileGrid(width=size, height=size)
+    tiles = [grid.get_tile(x, y) for y in range(size) for x in range(size)]
+
+    def legacy_adjacent():
+        for tile in tiles:
+            pos = tile.position
+            for adj in LegacyPosition(pos.x, pos.y, pos.z).get_adjacent_positions():
+                grid.get_tile(adj.x, adj.y, adj.z)
+
+    def grid_adjacent():
+        for tile in tiles:
+            grid.get_adjacent(tile)
+
+    print(f"TileGrid.get_adjacent over {count} tiles: Position per neighbor "
+          f"{timed(legacy_adjacent):.1f} ms, offsets {timed(grid_adjacent):.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+Benchmark: waiting on generation with and without speculative prefetch.
+
+Walks a chain of generated floors against a mock backend that takes a
+fixed time per reply, standing in for a local model. On each floor the
+player reads the scene for a while, takes a close look at the evidence
+there, and then takes the stairs to a floor not yet generated. Prints
+how long the player waited on each zoom and each move, with prefetch
+off and on.
+
+Usage:
+    python benchmarks/bench_prefetch.py [floors] [backend_ms] [read_ms]
+"""
+
+import contextlib
+import io
+import json
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from shadowengine.config import GameConfig
+from shadowengine.game import Game
+from shadowengine.interaction import Hotspot, HotspotType
+from shadowengine.llm import LLMBackend, LLMConfig, LLMResponse, MockLLMClient
+from shadowengine.render import Location
+
+
+def floor_json(n: int) -> str:
+    return json.dumps({
+        "id": f"floor_{n}", "name": f"Floor {n}",
+        "description": f"A dim landing, the {n}th of many.",
+        "location_type": "building", "is_outdoor": False,
+        "ambient": "A radiator knocks.",
+        "hotspots": [
+            {"id": f"hs_stairs_{n + 1}", "label": f"Stairwell {n + 1}", "type": "exit",
+             "description": "Stairs lead up.", "exit_to": f"floor_{n + 1}"},
+            {"id": f"hs_ledger_{n}", "label": "Ledger", "type": "evidence",
+             "description": "A ledger left open on a chair."},
+        ],
+        "npcs": [], "connections": {},
+    })
+
+
+LAYER_JSON = json.dumps({
+    "description": "Columns of figures, some corrected in a second hand.",
+    "detail_hooks": ["the corrections"],
+    "discovery": None,
+})
+
+
+class SlowBackend(MockLLMClient):
+    """Mock that takes backend_ms per reply and generates floor after floor."""
+
+    def __init__(self, config, backend_ms):
+        super().__init__(config)
+        self.backend_s = backend_ms / 1000
+
+    def chat(self, messages):
+        time.sleep(self.backend_s)
+        if any("ARM'S LENGTH" in m["content"] for m in messages):
+            return LLMResponse(text=LAYER_JSON, success=True, model="mock")
+        floors = [int(n) for n in re.findall(r"Stairwell (\d+)", messages[-1]["content"])]
+        return LLMResponse(text=floor_json(max(floors)), success=True, model="mock")
+
+
+def walk(floors: int, backend_ms: float, read_ms: float, workers: int) -> tuple:
+    """Returns the total time waited on zooms and on moves."""
+    game = Game(GameConfig(prefetch_workers=workers))
+    llm = SlowBackend(LLMConfig(backend=LLMBackend.MOCK), backend_ms)
+    game.location_manager.llm_client = llm
+    game.inspection_manager.detail_handler.llm_client = llm
+    game.renderer.wait_for_key = lambda prompt="": None
+
+    lobby = Location(id="floor_0", name="Lobby", description="A narrow lobby.")
+    lobby.add_hotspot(Hotspot(
+        id="hs_stairs_1", label="Stairwell 1", hotspot_type=HotspotType.EXIT,
+        position=(5, 5), description="Stairs lead up.", target_id="floor_1",
+    ))
+    lobby.add_hotspot(Hotspot(
+        id="hs_ledger_0", label="Ledger", hotspot_type=HotspotType.EVIDENCE,
+        position=(10, 10), description="A ledger left open on a chair.",
+    ))
+    game.add_location(lobby)
+    game.set_start_location("floor_0")
+
+    zoom_s = move_s = 0.0
+    with contextlib.redirect_stdout(io.StringIO()):
+        for n in range(floors):
+            game._prefetch()
+            time.sleep(read_ms / 1000)
+
+            start = time.perf_counter()
+            game.inspection_manager.handle("look closer at the ledger", game.state, game.config)
+            zoom_s += time.perf_counter() - start
+
+            stairs = game.current_location.get_hotspot_by_label(f"Stairwell {n + 1}")
+            start = time.perf_counter()
+            game.location_manager.handle_go(
+                stairs, game.current_location, game.state, game.config, game.add_character,
+            )
+            move_s += time.perf_counter() - start
+            assert game.state.current_location_id == f"floor_{n + 1}"
+
+    stats = dict(game.prefetcher.stats) if game.prefetcher else None
+    if game.prefetcher:
+        game.prefetcher.shutdown()
+    return zoom_s, move_s, stats
+
+
+def main() -> None:
+    floors = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    backend_ms = float(sys.argv[2]) if len(sys.argv) > 2 else 150.0
+    read_ms = float(sys.argv[3]) if len(sys.argv) > 3 else 400.0
+
+    print(f"{floors} floors, {backend_ms:.0f} ms per backend reply, {read_ms:.0f} ms reading")
+    for label, workers in (("prefetch off", 0), ("prefetch on", 2)):
+        zoom_s, move_s, stats = walk(floors, backend_ms, read_ms, workers)
+        print(f"{label:13s} zoom wait {zoom_s * 1000 / floors:6.1f} ms, "
+              f"move wait {move_s * 1000 / floors:6.1f} ms")
+        if stats:
+            print(f"{'':13s} {stats['hits']} hits, {stats['misses']} misses, "
+                  f"{stats['stale']} stale, {stats['cancelled']} cancelled")
+
+
+if __name__ == "__main__":
+    main()
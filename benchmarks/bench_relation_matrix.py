@@ -0,0 +1,68 @@
+"""
+Benchmark: SocialNetwork vs MatrixSocialNetwork.
+
+Builds towns of 100, 1k and 10k NPCs where each NPC knows a handful of
+others and half the relations carry tension, then times an update()
+tick, a storyline query, and a JSON save and load on both backends.
+
+Usage:
+    python benchmarks/bench_relation_matrix.py [relations_per_npc] [tense_fraction]
+"""
+
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from shadowengine.npc_intelligence.social_network import SocialNetwork
+from shadowengine.npc_intelligence.relation_matrix import MatrixSocialNetwork
+
+
+def build(npcs: int, per_npc: int, tense: float, seed: int = 1) -> SocialNetwork:
+    rng = random.Random(seed)
+    network = SocialNetwork()
+    ids = [f"npc_{i}" for i in range(npcs)]
+    for npc in ids:
+        for other in rng.sample(ids, per_npc):
+            if other == npc:
+                continue
+            relation = network.get_or_create_relation(npc, other)
+            relation.modify_affinity(rng.randrange(-90, 91))
+            relation.modify_trust(rng.randrange(-50, 51))
+            if rng.random() < tense:
+                relation.tension = rng.randrange(1, 101)
+    return network
+
+
+def timed(fn, repeat: int = 3) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) * 1000 / repeat
+
+
+def save_load(network: SocialNetwork) -> None:
+    SocialNetwork.from_dict(json.loads(json.dumps(network.to_dict())))
+
+
+def main() -> None:
+    per_npc = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    tense = float(sys.argv[2]) if len(sys.argv) > 2 else 0.5
+
+    for npcs in (100, 1000, 10000):
+        plain = build(npcs, per_npc, tense)
+        matrix = MatrixSocialNetwork.from_network(plain)
+        print(f"{npcs} NPCs, {len(plain.relations)} relations")
+        print(f"  tick:       list {timed(lambda: plain.update(1.0)):.2f} ms, "
+              f"matrix {timed(lambda: matrix.update(1.0)):.2f} ms")
+        print(f"  storylines: list {timed(plain.get_emergent_storylines):.2f} ms, "
+              f"matrix {timed(matrix.get_emergent_storylines):.2f} ms")
+        print(f"  save+load:  list {timed(lambda: save_load(plain), 1):.1f} ms, "
+              f"matrix {timed(lambda: save_load(matrix), 1):.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Benchmark: event-driven rumor diffusion across a district.
+
+Spreads NPCs over a set of locations, gives each a few relations and a
+few witnessed events to gossip about, then runs ticks two ways: the
+wait command's old all-pairs loop over every location, and
+RumorDiffusion sampling the same expected number of co-located
+interactions plus social contacts. Reports interactions per second and
+how much of a diffusion tick goes to building contacts and sampling.
+The all-pairs loop always has the same NPC speak first, so it revisits
+the same relations and passes on fewer rumors per interaction.
+
+Usage:
+    python benchmarks/bench_rumor_diffusion.py [npcs] [locations] [ticks]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from shadowengine.npc_intelligence.propagation_engine import PropagationEngine
+from shadowengine.npc_intelligence.world_event import WorldEvent, WitnessType
+
+
+def build(npcs: int, locations: int, seed: int = 1):
+    rng = random.Random(seed)
+    engine = PropagationEngine(seed=seed)
+    ids = [f"npc_{i}" for i in range(npcs)]
+    places = [f"loc_{i}" for i in range(locations)]
+    where = {npc: rng.choice(places) for npc in ids}
+    for npc in ids:
+        engine.register_npc(npc, rng.choice(["gossip", "default", "informant"]))
+        for other in rng.sample(ids, 3):
+            if other != npc:
+                engine.social_network.get_or_create_relation(npc, other) \
+                    .modify_trust(rng.randrange(-30, 50))
+    for i in range(npcs // 10):
+        event = WorldEvent(
+            id=f"evt_{i}", event_type=rng.choice(["violence", "theft", "death"]),
+            location=(i, i), location_name=rng.choice(places),
+            actors=["stranger"], notability=0.8
+        )
+        for witness in rng.sample(ids, 3):
+            event.add_witness(witness, WitnessType.DIRECT)
+        engine.process_event(event)
+    return engine, where
+
+
+def pairwise(engine: PropagationEngine, where: dict[str, str]) -> tuple[int, int]:
+    at: dict[str, list[str]] = {}
+    for npc, place in where.items():
+        at.setdefault(place, []).append(npc)
+    count = shared = 0
+    for npcs in at.values():
+        for i in range(len(npcs)):
+            for j in range(i + 1, len(npcs)):
+                shared += engine.simulate_interaction(npcs[i], npcs[j])["rumor_shared"]
+                count += 1
+    return count, shared
+
+
+def main() -> None:
+    npcs = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    locations = int(sys.argv[2]) if len(sys.argv) > 2 else 40
+    ticks = int(sys.argv[3]) if len(sys.argv) > 3 else 5
+
+    engine, where = build(npcs, locations)
+    start = time.perf_counter()
+    runs = [pairwise(engine, where) for _ in range(ticks)]
+    elapsed = time.perf_counter() - start
+    count = sum(n for n, _ in runs)
+    print(f"{npcs} NPCs at {locations} locations, {ticks} ticks")
+    print(f"pairwise:  {count} interactions, {count / elapsed:,.0f}/s, "
+          f"{sum(s for _, s in runs)} rumors shared")
+
+    engine, where = build(npcs, locations)
+    diffusion = engine.enable_diffusion()
+    sampling = 0.0
+    for _ in range(ticks):
+        start = time.perf_counter()
+        diffusion.sample(diffusion.build_contacts(where), 1.0)
+        sampling += time.perf_counter() - start
+        engine.diffuse_rumors(where, 1.0)
+    report = diffusion.get_throughput()
+    print(f"diffusion: {report['interactions']} interactions, "
+          f"{report['interactions_per_second']:,.0f}/s, "
+          f"{report['rumors_shared']} rumors shared")
+    print(f"contacts + sampling: {sampling * 1000 / ticks:.1f} ms per tick, "
+          f"{sampling / report['seconds']:.0%} of diffusion time")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Benchmark: indexed rumor lookups as the rumor pool grows.
+
+Fills RumorPropagation with rumors spread over a population that grows
+with it (so each NPC knows about the same number of rumors), then times the lookups one NPC interaction makes (the rumors the speaker
+knows, and the rumor a shared memory already became) through the
+indexes and through a scan of active_rumors, the way they were answered
+before. The indexed cost should stay flat as the pool grows.
+
+Usage:
+    python benchmarks/bench_rumors.py [rumors_per_npc] [interactions]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from shadowengine.npc_intelligence.rumor import Rumor, RumorPropagation
+
+
+def build_pool(rumors: int, npcs: int, seed: int = 3) -> RumorPropagation:
+    """Rumors with a few carriers each, one origin memory apiece."""
+    rng = random.Random(seed)
+    propagation = RumorPropagation()
+    for i in range(rumors):
+        carriers = {f"npc_{rng.randrange(npcs)}" for _ in range(3)}
+        propagation.add_rumor(Rumor(
+            rumor_id=f"rum_{i}",
+            carriers=carriers,
+            origin_memory=f"mem_{i}",
+            origin_location=f"loc_{i % 50}",
+            tags=[f"tag_{i % 20}"],
+        ))
+    return propagation
+
+
+def timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return (time.perf_counter() - start) * 1000
+
+
+def main() -> None:
+    per_npc = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    interactions = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+
+    rng = random.Random(11)
+    print(f"~{3 * per_npc} rumors known per NPC, {interactions} interactions")
+    for size in (1_000, 10_000, 50_000):
+        npcs = size // per_npc
+        propagation = build_pool(size, npcs)
+        queries = [(f"npc_{rng.randrange(npcs)}", f"mem_{rng.randrange(size)}")
+                   for _ in range(interactions)]
+
+        def indexed():
+            for npc_id, memory_id in queries:
+                propagation.get_rumors_known_by(npc_id)
+                propagation.get_rumor_from_memory(memory_id, npc_id)
+
+        def scanned():
+            for npc_id, memory_id in queries:
+                known = [r for r in propagation.active_rumors.values() if r.is_carrier(npc_id)]
+                next((r for r in known if r.origin_memory == memory_id), None)
+
+        per_indexed = timed(indexed) * 1000 / interactions
+        per_scanned = timed(scanned) * 1000 / interactions
+        print(f"{size:>6} rumors: indexed {per_indexed:.1f} us, scan {per_scanned:.0f} us per interaction")
+
+
+if __name__ == "__main__":
+    main()
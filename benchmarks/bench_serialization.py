@@ -0,0 +1,84 @@
+"""
+Benchmark: JSON vs chunked binary grid saves.
+
+Builds a dense map where every cell has its own terrain and height (the
+worst case for the per-tile JSON path), then times saving and loading it
+through serialize/json and through save_binary/load_binary, and reports
+file sizes. The lazy binary load is timed to open the file and to touch
+one cell, and separately to decode every chunk.
+
+Usage:
+    python benchmarks/bench_serialization.py [size] [entities]
+"""
+
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from shadowengine.grid import TileGrid, TerrainType, Position, Entity, EntityType
+
+
+def build_world(size: int, entities: int, seed: int = 5) -> TileGrid:
+    """Dense grid with varied terrain and height on every cell."""
+    rng = random.Random(seed)
+    grid = TileGrid(width=size, height=size, dense=True)
+    terrains = [TerrainType.SOIL, TerrainType.WOOD, TerrainType.ROCK,
+                TerrainType.METAL, TerrainType.WATER]
+    dense = grid._dense
+    for y in range(size):
+        for x in range(size):
+            dense.set_terrain(dense.index(x, y), rng.choice(terrains))
+            dense.elevation[dense.index(x, y)] = rng.randrange(4) * 0.5
+    for i in range(entities):
+        entity = Entity(id=f"e{i}", name=f"e{i}", entity_type=EntityType.ITEM)
+        grid.place_entity(entity, Position(rng.randrange(size), rng.randrange(size)))
+    return grid
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, (time.perf_counter() - start) * 1000
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 256
+    entities = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+
+    grid = build_world(size, entities)
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = os.path.join(tmp, "map.json")
+        binary_path = os.path.join(tmp, "map.grid")
+
+        def save_json():
+            with open(json_path, "w") as f:
+                json.dump(grid.serialize(), f)
+
+        def load_json():
+            with open(json_path) as f:
+                return TileGrid.from_dict(json.load(f))
+
+        _, json_save_ms = timed(save_json)
+        _, json_load_ms = timed(load_json)
+        _, binary_save_ms = timed(lambda: grid.save_binary(binary_path))
+
+        lazy, open_ms = timed(lambda: TileGrid.load_binary(binary_path))
+        _, touch_ms = timed(lambda: lazy.get_tile(size // 2, size // 2))
+        _, full_ms = timed(lambda: TileGrid.load_binary(binary_path, lazy=False))
+
+        json_mb = os.path.getsize(json_path) / 1e6
+        binary_mb = os.path.getsize(binary_path) / 1e6
+
+    print(f"{size}x{size} dense map, {entities} entities")
+    print(f"JSON:   save {json_save_ms:.0f} ms, load {json_load_ms:.0f} ms, {json_mb:.1f} MB")
+    print(f"binary: save {binary_save_ms:.0f} ms, load all {full_ms:.0f} ms, {binary_mb:.1f} MB")
+    print(f"lazy:   open {open_ms:.1f} ms, first get_tile {touch_ms:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Benchmark: PropagationEngine.update for a city-sized NPC population.
+
+Registers a few thousand background NPCs with tagged memories and times
+engine ticks with the regular per-NPC behavior update, then with
+ShardedTick in-process (1 worker) and on a process pool of 2, 4 and 8
+workers. Pool sizes above the machine's CPU count are skipped, since
+their workers would only share cores, and each pool is reported against
+the in-process tick so the crossover on this machine is visible.
+
+Usage:
+    python benchmarks/bench_sharded_tick.py [npcs] [memories] [ticks]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from shadowengine.npc_intelligence import PropagationEngine, MEMORY_TAG_BEHAVIORS
+from shadowengine.npc_intelligence.npc_memory import NPCMemory
+
+TAGS = list(MEMORY_TAG_BEHAVIORS) + ["weather", "gossip", "market"]
+
+
+def build_engine(npcs: int, memories: int, seed: int = 9) -> PropagationEngine:
+    rng = random.Random(seed)
+    engine = PropagationEngine()
+    for i in range(npcs):
+        bank = engine.register_npc(f"npc_{i}", "mob_boss").memory_bank
+        for _ in range(memories):
+            bank.add_memory(NPCMemory(
+                confidence=rng.uniform(0.5, 1.0),
+                decay_rate=0.001,
+                timestamp=-rng.uniform(0.0, 5.0),
+                tags=rng.sample(TAGS, rng.randrange(1, 4)),
+            ))
+    return engine
+
+
+def ms_per_tick(engine: PropagationEngine, ticks: int) -> float:
+    engine.update(1.0)  # Warm up (and start any worker processes)
+    start = time.perf_counter()
+    for _ in range(ticks):
+        engine.update(1.0)
+    return (time.perf_counter() - start) * 1000 / ticks
+
+
+def main() -> None:
+    npcs = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    memories = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    ticks = int(sys.argv[3]) if len(sys.argv) > 3 else 5
+
+    print(f"{npcs} NPCs x {memories} memories, {os.cpu_count()} CPUs")
+    engine = build_engine(npcs, memories)
+    print(f"regular tick:        {ms_per_tick(engine, ticks):.0f} ms")
+    cpus = os.cpu_count() or 1
+    serial = None
+    for workers in (1, 2, 4, 8):
+        if workers > cpus:
+            print(f"sharded, {workers} worker(s): skipped, more workers than CPUs")
+            continue
+        engine.use_sharded_tick(workers)
+        try:
+            elapsed = ms_per_tick(engine, ticks)
+        finally:
+            engine.close_sharded_tick()
+        if serial is None:
+            serial = elapsed
+            print(f"sharded, 1 worker:    {elapsed:.0f} ms (in-process)")
+        else:
+            print(f"sharded, {workers} worker(s): {elapsed:.0f} ms "
+                  f"({serial / elapsed:.2f}x the in-process tick)")
+
+
+if __name__ == "__main__":
+    main()
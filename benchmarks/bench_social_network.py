@@ -0,0 +1,77 @@
+"""
+Benchmark: scanned vs indexed SocialNetwork queries and ticks.
+
+Builds a town where each NPC knows a handful of others and a few
+relations carry tension, then times an update() tick, a storyline
+query, and a round of per-NPC relation lookups. The scan versions walk
+every relation the way SocialNetwork did before it kept adjacency and
+filed sets.
+
+Usage:
+    python benchmarks/bench_social_network.py [npcs] [relations_per_npc]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from shadowengine.npc_intelligence.social_network import SocialNetwork
+
+
+def build(npcs: int, per_npc: int, seed: int = 1) -> SocialNetwork:
+    rng = random.Random(seed)
+    network = SocialNetwork()
+    ids = [f"npc_{i}" for i in range(npcs)]
+    for npc in ids:
+        for other in rng.sample(ids, per_npc):
+            if other == npc:
+                continue
+            relation = network.get_or_create_relation(npc, other)
+            relation.modify_affinity(rng.randrange(-90, 91))
+            relation.modify_trust(rng.randrange(-50, 51))
+            if rng.random() < 0.02:
+                relation.tension = rng.randrange(1, 101)
+    return network
+
+
+def scan_tick(network: SocialNetwork, dt: float) -> None:
+    for relation in network.relations.values():
+        network.dynamics.decay_tension(relation, dt)
+        network.dynamics.check_for_conflict(relation)
+        network.dynamics.check_for_reconciliation(relation)
+
+
+def scan_lookups(network: SocialNetwork, ids: list[str]) -> None:
+    relations = network.relations.values()
+    for npc in ids:
+        [r for r in relations if r.from_npc == npc or r.to_npc == npc]
+
+
+def timed(fn, repeat: int = 3) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) * 1000 / repeat
+
+
+def main() -> None:
+    npcs = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    per_npc = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+
+    network = build(npcs, per_npc)
+    lookups = [f"npc_{i}" for i in range(0, npcs, max(1, npcs // 100))]
+    print(f"{npcs} NPCs, {len(network.relations)} relations, "
+          f"{len(network._active)} active")
+    print(f"tick:       scan {timed(lambda: scan_tick(network, 1.0)):.2f} ms, "
+          f"indexed {timed(lambda: network.update(1.0)):.2f} ms")
+    print(f"storylines: indexed {timed(network.get_emergent_storylines):.2f} ms")
+    print(f"lookups x{len(lookups)}: scan "
+          f"{timed(lambda: scan_lookups(network, lookups)):.1f} ms, indexed "
+          f"{timed(lambda: [network.get_all_relations_for(n) for n in lookups]):.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
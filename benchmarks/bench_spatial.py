@@ -0,0 +1,85 @@
+"""
+Benchmark: entity radius/nearest queries, spatial hash vs full scan.
+
+Places entities at random on a map and times "entities within r" and
+"nearest entity of type X" through the grid's spatial hash against a
+scan over every entity. It then times "tiles within r" and "tiles with
+affordance A", the latter through the affordance index against a scan
+over every tile.
+
+Usage:
+    python benchmarks/bench_spatial.py [entities] [size] [queries]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from shadowengine.grid import TileGrid, Position, Entity, EntityType, TerrainType
+
+
+def populate(size: int, count: int, seed: int = 3) -> TileGrid:
+    """A grid with characters and items at random cells."""
+    rng = random.Random(seed)
+    grid = TileGrid(width=size, height=size)
+    for i in range(count):
+        kind = EntityType.CHARACTER if i % 4 else EntityType.ITEM
+        entity = Entity(id=f"e{i}", name=f"e{i}", entity_type=kind)
+        grid.place_entity(entity, Position(rng.randrange(size), rng.randrange(size)))
+    return grid
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    size = int(sys.argv[2]) if len(sys.argv) > 2 else 256
+    queries = int(sys.argv[3]) if len(sys.argv) > 3 else 500
+
+    grid = populate(size, count)
+    rng = random.Random(9)
+    centers = [Position(rng.randrange(size), rng.randrange(size)) for _ in range(queries)]
+    entities = grid.get_all_entities()
+
+    def scan_within(center):
+        return [e for e in entities if center.distance_to(e.position, include_z=False) <= 10]
+
+    def scan_nearest(center):
+        items = [e for e in entities if e.entity_type == EntityType.ITEM]
+        return min(items, key=lambda e: center.distance_to(e.position))
+
+    rows = [
+        ("within r=10, scan", scan_within),
+        ("within r=10, hash", lambda c: grid.get_entities_in_radius(c, 10)),
+        ("nearest ITEM, scan", scan_nearest),
+        ("nearest ITEM, hash", lambda c: grid.find_nearest_entity(c, EntityType.ITEM)),
+    ]
+    print(f"{count} entities on {size}x{size}, {queries} queries")
+    for label, fn in rows:
+        start = time.perf_counter()
+        for center in centers:
+            fn(center)
+        elapsed = (time.perf_counter() - start) / queries * 1e6
+        print(f"{label:<22}{elapsed:10.1f} us/query")
+
+    grid.fill_rect(size // 4, size // 4, size // 4 + 15, size // 4 + 15, TerrainType.WATER)
+    grid.get_affordance_index()  # Build the index
+    for center in centers:
+        grid.get_in_radius(center, 10)  # Materialize the tiles it returns
+    tile_rows = [
+        ("tiles r=10", queries, lambda c: grid.get_in_radius(c, 10)),
+        ("swimmable, scan", 5, lambda c: grid.find_tiles_with_affordance("swimmable")),
+        ("swimmable, index", queries, lambda c: grid.find_affordance_in_rect(
+            "swimmable", 0, 0, size - 1, size - 1)),
+    ]
+    for label, repeats, fn in tile_rows:
+        start = time.perf_counter()
+        for center in centers[:repeats]:
+            fn(center)
+        elapsed = (time.perf_counter() - start) / repeats * 1e6
+        print(f"{label:<22}{elapsed:10.1f} us/query")
+
+
+if __name__ == "__main__":
+    main()
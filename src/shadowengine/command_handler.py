@@ -612,12 +612,23 @@ Interpret what the player wants to do and respond with JSON."""
         # Update NPC intelligence: decay memories, evolve relationships, spread rumors
         prop_engine = getattr(state, 'propagation_engine', None)
         if prop_engine:
+            if prop_engine.lod is not None:
+                prop_engine.assign_lod_tiers(
+                    state.current_location_id,
+                    {cid: c.state.location for cid, c in state.characters.items()},
+                    self.location_manager.location_distances,
+                )
             prop_engine.update(config.time_units_per_action)
 
             # NPCs at the same location may gossip
             npc_ids = self._get_npcs_at_location(state)
             bridge = getattr(state, 'event_bridge', None)
-            if len(npc_ids) >= 2 and bridge:
+            if prop_engine.diffusion is not None:
+                prop_engine.diffuse_rumors(
+                    {cid: c.state.location for cid, c in state.characters.items()},
+                    config.time_units_per_action,
+                )
+            elif len(npc_ids) >= 2 and bridge:
                 for i in range(len(npc_ids)):
                     for j in range(i + 1, len(npc_ids)):
                         bridge.trigger_gossip(npc_ids[i], npc_ids[j])
@@ -134,6 +134,13 @@ class GameConfig:
     speech_volume: float = 1.0  # TODO: wire to audio engine when integrated
     ambient_volume: float = 0.5  # TODO: wire to audio engine when integrated
 
+    # Dialogue
+    stream_dialogue: bool = True  # Show NPC replies as the LLM generates them
+
+    # Prefetch: generate likely next locations and zoom layers while the
+    # player reads. Spends backend time on paths never taken; 0 = off
+    prefetch_workers: int = 0
+
     def save(self, path: str) -> None:
         """Save config to JSON file."""
         with open(path, 'w') as f:
@@ -146,6 +153,7 @@ class GameConfig:
         "time_units_per_action", "npc_trust_threshold_modifier",
         "evidence_decay_rate", "enable_audio", "enable_speech",
         "master_volume", "speech_volume", "ambient_volume",
+        "stream_dialogue", "prefetch_workers",
     }
 
     @classmethod
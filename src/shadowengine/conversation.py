@@ -5,7 +5,7 @@ Extracted from game.py to isolate the conversation loop and
 LLM-driven dialogue into a testable, focused module.
 """
 
-from typing import Optional
+from typing import Iterable, Optional, Union
 import logging
 
 from .config import (
@@ -33,11 +33,14 @@ class ConversationManager:
         dialogue_handler: DialogueHandler,
         audio_engine=None,
         speech_enabled: bool = False,
+        stream_dialogue: bool = False,
     ):
         self.renderer = renderer
         self.dialogue_handler = dialogue_handler
         self.audio_engine = audio_engine
         self.speech_enabled = speech_enabled
+        # Show LLM replies word by word as they are generated
+        self.stream_dialogue = stream_dialogue
 
     def speak_dialogue(self, character_id: str, text: str, mood: str = "") -> None:
         """Speak dialogue using TTS if enabled."""
@@ -63,10 +66,24 @@ class ConversationManager:
 
         self.audio_engine.speak(character_id, text, emotion)
 
-    def show_dialogue(self, character: Character, text: str, mood: str = "") -> None:
-        """Display dialogue and speak it using TTS."""
-        self.renderer.render_dialogue(character.name, text, mood)
+    def show_dialogue(
+        self, character: Character, text: Union[str, Iterable[str]], mood: str = ""
+    ) -> str:
+        """
+        Display dialogue and speak it using TTS.
+
+        text may also be a stream of pieces, displayed as they arrive
+        and spoken once complete. Returns the text shown ("" if the
+        stream produced nothing, in which case nothing is displayed).
+        """
+        if isinstance(text, str):
+            self.renderer.render_dialogue(character.name, text, mood)
+        else:
+            text = self.renderer.render_dialogue_stream(character.name, text, mood)
+            if not text.strip():
+                return ""
         self.speak_dialogue(character.id, text, mood)
+        return text
 
     def conversation_loop(self, state: 'GameState') -> None:
         """Handle one tick of conversation mode."""
@@ -146,10 +163,18 @@ class ConversationManager:
             return
 
         # Generate response via LLM (with character memory context)
-        response = self.generate_dialogue(character, player_input, state)
+        if self.stream_dialogue:
+            response = self.show_dialogue(
+                character,
+                self.generate_dialogue(character, player_input, state, stream=True),
+                mood_mod,
+            )
+        else:
+            response = self.generate_dialogue(character, player_input, state)
+            if response:
+                self.show_dialogue(character, response, mood_mod)
 
         if response:
-            self.show_dialogue(character, response, mood_mod)
             state.world_state.generation_memory.record_dialogue(
                 npc_id=character.id,
                 player_said=player_input,
@@ -175,9 +200,15 @@ class ConversationManager:
             self.show_dialogue(character, fallback, mood_mod)
 
     def generate_dialogue(
-        self, character: Character, player_input: str, state: 'GameState'
-    ) -> Optional[str]:
-        """Generate NPC dialogue response using LLM, enriched with memory and intelligence."""
+        self, character: Character, player_input: str, state: 'GameState',
+        stream: bool = False,
+    ) -> Union[Optional[str], Iterable[str]]:
+        """
+        Generate NPC dialogue response using LLM, enriched with memory and intelligence.
+
+        With stream=True, returns the dialogue handler's stream of
+        cleaned pieces instead of the finished text.
+        """
         char_memory = state.memory.get_character_memory(character.id)
 
         # Pull intelligence hints from PropagationEngine (rumors, behavior)
@@ -207,7 +238,11 @@ class ConversationManager:
             for d in list(state.memory.player.discoveries.values())[-10:]
         ]
 
-        return self.dialogue_handler.generate_response(
+        generate = (
+            self.dialogue_handler.stream_response if stream
+            else self.dialogue_handler.generate_response
+        )
+        return generate(
             character=character,
             player_input=player_input,
             spine=state.spine,
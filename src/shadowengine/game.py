@@ -27,6 +27,7 @@ from .signal_router import SignalRouter
 from .npc_intelligence import PropagationEngine
 from .event_bridge import GameEventBridge
 from .inspection_manager import InspectionManager
+from .prefetch import PrefetchScheduler
 from .evidence_watch import EvidenceWatch
 from .street_talk import StreetTalk
 from .npc_agency import NPCAgency
@@ -92,6 +93,9 @@ class Game:
 
         # LLM
         self.llm_client = create_llm_client()
+        self.prefetcher: Optional[PrefetchScheduler] = None
+        if self.config.prefetch_workers > 0:
+            self.prefetcher = PrefetchScheduler(workers=self.config.prefetch_workers)
 
         self.signal_router = SignalRouter(renderer=self.renderer)
         self.save_system = SaveSystem(self)
@@ -109,23 +113,29 @@ class Game:
         Called on construction, on new_game, and after loading a save
         (the restored state needs freshly-bound delegates).
         """
+        if self.prefetcher is not None:
+            # Speculation about the old state is worthless now
+            self.prefetcher.cancel_except(set())
         self.dialogue_handler = DialogueHandler(self.llm_client, self.state.world_state)
         self.location_manager = LocationManager(
             llm_client=self.llm_client,
             world_state=self.state.world_state,
             renderer=self.renderer,
+            prefetcher=self.prefetcher,
         )
         self.conversation_manager = ConversationManager(
             renderer=self.renderer,
             dialogue_handler=self.dialogue_handler,
             audio_engine=self.audio_engine,
             speech_enabled=self.config.enable_speech,
+            stream_dialogue=self.config.stream_dialogue,
         )
         self.inspection_manager = InspectionManager(
             llm_client=self.llm_client,
             world_state=self.state.world_state,
             renderer=self.renderer,
             seed=seed,
+            prefetcher=self.prefetcher,
         )
         self.street_talk = StreetTalk(self.llm_client)
         self.npc_agency = NPCAgency(self.llm_client)
@@ -148,6 +158,8 @@ class Game:
         if seed is not None:
             self.state.environment.set_seed(seed)
             self.state.evidence_watch.seed(seed)
+            # Bias and rumor rolls share the engine's rng
+            self.state.propagation_engine.rng.seed(seed)
 
         # Apply theme-driven weather bias so genre packs affect atmosphere
         self.state.environment.weather.apply_theme_weights(self.theme.weather_weights)
@@ -251,16 +263,17 @@ class Game:
         # The world's counter-moves: tampered evidence, missing objects
         self.state.evidence_watch.update(self.state, self.renderer)
 
-        # The street talks: NPCs voice what the rumor network knows
-        self.street_talk.update(self.state, self.renderer)
-
-        # NPCs act on their own behalf: the culprit runs, the framed defend
-        self.npc_agency.update(self.state, self.renderer)
+        # The street talks: NPCs voice what the rumor network knows.
+        # NPCs act on their own behalf: the culprit runs, the framed defend.
+        remark_reply, defense_reply = self._tick_replies()
+        self.street_talk.update(self.state, self.renderer, remark_reply)
+        self.npc_agency.update(self.state, self.renderer, defense_reply)
         if not self.state.is_running:
             return
 
         scene = Scene(location=location, width=self.config.screen_width)
         self.renderer.render_scene(scene)
+        self._prefetch()
 
         raw_input = self.renderer.render_prompt()
 
@@ -278,6 +291,31 @@ class Game:
             command, context, self.state, self.config, self.add_character,
         )
 
+    def _tick_replies(self) -> list:
+        """
+        Generate the tick's NPC lines together when more than one is due.
+
+        They don't depend on each other, so the tick waits for the
+        slowest rather than the sum. With one or none due, each
+        component asks for its own as usual.
+        """
+        requests = [
+            self.street_talk.line_request(self.state),
+            self.npc_agency.line_request(self.state),
+        ]
+        if any(request is None for request in requests):
+            return [None] * len(requests)
+        return self.llm_client.chat_many(requests)
+
+    def _prefetch(self) -> None:
+        """Generate what the player may ask for next while they read."""
+        if self.prefetcher is None:
+            return
+        keys = self.location_manager.prefetch_exits(self.state, priority=0)
+        keys += self.inspection_manager.prefetch_layers(self.state, priority=1)
+        # Whatever was speculated for other scenes won't be claimed
+        self.prefetcher.cancel_except(set(keys))
+
     # ------------------------------------------------------------------
     # Convenience accessors (used by scenarios)
     # ------------------------------------------------------------------
@@ -3,13 +3,16 @@ Dialogue Handler - LLM-driven NPC dialogue generation.
 
 Handles generating character dialogue responses via the LLM,
 including building character context, conversation history,
-memory-based beliefs, and cleaning up responses.
+memory-based beliefs, and cleaning up responses. Responses can also
+be streamed, cleaned piece by piece as the LLM produces them.
 """
 
-from typing import Optional, TYPE_CHECKING
+from dataclasses import replace
+from typing import Generator, Iterable, Optional, TYPE_CHECKING
 import logging
 
 from ..character import Character
+from ..llm.client import LLMResponse, LLMStream
 from ..llm.validation import sanitize_player_input
 
 if TYPE_CHECKING:
@@ -60,6 +63,68 @@ class DialogueHandler:
         Returns:
             The generated dialogue string, or None if generation failed
         """
+        messages = self._build_messages(
+            character, player_input, spine, mystery, evidence_found,
+            current_location_id, character_memory, intelligence_hints,
+        )
+        response = self.llm_client.chat(messages)
+
+        if response.success and response.text:
+            return self._clean_response(response.text, character.name)
+
+        logger.warning(f"Dialogue generation failed for character '{character.id}'")
+        return None
+
+    def stream_response(
+        self,
+        character: Character,
+        player_input: str,
+        spine: Optional['NarrativeSpine'] = None,
+        mystery: Optional[dict] = None,
+        evidence_found: Optional[list[str]] = None,
+        current_location_id: str = "",
+        character_memory: Optional['CharacterMemory'] = None,
+        intelligence_hints: Optional[dict] = None,
+    ) -> LLMStream:
+        """
+        Generate an NPC dialogue response, yielding it as it arrives.
+
+        Takes the same arguments as generate_response. The pieces are
+        already cleaned and join to what generate_response would
+        return; the stream's response holds the full, cleaned result.
+        """
+        messages = self._build_messages(
+            character, player_input, spine, mystery, evidence_found,
+            current_location_id, character_memory, intelligence_hints,
+        )
+        return LLMStream(self._stream_cleaned(messages, character))
+
+    def _stream_cleaned(
+        self, messages: list[dict], character: Character
+    ) -> Generator[str, None, LLMResponse]:
+        stream = self.llm_client.chat_stream(messages)
+        try:
+            text = yield from self._clean_stream(stream, character.name)
+        finally:
+            stream.close()
+
+        response = replace(stream.response, text=text)
+        if not (response.success and response.text):
+            logger.warning(f"Dialogue streaming failed for character '{character.id}'")
+        return response
+
+    def _build_messages(
+        self,
+        character: Character,
+        player_input: str,
+        spine: Optional['NarrativeSpine'],
+        mystery: Optional[dict],
+        evidence_found: Optional[list[str]],
+        current_location_id: str,
+        character_memory: Optional['CharacterMemory'],
+        intelligence_hints: Optional[dict],
+    ) -> list[dict]:
+        """Build the chat messages for one dialogue response."""
         evidence_found = evidence_found or []
 
         # Build story context
@@ -106,17 +171,10 @@ class DialogueHandler:
             topics_discussed, evidence_found, current_location_id,
         )
 
-        # Call LLM
-        response = self.llm_client.chat([
+        return [
             {"role": "system", "content": system_prompt},
             {"role": "user", "content": user_prompt},
-        ])
-
-        if response.success and response.text:
-            return self._clean_response(response.text, character.name)
-
-        logger.warning(f"Dialogue generation failed for character '{character.id}'")
-        return None
+        ]
 
     @staticmethod
     def _build_memory_context(
@@ -282,3 +340,48 @@ Remember what you said before and stay consistent. Respond as {character.name} w
         if text.lower().startswith(character_name.lower() + ":"):
             text = text[len(character_name) + 1:].strip()
         return text
+
+    @staticmethod
+    def _clean_stream(
+        pieces: Iterable[str], character_name: str
+    ) -> Generator[str, None, str]:
+        """
+        Apply _clean_response to text arriving in pieces.
+
+        Leading text is held back until it can no longer be a
+        "Name:" prefix, and trailing whitespace until more text follows,
+        so the yielded pieces join to exactly what _clean_response
+        gives for the whole text. Returns that joined text.
+        """
+        prefix = character_name.lower() + ":"
+        phase = "start"  # start -> after_prefix -> body
+        pending = ""
+        shown = []
+
+        for piece in pieces:
+            pending += piece
+            if phase == "start":
+                pending = pending.lstrip()
+                lowered = pending.lower()
+                if len(pending) < len(prefix) and prefix.startswith(lowered):
+                    continue  # Could still become the prefix
+                phase = "after_prefix" if lowered.startswith(prefix) else "body"
+                if phase == "after_prefix":
+                    pending = pending[len(prefix):]
+            if phase == "after_prefix":
+                pending = pending.lstrip()
+                if not pending:
+                    continue
+                phase = "body"
+            text = pending.rstrip()
+            if text:
+                shown.append(text)
+                pending = pending[len(text):]
+                yield text
+
+        if phase == "start":
+            text = pending.rstrip()
+            if text:
+                shown.append(text)
+                yield text
+        return "".join(shown)
@@ -6,15 +6,30 @@ This module provides the spatial grid system including:
 - Tile: Rich spatial data containers
 - TileGrid: Spatial queries and pathfinding
 - Entity placement and affordance management
+- CostField: Precomputed movement costs for fast pathfinding
+- PathHierarchy: Cluster abstraction for long-range pathfinding
+- FlowField: Shared Dijkstra maps for many agents heading to the same goals
+- SpatialHash / AffordanceIndex: Bucketed entity and affordance lookups
+- FieldOfView: Shadowcasting visibility with cached visible sets
+- ConnectivityMap: Region labels for O(1) reachability checks
+- Chunked binary saves with lazy, memory-mapped loading (grid.chunked)
 """
 
-from .position import Position
+from .position import Position, neighbor_offsets
 from .terrain import TerrainType, TerrainModifier, FluidType
 from .tile import Tile, TileEnvironment, Layer
 from .entity import Entity, EntityType
 from .grid import TileGrid
 from .events import TileEvent, TileEventType
-from .pathfinding import find_path, get_line_of_sight, calculate_movement_cost
+from .pathfinding import (
+    find_path, get_line_of_sight, calculate_movement_cost,
+    FlowField, FlowFieldCache, build_flow_field
+)
+from .cost_field import CostField
+from .hierarchy import PathHierarchy, find_path_hierarchical
+from .spatial import SpatialHash, AffordanceIndex
+from .fov import FieldOfView
+from .connectivity import ConnectivityMap
 
 __all__ = [
     # Core classes
@@ -23,6 +38,14 @@ __all__ = [
     "TileGrid",
     "TileEnvironment",
     "Entity",
+    "CostField",
+    "PathHierarchy",
+    "FlowField",
+    "FlowFieldCache",
+    "SpatialHash",
+    "AffordanceIndex",
+    "FieldOfView",
+    "ConnectivityMap",
 
     # Enums
     "TerrainType",
@@ -37,6 +60,9 @@ __all__ = [
 
     # Functions
     "find_path",
+    "find_path_hierarchical",
+    "neighbor_offsets",
+    "build_flow_field",
     "get_line_of_sight",
     "calculate_movement_cost",
 ]
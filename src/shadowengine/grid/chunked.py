@@ -0,0 +1,396 @@
+"""
+Chunked binary save files for TileGrid.
+
+TileGrid.serialize turns every changed tile into a dict keyed by a
+stringified position, which is slow and large for big maps. The binary
+format splits each z-level into fixed-size square chunks and stores, per
+chunk, the packed per-cell arrays used by DenseTileStore (terrain,
+passability, opacity, height, moisture, light). Tiles whose state does
+not fit the arrays (entities, modifiers, features, ...) go into a small
+JSON side table per chunk, and entities into one JSON table for the file.
+
+Layout (little-endian):
+
+    header      magic, version, flags, dimensions, chunk size,
+                default terrain, offsets of the entity table and index
+    chunks      packed arrays + side table, only for non-default chunks
+    entities    JSON {entity_id: entity.serialize()}
+    index       (offset, packed length, side length) per chunk;
+                offset 0 marks a chunk that is entirely default
+
+Loading maps the file with mmap and reads only the header, index, and
+entities. Each chunk is decoded the first time the grid touches one of
+its cells, so opening a large map costs almost nothing until it is used.
+The JSON serialize/from_dict path is unchanged and stays the readable
+option for debugging.
+"""
+
+from __future__ import annotations
+import json
+import mmap
+import struct
+import sys
+from array import array
+from typing import Optional, List, Dict, Tuple, TYPE_CHECKING
+
+from .position import Position
+from .tile import Tile, TileEnvironment
+from .terrain import TerrainType
+from .entity import Entity
+from .dense import TERRAIN_CODES, TERRAIN_BY_CODE, is_packable
+
+if TYPE_CHECKING:
+    from .grid import TileGrid
+
+
+MAGIC = b"SEGR"
+FORMAT_VERSION = 1
+
+# Default chunk edge length in tiles
+DEFAULT_CHUNK_SIZE = 32
+
+_HEADER = struct.Struct("<4sHHIIIHBxQQQ")
+_INDEX_ENTRY = struct.Struct("<QII")
+_FLAG_DENSE = 1
+
+# (typecode, attribute) of each packed array, in file order
+_FIELDS = (
+    ("B", "terrain"), ("B", "passable"), ("B", "opaque"),
+    ("d", "elevation"), ("d", "moisture"), ("d", "light"),
+)
+
+_SWAP = sys.byteorder != "little"
+
+
+def _default_values(terrain: TerrainType) -> Dict[str, float]:
+    """Packed values of a freshly created tile of a terrain."""
+    defaults = terrain.get_default_properties()
+    env = TileEnvironment()
+    return {
+        "terrain": TERRAIN_CODES[terrain],
+        "passable": 1 if defaults.get("passable", True) else 0,
+        "opaque": 1 if defaults.get("opaque", False) else 0,
+        "elevation": 0.0,
+        "moisture": env.moisture,
+        "light": env.light_level,
+    }
+
+
+def _pack(values: array) -> bytes:
+    if _SWAP and values.itemsize > 1:
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _unpack(typecode: str, data) -> array:
+    values = array(typecode)
+    values.frombytes(data)
+    if _SWAP and values.itemsize > 1:
+        values.byteswap()
+    return values
+
+
+class ChunkLayout:
+    """
+    Chunk geometry shared by the writer and the reader.
+
+    Attributes:
+        width, height, depth: Grid dimensions
+        chunk_size: Chunk edge length in tiles
+        chunks_x, chunks_y: Chunks per row and column of a z-level
+    """
+
+    def __init__(self, width: int, height: int, depth: int, chunk_size: int):
+        if chunk_size < 1:
+            raise ValueError("Chunk size must be at least 1")
+        self.width = width
+        self.height = height
+        self.depth = depth
+        self.chunk_size = chunk_size
+        self.chunks_x = -(-width // chunk_size)
+        self.chunks_y = -(-height // chunk_size)
+
+    def __len__(self) -> int:
+        return self.chunks_x * self.chunks_y * self.depth
+
+    def chunk_of(self, x: int, y: int, z: int) -> int:
+        """Get the chunk id holding a cell."""
+        size = self.chunk_size
+        return (z * self.chunks_y + y // size) * self.chunks_x + x // size
+
+    def bounds(self, chunk: int) -> Tuple[int, int, int, int, int]:
+        """Get (x0, y0, z, chunk width, chunk height), clipped to the grid."""
+        z, rest = divmod(chunk, self.chunks_x * self.chunks_y)
+        cy, cx = divmod(rest, self.chunks_x)
+        x0 = cx * self.chunk_size
+        y0 = cy * self.chunk_size
+        return (x0, y0, z,
+                min(self.chunk_size, self.width - x0),
+                min(self.chunk_size, self.height - y0))
+
+
+def save_grid(grid: "TileGrid", path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    """
+    Write a grid to a chunked binary file.
+
+    Args:
+        grid: Grid to save
+        path: Destination file path
+        chunk_size: Chunk edge length in tiles
+
+    Returns:
+        Number of non-default chunks written
+    """
+    grid.load_all_chunks()
+    layout = ChunkLayout(grid.width, grid.height, grid.depth, chunk_size)
+    defaults = _default_values(grid.default_terrain)
+    dense = grid._dense
+
+    # Materialized tiles override the packed state of their cell
+    by_chunk: Dict[int, List[Tile]] = {}
+    for (x, y, z), tile in grid._tiles.items():
+        by_chunk.setdefault(layout.chunk_of(x, y, z), []).append(tile)
+
+    index = [(0, 0, 0)] * len(layout)
+    written = 0
+    with open(path, "wb") as f:
+        f.write(b"\0" * _HEADER.size)
+        for chunk in range(len(layout)):
+            tiles = by_chunk.get(chunk, [])
+            x0, y0, z, cw, ch = layout.bounds(chunk)
+
+            if dense is not None:
+                columns = {}
+                for typecode, name in _FIELDS:
+                    source = getattr(dense, name)
+                    column = array(typecode)
+                    for y in range(y0, y0 + ch):
+                        start = dense.index(x0, y, z)
+                        column.extend(source[start:start + cw])
+                    columns[name] = column
+                if not tiles and all(
+                    columns[name] == array(typecode, [defaults[name]]) * (cw * ch)
+                    for typecode, name in _FIELDS
+                ):
+                    continue
+            elif not tiles:
+                continue
+            else:
+                columns = {
+                    name: array(typecode, [defaults[name]]) * (cw * ch)
+                    for typecode, name in _FIELDS
+                }
+
+            side = []
+            for tile in tiles:
+                pos = tile.position
+                cell = (pos.y - y0) * cw + pos.x - x0
+                columns["terrain"][cell] = TERRAIN_CODES[tile.terrain_type]
+                columns["passable"][cell] = 1 if tile.passable else 0
+                columns["opaque"][cell] = 1 if tile.opaque else 0
+                columns["elevation"][cell] = tile.height
+                columns["moisture"][cell] = tile.environment.moisture
+                columns["light"][cell] = tile.environment.light_level
+                if not is_packable(tile):
+                    side.append(tile.serialize())
+
+            packed = b"".join(_pack(columns[name]) for _, name in _FIELDS)
+            side_bytes = json.dumps(side).encode("utf-8") if side else b""
+            index[chunk] = (f.tell(), len(packed), len(side_bytes))
+            f.write(packed)
+            f.write(side_bytes)
+            written += 1
+
+        entities_offset = f.tell()
+        entities = json.dumps({
+            eid: e.serialize() for eid, e in grid._entities.items()
+        }).encode("utf-8")
+        f.write(entities)
+
+        index_offset = f.tell()
+        for entry in index:
+            f.write(_INDEX_ENTRY.pack(*entry))
+
+        f.seek(0)
+        f.write(_HEADER.pack(
+            MAGIC, FORMAT_VERSION, _FLAG_DENSE if grid.dense else 0,
+            grid.width, grid.height, grid.depth, chunk_size,
+            TERRAIN_CODES[grid.default_terrain],
+            entities_offset, len(entities), index_offset
+        ))
+    return written
+
+
+class ChunkReader:
+    """
+    Lazily decodes the chunks of a memory-mapped binary grid file.
+
+    A TileGrid loaded with load_grid holds one of these until every chunk
+    has been decoded (or load_all_chunks is called), then closes it.
+
+    Attributes:
+        grid: The grid chunks are decoded into
+        layout: Chunk geometry of the file
+        loaded: Number of chunks decoded so far
+    """
+
+    def __init__(self, grid: "TileGrid", layout: ChunkLayout, mapped: mmap.mmap,
+                 index: List[Tuple[int, int, int]]):
+        self.grid = grid
+        self.layout = layout
+        self._mapped = mapped
+        self._index = index
+        self._pending = bytearray(1 if entry[0] else 0 for entry in index)
+        self._remaining = sum(self._pending)
+        self.loaded = 0
+        if not self._remaining:
+            self.close()
+
+    def load_at(self, x: int, y: int, z: int) -> bool:
+        """
+        Decode the chunk holding a cell if it has not been yet.
+
+        Returns:
+            True if a chunk was decoded
+        """
+        chunk = self.layout.chunk_of(x, y, z)
+        if not self._pending[chunk]:
+            return False
+        self._decode(chunk)
+        return True
+
+    def load_all(self) -> int:
+        """Decode every remaining chunk; returns how many were decoded."""
+        count = 0
+        for chunk in range(len(self.layout)):
+            if self._pending[chunk]:
+                self._decode(chunk)
+                count += 1
+        return count
+
+    def close(self) -> None:
+        """Release the memory map and detach from the grid."""
+        if self._mapped is not None:
+            self._mapped.close()
+            self._mapped = None
+        if self.grid._chunks is self:
+            self.grid._chunks = None
+
+    def _decode(self, chunk: int) -> None:
+        self._pending[chunk] = 0
+        self._remaining -= 1
+        self.loaded += 1
+
+        offset, packed_length, side_length = self._index[chunk]
+        x0, y0, z, cw, ch = self.layout.bounds(chunk)
+        cells = cw * ch
+        data = memoryview(self._mapped)[offset:offset + packed_length]
+        columns = {}
+        position = 0
+        for typecode, name in _FIELDS:
+            length = cells * array(typecode).itemsize
+            columns[name] = _unpack(typecode, data[position:position + length])
+            position += length
+        data.release()
+
+        grid = self.grid
+        if grid._dense is not None:
+            dense = grid._dense
+            for typecode, name in _FIELDS:
+                target = getattr(dense, name)
+                column = columns[name]
+                for row in range(ch):
+                    start = dense.index(x0, y0 + row, z)
+                    target[start:start + cw] = column[row * cw:(row + 1) * cw]
+        else:
+            self._materialize_changed(columns, x0, y0, z, cw, ch)
+
+        if side_length:
+            start = offset + packed_length
+            side = json.loads(bytes(self._mapped[start:start + side_length]))
+            for tile_data in side:
+                tile = Tile.from_dict(tile_data, grid._entities)
+                pos = tile.position
+                grid._tiles[(pos.x, pos.y, pos.z)] = tile
+
+        if not self._remaining:
+            self.close()
+
+    def _materialize_changed(self, columns: Dict[str, array],
+                             x0: int, y0: int, z: int, cw: int, ch: int) -> None:
+        """Build Tiles for the cells of a sparse grid that are not default."""
+        grid = self.grid
+        defaults = _default_values(grid.default_terrain)
+        terrain, passable, opaque = columns["terrain"], columns["passable"], columns["opaque"]
+        elevation, moisture, light = columns["elevation"], columns["moisture"], columns["light"]
+        default_row = tuple(defaults[name] for _, name in _FIELDS)
+        for cell in range(cw * ch):
+            values = (terrain[cell], passable[cell], opaque[cell],
+                      elevation[cell], moisture[cell], light[cell])
+            if values == default_row:
+                continue
+            y, x = divmod(cell, cw)
+            grid._tiles[(x0 + x, y0 + y, z)] = Tile(
+                position=Position(x0 + x, y0 + y, z),
+                terrain_type=TERRAIN_BY_CODE[terrain[cell]],
+                passable=bool(passable[cell]),
+                opaque=bool(opaque[cell]),
+                height=elevation[cell],
+                environment=TileEnvironment(moisture=moisture[cell], light_level=light[cell])
+            )
+
+
+def load_grid(path: str, lazy: bool = True) -> "TileGrid":
+    """
+    Open a grid saved with save_grid.
+
+    Args:
+        path: File to read
+        lazy: Decode chunks on first touch instead of all at once
+
+    Returns:
+        The loaded TileGrid
+
+    Raises:
+        ValueError: If the file is not a grid file of a supported version
+    """
+    from .grid import TileGrid
+
+    with open(path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    try:
+        if len(mapped) < _HEADER.size:
+            raise ValueError(f"{path} is not a grid file")
+        (magic, version, flags, width, height, depth, chunk_size, default_code,
+         entities_offset, entities_length, index_offset) = _HEADER.unpack_from(mapped, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a grid file")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Unsupported grid file version: {version}")
+
+        grid = TileGrid(
+            width=width, height=height, depth=depth,
+            default_terrain=TERRAIN_BY_CODE[default_code],
+            dense=bool(flags & _FLAG_DENSE)
+        )
+        layout = ChunkLayout(width, height, depth, chunk_size)
+        index = [
+            _INDEX_ENTRY.unpack_from(mapped, index_offset + i * _INDEX_ENTRY.size)
+            for i in range(len(layout))
+        ]
+
+        entities = json.loads(bytes(mapped[entities_offset:entities_offset + entities_length]))
+        for entity_data in entities.values():
+            entity = Entity.from_dict(entity_data)
+            grid._entities[entity.id] = entity
+            grid._spatial.insert(entity)
+    except Exception:
+        mapped.close()
+        raise
+
+    grid._chunks = ChunkReader(grid, layout, mapped, index)
+    if not lazy:
+        grid.load_all_chunks()
+    return grid
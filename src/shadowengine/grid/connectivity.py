@@ -0,0 +1,427 @@
+"""
+Connected-component labeling of passable cells.
+
+flood_fill and get_passable_tiles walk the grid one Tile at a time. A
+ConnectivityMap labels every passable cell with the id of its region in
+one pass over the CostField's passability lattice, so "can A reach B at
+all?" becomes a comparison of two integers before any search starts.
+
+Labeling is run-based: each row is split into runs of passable cells,
+runs that touch runs in the previous row are unioned, and the roots are
+painted back as labels. NumPy speeds up run extraction and painting when
+it is installed; the pure-Python path scans with bytearray.find and is
+used otherwise.
+
+When a wall or door changes, only the affected region is re-flooded:
+opening a cell merges the regions around it, closing one checks whether
+its region split. Closures whose neighbors still touch around the cell
+need no flood at all, and changes to regions too large to flood cheaply
+relabel just their z-level with the run-based pass.
+"""
+
+from __future__ import annotations
+from array import array
+from collections import deque
+from typing import Optional, List, Dict, Set, Tuple, TYPE_CHECKING
+
+from .position import Position
+from .events import TileEvent
+from .cost_field import COST_EVENTS, INF
+
+try:
+    import numpy as np
+    _NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    _NUMPY_AVAILABLE = False
+
+if TYPE_CHECKING:
+    from .grid import TileGrid
+
+
+class ConnectivityMap:
+    """
+    Region labels for every passable cell of a TileGrid.
+
+    Uses the same padded cell indices as the grid's CostField, and the
+    same passability (a cell is passable when it can be entered at all).
+    Label 0 marks impassable cells; regions never span z-levels.
+
+    Attributes:
+        grid: The grid being labeled
+        diagonal: Treat diagonal neighbors as connected (matches find_path)
+        use_numpy: Whether the NumPy labeling path is used
+        labels: Region label per cell
+    """
+
+    def __init__(self, grid: "TileGrid", diagonal: bool = True, use_numpy: Optional[bool] = None):
+        if use_numpy and not _NUMPY_AVAILABLE:
+            raise ImportError("NumPy is not installed")
+        self.grid = grid
+        self.field = grid.get_cost_field()
+        self.diagonal = diagonal
+        self.use_numpy = _NUMPY_AVAILABLE if use_numpy is None else use_numpy
+
+        row = self.field.row
+        self._steps = [1, -1, row, -row]
+        if diagonal:
+            self._steps += [row + 1, row - 1, -row + 1, -row - 1]
+
+        self.mask = bytearray()
+        self.labels = array("i")
+        self._sizes: Dict[int, int] = {}
+        self._next_label = 1
+        self._dirty: Set[int] = set()
+        self._attached = False
+        self.rebuild()
+
+    # -- Full labeling ----------------------------------------------------
+
+    def rebuild(self) -> None:
+        """Relabel every cell from scratch."""
+        self.field.refresh()
+        base = self.field.base
+        if self.use_numpy:
+            passable = np.frombuffer(base, dtype=np.float64) != INF
+            self.mask = bytearray(passable.astype(np.uint8).tobytes())
+        else:
+            self.mask = bytearray(0 if b == INF else 1 for b in base)
+
+        self.labels = array("i", [0]) * self.field.size
+        self._sizes = {}
+        self._next_label = 1
+        self._label_range(0, self.field.size)
+        self._dirty.clear()
+
+    def _relabel_plane(self, z: int) -> None:
+        """Relabel one z-level with a fresh run-based pass."""
+        low = z * self.field.plane
+        high = low + self.field.plane
+        for label in set(self.labels[low:high]):
+            self._sizes.pop(label, None)
+        self._label_range(low, high)
+
+    def _label_range(self, low: int, high: int) -> None:
+        """Label the cells in [low, high), which must cover whole z-levels."""
+        starts, ends = self._runs(low, high)
+        roots = self._union_runs(starts, ends)
+        self._paint(low, high, starts, ends, roots)
+
+    def _runs(self, low: int, high: int) -> Tuple[List[int], List[int]]:
+        """Get (starts, ends) of every run of passable cells in a range, in index order."""
+        mask = self.mask
+        if self.use_numpy:
+            # The padded border guarantees each plane starts and ends with 0
+            cells = np.frombuffer(mask, dtype=np.uint8)[low:high]
+            steps = np.diff(cells.astype(np.int8))
+            starts = (np.flatnonzero(steps == 1) + (low + 1)).tolist()
+            ends = (np.flatnonzero(steps == -1) + (low + 1)).tolist()
+            return starts, ends
+
+        starts: List[int] = []
+        ends: List[int] = []
+        find = mask.find
+        start = find(1, low, high)
+        while start != -1:
+            end = find(0, start, high)
+            starts.append(start)
+            ends.append(end)
+            start = find(1, end, high)
+        return starts, ends
+
+    def _union_runs(self, starts: List[int], ends: List[int]) -> List[int]:
+        """Union runs that touch a run in the previous row; return each run's root."""
+        row = self.field.row
+        reach = 1 if self.diagonal else 0
+        parent = list(range(len(starts)))
+
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        current_row = -2
+        row_first = 0
+        prev_first = prev_end = 0
+        j = 0
+        for i, (start, end) in enumerate(zip(starts, ends)):
+            run_row = start // row
+            if run_row != current_row:
+                if run_row == current_row + 1:
+                    prev_first, prev_end = row_first, i
+                else:
+                    prev_first = prev_end = i
+                row_first = i
+                current_row = run_row
+                j = prev_first
+
+            # Touching cells of the previous row, shifted into it
+            low = start - reach - row
+            high = end + reach - row
+            while j < prev_end and ends[j] <= low:
+                j += 1
+            k = j
+            while k < prev_end and starts[k] < high:
+                a, b = find(i), find(k)
+                if a != b:
+                    parent[max(a, b)] = min(a, b)
+                k += 1
+
+        return [find(i) for i in range(len(starts))]
+
+    def _paint(self, low: int, high: int, starts: List[int], ends: List[int],
+               roots: List[int]) -> None:
+        """Write fresh region labels for every run in [low, high)."""
+        label_of: Dict[int, int] = {}
+        run_labels = []
+        sizes = self._sizes
+        for start, end, root in zip(starts, ends, roots):
+            label = label_of.get(root)
+            if label is None:
+                label = self._new_label()
+                label_of[root] = label
+            run_labels.append(label)
+            sizes[label] = sizes.get(label, 0) + end - start
+
+        labels = self.labels
+        if self.use_numpy and starts:
+            delta = np.zeros(high - low + 1, dtype=np.int64)
+            run_values = np.asarray(run_labels, dtype=np.int64)
+            delta[np.asarray(starts) - low] = run_values
+            delta[np.asarray(ends) - low] = -run_values
+            painted = array("i")
+            painted.frombytes(np.cumsum(delta[:-1]).astype(np.intc).tobytes())
+            labels[low:high] = painted
+        else:
+            labels[low:high] = array("i", [0]) * (high - low)
+            for start, end, label in zip(starts, ends, run_labels):
+                labels[start:end] = array("i", [label]) * (end - start)
+
+    # -- Incremental updates ----------------------------------------------
+
+    def attach(self) -> None:
+        """Subscribe to the grid's cost-changing tile events and cell changes."""
+        if self._attached:
+            return
+        for event_type in COST_EVENTS:
+            self.grid.subscribe_to_event(event_type, self.on_tile_event)
+        self.grid.add_change_listener(self.invalidate)
+        self._attached = True
+
+    def detach(self) -> None:
+        """Stop listening to the grid."""
+        if not self._attached:
+            return
+        for event_type in COST_EVENTS:
+            self.grid.unsubscribe_from_event(event_type, self.on_tile_event)
+        self.grid.remove_change_listener(self.invalidate)
+        self._attached = False
+
+    def on_tile_event(self, event: TileEvent) -> None:
+        """Mark the cell an event touched for rechecking."""
+        pos = event.tile.position
+        self.invalidate(pos.x, pos.y, pos.z)
+
+    def invalidate(self, x: int, y: int, z: int = 0) -> None:
+        """Mark a cell for rechecking on the next query."""
+        if self.grid.is_valid_position(x, y, z):
+            self._dirty.add(self.field.index(x, y, z))
+
+    def refresh(self) -> int:
+        """
+        Apply passability changes of dirty cells.
+
+        Returns:
+            Number of cells whose passability changed
+        """
+        if not self._dirty:
+            return 0
+        self.field.refresh()
+        base = self.field.base
+        plane = self.field.plane
+        stale: Set[int] = set()
+        changed = 0
+        for index in sorted(self._dirty):
+            passable = base[index] != INF
+            if passable == bool(self.mask[index]):
+                continue
+            changed += 1
+            self.mask[index] = 1 if passable else 0
+            z = index // plane
+            if z in stale:
+                continue
+            updated = self._open(index) if passable else self._close(index)
+            if not updated:
+                stale.add(z)
+        for z in stale:
+            self._relabel_plane(z)
+        self._dirty.clear()
+        return changed
+
+    def _flood(self, seed: int, label: int, region: int) -> int:
+        """Relabel the cells of ``region`` connected to ``seed``; return the count."""
+        labels = self.labels
+        steps = self._steps
+        labels[seed] = label
+        queue = deque([seed])
+        count = 0
+        while queue:
+            cell = queue.popleft()
+            count += 1
+            for step in steps:
+                neighbor = cell + step
+                if labels[neighbor] == region:
+                    labels[neighbor] = label
+                    queue.append(neighbor)
+        return count
+
+    def _new_label(self) -> int:
+        label = self._next_label
+        self._next_label += 1
+        return label
+
+    @property
+    def _flood_limit(self) -> int:
+        # Flooding a cell costs about as much as a run pass over 16 cells
+        return self.field.plane // 16
+
+    def _open(self, index: int) -> bool:
+        """
+        A cell became passable: join it to, and merge, neighboring regions.
+
+        Returns:
+            False if the merge is too large to flood and the cell's
+            z-level needs a full relabel instead
+        """
+        labels = self.labels
+        around = {labels[index + step] for step in self._steps} - {0}
+        if not around:
+            label = self._new_label()
+            labels[index] = label
+            self._sizes[label] = 1
+            return True
+
+        # Keep the biggest region's label and flood the others into it
+        keep = max(around, key=lambda label: self._sizes[label])
+        if sum(self._sizes[label] for label in around) - self._sizes[keep] > self._flood_limit:
+            return False
+        labels[index] = keep
+        self._sizes[keep] += 1
+        for step in self._steps:
+            other = labels[index + step]
+            if other and other != keep:
+                self._sizes[keep] += self._flood(index + step, keep, other)
+                del self._sizes[other]
+        return True
+
+    def _close(self, index: int) -> bool:
+        """
+        A cell became impassable: split its region if it disconnected.
+
+        Returns:
+            False if the region is too large to flood and the cell's
+            z-level needs a full relabel instead
+        """
+        labels = self.labels
+        region = labels[index]
+        labels[index] = 0
+        self._sizes[region] -= 1
+        if not self._sizes[region]:
+            del self._sizes[region]
+            return True
+
+        seeds = [index + step for step in self._steps if labels[index + step] == region]
+        if len(seeds) < 2 or self._ring_connected(index, seeds, region):
+            return True
+        if self._sizes[region] > self._flood_limit:
+            return False
+
+        # Flood from each seed still carrying the old label. The first
+        # flood temporarily takes a fresh label; if it already covers
+        # every seed, nothing split and the old label is restored.
+        remaining = self._sizes[region]
+        parts: List[Tuple[int, int]] = []
+        for seed in seeds:
+            if labels[seed] != region:
+                continue
+            label = self._new_label()
+            count = self._flood(seed, label, region)
+            parts.append((label, count))
+            remaining -= count
+            if remaining == 0:
+                break
+
+        del self._sizes[region]
+        if len(parts) == 1:
+            self._flood(seeds[0], region, parts[0][0])
+            self._sizes[region] = parts[0][1]
+            return True
+        for label, count in parts:
+            self._sizes[label] = count
+        return True
+
+    def _ring_connected(self, index: int, seeds: List[int], region: int) -> bool:
+        """
+        Check whether the seeds around a closed cell still touch each other
+        through the eight cells surrounding it.
+
+        When they do the region cannot have split, which settles most
+        closures (a wall placed in the open) without flooding anything.
+        """
+        row = self.field.row
+        labels = self.labels
+        ring = [
+            cell for cell in (index + offset for offset in (
+                -row - 1, -row, -row + 1, -1, 1, row - 1, row, row + 1))
+            if labels[cell] == region
+        ]
+        steps = set(self._steps)
+        reached = {seeds[0]}
+        frontier = [seeds[0]]
+        while frontier:
+            cell = frontier.pop()
+            for other in ring:
+                if other not in reached and other - cell in steps:
+                    reached.add(other)
+                    frontier.append(other)
+        return all(seed in reached for seed in seeds)
+
+    # -- Queries ----------------------------------------------------------
+
+    def label_at(self, position: Position) -> int:
+        """Get the region label of a cell (0 if impassable or off the grid)."""
+        if not self.grid.is_valid_position(position.x, position.y, position.z):
+            return 0
+        self.refresh()
+        return self.labels[self.field.index(position.x, position.y, position.z)]
+
+    def region_size(self, position: Position) -> int:
+        """Get the number of cells in a position's region (0 if impassable)."""
+        label = self.label_at(position)
+        return self._sizes.get(label, 0) if label else 0
+
+    @property
+    def region_count(self) -> int:
+        """Number of passable regions."""
+        self.refresh()
+        return len(self._sizes)
+
+    def is_reachable(self, start: Position, end: Position) -> bool:
+        """
+        Check whether any path can lead from start to end.
+
+        The end must be passable. Like find_path, the start itself may be
+        impassable (an entity standing in a doorway), in which case any
+        passable neighbor's region counts.
+        """
+        target = self.label_at(end)
+        if not target or start.z != end.z:
+            return False
+        source = self.label_at(start)
+        if source:
+            return source == target
+        if not self.grid.is_valid_position(start.x, start.y, start.z):
+            return False
+        index = self.field.index(start.x, start.y, start.z)
+        return any(self.labels[index + step] == target for step in self._steps)
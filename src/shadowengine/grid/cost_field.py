@@ -0,0 +1,361 @@
+"""
+Precomputed movement-cost lattice for fast pathfinding.
+
+calculate_movement_cost re-reads terrain costs, the tile environment and
+every modifier for each neighbor expansion. A CostField computes the
+per-cell parts of that cost once, stores them in flat arrays, and only
+recomputes cells that a tile event (or an explicit invalidate) marks
+dirty.
+
+The cost of stepping from cell ``a`` into cell ``b`` is::
+
+    (base[b] + |elevation[b] - elevation[a]| * 0.5) * diagonal * layer[b]
+
+where ``layer`` is the environment/modifier multiplier, combined with an
+entity's ``movement_modifiers`` for entity-specific cost layers. This
+mirrors calculate_movement_cost up to floating-point rounding.
+"""
+
+from __future__ import annotations
+from array import array
+from typing import Optional, Dict, Set, Tuple, Iterator, TYPE_CHECKING
+
+from .terrain import TERRAIN_COST
+from .events import TileEvent, TileEventType
+from .dense import TERRAIN_CODES, TERRAIN_BY_CODE
+
+if TYPE_CHECKING:
+    from .grid import TileGrid
+    from .tile import Tile
+    from .entity import Entity
+
+
+INF = float('inf')
+
+# Diagonal step multiplier (matches calculate_movement_cost)
+DIAGONAL_COST = 1.414
+
+# Tile events that can change the cost of entering a tile
+COST_EVENTS = (
+    TileEventType.DAMAGED,
+    TileEventType.FLOODED,
+    TileEventType.FROZEN,
+    TileEventType.LIT,
+    TileEventType.MODIFIED,
+    TileEventType.COLLAPSED,
+)
+
+# Key for the layer used when no entity modifiers apply
+_BASE_PROFILE: Tuple = ()
+
+
+def entity_profile(entity: Optional["Entity"]) -> Tuple:
+    """
+    Get the cost profile key for an entity.
+
+    Entities with identical movement_modifiers share one cost layer.
+    """
+    if entity is None or not entity.movement_modifiers:
+        return _BASE_PROFILE
+    return tuple(sorted(entity.movement_modifiers.items()))
+
+
+def _environment_multiplier(moisture: float, light_level: float) -> float:
+    """Multiplier from the tile environment."""
+    multiplier = 1.0
+    if moisture > 0.7:
+        multiplier *= 1.5  # Harder to move in water
+    if light_level < 0.2:
+        multiplier *= 1.2  # Slower in darkness
+    return multiplier
+
+
+def tile_cost_terms(tile: "Tile") -> Tuple[float, float]:
+    """
+    Get the (base, multiplier) cost terms for entering a tile.
+
+    Base is infinite when the tile cannot be entered.
+    """
+    if not tile.is_passable():
+        return INF, 1.0
+
+    base = TERRAIN_COST.get(tile.terrain_type, 1.0)
+    if base >= 999.0:
+        return INF, 1.0
+
+    multiplier = _environment_multiplier(
+        tile.environment.moisture, tile.environment.light_level
+    )
+    for modifier in tile.modifiers:
+        effects = modifier.get_effects()
+        if "movement_cost_modifier" in effects:
+            multiplier *= effects["movement_cost_modifier"]
+    return base, multiplier
+
+
+class CostField:
+    """
+    Per-cell movement cost lattice for a TileGrid.
+
+    Each z-plane is stored with a one-cell border of impassable cells, so
+    neighbor expansion needs no bounds checks: stepping off the map lands
+    on an infinite-cost cell.
+
+    Attributes:
+        grid: The grid the costs describe
+        row: Stride between rows (width + 2)
+        plane: Stride between z-planes ((width + 2) * (height + 2))
+        size: Number of stored cells, border included
+    """
+
+    def __init__(self, grid: "TileGrid"):
+        self.grid = grid
+        self.width = grid.width
+        self.height = grid.height
+        self.depth = grid.depth
+        self.row = grid.width + 2
+        self.plane = self.row * (grid.height + 2)
+        self.size = self.plane * grid.depth
+
+        self.base = array("d")
+        self.multiplier = array("d")
+        self.elevation = array("d")
+        self.terrain = array("B")
+        self._layers: Dict[Tuple, Tuple[array, array]] = {}
+        self._min_enter: Dict[Tuple, float] = {}
+        self._dirty: Set[int] = set()
+        self._attached = False
+        self.rebuild()
+
+    def index(self, x: int, y: int, z: int = 0) -> int:
+        """Get the flat cell index for a coordinate."""
+        return z * self.plane + (y + 1) * self.row + x + 1
+
+    def coords(self, index: int) -> Tuple[int, int, int]:
+        """Get the (x, y, z) coordinate for a flat cell index."""
+        z, rest = divmod(index, self.plane)
+        y, x = divmod(rest, self.row)
+        return (x - 1, y - 1, z)
+
+    def cells(self) -> Iterator[Tuple[int, int, int, int]]:
+        """Iterate (index, x, y, z) over every grid cell, border excluded."""
+        for z in range(self.depth):
+            for y in range(self.height):
+                index = self.index(0, y, z)
+                for x in range(self.width):
+                    yield index + x, x, y, z
+
+    def rebuild(self) -> None:
+        """Recompute every cell and drop cached entity layers."""
+        grid = self.grid
+        grid.load_all_chunks()
+        dense = grid._dense
+
+        if dense is not None:
+            self.terrain = array("B", [TERRAIN_CODES[grid.default_terrain]]) * self.size
+            self.elevation = array("d", [0.0]) * self.size
+            self.base = array("d", [INF]) * self.size
+            self.multiplier = array("d", [1.0]) * self.size
+            for index, x, y, z in self.cells():
+                self._store_packed(index, dense.index(x, y, z))
+        else:
+            # Untouched cells of a sparse grid are all default tiles
+            from .tile import Tile
+            from .position import Position
+            default_tile = Tile(position=Position(0, 0, 0), terrain_type=grid.default_terrain)
+            base, multiplier = tile_cost_terms(default_tile)
+            self.terrain = array("B", [TERRAIN_CODES[grid.default_terrain]]) * self.size
+            self.elevation = array("d", [0.0]) * self.size
+            self.base = array("d", [INF]) * self.size
+            self.multiplier = array("d", [multiplier]) * self.size
+            interior = array("d", [base]) * self.width
+            for z in range(self.depth):
+                for y in range(self.height):
+                    start = self.index(0, y, z)
+                    self.base[start:start + self.width] = interior
+
+        for key, tile in grid._tiles.items():
+            self._store_tile(self.index(*key), tile)
+
+        self._dirty.clear()
+        self._layers = {}
+        self._min_enter = {}
+        self._layers[_BASE_PROFILE] = self._build_layers(_BASE_PROFILE)
+
+    def _store_packed(self, index: int, dense_index: int) -> None:
+        """Compute a cell from the grid's dense arrays."""
+        dense = self.grid._dense
+        terrain_type = TERRAIN_BY_CODE[dense.terrain[dense_index]]
+        base = TERRAIN_COST.get(terrain_type, 1.0)
+        if not dense.passable[dense_index] or base >= 999.0:
+            self.base[index] = INF
+            self.multiplier[index] = 1.0
+        else:
+            self.base[index] = base
+            self.multiplier[index] = _environment_multiplier(
+                dense.moisture[dense_index], dense.light[dense_index]
+            )
+        self.terrain[index] = dense.terrain[dense_index]
+        self.elevation[index] = dense.elevation[dense_index]
+
+    def _store_tile(self, index: int, tile: "Tile") -> None:
+        """Compute a cell from a materialized tile."""
+        base, multiplier = tile_cost_terms(tile)
+        self.base[index] = base
+        self.multiplier[index] = multiplier
+        self.terrain[index] = TERRAIN_CODES[tile.terrain_type]
+        self.elevation[index] = tile.height
+
+    def attach(self) -> None:
+        """Subscribe to the grid's cost-changing tile events and cell changes."""
+        if self._attached:
+            return
+        for event_type in COST_EVENTS:
+            self.grid.subscribe_to_event(event_type, self.on_tile_event)
+        self.grid.add_change_listener(self.invalidate)
+        self._attached = True
+
+    def detach(self) -> None:
+        """Stop listening to the grid."""
+        if not self._attached:
+            return
+        for event_type in COST_EVENTS:
+            self.grid.unsubscribe_from_event(event_type, self.on_tile_event)
+        self.grid.remove_change_listener(self.invalidate)
+        self._attached = False
+
+    def on_tile_event(self, event: TileEvent) -> None:
+        """Mark the cell an event touched as dirty."""
+        pos = event.tile.position
+        self.invalidate(pos.x, pos.y, pos.z)
+
+    def invalidate(self, x: int, y: int, z: int = 0) -> None:
+        """
+        Mark a cell for recomputation.
+
+        Dirty cells are refreshed lazily on the next query, so handlers
+        that mutate the tile after this one has run are still picked up.
+        """
+        if 0 <= x < self.width and 0 <= y < self.height and 0 <= z < self.depth:
+            self._dirty.add(self.index(x, y, z))
+
+    @property
+    def dirty_count(self) -> int:
+        """Number of cells waiting to be recomputed."""
+        return len(self._dirty)
+
+    def refresh(self) -> int:
+        """
+        Recompute all dirty cells, including cached entity layers.
+
+        Returns:
+            Number of cells recomputed
+        """
+        if not self._dirty:
+            return 0
+
+        grid = self.grid
+        for index in self._dirty:
+            key = self.coords(index)
+            tile = grid._tiles.get(key)
+            if tile is not None:
+                self._store_tile(index, tile)
+            elif grid._dense is not None:
+                self._store_packed(index, grid._dense.index(*key))
+            else:
+                tile = grid.get_tile(*key)
+                self._store_tile(index, tile)
+
+            for profile, (layer, enter) in self._layers.items():
+                if profile is not _BASE_PROFILE:
+                    layer[index] = self._profile_multiplier(index, dict(profile))
+                enter[index] = self.base[index] * layer[index]
+
+        count = len(self._dirty)
+        self._dirty.clear()
+        self._min_enter.clear()
+        return count
+
+    def _profile_multiplier(self, index: int, modifiers: dict) -> float:
+        """Multiplier for one cell under an entity's movement modifiers."""
+        terrain_type = TERRAIN_BY_CODE[self.terrain[index]]
+        return self.multiplier[index] * modifiers.get(terrain_type.name, 1.0)
+
+    def _build_layers(self, profile: Tuple) -> Tuple[array, array]:
+        """Build the multiplier and flat enter-cost layers for a profile."""
+        base = self.base
+        if profile is _BASE_PROFILE:
+            layer = self.multiplier
+        else:
+            modifiers = dict(profile)
+            per_terrain = [
+                modifiers.get(terrain_type.name, 1.0) for terrain_type in TERRAIN_BY_CODE
+            ]
+            multiplier = self.multiplier
+            terrain = self.terrain
+            layer = array("d", (
+                multiplier[i] * per_terrain[terrain[i]] for i in range(self.size)
+            ))
+        enter = array("d", (base[i] * layer[i] for i in range(self.size)))
+        return layer, enter
+
+    def layers_for(self, entity: Optional["Entity"] = None) -> Tuple[array, array]:
+        """
+        Get the cost layers for an entity.
+
+        Returns a (multiplier, enter) pair: ``multiplier`` scales the whole
+        step cost of entering a cell, ``enter`` is the precomputed cost of
+        a flat, straight step into it. Layers are built once per distinct
+        movement_modifiers profile and kept in sync by refresh().
+        """
+        self.refresh()
+        profile = entity_profile(entity)
+        layers = self._layers.get(profile)
+        if layers is None:
+            layers = self._build_layers(profile)
+            self._layers[profile] = layers
+        return layers
+
+    def min_enter_cost(self, entity: Optional["Entity"] = None) -> float:
+        """
+        Get the cheapest flat, straight step into any cell for an entity.
+
+        No step costs less (climbing and diagonals only add to it), so
+        scaling a distance heuristic by this keeps it admissible when
+        modifiers below 1 make steps cheaper than 1.0. Computed once per
+        layer and recomputed after cells change.
+        """
+        enter = self.layers_for(entity)[1]
+        profile = entity_profile(entity)
+        cheapest = self._min_enter.get(profile)
+        if cheapest is None:
+            cheapest = min((cost for cost in enter if cost != INF), default=1.0)
+            self._min_enter[profile] = cheapest
+        return cheapest
+
+    def layer_for(self, entity: Optional["Entity"] = None) -> array:
+        """Get the cost multiplier layer for an entity."""
+        return self.layers_for(entity)[0]
+
+    def step_cost(self, from_index: int, to_index: int, entity: Optional["Entity"] = None) -> float:
+        """
+        Get the cost of stepping between two adjacent cells.
+
+        Returns:
+            Movement cost, or infinity if the destination cannot be entered
+        """
+        layer = self.layer_for(entity)
+        base = self.base[to_index]
+        if base == INF:
+            return INF
+        cost = base + abs(self.elevation[to_index] - self.elevation[from_index]) * 0.5
+        fx, fy, _ = self.coords(from_index)
+        tx, ty, _ = self.coords(to_index)
+        if fx != tx and fy != ty:
+            cost *= DIAGONAL_COST
+        return cost * layer[to_index]
+
+    def is_enterable(self, index: int) -> bool:
+        """Check if a cell can be entered at all."""
+        self.refresh()
+        return self.base[index] != INF
@@ -0,0 +1,146 @@
+"""
+Array-backed dense storage for TileGrid.
+
+Large maps hold millions of cells, most of which never carry entities or
+modifiers. The dense store keeps the per-cell scalars every system reads
+(terrain, height, passability, opacity, moisture, light) in typed parallel
+arrays indexed by ``(z * height + y) * width + x``. Full ``Tile`` objects
+are only built when a caller asks for one.
+"""
+
+from __future__ import annotations
+from array import array
+from typing import Tuple
+
+from .position import Position
+from .tile import Tile, TileEnvironment
+from .terrain import TerrainType, FluidType
+
+
+# Stable ordinal for each terrain type, used as the packed terrain code
+TERRAIN_CODES: dict[TerrainType, int] = {t: i for i, t in enumerate(TerrainType)}
+TERRAIN_BY_CODE: Tuple[TerrainType, ...] = tuple(TerrainType)
+
+# Environment values a tile gets when nothing has touched it
+_DEFAULT_ENV = TileEnvironment()
+
+
+class DenseTileStore:
+    """
+    Parallel typed arrays holding the scalar state of every grid cell.
+
+    Attributes:
+        width: Grid width (x-axis)
+        height: Grid height (y-axis)
+        depth: Grid depth (z-axis)
+        terrain: Terrain code per cell (index into TERRAIN_BY_CODE)
+        passable: 1 if the cell is passable, else 0
+        opaque: 1 if the cell blocks line of sight, else 0
+        elevation: Tile height per cell
+        moisture: Environment moisture per cell
+        light: Environment light level per cell
+    """
+
+    def __init__(self, width: int, height: int, depth: int,
+                 default_terrain: TerrainType = TerrainType.SOIL):
+        self.width = width
+        self.height = height
+        self.depth = depth
+        size = width * height * depth
+
+        defaults = default_terrain.get_default_properties()
+        self.terrain = array("B", [TERRAIN_CODES[default_terrain]]) * size
+        self.passable = array("B", [1 if defaults.get("passable", True) else 0]) * size
+        self.opaque = array("B", [1 if defaults.get("opaque", False) else 0]) * size
+        self.elevation = array("d", [0.0]) * size
+        self.moisture = array("d", [_DEFAULT_ENV.moisture]) * size
+        self.light = array("d", [_DEFAULT_ENV.light_level]) * size
+
+    def __len__(self) -> int:
+        return len(self.terrain)
+
+    def index(self, x: int, y: int, z: int = 0) -> int:
+        """Get the flat array index for a coordinate."""
+        return (z * self.height + y) * self.width + x
+
+    def coords(self, index: int) -> Tuple[int, int, int]:
+        """Get the (x, y, z) coordinate for a flat array index."""
+        plane = self.width * self.height
+        z, rest = divmod(index, plane)
+        y, x = divmod(rest, self.width)
+        return (x, y, z)
+
+    def terrain_at(self, index: int) -> TerrainType:
+        """Get the terrain type stored at an index."""
+        return TERRAIN_BY_CODE[self.terrain[index]]
+
+    def materialize(self, index: int) -> Tile:
+        """
+        Build a Tile from the packed state of a cell.
+
+        Fields that are not packed (temperature, fluid, stability, ...)
+        take their defaults.
+        """
+        x, y, z = self.coords(index)
+        return Tile(
+            position=Position(x, y, z),
+            terrain_type=TERRAIN_BY_CODE[self.terrain[index]],
+            passable=bool(self.passable[index]),
+            opaque=bool(self.opaque[index]),
+            height=self.elevation[index],
+            environment=TileEnvironment(
+                moisture=self.moisture[index],
+                light_level=self.light[index]
+            )
+        )
+
+    def store(self, index: int, tile: Tile) -> None:
+        """Write the packed fields of a tile back into the arrays."""
+        self.terrain[index] = TERRAIN_CODES[tile.terrain_type]
+        self.passable[index] = 1 if tile.passable else 0
+        self.opaque[index] = 1 if tile.opaque else 0
+        self.elevation[index] = tile.height
+        self.moisture[index] = tile.environment.moisture
+        self.light[index] = tile.environment.light_level
+
+    def set_terrain(self, index: int, terrain_type: TerrainType) -> None:
+        """Set terrain at an index, resetting passability and opacity to its defaults."""
+        defaults = terrain_type.get_default_properties()
+        self.terrain[index] = TERRAIN_CODES[terrain_type]
+        self.passable[index] = 1 if defaults.get("passable", True) else 0
+        self.opaque[index] = 1 if defaults.get("opaque", False) else 0
+
+    def is_default(self, index: int, default_terrain: TerrainType) -> bool:
+        """Check if a cell still holds the state of a freshly created tile."""
+        defaults = default_terrain.get_default_properties()
+        return (self.terrain[index] == TERRAIN_CODES[default_terrain]
+                and self.passable[index] == (1 if defaults.get("passable", True) else 0)
+                and self.opaque[index] == (1 if defaults.get("opaque", False) else 0)
+                and self.elevation[index] == 0.0
+                and self.moisture[index] == _DEFAULT_ENV.moisture
+                and self.light[index] == _DEFAULT_ENV.light_level)
+
+    def memory_usage(self) -> int:
+        """Get the number of bytes held by the packed arrays."""
+        return sum(
+            a.itemsize * len(a)
+            for a in (self.terrain, self.passable, self.opaque,
+                      self.elevation, self.moisture, self.light)
+        )
+
+
+def is_packable(tile: Tile) -> bool:
+    """
+    Check if a tile's whole state fits in the dense arrays.
+
+    Tiles with entities, modifiers, features, or non-default unpacked
+    fields must stay materialized.
+    """
+    env = tile.environment
+    return (not tile.entities
+            and not tile.modifiers
+            and not tile.features
+            and tile.stability == 1.0
+            and env.fluid == FluidType.NONE
+            and env.temperature == _DEFAULT_ENV.temperature
+            and env.sound_level == _DEFAULT_ENV.sound_level)
@@ -3,9 +3,11 @@ Tile events system for the grid.
 """
 
 from __future__ import annotations
+from collections import deque
+from contextlib import contextmanager
 from enum import Enum, auto
 from dataclasses import dataclass, field
-from typing import Optional, Callable, List, TYPE_CHECKING
+from typing import Optional, Callable, List, Dict, Deque, Iterator, TYPE_CHECKING
 import logging
 import time
 
@@ -63,19 +65,48 @@ class TileEvent:
 
 # Type alias for event handlers
 EventHandler = Callable[["TileEvent"], None]
+BatchHandler = Callable[[List["TileEvent"]], None]
+
+# Default number of events kept in history
+DEFAULT_MAX_HISTORY = 1000
 
 
 class TileEventManager:
     """
     Manages tile event subscription and dispatching.
+
+    Dispatch never recurses: an event emitted from inside a handler is
+    queued and dispatched once the current event's handlers finish, so a
+    cascade of follow-up events runs as a loop however long it gets.
+
+    Inside batch() events are held instead of dispatched, coalesced per
+    (type, cell, cause) keeping the latest, and dispatched together when
+    the outermost batch ends. Handlers registered with subscribe_batch
+    then receive each type's events as one list.
+
+    History is a ring buffer of the most recent events; per-type totals
+    are kept in counters.
     """
 
-    def __init__(self):
+    def __init__(self, max_history: int = DEFAULT_MAX_HISTORY):
         self._handlers: dict[TileEventType, List[EventHandler]] = {
             event_type: [] for event_type in TileEventType
         }
-        self._event_history: List[TileEvent] = []
-        self._max_history: int = 1000
+        self._batch_handlers: dict[TileEventType, List[BatchHandler]] = {
+            event_type: [] for event_type in TileEventType
+        }
+        self._event_history: Deque[TileEvent] = deque(maxlen=max_history)
+        self._counts: Dict[TileEventType, int] = {}
+        self._queue: Deque[TileEvent] = deque()
+        self._dispatching = False
+        self._batch_depth = 0
+        self._batched: Dict[tuple, TileEvent] = {}
+        self.coalesced = 0
+
+    @property
+    def max_history(self) -> int:
+        """Number of events kept in history."""
+        return self._event_history.maxlen
 
     def subscribe(self, event_type: TileEventType, handler: EventHandler) -> None:
         """
@@ -88,20 +119,34 @@ class TileEventManager:
         if handler not in self._handlers[event_type]:
             self._handlers[event_type].append(handler)
 
+    def subscribe_batch(self, event_type: TileEventType, handler: BatchHandler) -> None:
+        """
+        Subscribe to a tile event type with a handler that takes batches.
+
+        Outside a batch the handler is called with a one-event list.
+
+        Args:
+            event_type: Type of event to subscribe to
+            handler: Function called with a list of events
+        """
+        if handler not in self._batch_handlers[event_type]:
+            self._batch_handlers[event_type].append(handler)
+
     def unsubscribe(self, event_type: TileEventType, handler: EventHandler) -> bool:
         """
         Unsubscribe from a tile event type.
 
         Args:
             event_type: Type of event
-            handler: Handler to remove
+            handler: Handler to remove (per-event or batch)
 
         Returns:
             True if handler was removed
         """
-        if handler in self._handlers[event_type]:
-            self._handlers[event_type].remove(handler)
-            return True
+        for handlers in (self._handlers[event_type], self._batch_handlers[event_type]):
+            if handler in handlers:
+                handlers.remove(handler)
+                return True
         return False
 
     def emit(self, event: TileEvent) -> None:
@@ -111,21 +156,94 @@ class TileEventManager:
         Args:
             event: Event to emit
         """
-        # Store in history
+        if self._batch_depth:
+            key = (event.event_type, event.tile.position, id(event.cause))
+            if key in self._batched:
+                self.coalesced += 1
+                # Keep the first event's place in the order, the latest event's state
+                del self._batched[key]
+            self._batched[key] = event
+            return
+
+        self._queue.append(event)
+        self._drain()
+
+    @contextmanager
+    def batch(self) -> Iterator["TileEventManager"]:
+        """
+        Hold events emitted inside the block and dispatch them together.
+
+        Batches nest; events are dispatched when the outermost one ends.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self.flush()
+
+    def flush(self) -> int:
+        """
+        Dispatch events held by a batch.
+
+        Returns:
+            Number of events dispatched
+        """
+        if not self._batched:
+            return 0
+        events = list(self._batched.values())
+        self._batched.clear()
+
+        by_type: Dict[TileEventType, List[TileEvent]] = {}
+        for event in events:
+            by_type.setdefault(event.event_type, []).append(event)
+
+        dispatching = self._dispatching
+        self._dispatching = True
+        try:
+            for event in events:
+                self._dispatch(event)
+            for event_type, typed in by_type.items():
+                for handler in list(self._batch_handlers[event_type]):
+                    self._call(handler, typed, event_type)
+        finally:
+            self._dispatching = dispatching
+        self._drain()
+        return len(events)
+
+    def _drain(self) -> None:
+        """Dispatch queued events until none are left."""
+        if self._dispatching:
+            return  # The outer loop picks up the queued event
+        self._dispatching = True
+        try:
+            queue = self._queue
+            while queue:
+                event = queue.popleft()
+                self._dispatch(event)
+                for handler in list(self._batch_handlers[event.event_type]):
+                    self._call(handler, [event], event.event_type)
+        finally:
+            self._dispatching = False
+
+    def _dispatch(self, event: TileEvent) -> None:
+        """Record one event and call its per-event handlers."""
         self._event_history.append(event)
-        if len(self._event_history) > self._max_history:
-            self._event_history.pop(0)
-
-        # Call handlers
-        for handler in self._handlers[event.event_type]:
-            try:
-                handler(event)
-            except Exception as e:
-                logger.error(
-                    "Error in tile event handler for %s: %s",
-                    event.event_type.name, e,
-                    exc_info=True
-                )
+        event_type = event.event_type
+        self._counts[event_type] = self._counts.get(event_type, 0) + 1
+        for handler in list(self._handlers[event_type]):
+            self._call(handler, event, event_type)
+
+    def _call(self, handler: Callable, payload, event_type: TileEventType) -> None:
+        try:
+            handler(payload)
+        except Exception as e:
+            logger.error(
+                "Error in tile event handler for %s: %s",
+                event_type.name, e,
+                exc_info=True
+            )
 
     def get_history(
         self,
@@ -142,18 +260,30 @@ class TileEventManager:
         Returns:
             List of events, most recent first
         """
-        events = self._event_history.copy()
+        if limit <= 0:
+            return []
 
-        if event_type:
-            events = [e for e in events if e.event_type == event_type]
+        events = []
+        for event in reversed(self._event_history):
+            if event_type is None or event.event_type == event_type:
+                events.append(event)
+                if len(events) >= limit:
+                    break
+        return events
 
-        if limit > 0:
-            return events[-limit:][::-1]
-        return []
+    def get_counts(self) -> Dict[TileEventType, int]:
+        """Get the number of events dispatched per type since the last clear."""
+        return dict(self._counts)
+
+    def count(self, event_type: TileEventType) -> int:
+        """Get the number of events of one type dispatched since the last clear."""
+        return self._counts.get(event_type, 0)
 
     def clear_history(self) -> None:
-        """Clear event history."""
+        """Clear event history and counters."""
         self._event_history.clear()
+        self._counts.clear()
+        self.coalesced = 0
 
 
 # Default event handlers
@@ -191,34 +321,38 @@ def on_tile_entered(event: TileEvent, event_manager: Optional[TileEventManager]
                     logger.error("Error signaling proximity to entity %s: %s", other_entity.id, e)
 
 
-def on_tile_damaged(event: TileEvent) -> None:
-    """Handle tile taking damage."""
+def on_tile_damaged(event: TileEvent, event_manager: Optional[TileEventManager] = None) -> None:
+    """
+    Handle tile taking damage.
+
+    Shattering emits MODIFIED and collapsing emits COLLAPSED through the
+    event manager, when one is given. The manager queues them behind the
+    current event, so chains of follow-up events never recurse.
+    """
+    from .terrain import TerrainType, TerrainModifier
     tile = event.tile
     damage = event.data.get("damage", 0)
+    follow_ups = []
 
     # Check for glass shattering
-    from .terrain import TerrainType
     if tile.terrain_type == TerrainType.GLASS and damage > 10:
         # Glass shatters
         tile.passable = True
-        tile.add_modifier(
-            __import__("shadowengine.grid.terrain", fromlist=["TerrainModifier"]).TerrainModifier(
-                type="cracked",
-                intensity=1.0
-            )
-        )
+        tile.add_modifier(TerrainModifier(type="cracked", intensity=1.0))
+        follow_ups.append((TileEventType.MODIFIED, {"modifier": "cracked"}))
 
     # Check for collapse
     if tile.stability < (damage / 100):
         # Tile collapses - mark as impassable and add collapsed modifier
         tile.passable = False
-        tile.add_modifier(
-            __import__("shadowengine.grid.terrain", fromlist=["TerrainModifier"]).TerrainModifier(
-                type="collapsed",
-                intensity=1.0
-            )
-        )
+        tile.add_modifier(TerrainModifier(type="collapsed", intensity=1.0))
         logger.info("Tile at %s collapsed due to damage", tile.position)
+        follow_ups.append((TileEventType.COLLAPSED, {"damage": damage}))
+
+    if event_manager is not None:
+        for event_type, data in follow_ups:
+            event_manager.emit(TileEvent(event_type=event_type, tile=tile,
+                                         cause=event.cause, data=data))
 
 
 def on_tile_flooded(event: TileEvent) -> None:
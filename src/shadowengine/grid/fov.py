@@ -0,0 +1,347 @@
+"""
+Field of view by recursive shadowcasting.
+
+get_line_of_sight walks one Bresenham line per pair of tiles, so asking
+which of N observers can see an event costs N line walks. Shadowcasting
+computes everything visible from one origin in a single pass over the
+eight octants, skipping whole wedges behind opaque cells; "who can see
+X" casts once from X and checks observers against that set. Visible sets
+are cached per (origin, radius) and dropped when a tile event changes the
+opacity of a cell they contain.
+
+Opacity follows Tile.is_opaque(): glass is see-through, opaque entities
+block sight, and opaque cells themselves are visible (you see the wall).
+"""
+
+from __future__ import annotations
+import math
+from collections import OrderedDict
+from typing import Optional, List, FrozenSet, Tuple, Iterable, Union, TYPE_CHECKING
+
+from .position import Position
+from .terrain import TerrainType
+from .events import TileEvent, TileEventType
+from .dense import TERRAIN_CODES
+
+if TYPE_CHECKING:
+    from .grid import TileGrid
+    from .entity import Entity, EntityType
+
+
+# Default number of cached visible sets
+DEFAULT_FOV_CAPACITY = 256
+
+# Octant transforms (xx, xy, yx, yy) mapping octant-local to grid offsets
+_OCTANTS = (
+    (1, 0, 0, -1), (0, 1, -1, 0), (0, -1, -1, 0), (-1, 0, 0, -1),
+    (-1, 0, 0, 1), (0, -1, 1, 0), (0, 1, 1, 0), (1, 0, 0, 1),
+)
+
+CacheKey = Tuple[int, int, int, float]
+
+
+class FieldOfView:
+    """
+    Shadowcasting visibility engine with an LRU cache of visible sets.
+
+    Keeps a per-cell opacity lattice so casting never touches Tile
+    objects. Visible sets are frozensets of in-plane cell indices
+    (``y * width + x``); use visible_cells for coordinates.
+
+    Attributes:
+        grid: The grid being viewed
+        capacity: Maximum number of cached visible sets
+        hits: Lookups served from the cache
+        misses: Lookups that cast a new field of view
+    """
+
+    def __init__(self, grid: "TileGrid", capacity: int = DEFAULT_FOV_CAPACITY):
+        if capacity < 1:
+            raise ValueError("Field of view cache capacity must be at least 1")
+        self.grid = grid
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self.opaque = bytearray()
+        self._cache: "OrderedDict[CacheKey, FrozenSet[int]]" = OrderedDict()
+        self._attached = False
+        self.rebuild()
+
+    def rebuild(self) -> None:
+        """Recompute the opacity lattice and drop every cached set."""
+        grid = self.grid
+        grid.load_all_chunks()
+        size = grid.width * grid.height * grid.depth
+        dense = grid._dense
+
+        if dense is not None:
+            glass = TERRAIN_CODES[TerrainType.GLASS]
+            self.opaque = bytearray(
+                1 if dense.opaque[i] and dense.terrain[i] != glass else 0
+                for i in range(size)
+            )
+        else:
+            from .tile import Tile
+            default_tile = Tile(position=Position(0, 0, 0), terrain_type=grid.default_terrain)
+            self.opaque = bytearray([1 if default_tile.is_opaque() else 0]) * size
+
+        for (x, y, z), tile in grid._tiles.items():
+            self.opaque[self._index(x, y, z)] = 1 if tile.is_opaque() else 0
+        self._cache.clear()
+
+    def _index(self, x: int, y: int, z: int) -> int:
+        """Flat lattice index for a coordinate."""
+        return (z * self.grid.height + y) * self.grid.width + x
+
+    def _cell_opaque(self, x: int, y: int, z: int) -> bool:
+        """Derive a cell's opacity without materializing it into the grid."""
+        grid = self.grid
+        tile = grid._tiles.get((x, y, z))
+        if tile is not None:
+            return tile.is_opaque()
+        if grid._dense is not None:
+            index = grid._dense.index(x, y, z)
+            return (bool(grid._dense.opaque[index])
+                    and grid._dense.terrain[index] != TERRAIN_CODES[TerrainType.GLASS])
+        return bool(self.opaque[self._index(x, y, z)])
+
+    # -- Invalidation -----------------------------------------------------
+
+    def attach(self) -> None:
+        """Subscribe to tile events and cell changes."""
+        if self._attached:
+            return
+        for event_type in TileEventType:
+            self.grid.subscribe_to_event(event_type, self.on_tile_event)
+        self.grid.add_change_listener(self.invalidate)
+        self._attached = True
+
+    def detach(self) -> None:
+        """Stop listening to the grid."""
+        if not self._attached:
+            return
+        for event_type in TileEventType:
+            self.grid.unsubscribe_from_event(event_type, self.on_tile_event)
+        self.grid.remove_change_listener(self.invalidate)
+        self._attached = False
+
+    def on_tile_event(self, event: TileEvent) -> None:
+        """Update the opacity of the cell an event touched."""
+        pos = event.tile.position
+        self._set_opaque(pos.x, pos.y, pos.z, event.tile.is_opaque())
+
+    def invalidate(self, x: int, y: int, z: int = 0) -> None:
+        """Re-derive one cell's opacity after a direct change."""
+        if self.grid.is_valid_position(x, y, z):
+            self._set_opaque(x, y, z, self._cell_opaque(x, y, z))
+
+    def _set_opaque(self, x: int, y: int, z: int, opaque: bool) -> int:
+        """
+        Store a cell's opacity and drop cached sets it can affect.
+
+        Only sets that contain the cell can change: a cell hidden from an
+        origin stays hidden whatever its own opacity.
+
+        Returns:
+            Number of cached sets dropped
+        """
+        index = self._index(x, y, z)
+        value = 1 if opaque else 0
+        if self.opaque[index] == value:
+            return 0
+        self.opaque[index] = value
+
+        cell = y * self.grid.width + x
+        stale = [
+            key for key, visible in self._cache.items()
+            if key[2] == z and cell in visible
+        ]
+        for key in stale:
+            del self._cache[key]
+        return len(stale)
+
+    def clear(self) -> None:
+        """Drop all cached visible sets."""
+        self._cache.clear()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    # -- Casting ----------------------------------------------------------
+
+    def compute(self, origin: Position, radius: float) -> FrozenSet[int]:
+        """
+        Get the set of cells visible from an origin within a radius.
+
+        Args:
+            origin: Viewer position
+            radius: Maximum sight distance (Euclidean, in tiles)
+
+        Returns:
+            Frozenset of in-plane cell indices (``y * width + x``) on the
+            origin's z-level; empty if the origin is off the grid
+        """
+        key = (origin.x, origin.y, origin.z, radius)
+        visible = self._cache.get(key)
+        if visible is not None:
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return visible
+
+        self.misses += 1
+        visible = self._cast(origin.x, origin.y, origin.z, radius)
+        self._cache[key] = visible
+        if len(self._cache) > self.capacity:
+            self._cache.popitem(last=False)
+        return visible
+
+    def _cast(self, ox: int, oy: int, z: int, radius: float) -> FrozenSet[int]:
+        """Shadowcast all eight octants from one origin."""
+        grid = self.grid
+        if not grid.is_valid_position(ox, oy, z):
+            return frozenset()
+
+        width = grid.width
+        visible = {oy * width + ox}
+        rows = int(math.ceil(radius))
+        for transform in _OCTANTS:
+            self._cast_octant(ox, oy, z, 1, 1.0, 0.0, rows, radius * radius, transform, visible)
+        return frozenset(visible)
+
+    def _cast_octant(
+        self,
+        ox: int, oy: int, z: int,
+        row: int,
+        start: float, end: float,
+        rows: int, radius_sq: float,
+        transform: Tuple[int, int, int, int],
+        visible: set
+    ) -> None:
+        """
+        Scan one octant from ``row`` outward between two slopes.
+
+        Each opaque run splits the wedge: the part before it is scanned
+        recursively one row further out, the scan then resumes past it.
+        """
+        if start < end:
+            return
+
+        xx, xy, yx, yy = transform
+        width = self.grid.width
+        height = self.grid.height
+        opaque = self.opaque
+        plane = z * width * height
+        new_start = 0.0
+
+        for distance in range(row, rows + 1):
+            dy = -distance
+            blocked = False
+            for dx in range(-distance, 1):
+                left_slope = (dx - 0.5) / (dy + 0.5)
+                right_slope = (dx + 0.5) / (dy - 0.5)
+                if start < right_slope:
+                    continue
+                if end > left_slope:
+                    break
+
+                x = ox + dx * xx + dy * xy
+                y = oy + dx * yx + dy * yy
+                if 0 <= x < width and 0 <= y < height:
+                    if dx * dx + dy * dy <= radius_sq:
+                        visible.add(y * width + x)
+                    is_opaque = opaque[plane + y * width + x]
+                else:
+                    is_opaque = 1
+
+                if blocked:
+                    if is_opaque:
+                        new_start = right_slope
+                    else:
+                        blocked = False
+                        start = new_start
+                elif is_opaque and distance < rows:
+                    blocked = True
+                    self._cast_octant(ox, oy, z, distance + 1, start, left_slope,
+                                      rows, radius_sq, transform, visible)
+                    new_start = right_slope
+            if blocked:
+                break
+
+    # -- Queries ----------------------------------------------------------
+
+    def visible_cells(self, origin: Position, radius: float) -> List[Tuple[int, int, int]]:
+        """Get (x, y, z) of every cell visible from an origin, in row order."""
+        width = self.grid.width
+        return [
+            (cell % width, cell // width, origin.z)
+            for cell in sorted(self.compute(origin, radius))
+        ]
+
+    def can_see(self, origin: Position, target: Position, radius: float) -> bool:
+        """Check if a target cell is visible from an origin."""
+        if origin.z != target.z or not self.grid.is_valid_position(target.x, target.y, target.z):
+            return False
+        return target.y * self.grid.width + target.x in self.compute(origin, radius)
+
+    def who_can_see(
+        self,
+        target: Position,
+        observers: Iterable[Union["Entity", Position]],
+        radius: float
+    ) -> List[Union["Entity", Position]]:
+        """
+        Filter observers down to those that can see a target cell.
+
+        Casts once from the target and keeps the observers standing in
+        its visible set, so the cost is one shadowcast per target however
+        many observers are asked about. Sight lines are treated as
+        symmetric, which shadowcasting only approximates at the edges of
+        shadows.
+
+        Args:
+            target: Cell being watched (e.g. where an event happened)
+            observers: Entities (by their position) or positions
+            radius: Observers' sight radius
+
+        Returns:
+            The observers that can see the target, in input order
+        """
+        visible = self.compute(target, radius)
+        if not visible:
+            return []
+        width = self.grid.width
+        seen = []
+        for observer in observers:
+            pos = observer if isinstance(observer, Position) else observer.position
+            if (pos is not None and pos.z == target.z
+                    and 0 <= pos.x < width and pos.y * width + pos.x in visible):
+                seen.append(observer)
+        return seen
+
+    def witnesses(
+        self,
+        target: Position,
+        radius: float,
+        entity_type: Optional["EntityType"] = None,
+        exclude: Optional["Entity"] = None
+    ) -> List["Entity"]:
+        """
+        Get the grid's entities that can see a target cell.
+
+        Candidates come from the grid's spatial hash, so only entities
+        within the radius are considered.
+
+        Args:
+            target: Cell being watched
+            radius: Sight radius of the candidates
+            entity_type: Only consider entities of this type
+            exclude: Entity to leave out (e.g. the culprit)
+
+        Returns:
+            Entities that can see the target, nearest first
+        """
+        candidates = [
+            entity for entity in self.grid.get_entities_in_radius(target, radius, entity_type)
+            if entity is not exclude
+        ]
+        return self.who_can_see(target, candidates, radius)
@@ -4,14 +4,23 @@ TileGrid class - the main grid container and spatial query system.
 
 from __future__ import annotations
 from dataclasses import dataclass, field
-from typing import Optional, List, Iterator, Callable, Dict
-import math
+from typing import Optional, List, Iterator, Callable, Dict, ContextManager, TYPE_CHECKING
 
-from .position import Position
+from .position import Position, neighbor_offsets
 from .tile import Tile
 from .terrain import TerrainType
-from .entity import Entity
+from .entity import Entity, EntityType
 from .events import TileEventManager, TileEvent, TileEventType
+from .dense import DenseTileStore, is_packable
+from .spatial import SpatialHash, AffordanceIndex, disc_spans
+
+if TYPE_CHECKING:
+    from .cost_field import CostField
+    from .hierarchy import PathHierarchy
+    from .pathfinding import FlowField, FlowFieldCache
+    from .fov import FieldOfView
+    from .connectivity import ConnectivityMap
+    from .chunked import ChunkReader
 
 
 @dataclass
@@ -26,20 +35,38 @@ class TileGrid:
         height: Grid height (y-axis)
         depth: Grid depth (z-axis, number of levels)
         default_terrain: Default terrain for new tiles
+        dense: Keep cell state in packed arrays instead of Tile objects.
+            Tiles are materialized on access and can be released again
+            with compact().
     """
     width: int
     height: int
     depth: int = 1
     default_terrain: TerrainType = TerrainType.SOIL
+    dense: bool = False
 
     _tiles: Dict[tuple, Tile] = field(default_factory=dict, repr=False)
     _entities: Dict[str, Entity] = field(default_factory=dict, repr=False)
     _event_manager: TileEventManager = field(default_factory=TileEventManager, repr=False)
+    _dense: Optional[DenseTileStore] = field(default=None, repr=False)
+    _change_listeners: List[Callable[[int, int, int], None]] = field(default_factory=list, repr=False)
+    _cost_field: Optional["CostField"] = field(default=None, repr=False)
+    _path_hierarchy: Optional["PathHierarchy"] = field(default=None, repr=False)
+    _flow_fields: Optional["FlowFieldCache"] = field(default=None, repr=False)
+    _spatial: SpatialHash = field(default_factory=SpatialHash, repr=False)
+    _affordance_index: Optional[AffordanceIndex] = field(default=None, repr=False)
+    _fov: Optional["FieldOfView"] = field(default=None, repr=False)
+    _connectivity: Optional["ConnectivityMap"] = field(default=None, repr=False)
+    _chunks: Optional["ChunkReader"] = field(default=None, repr=False)
 
     def __post_init__(self):
         """Validate grid dimensions."""
         if self.width <= 0 or self.height <= 0 or self.depth <= 0:
             raise ValueError("Grid dimensions must be positive")
+        if self.dense and self._dense is None:
+            self._dense = DenseTileStore(
+                self.width, self.height, self.depth, self.default_terrain
+            )
 
     def _pos_key(self, x: int, y: int, z: int = 0) -> tuple:
         """Create position key for internal storage."""
@@ -63,18 +90,29 @@ class TileGrid:
         Returns:
             Tile at position, or None if out of bounds
         """
+        key = (x, y, z)
+        tile = self._tiles.get(key)
+        if tile is not None:
+            return tile
         if not self.is_valid_position(x, y, z):
             return None
-
-        key = self._pos_key(x, y, z)
-        if key not in self._tiles:
+        if self._chunks is not None and self._chunks.load_at(x, y, z):
+            # The cell's chunk was just decoded from a binary save
+            tile = self._tiles.get(key)
+            if tile is not None:
+                return tile
+
+        if self._dense is not None:
+            # Materialize from the packed arrays
+            tile = self._dense.materialize(self._dense.index(x, y, z))
+        else:
             # Create tile on demand with default terrain
-            position = Position(x, y, z)
-            self._tiles[key] = Tile(
-                position=position,
+            tile = Tile(
+                position=Position(x, y, z),
                 terrain_type=self.default_terrain
             )
-        return self._tiles[key]
+        self._tiles[key] = tile
+        return tile
 
     def get_tile_at_position(self, position: Position) -> Optional[Tile]:
         """Get tile at a Position object."""
@@ -94,10 +132,177 @@ class TileGrid:
         if not self.is_valid_position(pos.x, pos.y, pos.z):
             return False
 
+        self._load_chunk(pos.x, pos.y, pos.z)
         key = self._pos_key(pos.x, pos.y, pos.z)
         self._tiles[key] = tile
+        self.notify_tile_changed(pos.x, pos.y, pos.z)
         return True
 
+    def add_change_listener(self, listener: Callable[[int, int, int], None]) -> None:
+        """
+        Register a callback for direct cell changes.
+
+        Listeners are called with (x, y, z) whenever set_tile, fill_rect,
+        or notify_tile_changed changes a cell outside the event system.
+        """
+        if listener not in self._change_listeners:
+            self._change_listeners.append(listener)
+
+    def remove_change_listener(self, listener: Callable[[int, int, int], None]) -> bool:
+        """Remove a cell change listener."""
+        if listener in self._change_listeners:
+            self._change_listeners.remove(listener)
+            return True
+        return False
+
+    def notify_tile_changed(self, x: int, y: int, z: int = 0) -> None:
+        """
+        Tell derived caches that a cell changed.
+
+        Call this after mutating a tile's terrain, passability, or
+        environment directly instead of through a tile event.
+        """
+        for listener in self._change_listeners:
+            listener(x, y, z)
+
+    def get_cost_field(self) -> "CostField":
+        """
+        Get the grid's shared movement-cost lattice, building it on first use.
+
+        The field stays in sync through tile events and change listeners;
+        pass it to find_path for the fast indexed A*.
+        """
+        if self._cost_field is None:
+            from .cost_field import CostField
+            self._cost_field = CostField(self)
+            self._cost_field.attach()
+        return self._cost_field
+
+    def get_path_hierarchy(self, cluster_size: Optional[int] = None) -> "PathHierarchy":
+        """
+        Get the grid's cached cluster abstraction for hierarchical pathfinding.
+
+        Args:
+            cluster_size: Cluster edge length; a different size than the
+                cached hierarchy's replaces it
+
+        Returns:
+            The shared PathHierarchy, kept in sync by tile events
+        """
+        from .hierarchy import PathHierarchy, DEFAULT_CLUSTER_SIZE
+        hierarchy = self._path_hierarchy
+        if hierarchy is None or (cluster_size is not None and cluster_size != hierarchy.cluster_size):
+            if hierarchy is not None:
+                hierarchy.detach()
+            hierarchy = PathHierarchy(self, cluster_size or DEFAULT_CLUSTER_SIZE)
+            hierarchy.attach()
+            self._path_hierarchy = hierarchy
+        return hierarchy
+
+    def get_flow_fields(self) -> "FlowFieldCache":
+        """
+        Get the grid's flow field cache, building it on first use.
+
+        Cached fields are dropped when a tile event or change listener
+        touches a cell inside their reach.
+        """
+        if self._flow_fields is None:
+            from .pathfinding import FlowFieldCache
+            self._flow_fields = FlowFieldCache(self)
+            self._flow_fields.attach()
+        return self._flow_fields
+
+    def get_flow_field(
+        self,
+        goals: Position | List[Position],
+        entity: Optional[Entity] = None,
+        max_cost: float = float('inf')
+    ) -> "FlowField":
+        """
+        Get a shared Dijkstra map toward one or more goals.
+
+        Every agent heading for the same goals reads its next step from
+        the same field instead of running A* on its own.
+
+        Args:
+            goals: Goal position or positions
+            entity: Entity whose movement costs the field uses
+            max_cost: Maximum cost-to-goal to explore
+
+        Returns:
+            FlowField from the grid's LRU cache
+        """
+        if isinstance(goals, Position):
+            goals = [goals]
+        return self.get_flow_fields().get(goals, entity, max_cost)
+
+    def get_connectivity(self) -> "ConnectivityMap":
+        """
+        Get the grid's region labels, building them on first use.
+
+        Once built, find_path with a cost_field rejects unreachable
+        queries by comparing labels before searching.
+        """
+        if self._connectivity is None:
+            from .connectivity import ConnectivityMap
+            self._connectivity = ConnectivityMap(self)
+            self._connectivity.attach()
+        return self._connectivity
+
+    def get_terrain_at(self, x: int, y: int, z: int = 0) -> Optional[TerrainType]:
+        """
+        Get the terrain type at a position without materializing a tile.
+
+        Returns:
+            Terrain type, or None if out of bounds
+        """
+        if not self.is_valid_position(x, y, z):
+            return None
+
+        self._load_chunk(x, y, z)
+        tile = self._tiles.get(self._pos_key(x, y, z))
+        if tile is not None:
+            return tile.terrain_type
+        if self._dense is not None:
+            return self._dense.terrain_at(self._dense.index(x, y, z))
+        return self.default_terrain
+
+    def compact(self) -> int:
+        """
+        Release materialized tiles back into the dense arrays.
+
+        Tiles whose whole state fits in the arrays are dropped; tiles with
+        entities, modifiers, features, or other unpacked state stay
+        materialized. References to released tiles held by callers are
+        detached from the grid afterwards. No-op on sparse grids.
+
+        Returns:
+            Number of tiles released
+        """
+        if self._dense is None:
+            return 0
+
+        released = 0
+        for key, tile in list(self._tiles.items()):
+            index = self._dense.index(*key)
+            self._dense.store(index, tile)
+            if is_packable(tile):
+                del self._tiles[key]
+                released += 1
+        return released
+
+    def memory_usage(self) -> dict:
+        """
+        Estimate storage held by the grid.
+
+        Returns:
+            Dictionary with materialized tile count and packed array bytes
+        """
+        return {
+            "materialized_tiles": len(self._tiles),
+            "dense_bytes": self._dense.memory_usage() if self._dense is not None else 0,
+        }
+
     def get_adjacent(self, tile: Tile, include_diagonals: bool = True) -> List[Tile]:
         """
         Get tiles adjacent to the given tile.
@@ -111,9 +316,12 @@ class TileGrid:
         """
         adjacent = []
         pos = tile.position
+        x, y, z = pos.x, pos.y, pos.z
+        get_tile = self.get_tile
 
-        for adj_pos in pos.get_adjacent_positions(include_diagonals=include_diagonals):
-            adj_tile = self.get_tile(adj_pos.x, adj_pos.y, adj_pos.z)
+        # Step through the shared offsets rather than building Positions
+        for dx, dy in neighbor_offsets(include_diagonals):
+            adj_tile = get_tile(x + dx, y + dy, z)
             if adj_tile:
                 adjacent.append(adj_tile)
 
@@ -142,26 +350,24 @@ class TileGrid:
             center_pos = center
 
         tiles = []
-        int_radius = int(math.ceil(radius))
-
-        for dx in range(-int_radius, int_radius + 1):
-            for dy in range(-int_radius, int_radius + 1):
-                x = center_pos.x + dx
-                y = center_pos.y + dy
-                z = center_pos.z
-
-                if not self.is_valid_position(x, y, z):
+        cx, cy, z = center_pos.x, center_pos.y, center_pos.z
+        if not 0 <= z < self.depth:
+            return tiles
+        stored = self._tiles
+        get_tile = self.get_tile
+
+        # The disc's column spans are shared with the spatial hash and
+        # cached per radius, so there is no per-cell distance test
+        for dx, span in disc_spans(radius):
+            x = cx + dx
+            if not 0 <= x < self.width:
+                continue
+            for y in range(max(0, cy - span), min(self.height - 1, cy + span) + 1):
+                if not include_center and dx == 0 and y == cy:
                     continue
-
-                pos = Position(x, y, z)
-                distance = center_pos.distance_to(pos, include_z=False)
-
-                if distance <= radius:
-                    if not include_center and pos == center_pos:
-                        continue
-                    tile = self.get_tile(x, y, z)
-                    if tile:
-                        tiles.append(tile)
+                tile = stored.get((x, y, z))
+                # Only cells not yet materialized go through get_tile
+                tiles.append(tile if tile is not None else get_tile(x, y, z))
 
         return tiles
 
@@ -218,6 +424,20 @@ class TileGrid:
 
         return tiles
 
+    def get_field_of_view(self) -> "FieldOfView":
+        """
+        Get the grid's shadowcasting engine, building it on first use.
+
+        Visible sets are cached per (origin, radius) and dropped by tile
+        events that change a visible cell's opacity; call
+        notify_tile_changed after mutating a tile directly.
+        """
+        if self._fov is None:
+            from .fov import FieldOfView
+            self._fov = FieldOfView(self)
+            self._fov.attach()
+        return self._fov
+
     def has_line_of_sight(self, from_tile: Tile, to_tile: Tile) -> bool:
         """
         Check if there is unobstructed line of sight between tiles.
@@ -241,7 +461,8 @@ class TileGrid:
         start: Tile | Position,
         end: Tile | Position,
         entity: Optional[Entity] = None,
-        max_cost: float = float('inf')
+        max_cost: float = float('inf'),
+        cost_field: Optional["CostField"] = None
     ) -> Optional[List[Tile]]:
         """
         Find path between two tiles using A* algorithm.
@@ -251,12 +472,13 @@ class TileGrid:
             end: Ending tile or position
             entity: Entity that will traverse (affects movement costs)
             max_cost: Maximum path cost allowed
+            cost_field: Precomputed cost lattice (see get_cost_field)
 
         Returns:
             List of tiles forming path, or None if no path exists
         """
         from .pathfinding import find_path as pathfind
-        return pathfind(self, start, end, entity, max_cost)
+        return pathfind(self, start, end, entity, max_cost, cost_field)
 
     def place_entity(self, entity: Entity, position: Position) -> bool:
         """
@@ -288,9 +510,12 @@ class TileGrid:
         # Place on new tile
         if tile.add_entity(entity):
             self._entities[entity.id] = entity
+            self._spatial.insert(entity)
             self._emit_event(TileEventType.ENTERED, tile, entity)
             return True
 
+        if entity.id in self._entities:
+            self._spatial.move(entity)
         return False
 
     def remove_entity(self, entity: Entity) -> bool:
@@ -313,6 +538,7 @@ class TileGrid:
                 self._emit_event(TileEventType.ENTITY_REMOVED, tile, entity)
 
         del self._entities[entity.id]
+        self._spatial.remove(entity)
         return True
 
     def move_entity(
@@ -363,8 +589,10 @@ class TileGrid:
             # Placement failed — restore entity to old tile
             if from_tile:
                 from_tile.add_entity(entity)
+            self._spatial.move(entity)
             return False
 
+        self._spatial.move(entity)
         self._emit_event(TileEventType.ENTERED, to_tile, entity)
         return True
 
@@ -383,6 +611,75 @@ class TileGrid:
         """Get all entities in the grid."""
         return list(self._entities.values())
 
+    def get_entities_in_radius(
+        self,
+        center: Position,
+        radius: float,
+        entity_type: Optional[EntityType] = None
+    ) -> List[Entity]:
+        """
+        Get entities within a radius of a position, on the same z-level.
+
+        Uses the spatial hash, so only nearby buckets are visited.
+
+        Args:
+            center: Center position
+            radius: Planar radius to search
+            entity_type: Only return entities of this type
+
+        Returns:
+            Entities sorted by distance
+        """
+        return self._spatial.within(center, radius, entity_type)
+
+    def get_entities_in_rect(
+        self,
+        x1: int, y1: int,
+        x2: int, y2: int,
+        z: int = 0,
+        entity_type: Optional[EntityType] = None
+    ) -> List[Entity]:
+        """Get entities inside a rectangle (corners inclusive)."""
+        return self._spatial.in_rect(x1, y1, x2, y2, z, entity_type)
+
+    def find_nearest_entity(
+        self,
+        center: Position,
+        entity_type: Optional[EntityType] = None,
+        max_radius: float = float('inf'),
+        exclude: Optional[Entity] = None
+    ) -> Optional[Entity]:
+        """
+        Find the closest entity to a position on the same z-level.
+
+        Args:
+            center: Position to search from
+            entity_type: Only consider entities of this type
+            max_radius: Ignore entities farther than this
+            exclude: Entity to skip (e.g. the one searching)
+
+        Returns:
+            Nearest matching entity, or None
+        """
+        return self._spatial.nearest(
+            center, entity_type, max_radius, exclude.id if exclude else None
+        )
+
+    def emit_event(
+        self,
+        event_type: TileEventType,
+        tile: Tile,
+        cause: Optional[Entity] = None,
+        data: Optional[dict] = None
+    ) -> None:
+        """
+        Emit a tile event to subscribers.
+
+        Systems that change a tile (flooding, damage, modifiers) should
+        announce it here so derived caches stay in sync.
+        """
+        self._emit_event(event_type, tile, cause, data)
+
     def _emit_event(
         self,
         event_type: TileEventType,
@@ -407,6 +704,14 @@ class TileGrid:
         """Subscribe to tile events."""
         self._event_manager.subscribe(event_type, handler)
 
+    def subscribe_to_event_batch(
+        self,
+        event_type: TileEventType,
+        handler: Callable[[List[TileEvent]], None]
+    ) -> None:
+        """Subscribe to tile events with a handler that takes a list of events."""
+        self._event_manager.subscribe_batch(event_type, handler)
+
     def unsubscribe_from_event(
         self,
         event_type: TileEventType,
@@ -415,6 +720,21 @@ class TileGrid:
         """Unsubscribe from tile events."""
         return self._event_manager.unsubscribe(event_type, handler)
 
+    def batch_events(self) -> ContextManager[TileEventManager]:
+        """
+        Hold tile events emitted inside a block and dispatch them together.
+
+        Use around a tick's worth of changes (a flood spreading, a fire
+        burning through a row). Repeated events for the same cell, type,
+        and cause are coalesced to the latest one.
+
+        Example:
+            with grid.batch_events():
+                for tile in flooded:
+                    grid.emit_event(TileEventType.FLOODED, tile)
+        """
+        return self._event_manager.batch()
+
     def all_tiles(self) -> Iterator[Tile]:
         """Iterate over all tiles in the grid."""
         for z in range(self.depth):
@@ -452,9 +772,49 @@ class TileGrid:
         return self.find_tiles(lambda t: t.terrain_type == terrain_type)
 
     def find_tiles_with_affordance(self, affordance: str) -> List[Tile]:
-        """Find all tiles with a specific affordance."""
+        """
+        Find all tiles with a specific affordance.
+
+        Scans live tiles, so changes made through a tile's own API (its
+        modifiers, entities or environment) are always seen. For repeated
+        lookups in a region, find_affordance_in_rect reads the index.
+        """
         return self.find_tiles(lambda t: affordance in t.get_affordances())
 
+    def get_affordance_index(self) -> AffordanceIndex:
+        """
+        Get the grid's affordance-to-cell index, building it on first use.
+
+        The index follows tile events and change listeners; call
+        notify_tile_changed after mutating a tile directly.
+        """
+        if self._affordance_index is None:
+            self._affordance_index = AffordanceIndex(self)
+            self._affordance_index.attach()
+        return self._affordance_index
+
+    def find_affordance_in_rect(
+        self,
+        affordance: str,
+        x1: int, y1: int,
+        x2: int, y2: int,
+        z: int = 0
+    ) -> List[Tile]:
+        """
+        Find tiles with an affordance inside a rectangle using the index.
+
+        Args:
+            affordance: Affordance to look for
+            x1, y1: One corner
+            x2, y2: Opposite corner (inclusive)
+            z: Z level
+
+        Returns:
+            Matching tiles in row order
+        """
+        cells = self.get_affordance_index().cells_in_rect(affordance, x1, y1, x2, y2, z)
+        return [self.get_tile(*key) for key in cells]
+
     def get_passable_tiles(self) -> List[Tile]:
         """Get all passable tiles."""
         return self.find_tiles(lambda t: t.is_passable())
@@ -482,6 +842,14 @@ class TileGrid:
         for x in range(min(x1, x2), max(x1, x2) + 1):
             for y in range(min(y1, y2), max(y1, y2) + 1):
                 if self.is_valid_position(x, y, z):
+                    self._load_chunk(x, y, z)
+                    key = self._pos_key(x, y, z)
+                    if self._dense is not None and key not in self._tiles:
+                        # Write straight into the arrays, no tile needed
+                        self._dense.set_terrain(self._dense.index(x, y, z), terrain_type)
+                        self.notify_tile_changed(x, y, z)
+                        count += 1
+                        continue
                     tile = self.get_tile(x, y, z)
                     if tile:
                         tile.terrain_type = terrain_type
@@ -489,23 +857,93 @@ class TileGrid:
                         defaults = terrain_type.get_default_properties()
                         tile.passable = defaults.get("passable", True)
                         tile.opaque = defaults.get("opaque", False)
+                        self.notify_tile_changed(x, y, z)
                         count += 1
         return count
 
+    def _changed_tiles(self) -> Iterator[tuple]:
+        """Iterate (key, tile) for every cell that differs from a fresh tile."""
+        self.load_all_chunks()
+        yield from self._tiles.items()
+        if self._dense is None:
+            return
+
+        for index in range(len(self._dense)):
+            if self._dense.is_default(index, self.default_terrain):
+                continue
+            key = self._dense.coords(index)
+            if key not in self._tiles:
+                yield key, self._dense.materialize(index)
+
     def serialize(self) -> dict:
         """Serialize grid to dictionary."""
-        return {
+        data = {
             "dimensions": [self.width, self.height, self.depth],
             "default_terrain": self.default_terrain.name,
             "tiles": {
                 f"{k[0]},{k[1]},{k[2]}": v.serialize()
-                for k, v in self._tiles.items()
+                for k, v in self._changed_tiles()
             },
             "entities": {
                 eid: e.serialize()
                 for eid, e in self._entities.items()
             }
         }
+        if self.dense:
+            data["dense"] = True
+        return data
+
+    def save_binary(self, path: str, chunk_size: Optional[int] = None) -> int:
+        """
+        Save the grid to a chunked binary file.
+
+        Much smaller and faster than serialize() for large maps; see
+        grid.chunked for the format.
+
+        Args:
+            path: Destination file path
+            chunk_size: Chunk edge length in tiles
+
+        Returns:
+            Number of non-default chunks written
+        """
+        from .chunked import save_grid, DEFAULT_CHUNK_SIZE
+        return save_grid(self, path, chunk_size or DEFAULT_CHUNK_SIZE)
+
+    @classmethod
+    def load_binary(cls, path: str, lazy: bool = True) -> "TileGrid":
+        """
+        Load a grid saved with save_binary.
+
+        Args:
+            path: File to read
+            lazy: Memory-map the file and decode each chunk the first
+                time one of its cells is touched
+
+        Returns:
+            The loaded grid
+        """
+        from .chunked import load_grid
+        return load_grid(path, lazy)
+
+    def load_all_chunks(self) -> int:
+        """
+        Decode every chunk still pending from a lazy binary load.
+
+        Called before whole-grid passes (cost fields, field of view,
+        serialization) that read the storage directly.
+
+        Returns:
+            Number of chunks decoded
+        """
+        if self._chunks is None:
+            return 0
+        return self._chunks.load_all()
+
+    def _load_chunk(self, x: int, y: int, z: int) -> None:
+        """Decode the chunk holding a cell before it is read or written directly."""
+        if self._chunks is not None:
+            self._chunks.load_at(x, y, z)
 
     @classmethod
     def from_dict(cls, data: dict) -> "TileGrid":
@@ -515,20 +953,24 @@ class TileGrid:
             width=dims[0],
             height=dims[1],
             depth=dims[2] if len(dims) > 2 else 1,
-            default_terrain=TerrainType[data.get("default_terrain", "SOIL")]
+            default_terrain=TerrainType[data.get("default_terrain", "SOIL")],
+            dense=data.get("dense", False)
         )
 
         # Load entities first
         for entity_data in data.get("entities", {}).values():
             entity = Entity.from_dict(entity_data)
             grid._entities[entity.id] = entity
+            grid._spatial.insert(entity)
 
         # Load tiles with entity references
         for pos_key, tile_data in data.get("tiles", {}).items():
             tile = Tile.from_dict(tile_data, grid._entities)
             grid._tiles[tuple(map(int, pos_key.split(",")))] = tile
 
+        grid.compact()
         return grid
 
     def __repr__(self):
-        return f"TileGrid({self.width}x{self.height}x{self.depth})"
+        mode = ", dense" if self.dense else ""
+        return f"TileGrid({self.width}x{self.height}x{self.depth}{mode})"
@@ -0,0 +1,577 @@
+"""
+Hierarchical pathfinding (HPA*) over a TileGrid.
+
+The grid is partitioned into square clusters. Wherever two neighboring
+clusters share a run of enterable border cells, one or two transitions
+become abstract nodes; nodes inside a cluster are linked by their
+cluster-bounded shortest path costs. Long queries search this small
+abstract graph and only refine the chosen edges into tiles. Cluster links
+are computed the first time a search reaches the cluster, and refined
+segments are cached, both until the cluster changes.
+
+Tile events and grid change listeners mark clusters dirty, and only the
+dirty clusters (plus the borders they share) are rebuilt.
+"""
+
+from __future__ import annotations
+from typing import Optional, List, Dict, Set, Tuple, Iterator, TYPE_CHECKING
+import heapq
+
+from .position import Position
+from .events import TileEvent
+from .cost_field import COST_EVENTS, INF, entity_profile
+from .pathfinding import plane_offsets, find_path
+
+if TYPE_CHECKING:
+    from .grid import TileGrid
+    from .tile import Tile
+    from .entity import Entity
+
+
+# Default cluster edge length in tiles
+DEFAULT_CLUSTER_SIZE = 16
+
+# Entrance runs at least this long get a transition at each end
+WIDE_ENTRANCE = 6
+
+# Sentinel abstract node for the query goal
+_GOAL = -1
+
+Cluster = Tuple[int, int, int]
+
+
+class _AbstractGraph:
+    """Abstract graph for one entity cost profile."""
+
+    def __init__(self):
+        # (cluster_a, cluster_b) -> [(cell_a, cell_b)]
+        self.borders: Dict[Tuple[Cluster, Cluster], List[Tuple[int, int]]] = {}
+        # node -> {node across a border: step cost}
+        self.cross: Dict[int, Dict[int, float]] = {}
+        # cluster -> node -> {node in same cluster: path cost}, built lazily
+        self.intra: Dict[Cluster, Dict[int, Dict[int, float]]] = {}
+        # cluster -> (from, to) -> refined cell indices, built lazily
+        self.segments: Dict[Cluster, Dict[Tuple[int, int], List[int]]] = {}
+        self.dirty: Set[Cluster] = set()
+        self.built = False
+
+
+class PathHierarchy:
+    """
+    Cached cluster abstraction for hierarchical pathfinding.
+
+    Attributes:
+        grid: The grid being abstracted
+        cluster_size: Cluster edge length in tiles
+    """
+
+    def __init__(self, grid: "TileGrid", cluster_size: int = DEFAULT_CLUSTER_SIZE):
+        if cluster_size < 2:
+            raise ValueError(f"Cluster size must be at least 2, got {cluster_size}")
+        self.grid = grid
+        self.field = grid.get_cost_field()
+        self.cluster_size = cluster_size
+        self.columns = -(-grid.width // cluster_size)
+        self.rows = -(-grid.height // cluster_size)
+        self._graphs: Dict[Tuple, _AbstractGraph] = {}
+        self._steps = plane_offsets(self.field.row)
+        self._attached = False
+
+    # -- Cluster geometry -------------------------------------------------
+
+    def cluster_of(self, x: int, y: int, z: int = 0) -> Cluster:
+        """Get the cluster containing a cell."""
+        return (x // self.cluster_size, y // self.cluster_size, z)
+
+    def cluster_bounds(self, cluster: Cluster) -> Tuple[int, int, int, int]:
+        """Get (x0, y0, x1, y1) bounds of a cluster, upper bounds exclusive."""
+        cx, cy, _ = cluster
+        size = self.cluster_size
+        return (cx * size, cy * size,
+                min((cx + 1) * size, self.grid.width),
+                min((cy + 1) * size, self.grid.height))
+
+    def _clusters(self) -> Iterator[Cluster]:
+        for z in range(self.grid.depth):
+            for cy in range(self.rows):
+                for cx in range(self.columns):
+                    yield (cx, cy, z)
+
+    def _neighbors(self, cluster: Cluster) -> List[Cluster]:
+        cx, cy, z = cluster
+        return [
+            (nx, ny, z) for nx, ny in ((cx - 1, cy), (cx + 1, cy), (cx, cy - 1), (cx, cy + 1))
+            if 0 <= nx < self.columns and 0 <= ny < self.rows
+        ]
+
+    def _node_cluster(self, index: int) -> Cluster:
+        x, y, z = self.field.coords(index)
+        return self.cluster_of(x, y, z)
+
+    # -- Invalidation -----------------------------------------------------
+
+    def attach(self) -> None:
+        """Subscribe to the grid's cost-changing tile events and cell changes."""
+        if self._attached:
+            return
+        for event_type in COST_EVENTS:
+            self.grid.subscribe_to_event(event_type, self.on_tile_event)
+        self.grid.add_change_listener(self.invalidate)
+        self._attached = True
+
+    def detach(self) -> None:
+        """Stop listening to the grid."""
+        if not self._attached:
+            return
+        for event_type in COST_EVENTS:
+            self.grid.unsubscribe_from_event(event_type, self.on_tile_event)
+        self.grid.remove_change_listener(self.invalidate)
+        self._attached = False
+
+    def on_tile_event(self, event: TileEvent) -> None:
+        """Mark the cluster an event touched as dirty."""
+        pos = event.tile.position
+        self.invalidate(pos.x, pos.y, pos.z)
+
+    def invalidate(self, x: int, y: int, z: int = 0) -> None:
+        """Mark the cluster containing a cell for rebuilding."""
+        cluster = self.cluster_of(x, y, z)
+        for graph in self._graphs.values():
+            graph.dirty.add(cluster)
+
+    def dirty_clusters(self, entity: Optional["Entity"] = None) -> Set[Cluster]:
+        """Get clusters waiting to be rebuilt for an entity's profile."""
+        graph = self._graphs.get(entity_profile(entity))
+        return set(graph.dirty) if graph else set()
+
+    # -- Abstraction building ---------------------------------------------
+
+    def _graph(self, entity: Optional["Entity"]) -> _AbstractGraph:
+        """Get the up-to-date abstract graph for an entity's cost profile."""
+        layers = self.field.layers_for(entity)
+        profile = entity_profile(entity)
+        graph = self._graphs.get(profile)
+        if graph is None:
+            graph = _AbstractGraph()
+            self._graphs[profile] = graph
+
+        if not graph.built:
+            for cluster in self._clusters():
+                for other in self._neighbors(cluster):
+                    if other > cluster:
+                        self._build_border(graph, layers, cluster, other)
+            graph.built = True
+            graph.dirty.clear()
+        elif graph.dirty:
+            self._rebuild(graph, layers)
+        return graph
+
+    def _rebuild(self, graph: _AbstractGraph, layers: tuple) -> None:
+        """Rebuild dirty clusters, their borders, and their neighbors' links."""
+        affected: Set[Cluster] = set()
+        borders: Set[Tuple[Cluster, Cluster]] = set()
+        for cluster in graph.dirty:
+            affected.add(cluster)
+            for other in self._neighbors(cluster):
+                affected.add(other)
+                borders.add((min(cluster, other), max(cluster, other)))
+
+        for a, b in borders:
+            self._build_border(graph, layers, a, b)
+        for cluster in affected:
+            graph.intra.pop(cluster, None)
+            graph.segments.pop(cluster, None)
+        graph.dirty.clear()
+
+    def _step(self, layers: tuple, from_index: int, to_index: int, weight: float = 1.0) -> float:
+        """Cost of one step between adjacent cells under a profile."""
+        layer, enter = layers
+        cost = enter[to_index]
+        if cost == INF:
+            return INF
+        elevation = self.field.elevation
+        if elevation[to_index] != elevation[from_index]:
+            cost += abs(elevation[to_index] - elevation[from_index]) * 0.5 * layer[to_index]
+        return cost * weight
+
+    def _build_border(self, graph: _AbstractGraph, layers: tuple,
+                      a: Cluster, b: Cluster) -> None:
+        """Find the transitions on the border between two clusters."""
+        for cell_a, cell_b in graph.borders.pop((a, b), []):
+            graph.cross.get(cell_a, {}).pop(cell_b, None)
+            graph.cross.get(cell_b, {}).pop(cell_a, None)
+
+        field = self.field
+        enter = layers[1]
+        ax0, ay0, ax1, ay1 = self.cluster_bounds(a)
+        z = a[2]
+        if a[0] != b[0]:
+            # Vertical border: a is left of b
+            pairs = [(field.index(ax1 - 1, y, z), field.index(ax1, y, z)) for y in range(ay0, ay1)]
+        else:
+            # Horizontal border: a is above b
+            pairs = [(field.index(x, ay1 - 1, z), field.index(x, ay1, z)) for x in range(ax0, ax1)]
+
+        transitions: List[Tuple[int, int]] = []
+        run: List[Tuple[int, int]] = []
+        for pair in pairs + [None]:
+            if pair is not None and enter[pair[0]] != INF and enter[pair[1]] != INF:
+                run.append(pair)
+                continue
+            if run:
+                if len(run) >= WIDE_ENTRANCE:
+                    transitions.extend((run[0], run[-1]))
+                else:
+                    transitions.append(run[len(run) // 2])
+                run = []
+
+        for cell_a, cell_b in transitions:
+            graph.cross.setdefault(cell_a, {})[cell_b] = self._step(layers, cell_a, cell_b)
+            graph.cross.setdefault(cell_b, {})[cell_a] = self._step(layers, cell_b, cell_a)
+        graph.borders[(a, b)] = transitions
+
+    def _cluster_nodes(self, graph: _AbstractGraph, cluster: Cluster) -> Set[int]:
+        """Abstract nodes lying inside a cluster."""
+        nodes = set()
+        for other in self._neighbors(cluster):
+            key = (min(cluster, other), max(cluster, other))
+            for cell_a, cell_b in graph.borders.get(key, []):
+                nodes.add(cell_a if key[0] == cluster else cell_b)
+        return nodes
+
+    def _intra_links(self, graph: _AbstractGraph, layers: tuple,
+                     cluster: Cluster) -> Dict[int, Dict[int, float]]:
+        """Get a cluster's node-to-node costs, linking every pair on first use."""
+        links = graph.intra.get(cluster)
+        if links is not None:
+            return links
+
+        nodes = self._cluster_nodes(graph, cluster)
+        bounds = self.cluster_bounds(cluster)
+        links = {}
+        for node in nodes:
+            dist, _ = self._search(layers, node, bounds)
+            links[node] = {
+                other: dist[other] for other in nodes
+                if other != node and other in dist
+            }
+        graph.intra[cluster] = links
+        return links
+
+    def _search(self, layers: tuple, source: int, bounds: Tuple[int, int, int, int],
+                goal: Optional[int] = None, reverse: bool = False
+                ) -> Tuple[Dict[int, float], Dict[int, int]]:
+        """
+        Dijkstra from a cell, confined to a rectangle.
+
+        With reverse=True, distances are costs of reaching ``source`` from
+        each cell rather than the other way round.
+
+        Returns:
+            (distances, came_from) keyed by cell index
+        """
+        field = self.field
+        x0, y0, x1, y1 = bounds
+        row = field.row
+        plane = field.plane
+        layer, enter = layers
+        elevation = field.elevation
+        dist = {source: 0.0}
+        came_from: Dict[int, int] = {}
+        done: Set[int] = set()
+        heap = [(0.0, source)]
+        heappush = heapq.heappush
+        heappop = heapq.heappop
+
+        while heap:
+            d, current = heappop(heap)
+            if current in done:
+                continue
+            done.add(current)
+            if current == goal:
+                break
+
+            cy, cx = divmod(current % plane, row)
+            for dx, dy, delta, weight in self._steps:
+                nx = cx + dx - 1
+                ny = cy + dy - 1
+                if nx < x0 or nx >= x1 or ny < y0 or ny >= y1:
+                    continue
+                neighbor = current + delta
+                if neighbor in done:
+                    continue
+                # Forward searches step into the neighbor, reverse ones out of it
+                if reverse:
+                    if enter[neighbor] == INF:
+                        continue
+                    into, out = current, neighbor
+                else:
+                    into, out = neighbor, current
+                cost = enter[into]
+                if cost == INF:
+                    continue
+                if elevation[into] != elevation[out]:
+                    cost += abs(elevation[into] - elevation[out]) * 0.5 * layer[into]
+                nd = d + cost * weight
+                if nd < dist.get(neighbor, INF):
+                    dist[neighbor] = nd
+                    came_from[neighbor] = current
+                    heappush(heap, (nd, neighbor))
+
+        return dist, came_from
+
+    def abstract_size(self, entity: Optional["Entity"] = None) -> Tuple[int, int]:
+        """
+        Get the size of the fully linked abstract graph for an entity's profile.
+
+        Links every cluster that has not been reached by a search yet.
+
+        Returns:
+            (node count, directed edge count)
+        """
+        graph = self._graph(entity)
+        layers = self.field.layers_for(entity)
+        edges = sum(len(links) for links in graph.cross.values())
+        nodes = set(graph.cross)
+        for cluster in self._clusters():
+            links = self._intra_links(graph, layers, cluster)
+            nodes.update(links)
+            edges += sum(len(targets) for targets in links.values())
+        return len(nodes), edges
+
+    # -- Queries ------------------------------------------------------------
+
+    def find_path(
+        self,
+        start: "Tile" | Position,
+        end: "Tile" | Position,
+        entity: Optional["Entity"] = None
+    ) -> Optional[List["Tile"]]:
+        """
+        Find a path using the cluster abstraction.
+
+        Short queries (start and end within one cluster of each other) and
+        queries the abstraction cannot answer fall back to the exact
+        indexed A*, so a path is found whenever one exists.
+
+        Returns:
+            List of tiles forming path, or None if no path exists
+        """
+        tiles = self.iter_path(start, end, entity)
+        if tiles is None:
+            return None
+        return list(tiles)
+
+    def iter_path(
+        self,
+        start: "Tile" | Position,
+        end: "Tile" | Position,
+        entity: Optional["Entity"] = None
+    ) -> Optional[Iterator["Tile"]]:
+        """
+        Plan a path and refine it lazily.
+
+        The abstract route is found up front; each leg is expanded into
+        tiles only as the iterator reaches it.
+
+        Returns:
+            Iterator over the path's tiles, or None if no path exists
+        """
+        grid = self.grid
+        start_pos = start if isinstance(start, Position) else start.position
+        end_pos = end if isinstance(end, Position) else end.position
+        start_tile = grid.get_tile_at_position(start_pos)
+        end_tile = grid.get_tile_at_position(end_pos)
+        if not start_tile or not end_tile or not end_tile.is_passable():
+            return None
+        if start_pos.z != end_pos.z:
+            return None
+        connectivity = grid._connectivity
+        if connectivity is not None and not connectivity.is_reachable(start_pos, end_pos):
+            return None
+
+        start_cluster = self.cluster_of(start_pos.x, start_pos.y, start_pos.z)
+        end_cluster = self.cluster_of(end_pos.x, end_pos.y, end_pos.z)
+        if (abs(start_cluster[0] - end_cluster[0]) <= 1
+                and abs(start_cluster[1] - end_cluster[1]) <= 1):
+            return self._exact(start_tile, end_tile, entity)
+
+        graph = self._graph(entity)
+        layers = self.field.layers_for(entity)
+        route = self._abstract_search(
+            graph, layers, start_pos, end_pos, start_cluster, end_cluster,
+            self.field.min_enter_cost(entity),
+        )
+        if route is None:
+            return self._exact(start_tile, end_tile, entity)
+        start_index = self.field.index(start_pos.x, start_pos.y, start_pos.z)
+        return self._refine(graph, layers, start_index, route, start_pos.z)
+
+    def _exact(self, start_tile: "Tile", end_tile: "Tile",
+               entity: Optional["Entity"]) -> Optional[Iterator["Tile"]]:
+        path = find_path(self.grid, start_tile, end_tile, entity, cost_field=self.field)
+        return iter(path) if path is not None else None
+
+    def _abstract_search(self, graph: _AbstractGraph, layers: tuple,
+                         start_pos: Position, end_pos: Position,
+                         start_cluster: Cluster, end_cluster: Cluster,
+                         scale: float = 1.0) -> Optional[list]:
+        """
+        A* over the abstract graph with start and end linked in.
+
+        The octile heuristic is scaled by the cheapest step in the layer
+        (CostField.min_enter_cost), so it never overestimates.
+
+        Returns:
+            List of (node, leg) pairs from start to goal, where leg is the
+            data needed to refine the step into that node
+        """
+        field = self.field
+        start = field.index(start_pos.x, start_pos.y, start_pos.z)
+        end = field.index(end_pos.x, end_pos.y, end_pos.z)
+
+        start_dist, start_came = self._search(
+            layers, start, self.cluster_bounds(start_cluster)
+        )
+        end_dist, end_came = self._search(
+            layers, end, self.cluster_bounds(end_cluster), reverse=True
+        )
+        start_links = {
+            node: start_dist[node]
+            for node in self._cluster_nodes(graph, start_cluster) if node in start_dist
+        }
+        end_links = {
+            node: end_dist[node]
+            for node in self._cluster_nodes(graph, end_cluster) if node in end_dist
+        }
+        if not start_links or not end_links:
+            return None
+
+        gx, gy = end_pos.x, end_pos.y
+
+        def heuristic(node: int) -> float:
+            x, y, _ = field.coords(node)
+            dx = abs(x - gx)
+            dy = abs(y - gy)
+            return scale * (dx + 0.414 * dy if dx > dy else dy + 0.414 * dx)
+
+        g_score = {start: 0.0}
+        came_from: Dict[int, Tuple[int, tuple]] = {}
+        closed: Set[int] = set()
+        open_set = [(heuristic(start), start)]
+
+        while open_set:
+            _, node = heapq.heappop(open_set)
+            if node in closed:
+                continue
+            if node == _GOAL:
+                route = []
+                while node != start:
+                    prev, leg = came_from[node]
+                    route.append((node, leg))
+                    node = prev
+                route.reverse()
+                return route
+            closed.add(node)
+
+            edges: List[Tuple[int, float, tuple]] = []
+            if node == start:
+                edges.extend((n, c, ("start", start_came)) for n, c in start_links.items())
+            else:
+                cluster = self._node_cluster(node)
+                for n, c in self._intra_links(graph, layers, cluster).get(node, {}).items():
+                    edges.append((n, c, ("intra", cluster)))
+            for n, c in graph.cross.get(node, {}).items():
+                edges.append((n, c, ("cross",)))
+            if node in end_links:
+                edges.append((_GOAL, end_links[node], ("end", end_came)))
+
+            for neighbor, cost, leg in edges:
+                if cost == INF or neighbor in closed:
+                    continue
+                tentative = g_score[node] + cost
+                if tentative < g_score.get(neighbor, INF):
+                    g_score[neighbor] = tentative
+                    came_from[neighbor] = (node, leg)
+                    h = 0.0 if neighbor == _GOAL else heuristic(neighbor)
+                    heapq.heappush(open_set, (tentative + h, neighbor))
+
+        return None
+
+    def _refine(self, graph: _AbstractGraph, layers: tuple, start: int,
+                route: list, z: int) -> Iterator["Tile"]:
+        """Expand an abstract route into tiles, one leg at a time."""
+        field = self.field
+        grid = self.grid
+        current = start
+
+        def tile(index: int) -> "Tile":
+            x, y, _ = field.coords(index)
+            return grid.get_tile(x, y, z)
+
+        yield tile(start)
+        for node, leg in route:
+            kind = leg[0]
+            if kind == "start":
+                came = leg[1]
+                cells = [node]
+                while cells[-1] in came:
+                    cells.append(came[cells[-1]])
+                cells.reverse()
+            elif kind == "cross":
+                cells = [current, node]
+            elif kind == "intra":
+                cells = self._segment(graph, layers, current, node, leg[1])
+            else:
+                came = leg[1]
+                cells = [current]
+                while cells[-1] in came:
+                    cells.append(came[cells[-1]])
+
+            # Each leg starts on the cell the previous one ended on
+            for index in cells[1:]:
+                yield tile(index)
+            current = cells[-1]
+
+    def _segment(self, graph: _AbstractGraph, layers: tuple,
+                 source: int, target: int, cluster: Cluster) -> List[int]:
+        """Get the refined cells of an intra-cluster edge, caching the result."""
+        segments = graph.segments.setdefault(cluster, {})
+        key = (source, target)
+        cells = segments.get(key)
+        if cells is None:
+            _, came = self._search(layers, source, self.cluster_bounds(cluster), goal=target)
+            cells = [target]
+            while cells[-1] != source:
+                cells.append(came[cells[-1]])
+            cells.reverse()
+            segments[key] = cells
+        return cells
+
+
+def find_path_hierarchical(
+    grid: "TileGrid",
+    start: "Tile" | Position,
+    end: "Tile" | Position,
+    entity: Optional["Entity"] = None
+) -> Optional[List["Tile"]]:
+    """
+    Find a path using the grid's cached cluster abstraction.
+
+    Trades a small amount of path quality for far fewer expansions on long
+    routes. Paths are valid, but long routes pass through cluster
+    transitions and may cost somewhat more than the optimal path.
+    Queries between neighboring clusters use the exact indexed A* and
+    are optimal.
+
+    Args:
+        grid: The tile grid
+        start: Starting tile or position
+        end: Ending tile or position
+        entity: Entity that will traverse (affects movement costs)
+
+    Returns:
+        List of tiles forming path (including start and end),
+        or None if no path exists
+    """
+    return grid.get_path_hierarchy().find_path(start, end, entity)
@@ -3,16 +3,21 @@ Pathfinding algorithms for the tile grid system.
 """
 
 from __future__ import annotations
-from typing import Optional, List, TYPE_CHECKING
+from collections import OrderedDict, deque
+from typing import Optional, List, Dict, Tuple, FrozenSet, Iterable, TYPE_CHECKING
 import heapq
+import math
 
 if TYPE_CHECKING:
     from .grid import TileGrid
     from .tile import Tile
     from .entity import Entity
+    from .cost_field import CostField
 
 from .position import Position
 from .terrain import TERRAIN_COST
+from .events import TileEvent
+from .cost_field import COST_EVENTS, entity_profile
 
 
 def calculate_movement_cost(
@@ -78,7 +83,21 @@ def heuristic(a: Position, b: Position) -> float:
 
     Uses 2D Euclidean distance (z/height handled by movement cost).
     """
-    return a.distance_to(b, include_z=False)
+    return math.hypot(a.x - b.x, a.y - b.y)
+
+
+def octile_distance(a: Position, b: Position) -> float:
+    """
+    Octile distance between two positions on the same plane.
+
+    Exact cost of an unobstructed 8-way path with unit straight steps
+    and 1.414 diagonals.
+    """
+    dx = abs(a.x - b.x)
+    dy = abs(a.y - b.y)
+    if dx > dy:
+        return dx + 0.414 * dy
+    return dy + 0.414 * dx
 
 
 def find_path(
@@ -86,7 +105,8 @@ def find_path(
     start: "Tile" | Position,
     end: "Tile" | Position,
     entity: Optional["Entity"] = None,
-    max_cost: float = float('inf')
+    max_cost: float = float('inf'),
+    cost_field: Optional["CostField"] = None
 ) -> Optional[List["Tile"]]:
     """
     Find path between two positions using A* algorithm.
@@ -97,6 +117,8 @@ def find_path(
         end: Ending tile or position
         entity: Entity that will traverse (affects movement costs)
         max_cost: Maximum total path cost allowed
+        cost_field: Precomputed cost lattice; when given, the search runs
+            over integer cell indices instead of Tile objects
 
     Returns:
         List of tiles forming path (including start and end),
@@ -120,6 +142,13 @@ def find_path(
     if not end_tile.is_passable():
         return None
 
+    if cost_field is not None:
+        connectivity = grid._connectivity
+        if connectivity is not None and not connectivity.is_reachable(
+                start_tile.position, end_tile.position):
+            return None  # Different regions, no search needed
+        return _find_path_indexed(grid, start_tile, end_tile, entity, max_cost, cost_field)
+
     start_pos = start_tile.position
     end_pos = end_tile.position
 
@@ -180,6 +209,128 @@ def find_path(
     return None  # No path found
 
 
+def plane_offsets(row: int) -> List[tuple]:
+    """
+    Get (dx, dy, index_delta, weight) steps for the 8 in-plane neighbors.
+
+    Args:
+        row: Stride between rows of the flat index
+
+    Weight is the diagonal cost multiplier (1.0 for straight steps).
+    Order matches Position.get_adjacent_positions.
+    """
+    return [
+        (1, 0, 1, 1.0), (-1, 0, -1, 1.0),
+        (0, 1, row, 1.0), (0, -1, -row, 1.0),
+        (1, 1, row + 1, 1.414), (1, -1, 1 - row, 1.414),
+        (-1, 1, row - 1, 1.414), (-1, -1, -row - 1, 1.414),
+    ]
+
+
+def _find_path_indexed(
+    grid: "TileGrid",
+    start_tile: "Tile",
+    end_tile: "Tile",
+    entity: Optional["Entity"],
+    max_cost: float,
+    cost_field: "CostField"
+) -> Optional[List["Tile"]]:
+    """
+    A* over flat cell indices using a precomputed cost lattice.
+
+    Same search and cost model as find_path, but g-scores live in a flat
+    list and neighbors are integer offsets, so no Tile or Position objects
+    are touched until the path is rebuilt. The lattice border is
+    impassable, which makes bounds checks unnecessary.
+
+    The heuristic is octile distance scaled by the cheapest step into
+    any cell of the entity's layer. No straight step costs less than
+    that (and no diagonal less than 1.414 times it), so the heuristic
+    never overestimates and the path is optimal, even when movement
+    modifiers below 1 make steps cheaper than 1.0. On maps whose
+    cheapest step is 1.0 it is tighter than the Euclidean heuristic,
+    roughly halving expansions.
+    """
+    start_pos = start_tile.position
+    end_pos = end_tile.position
+    if not (grid.is_valid_position(start_pos.x, start_pos.y, start_pos.z)
+            and grid.is_valid_position(end_pos.x, end_pos.y, end_pos.z)):
+        return None
+    if start_pos.z != end_pos.z:
+        return None  # Movement never leaves the plane
+
+    layer, enter = cost_field.layers_for(entity)
+    scale = cost_field.min_enter_cost(entity)
+    straight = scale
+    diagonal = 0.414 * scale
+    elevation = cost_field.elevation
+    offset = start_pos.z * cost_field.plane
+    inf = float('inf')
+    heappush = heapq.heappush
+    heappop = heapq.heappop
+    steps = plane_offsets(cost_field.row)
+
+    # Indices below are relative to the start of the z-plane
+    row = cost_field.row
+    start = cost_field.index(start_pos.x, start_pos.y)
+    goal = cost_field.index(end_pos.x, end_pos.y)
+    # Goal in padded coordinates, for the heuristic
+    ex, ey = end_pos.x + 1, end_pos.y + 1
+
+    g_score = [inf] * cost_field.plane
+    came_from = [-1] * cost_field.plane
+    closed = bytearray(cost_field.plane)
+    g_score[start] = 0.0
+    open_set = [(octile_distance(start_pos, end_pos) * scale, start)]
+
+    while open_set:
+        _, current = heappop(open_set)
+        if closed[current]:
+            continue
+
+        if current == goal:
+            path = []
+            while current != -1:
+                x, y, _ = cost_field.coords(current)
+                path.append(grid.get_tile(x, y, start_pos.z))
+                current = came_from[current]
+            path.reverse()
+            return path
+
+        closed[current] = 1
+        current_g = g_score[current]
+        if current_g > max_cost:
+            continue
+
+        cy, cx = divmod(current, row)
+        current_height = elevation[offset + current]
+
+        for dx, dy, delta, weight in steps:
+            neighbor = current + delta
+            if closed[neighbor]:
+                continue
+            cell = offset + neighbor
+            cost = enter[cell]
+            if cost == inf:
+                continue
+
+            if elevation[cell] != current_height:
+                cost += abs(elevation[cell] - current_height) * 0.5 * layer[cell]
+            tentative_g = current_g + cost * weight
+
+            if tentative_g < g_score[neighbor]:
+                g_score[neighbor] = tentative_g
+                came_from[neighbor] = current
+                hx = abs(cx + dx - ex)
+                hy = abs(cy + dy - ey)
+                if hx > hy:
+                    heappush(open_set, (tentative_g + straight * hx + diagonal * hy, neighbor))
+                else:
+                    heappush(open_set, (tentative_g + straight * hy + diagonal * hx, neighbor))
+
+    return None  # No path found
+
+
 def get_line_of_sight(
     grid: "TileGrid",
     from_pos: Position,
@@ -233,10 +384,10 @@ def flood_fill(
 
     visited: set[Position] = set()
     result: List["Tile"] = []
-    queue: List["Tile"] = [start_tile]
+    queue: deque = deque([start_tile])
 
     while queue and len(result) < max_tiles:
-        current = queue.pop(0)
+        current = queue.popleft()
         current_pos = current.position
 
         if current_pos in visited:
@@ -259,7 +410,8 @@ def get_reachable_tiles(
     grid: "TileGrid",
     start: Position,
     max_movement: float,
-    entity: Optional["Entity"] = None
+    entity: Optional["Entity"] = None,
+    cost_field: Optional["CostField"] = None
 ) -> dict[Position, float]:
     """
     Get all tiles reachable within a movement budget.
@@ -271,10 +423,24 @@ def get_reachable_tiles(
         start: Starting position
         max_movement: Maximum movement cost allowed
         entity: Entity that will traverse
+        cost_field: Precomputed cost lattice; when given, the search runs
+            over integer cell indices instead of Tile objects
 
     Returns:
         Dictionary mapping positions to their movement cost from start
     """
+    if cost_field is not None:
+        if not grid.is_valid_position(start.x, start.y, start.z):
+            return {}
+        distances, _ = _dijkstra_indexed(
+            cost_field, [cost_field.index(start.x, start.y, start.z)],
+            cost_field.layers_for(entity), max_movement
+        )
+        return {
+            Position(*cost_field.coords(index)): dist
+            for index, dist in distances.items()
+        }
+
     start_tile = grid.get_tile_at_position(start)
     if not start_tile:
         return {}
@@ -335,3 +501,335 @@ def calculate_path_cost(
         total += cost
 
     return total
+
+
+def _dijkstra_indexed(
+    cost_field: "CostField",
+    sources: Iterable[int],
+    layers: Tuple,
+    max_cost: float = float('inf'),
+    reverse: bool = False
+) -> Tuple[Dict[int, float], Dict[int, int]]:
+    """
+    Multi-source Dijkstra over flat cell indices.
+
+    The index-based counterpart of get_reachable_tiles. Forward searches
+    measure the cost of walking out of the sources; reverse searches
+    measure the cost of walking into them, which is what a Dijkstra map
+    toward a goal needs (step costs are not symmetric on uneven ground).
+
+    Args:
+        cost_field: Cost lattice to search
+        sources: Cell indices at distance zero
+        layers: (multiplier, enter) layers from CostField.layers_for
+        max_cost: Cells costlier than this are left out
+        reverse: Measure cost toward the sources instead of away from them
+
+    Returns:
+        (distances, links): cost per reached cell, and for each reached
+        non-source cell the neighbor it was reached through, which is
+        the previous step forward and the next step in reverse
+    """
+    layer, enter = layers
+    elevation = cost_field.elevation
+    steps = [(delta, weight) for _, _, delta, weight in plane_offsets(cost_field.row)]
+    inf = float('inf')
+    heappush = heapq.heappush
+    heappop = heapq.heappop
+
+    distances: Dict[int, float] = {}
+    links: Dict[int, int] = {}
+    heap = []
+    for source in sources:
+        if source not in distances:
+            distances[source] = 0.0
+            heap.append((0.0, source))
+    heapq.heapify(heap)
+
+    while heap:
+        dist, current = heappop(heap)
+        if dist > distances[current]:
+            continue
+
+        current_height = elevation[current]
+        for delta, weight in steps:
+            neighbor = current + delta
+            if reverse:
+                # Walking neighbor -> current: the neighbor must be
+                # standable and the cost is that of entering current
+                if enter[neighbor] == inf:
+                    continue
+                cell = current
+            else:
+                cell = neighbor
+            cost = enter[cell]
+            if cost == inf:
+                continue
+            if elevation[neighbor] != current_height:
+                cost += abs(elevation[neighbor] - current_height) * 0.5 * layer[cell]
+
+            new_dist = dist + cost * weight
+            if new_dist <= max_cost and new_dist < distances.get(neighbor, inf):
+                distances[neighbor] = new_dist
+                links[neighbor] = current
+                heappush(heap, (new_dist, neighbor))
+
+    return distances, links
+
+
+class FlowField:
+    """
+    Dijkstra map toward a set of goal cells.
+
+    Built once by a reverse search from the goals, after which any number
+    of agents read their cost-to-goal and next step with a dictionary
+    lookup instead of running their own A*. With several goals each cell
+    points toward whichever goal is cheapest to reach from it.
+
+    Attributes:
+        cost_field: Cost lattice the field was computed on
+        goals: Goal cell indices
+        max_cost: Search budget; cells costlier than this are unreached
+        valid: False once a tile change inside the field's reach has
+            made it stale (tracked while the field is cached)
+    """
+
+    def __init__(
+        self,
+        cost_field: "CostField",
+        goals: FrozenSet[int],
+        distances: Dict[int, float],
+        links: Dict[int, int],
+        max_cost: float = float('inf')
+    ):
+        self.cost_field = cost_field
+        self.goals = goals
+        self.max_cost = max_cost
+        self.valid = True
+        self._distances = distances
+        self._next = links
+        self._offsets = [delta for _, _, delta, _ in plane_offsets(cost_field.row)]
+
+    def __len__(self) -> int:
+        """Number of cells that can reach a goal."""
+        return len(self._distances)
+
+    def _index(self, position: Position) -> Optional[int]:
+        """Get the cell index for a position, or None if it is off the grid."""
+        field = self.cost_field
+        if (0 <= position.x < field.width and 0 <= position.y < field.height
+                and 0 <= position.z < field.depth):
+            return field.index(position.x, position.y, position.z)
+        return None
+
+    def cost_to_goal(self, position: Position) -> float:
+        """Get the movement cost from a position to the nearest goal (inf if unreached)."""
+        index = self._index(position)
+        if index is None:
+            return float('inf')
+        return self._distances.get(index, float('inf'))
+
+    def is_reachable(self, position: Position) -> bool:
+        """Check if a goal can be reached from a position."""
+        index = self._index(position)
+        return index is not None and index in self._distances
+
+    def is_goal(self, position: Position) -> bool:
+        """Check if a position is one of the goals."""
+        index = self._index(position)
+        return index is not None and index in self.goals
+
+    def next_step(self, position: Position) -> Optional[Position]:
+        """
+        Get the next position on a cheapest path toward the goals.
+
+        Returns:
+            Adjacent position to move to, or None at a goal or when no
+            goal can be reached
+        """
+        index = self._index(position)
+        if index is None:
+            return None
+        step = self._next.get(index)
+        if step is None:
+            return None
+        return Position(*self.cost_field.coords(step))
+
+    def path_from(self, position: Position) -> List[Position]:
+        """
+        Follow the field from a position to a goal.
+
+        Returns:
+            Positions from start to goal inclusive, or an empty list when
+            no goal can be reached
+        """
+        index = self._index(position)
+        if index is None or index not in self._distances:
+            return []
+        coords = self.cost_field.coords
+        path = [Position(*coords(index))]
+        while index in self._next:
+            index = self._next[index]
+            path.append(Position(*coords(index)))
+        return path
+
+    def touches(self, index: int) -> bool:
+        """
+        Check if a change to a cell can affect this field.
+
+        A cell matters if it is inside the reach or borders it, since a
+        newly opened neighbor of the reach can shorten or extend it.
+        """
+        distances = self._distances
+        if index in distances:
+            return True
+        for delta in self._offsets:
+            if index + delta in distances:
+                return True
+        return False
+
+
+def build_flow_field(
+    grid: "TileGrid",
+    goals: Iterable[Position],
+    entity: Optional["Entity"] = None,
+    max_cost: float = float('inf'),
+    cost_field: Optional["CostField"] = None
+) -> FlowField:
+    """
+    Compute a flow field toward one or more goals.
+
+    Goals off the grid or on cells that cannot be entered are ignored.
+
+    Args:
+        grid: The tile grid
+        goals: Goal positions
+        entity: Entity whose movement costs the field uses
+        max_cost: Maximum cost-to-goal to explore
+        cost_field: Cost lattice to use (defaults to the grid's shared one)
+
+    Returns:
+        FlowField toward the nearest goal
+    """
+    if cost_field is None:
+        cost_field = grid.get_cost_field()
+    layers = cost_field.layers_for(entity)
+    enter = layers[1]
+    indices = frozenset(
+        cost_field.index(goal.x, goal.y, goal.z)
+        for goal in goals
+        if grid.is_valid_position(goal.x, goal.y, goal.z)
+    )
+    indices = frozenset(index for index in indices if enter[index] != float('inf'))
+    distances, links = _dijkstra_indexed(cost_field, indices, layers, max_cost, reverse=True)
+    return FlowField(cost_field, indices, distances, links, max_cost)
+
+
+# Default number of flow fields kept per grid
+DEFAULT_FLOW_FIELD_CAPACITY = 32
+
+
+class FlowFieldCache:
+    """
+    LRU cache of flow fields keyed by goal set, cost profile and budget.
+
+    Tile events and grid change listeners drop every cached field whose
+    reach contains (or borders) the changed cell; fields elsewhere on the
+    map stay cached.
+
+    Attributes:
+        grid: The grid the fields describe
+        capacity: Maximum number of cached fields
+        hits: Lookups served from the cache
+        misses: Lookups that built a new field
+    """
+
+    def __init__(self, grid: "TileGrid", capacity: int = DEFAULT_FLOW_FIELD_CAPACITY):
+        if capacity < 1:
+            raise ValueError("Flow field cache capacity must be at least 1")
+        self.grid = grid
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self._fields: "OrderedDict[Tuple, FlowField]" = OrderedDict()
+        self._attached = False
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    def attach(self) -> None:
+        """Subscribe to the grid's cost-changing tile events and cell changes."""
+        if self._attached:
+            return
+        for event_type in COST_EVENTS:
+            self.grid.subscribe_to_event(event_type, self.on_tile_event)
+        self.grid.add_change_listener(self.invalidate)
+        self._attached = True
+
+    def detach(self) -> None:
+        """Stop listening to the grid."""
+        if not self._attached:
+            return
+        for event_type in COST_EVENTS:
+            self.grid.unsubscribe_from_event(event_type, self.on_tile_event)
+        self.grid.remove_change_listener(self.invalidate)
+        self._attached = False
+
+    def on_tile_event(self, event: TileEvent) -> None:
+        """Drop fields affected by the cell an event touched."""
+        pos = event.tile.position
+        self.invalidate(pos.x, pos.y, pos.z)
+
+    def invalidate(self, x: int, y: int, z: int = 0) -> int:
+        """
+        Drop every cached field a changed cell can affect.
+
+        Returns:
+            Number of fields dropped
+        """
+        if not self.grid.is_valid_position(x, y, z):
+            return 0
+        cost_field = self.grid.get_cost_field()
+        index = cost_field.index(x, y, z)
+        stale = [key for key, field in self._fields.items() if field.touches(index)]
+        for key in stale:
+            self._fields.pop(key).valid = False
+        return len(stale)
+
+    def clear(self) -> None:
+        """Drop all cached fields."""
+        for field in self._fields.values():
+            field.valid = False
+        self._fields.clear()
+
+    def get(
+        self,
+        goals: Iterable[Position],
+        entity: Optional["Entity"] = None,
+        max_cost: float = float('inf')
+    ) -> FlowField:
+        """
+        Get the flow field toward a goal set, computing it on a miss.
+
+        Args:
+            goals: Goal positions (order does not matter)
+            entity: Entity whose movement costs the field uses
+            max_cost: Maximum cost-to-goal to explore
+
+        Returns:
+            Cached or freshly built FlowField
+        """
+        goals = frozenset(goals)
+        key = (goals, entity_profile(entity), max_cost)
+        field = self._fields.get(key)
+        if field is not None:
+            self._fields.move_to_end(key)
+            self.hits += 1
+            return field
+
+        self.misses += 1
+        field = build_flow_field(self.grid, goals, entity, max_cost)
+        self._fields[key] = field
+        if len(self._fields) > self.capacity:
+            self._fields.popitem(last=False)
+        return field
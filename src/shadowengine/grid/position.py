@@ -1,14 +1,30 @@
 """
 Position class for 3D coordinate system in the tile grid.
+
+Positions are slotted, since one is created for every neighbor visited
+and every tile materialized. Hot loops that only need coordinates can
+skip Position entirely and step through the precomputed (dx, dy) offset
+tuples below.
 """
 
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Tuple
+from typing import Tuple, Iterator
 import math
 
 
-@dataclass(frozen=True)
+# In-plane neighbor offsets, in get_adjacent_positions order
+CARDINAL_OFFSETS: Tuple[Tuple[int, int], ...] = ((1, 0), (-1, 0), (0, 1), (0, -1))
+DIAGONAL_OFFSETS: Tuple[Tuple[int, int], ...] = ((1, 1), (1, -1), (-1, 1), (-1, -1))
+NEIGHBOR_OFFSETS: Tuple[Tuple[int, int], ...] = CARDINAL_OFFSETS + DIAGONAL_OFFSETS
+
+
+def neighbor_offsets(include_diagonals: bool = True) -> Tuple[Tuple[int, int], ...]:
+    """Get the shared (dx, dy) offsets of in-plane neighbors."""
+    return NEIGHBOR_OFFSETS if include_diagonals else CARDINAL_OFFSETS
+
+
+@dataclass(frozen=True, slots=True)
 class Position:
     """
     Represents a 3D position in the tile grid.
@@ -57,13 +73,9 @@ class Position:
         if not isinstance(other, Position):
             raise TypeError(f"Expected Position, got {type(other)}")
 
-        dx = self.x - other.x
-        dy = self.y - other.y
-
         if include_z:
-            dz = self.z - other.z
-            return math.sqrt(dx * dx + dy * dy + dz * dz)
-        return math.sqrt(dx * dx + dy * dy)
+            return math.hypot(self.x - other.x, self.y - other.y, self.z - other.z)
+        return math.hypot(self.x - other.x, self.y - other.y)
 
     def manhattan_distance(self, other: Position, include_z: bool = True) -> int:
         """
@@ -141,30 +153,33 @@ class Position:
         Returns:
             List of adjacent positions
         """
-        neighbors = []
-
-        # Cardinal directions
-        offsets = [(1, 0), (-1, 0), (0, 1), (0, -1)]
-
-        if include_diagonals:
-            offsets.extend([(1, 1), (1, -1), (-1, 1), (-1, -1)])
-
-        for dx, dy in offsets:
-            neighbors.append(Position(self.x + dx, self.y + dy, self.z))
+        x, y, z = self.x, self.y, self.z
+        offsets = neighbor_offsets(include_diagonals)
+        neighbors = [Position(x + dx, y + dy, z) for dx, dy in offsets]
 
         if include_z:
             # Above and below
-            neighbors.append(Position(self.x, self.y, self.z + 1))
-            neighbors.append(Position(self.x, self.y, self.z - 1))
+            neighbors.append(Position(x, y, z + 1))
+            neighbors.append(Position(x, y, z - 1))
 
             if include_diagonals:
                 # Diagonal above/below
                 for dx, dy in offsets:
-                    neighbors.append(Position(self.x + dx, self.y + dy, self.z + 1))
-                    neighbors.append(Position(self.x + dx, self.y + dy, self.z - 1))
+                    neighbors.append(Position(x + dx, y + dy, z + 1))
+                    neighbors.append(Position(x + dx, y + dy, z - 1))
 
         return neighbors
 
+    def iter_neighbor_coords(self, include_diagonals: bool = True) -> Iterator[Tuple[int, int, int]]:
+        """
+        Iterate (x, y, z) of in-plane neighbors without creating Positions.
+
+        Same order as get_adjacent_positions.
+        """
+        x, y, z = self.x, self.y, self.z
+        for dx, dy in neighbor_offsets(include_diagonals):
+            yield x + dx, y + dy, z
+
     def to_tuple(self) -> Tuple[int, int, int]:
         """Convert to tuple representation."""
         return (self.x, self.y, self.z)
@@ -0,0 +1,417 @@
+"""
+Spatial indexes for entity and affordance queries.
+
+SpatialHash buckets entities into square cells of the map so radius,
+nearest-neighbor and rectangle queries only visit the buckets that
+overlap the query area. AffordanceIndex keeps, for every affordance, the
+set of cells that provide it, bucketed the same way, and is updated one
+cell at a time from tile events instead of rescanning the grid.
+"""
+
+from __future__ import annotations
+from functools import lru_cache
+import math
+from typing import Optional, List, Dict, Set, Tuple, FrozenSet, Iterator, TYPE_CHECKING
+
+from .position import Position
+from .events import TileEvent, TileEventType
+
+if TYPE_CHECKING:
+    from .grid import TileGrid
+    from .tile import Tile
+    from .entity import Entity, EntityType
+
+
+# Default bucket edge length in tiles
+DEFAULT_BUCKET_SIZE = 8
+
+Bucket = Tuple[int, int, int]
+CellKey = Tuple[int, int, int]
+
+
+@lru_cache(maxsize=128)
+def disc_spans(radius: float) -> Tuple[Tuple[int, int], ...]:
+    """
+    Get the (dx, span) columns of a disc of cells around the origin.
+
+    Cell (dx, dy) is within radius exactly when |dy| <= span for its
+    column. Columns the disc doesn't reach are left out.
+    """
+    spans = []
+    reach = int(math.ceil(radius))
+    for dx in range(-reach, reach + 1):
+        span = int(math.sqrt(max(radius * radius - dx * dx, 0.0)))
+        while span >= 0 and math.sqrt(dx * dx + span * span) > radius:
+            span -= 1
+        while math.sqrt(dx * dx + (span + 1) * (span + 1)) <= radius:
+            span += 1
+        if span >= 0:
+            spans.append((dx, span))
+    return tuple(spans)
+
+
+class SpatialHash:
+    """
+    Uniform bucket hash of entity positions.
+
+    Attributes:
+        bucket_size: Edge length of a bucket in tiles
+    """
+
+    def __init__(self, bucket_size: int = DEFAULT_BUCKET_SIZE):
+        if bucket_size < 1:
+            raise ValueError("Bucket size must be at least 1")
+        self.bucket_size = bucket_size
+        self._buckets: Dict[Bucket, Dict[str, "Entity"]] = {}
+        self._where: Dict[str, Bucket] = {}
+        # Bucket-coordinate bounds of everything ever inserted
+        self._extent: Optional[List[int]] = None
+
+    def __len__(self) -> int:
+        return len(self._where)
+
+    def __contains__(self, entity: "Entity") -> bool:
+        return entity.id in self._where
+
+    def bucket_of(self, x: int, y: int, z: int = 0) -> Bucket:
+        """Get the bucket key containing a cell."""
+        return (x // self.bucket_size, y // self.bucket_size, z)
+
+    def insert(self, entity: "Entity") -> None:
+        """Index an entity at its current position (re-indexing if already present)."""
+        self.remove(entity)
+        pos = entity.position
+        if pos is None:
+            return
+        bucket = self.bucket_of(pos.x, pos.y, pos.z)
+        self._buckets.setdefault(bucket, {})[entity.id] = entity
+        self._where[entity.id] = bucket
+
+        bx, by, _ = bucket
+        extent = self._extent
+        if extent is None:
+            self._extent = [bx, by, bx, by]
+        else:
+            extent[0] = min(extent[0], bx)
+            extent[1] = min(extent[1], by)
+            extent[2] = max(extent[2], bx)
+            extent[3] = max(extent[3], by)
+
+    def remove(self, entity: "Entity") -> bool:
+        """Drop an entity from the index."""
+        bucket = self._where.pop(entity.id, None)
+        if bucket is None:
+            return False
+        members = self._buckets[bucket]
+        del members[entity.id]
+        if not members:
+            del self._buckets[bucket]
+        return True
+
+    def move(self, entity: "Entity") -> None:
+        """Update an entity after its position changed."""
+        pos = entity.position
+        if pos is not None and self._where.get(entity.id) == self.bucket_of(pos.x, pos.y, pos.z):
+            return
+        self.insert(entity)
+
+    def clear(self) -> None:
+        """Drop every entity."""
+        self._buckets.clear()
+        self._where.clear()
+        self._extent = None
+
+    def _bucket_range(self, x1: int, y1: int, x2: int, y2: int, z: int) -> Iterator[Dict[str, "Entity"]]:
+        """Iterate the non-empty buckets overlapping a rectangle."""
+        size = self.bucket_size
+        buckets = self._buckets
+        for bx in range(x1 // size, x2 // size + 1):
+            for by in range(y1 // size, y2 // size + 1):
+                members = buckets.get((bx, by, z))
+                if members:
+                    yield members
+
+    def _disc_buckets(self, center: Position, radius: float) -> Iterator[Dict[str, "Entity"]]:
+        """Iterate the non-empty buckets overlapping a disc, skipping its corners."""
+        size = self.bucket_size
+        buckets = self._buckets
+        # Widest span of each bucket column the disc reaches
+        widest: Dict[int, int] = {}
+        for dx, span in disc_spans(radius):
+            bx = (center.x + dx) // size
+            if widest.get(bx, -1) < span:
+                widest[bx] = span
+        for bx, span in widest.items():
+            for by in range((center.y - span) // size, (center.y + span) // size + 1):
+                members = buckets.get((bx, by, center.z))
+                if members:
+                    yield members
+
+    def in_rect(
+        self,
+        x1: int, y1: int,
+        x2: int, y2: int,
+        z: int = 0,
+        entity_type: Optional["EntityType"] = None
+    ) -> List["Entity"]:
+        """Get entities inside a rectangle (corners inclusive)."""
+        x1, x2 = min(x1, x2), max(x1, x2)
+        y1, y2 = min(y1, y2), max(y1, y2)
+        found = []
+        for members in self._bucket_range(x1, y1, x2, y2, z):
+            for entity in members.values():
+                pos = entity.position
+                if (x1 <= pos.x <= x2 and y1 <= pos.y <= y2
+                        and (entity_type is None or entity.entity_type == entity_type)):
+                    found.append(entity)
+        return found
+
+    def within(
+        self,
+        center: Position,
+        radius: float,
+        entity_type: Optional["EntityType"] = None
+    ) -> List["Entity"]:
+        """
+        Get entities within a planar radius of a position, on its z-level.
+
+        Results are sorted by distance.
+        """
+        limit = radius * radius
+        found = []
+        for members in self._disc_buckets(center, radius):
+            for entity in members.values():
+                pos = entity.position
+                dx = pos.x - center.x
+                dy = pos.y - center.y
+                d2 = dx * dx + dy * dy
+                if d2 <= limit and (entity_type is None or entity.entity_type == entity_type):
+                    found.append((d2, entity.id, entity))
+        found.sort(key=lambda item: (item[0], item[1]))
+        return [entity for _, _, entity in found]
+
+    def nearest(
+        self,
+        center: Position,
+        entity_type: Optional["EntityType"] = None,
+        max_radius: float = float('inf'),
+        exclude: Optional[str] = None
+    ) -> Optional["Entity"]:
+        """
+        Find the closest entity on a position's z-level.
+
+        Searches rings of buckets outward from the center and stops once
+        no unvisited bucket can hold anything closer.
+
+        Args:
+            center: Position to search from
+            entity_type: Only consider entities of this type
+            max_radius: Ignore entities farther than this
+            exclude: Entity id to skip (e.g. the searcher itself)
+
+        Returns:
+            Nearest matching entity, or None
+        """
+        if not self._buckets:
+            return None
+
+        size = self.bucket_size
+        cbx, cby = center.x // size, center.y // size
+        z = center.z
+        limit = max_radius * max_radius
+        best = None
+        best_key = None
+
+        # Every bucket lies within this many rings of the center
+        min_bx, min_by, max_bx, max_by = self._extent
+        max_ring = max(cbx - min_bx, max_bx - cbx, cby - min_by, max_by - cby, 0)
+
+        for ring in range(max_ring + 1):
+            # Cells in this ring are at least (ring - 1) * size tiles away
+            floor = max(0, ring - 1) * size
+            if best_key is not None and floor * floor > best_key[0]:
+                break
+            if floor * floor > limit:
+                break
+
+            for bx, by in _ring(cbx, cby, ring):
+                members = self._buckets.get((bx, by, z))
+                if not members:
+                    continue
+                for entity in members.values():
+                    if entity.id == exclude:
+                        continue
+                    if entity_type is not None and entity.entity_type != entity_type:
+                        continue
+                    pos = entity.position
+                    dx = pos.x - center.x
+                    dy = pos.y - center.y
+                    key = (dx * dx + dy * dy, entity.id)
+                    if key[0] <= limit and (best_key is None or key < best_key):
+                        best_key = key
+                        best = entity
+        return best
+
+
+def _ring(cx: int, cy: int, ring: int) -> Iterator[Tuple[int, int]]:
+    """Iterate bucket coordinates at Chebyshev distance ``ring`` from (cx, cy)."""
+    if ring == 0:
+        yield cx, cy
+        return
+    for bx in range(cx - ring, cx + ring + 1):
+        yield bx, cy - ring
+        yield bx, cy + ring
+    for by in range(cy - ring + 1, cy + ring):
+        yield cx - ring, by
+        yield cx + ring, by
+
+
+class AffordanceIndex:
+    """
+    Cells grouped by the affordances they provide.
+
+    Only cells whose affordances differ from an untouched default tile
+    are stored; affordances of the default terrain are answered by
+    scanning the query rectangle and skipping stored cells that lost them.
+    Tile events and grid change listeners re-derive a single cell.
+
+    Attributes:
+        grid: The grid being indexed
+        bucket_size: Edge length of a bucket in tiles
+    """
+
+    def __init__(self, grid: "TileGrid", bucket_size: int = DEFAULT_BUCKET_SIZE):
+        if bucket_size < 1:
+            raise ValueError("Bucket size must be at least 1")
+        self.grid = grid
+        self.bucket_size = bucket_size
+        self._cells: Dict[CellKey, FrozenSet[str]] = {}
+        self._by_affordance: Dict[str, Dict[Bucket, Set[CellKey]]] = {}
+        self._attached = False
+
+        from .tile import Tile
+        default_tile = Tile(position=Position(0, 0, 0), terrain_type=grid.default_terrain)
+        self.default_affordances: FrozenSet[str] = frozenset(default_tile.get_affordances())
+        self.rebuild()
+
+    def rebuild(self) -> None:
+        """Re-derive every cell that differs from a fresh tile."""
+        self._cells.clear()
+        self._by_affordance.clear()
+        for key, tile in self.grid._changed_tiles():
+            self._set_cell(key, frozenset(tile.get_affordances()))
+
+    def _set_cell(self, key: CellKey, affordances: FrozenSet[str]) -> None:
+        """Replace the stored affordances of one cell."""
+        old = self._cells.get(key, self.default_affordances)
+        if affordances == old:
+            return
+
+        bucket = (key[0] // self.bucket_size, key[1] // self.bucket_size, key[2])
+        for affordance in old - affordances:
+            buckets = self._by_affordance.get(affordance)
+            if buckets and bucket in buckets:
+                buckets[bucket].discard(key)
+                if not buckets[bucket]:
+                    del buckets[bucket]
+        for affordance in affordances - old:
+            # Default affordances are answered by scanning, not stored
+            if affordance not in self.default_affordances:
+                self._by_affordance.setdefault(affordance, {}).setdefault(bucket, set()).add(key)
+
+        if affordances == self.default_affordances:
+            self._cells.pop(key, None)
+        else:
+            self._cells[key] = affordances
+
+    def _cell_affordances(self, x: int, y: int, z: int) -> FrozenSet[str]:
+        """Derive a cell's affordances without materializing it into the grid."""
+        grid = self.grid
+        tile = grid._tiles.get((x, y, z))
+        if tile is None:
+            if grid._dense is None:
+                return self.default_affordances
+            tile = grid._dense.materialize(grid._dense.index(x, y, z))
+        return frozenset(tile.get_affordances())
+
+    def attach(self) -> None:
+        """Subscribe to every tile event and to cell changes."""
+        if self._attached:
+            return
+        for event_type in TileEventType:
+            self.grid.subscribe_to_event(event_type, self.on_tile_event)
+        self.grid.add_change_listener(self.invalidate)
+        self._attached = True
+
+    def detach(self) -> None:
+        """Stop listening to the grid."""
+        if not self._attached:
+            return
+        for event_type in TileEventType:
+            self.grid.unsubscribe_from_event(event_type, self.on_tile_event)
+        self.grid.remove_change_listener(self.invalidate)
+        self._attached = False
+
+    def on_tile_event(self, event: TileEvent) -> None:
+        """Re-derive the cell an event touched."""
+        pos = event.tile.position
+        self._set_cell((pos.x, pos.y, pos.z), frozenset(event.tile.get_affordances()))
+
+    def invalidate(self, x: int, y: int, z: int = 0) -> None:
+        """Re-derive one cell after a direct change."""
+        if self.grid.is_valid_position(x, y, z):
+            self._set_cell((x, y, z), self._cell_affordances(x, y, z))
+
+    def affordances_at(self, x: int, y: int, z: int = 0) -> FrozenSet[str]:
+        """Get the indexed affordances of a cell."""
+        return self._cells.get((x, y, z), self.default_affordances)
+
+    def cells_in_rect(
+        self,
+        affordance: str,
+        x1: int, y1: int,
+        x2: int, y2: int,
+        z: int = 0
+    ) -> List[CellKey]:
+        """
+        Get (x, y, z) keys of cells with an affordance inside a rectangle.
+
+        The rectangle is clipped to the grid; corners are inclusive.
+        """
+        grid = self.grid
+        x1, x2 = max(0, min(x1, x2)), min(grid.width - 1, max(x1, x2))
+        y1, y2 = max(0, min(y1, y2)), min(grid.height - 1, max(y1, y2))
+        if x1 > x2 or y1 > y2 or not 0 <= z < grid.depth:
+            return []
+
+        if affordance in self.default_affordances:
+            # Every untouched cell qualifies; skip stored cells that lost it
+            cells = self._cells
+            found = []
+            for y in range(y1, y2 + 1):
+                for x in range(x1, x2 + 1):
+                    stored = cells.get((x, y, z))
+                    if stored is None or affordance in stored:
+                        found.append((x, y, z))
+            return found
+
+        buckets = self._by_affordance.get(affordance)
+        if not buckets:
+            return []
+        size = self.bucket_size
+        found = []
+        for bx in range(x1 // size, x2 // size + 1):
+            for by in range(y1 // size, y2 // size + 1):
+                for key in buckets.get((bx, by, z), ()):
+                    if x1 <= key[0] <= x2 and y1 <= key[1] <= y2:
+                        found.append(key)
+        found.sort(key=lambda k: (k[1], k[0]))
+        return found
+
+    def cells_with(self, affordance: str) -> List[CellKey]:
+        """Get every cell with an affordance, in (z, y, x) order."""
+        grid = self.grid
+        found = []
+        for z in range(grid.depth):
+            found.extend(self.cells_in_rect(affordance, 0, 0, grid.width - 1, grid.height - 1, z))
+        return found
@@ -25,6 +25,7 @@ from .config import SPINE_EVIDENCE_THRESHOLD
 from .interaction import Hotspot, HotspotType
 from .memory import EventType
 from .generation.detail_handler import LLMDetailHandler
+from .prefetch import PrefetchScheduler
 
 if TYPE_CHECKING:
     from .interaction import Hotspot
@@ -173,10 +174,12 @@ class InspectionManager:
         world_state: 'WorldState',
         renderer: 'Renderer',
         seed: Optional[int] = None,
+        prefetcher: Optional[PrefetchScheduler] = None,
     ):
         self.engine = InspectionEngine(seed=seed)
         self.detail_handler = LLMDetailHandler(llm_client, world_state)
         self.renderer = renderer
+        self.prefetcher = prefetcher
 
         self._object_by_hotspot: dict[str, str] = {}   # hotspot.id -> object.id
         self._hotspot_by_object: dict[str, str] = {}   # object.id -> hotspot.id
@@ -498,6 +501,26 @@ class InspectionManager:
             obj.location_id = state.current_location_id
             return obj
 
+        obj = self._build_object(hotspot, state)
+        if hotspot.planted_by:
+            framed = state.characters.get(hotspot.frames)
+            framed_name = framed.name if framed else "someone else"
+            self._fact_details[f"staged_{hotspot.id}"[:64]] = {
+                "description": (
+                    f"The {hotspot.label} was planted. Someone staged it to "
+                    f"point you at {framed_name} — which means someone else "
+                    "has something to hide."
+                ),
+                "is_evidence": True,
+            }
+
+        self.engine.register_object(obj)
+        self._object_by_hotspot[hotspot.id] = obj.id
+        self._hotspot_by_object[obj.id] = hotspot.id
+        return obj
+
+    def _build_object(self, hotspot: 'Hotspot', state) -> InspectableObject:
+        """A new InspectableObject for a hotspot, not yet registered."""
         is_person = hotspot.hotspot_type == HotspotType.PERSON
         base = hotspot.examine_text or hotspot.description or f"The {hotspot.label}."
         if is_person and hotspot.target_id in state.characters:
@@ -524,8 +547,6 @@ class InspectionManager:
         # Planted evidence carries a tell: under magnification the staging
         # shows. Looking closer is the counter to a frame-up.
         if hotspot.planted_by:
-            framed = state.characters.get(hotspot.frames)
-            framed_name = framed.name if framed else "someone else"
             staged_fact = f"staged_{hotspot.id}"[:64]
             obj.add_layer(DetailLayer(
                 zoom_level=ZoomLevel.FINE,
@@ -543,18 +564,6 @@ class InspectionManager:
                     "and carefully."
                 ),
             ))
-            self._fact_details[staged_fact] = {
-                "description": (
-                    f"The {hotspot.label} was planted. Someone staged it to "
-                    f"point you at {framed_name} — which means someone else "
-                    "has something to hide."
-                ),
-                "is_evidence": True,
-            }
-
-        self.engine.register_object(obj)
-        self._object_by_hotspot[hotspot.id] = obj.id
-        self._hotspot_by_object[obj.id] = hotspot.id
         return obj
 
     def _ensure_layer(
@@ -569,18 +578,13 @@ class InspectionManager:
             return
         attempted.add(level.value)
 
-        location = state.locations.get(state.current_location_id)
-        is_evidence = self._is_evidence(hotspot)
-        data = self.detail_handler.generate_layer(
-            object_name=obj.name,
-            base_description=obj.base_description,
-            zoom_value=level.value,
-            location_name=location.name if location else "",
-            location_description=location.description if location else "",
-            prior_layers=self._layer_descriptions(obj),
-            is_evidence=is_evidence and level.value >= ZoomLevel.CLOSE.value,
-            clue_hint=self._clue_hint(hotspot) if level.value >= ZoomLevel.CLOSE.value else None,
+        request = self._layer_request(obj, level, hotspot, state)
+        hit, data = (
+            self.prefetcher.take(("layer", hotspot.id, level.value), request)
+            if self.prefetcher is not None else (False, None)
         )
+        if not hit:
+            data = self.detail_handler.generate_layer(**request)
         if data is None:
             # Offline: the engine's template DetailGenerator still adds
             # procedural micro-details on top of existing layers.
@@ -612,6 +616,55 @@ class InspectionManager:
             self._fact_details[fact_id] = discovery
         obj.add_layer(layer)
 
+    def _layer_request(
+        self, obj: InspectableObject, level: ZoomLevel, hotspot: 'Hotspot', state,
+    ) -> dict:
+        """Arguments for generate_layer at a zoom level."""
+        location = state.locations.get(state.current_location_id)
+        close = level.value >= ZoomLevel.CLOSE.value
+        return {
+            "object_name": obj.name,
+            "base_description": obj.base_description,
+            "zoom_value": level.value,
+            "location_name": location.name if location else "",
+            "location_description": location.description if location else "",
+            "prior_layers": self._layer_descriptions(obj),
+            "is_evidence": self._is_evidence(hotspot) and close,
+            "clue_hint": self._clue_hint(hotspot) if close else None,
+        }
+
+    def prefetch_layers(self, state, priority: int = 1) -> list:
+        """
+        Start generating the first close look at each piece of evidence here.
+
+        Only the LLM request runs in the background; the layer is added
+        when the player zooms in. Returns the keys submitted.
+        """
+        location = state.locations.get(state.current_location_id)
+        if self.prefetcher is None or location is None:
+            return []
+
+        keys = []
+        for hotspot in location.hotspots:
+            if not (hotspot.visible and hotspot.active and self._is_evidence(hotspot)):
+                continue
+            object_id = self._object_by_hotspot.get(hotspot.id)
+            obj = self.engine.objects.get(object_id) if object_id else None
+            if obj is None:
+                obj = self._build_object(hotspot, state)
+            elif (obj.has_layer(ZoomLevel.MEDIUM)
+                  or ZoomLevel.MEDIUM.value in self._layers_attempted.get(obj.id, ())):
+                continue
+
+            key = ("layer", hotspot.id, ZoomLevel.MEDIUM.value)
+            request = self._layer_request(obj, ZoomLevel.MEDIUM, hotspot, state)
+            self.prefetcher.submit(
+                key, request,
+                lambda r=request: self.detail_handler.generate_layer(**r), priority,
+            )
+            keys.append(key)
+        return keys
+
     @staticmethod
     def _layer_descriptions(obj: InspectableObject) -> list[str]:
         layers = sorted(obj.layers.values(), key=lambda l: l.zoom_level.value)
@@ -13,6 +13,7 @@ Supported backends:
 from .client import (
     LLMClient,
     LLMResponse,
+    LLMStream,
     LLMConfig,
     LLMBackend,
     OllamaClient,
@@ -21,6 +22,21 @@ from .client import (
     create_llm_client,
 )
 
+from .transport import (
+    PooledTransport,
+    LatencyHistogram,
+)
+
+from .cache import (
+    CachingLLMClient,
+    ResponseCache,
+)
+
+from .async_client import (
+    AsyncLLMClient,
+    run_sync,
+)
+
 from .prompts import (
     PromptTemplate,
     CharacterPrompt,
@@ -39,12 +55,22 @@ __all__ = [
     # Client
     "LLMClient",
     "LLMResponse",
+    "LLMStream",
     "LLMConfig",
     "LLMBackend",
     "OllamaClient",
     "OpenAIClient",
     "MockLLMClient",
     "create_llm_client",
+    # Transport
+    "PooledTransport",
+    "LatencyHistogram",
+    # Cache
+    "CachingLLMClient",
+    "ResponseCache",
+    # Async
+    "AsyncLLMClient",
+    "run_sync",
     # Prompts
     "PromptTemplate",
     "CharacterPrompt",
@@ -0,0 +1,153 @@
+"""
+asyncio interface to the LLM clients, with concurrent fan-out.
+
+Every LLM call used to run one at a time on the game thread, so a turn
+that needed several independent replies waited for the sum of them.
+AsyncLLMClient wraps any LLMClient (Ollama, OpenAI, mock or cached) and
+exposes its calls as coroutines. chat_many() and generate_many() send a
+batch of independent requests at once, at most max_concurrency in
+flight, so a batch takes about as long as its slowest reply.
+
+The backends speak blocking HTTP over the thread-safe PooledTransport,
+so calls run on a small thread pool sized to max_concurrency rather
+than on the event loop itself. By default that is the transport's
+pool_size, so every request in flight has a keep-alive connection to
+reuse.
+
+Synchronous callers use LLMClient.chat_many(), which runs the fan-out
+through run_sync() and returns when every reply is in.
+"""
+
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Awaitable, Callable, Optional, TypeVar
+
+from .client import LLMClient, LLMResponse
+
+T = TypeVar("T")
+
+
+def run_sync(awaitable: Awaitable[T]) -> T:
+    """
+    Run a coroutine to completion from synchronous code.
+
+    Inside a running event loop, where asyncio.run() is not allowed, the
+    coroutine runs on a fresh loop in a helper thread.
+    """
+    async def main() -> T:
+        return await awaitable
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(main())
+
+    outcome: dict = {}
+
+    def run() -> None:
+        try:
+            outcome["value"] = asyncio.run(main())
+        except BaseException as e:
+            outcome["error"] = e
+
+    thread = threading.Thread(target=run, name="llm-run-sync")
+    thread.start()
+    thread.join()
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome["value"]
+
+
+class AsyncLLMClient:
+    """
+    Coroutine versions of an LLMClient's calls.
+
+    Attributes:
+        client: The wrapped client, which does the actual requests
+        config: The wrapped client's LLMConfig
+        max_concurrency: Requests allowed in flight at once
+    """
+
+    def __init__(self, client: LLMClient, max_concurrency: Optional[int] = None):
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.client = client
+        self.config = client.config
+        self.max_concurrency = max_concurrency or max(1, client.config.pool_size)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_concurrency, thread_name_prefix="llm"
+        )
+
+    async def _call(self, fn: Callable[..., T], *args) -> T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(fn, *args))
+
+    async def _guarded(self, fn: Callable[..., LLMResponse], *args) -> LLMResponse:
+        # One request failing must not lose the rest of a batch
+        try:
+            return await self._call(fn, *args)
+        except Exception as e:
+            return LLMResponse.error_response(f"{type(e).__name__}: {e}")
+
+    async def check_availability(self) -> bool:
+        """Check if the LLM backend is available."""
+        return await self._call(self.client.check_availability)
+
+    async def generate(self, prompt: str, system: Optional[str] = None) -> LLMResponse:
+        """Generate a response from the LLM."""
+        return await self._call(self.client.generate, prompt, system)
+
+    async def chat(self, messages: list[dict]) -> LLMResponse:
+        """Chat with message history."""
+        return await self._call(self.client.chat, messages)
+
+    async def chat_stream(self, messages: list[dict]) -> AsyncIterator[str]:
+        """Yield the reply in pieces as it is generated."""
+        stream = await self._call(self.client.chat_stream, messages)
+        done = object()
+        try:
+            while True:
+                piece = await self._call(next, stream, done)
+                if piece is done:
+                    return
+                yield piece
+        finally:
+            stream.close()
+
+    async def chat_many(self, requests: list[list[dict]]) -> list[LLMResponse]:
+        """
+        Send independent chats at once.
+
+        Replies come back in request order. A request that raises
+        becomes a failed LLMResponse, as a backend error would.
+        """
+        return list(await asyncio.gather(
+            *(self._guarded(self.client.chat, messages) for messages in requests)
+        ))
+
+    async def generate_many(
+        self, prompts: list[tuple[str, Optional[str]]]
+    ) -> list[LLMResponse]:
+        """Send independent (prompt, system) generations at once."""
+        return list(await asyncio.gather(
+            *(self._guarded(self.client.generate, prompt, system)
+              for prompt, system in prompts)
+        ))
+
+    def close(self) -> None:
+        """Stop the worker threads. The wrapped client stays open."""
+        self._executor.shutdown(wait=False)
+
+    def __enter__(self) -> "AsyncLLMClient":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    async def __aenter__(self) -> "AsyncLLMClient":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,345 @@
+"""
+Content-addressed cache of LLM responses.
+
+The same requests come up again and again: fallback locations, detail
+layers for common objects, and every request of a replayed seed.
+CachingLLMClient wraps any LLMClient and keys each request by a hash
+of its normalized content (kind, model, temperature, max tokens,
+system prompt and messages), so a repeat is answered without calling
+the backend.
+
+ResponseCache keeps the most recently used entries in an in-memory LRU
+in front of an optional SQLite file, which persists across runs. The
+file holds at most max_entries responses, least recently used going
+first, and entries older than ttl seconds are dropped.
+
+A reply at temperature > 0 is one sample of many, so such requests
+bypass the cache unless cache_any_temperature is set, as it is when
+recording a run for offline replay. In offline mode the backend is
+never called: a miss returns a failed LLMResponse, which callers
+already handle by falling back to their non-LLM paths.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Generator, Optional
+
+from .client import LLMClient, LLMResponse, LLMStream
+
+
+def request_key(kind: str, config, payload: dict) -> str:
+    """
+    Hash of a normalized request.
+
+    Line endings and surrounding whitespace in the text are normalized
+    and message fields other than role and content ignored, so requests
+    that would get the same reply share a key.
+    """
+    def norm(text) -> str:
+        return str(text or "").replace("\r\n", "\n").strip()
+
+    normalized = {"kind": kind, "model": config.model,
+                  "temperature": config.temperature, "max_tokens": config.max_tokens}
+    if "messages" in payload:
+        normalized["messages"] = [
+            [m.get("role", "user"), norm(m.get("content"))] for m in payload["messages"]
+        ]
+    else:
+        normalized["prompt"] = norm(payload["prompt"])
+        normalized["system"] = norm(payload.get("system"))
+    encoded = json.dumps(normalized, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """
+    LRU of responses in memory, over an optional SQLite store.
+
+    Attributes:
+        path: SQLite file, or None to keep entries in memory only
+        memory_entries: Entries kept in the in-memory LRU
+        max_entries: Entries kept in the file (in memory without one)
+        ttl: Seconds an entry stays valid, or None for no limit
+        evictions: Entries removed for space or age
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        memory_entries: int = 256,
+        max_entries: int = 10_000,
+        ttl: Optional[float] = None
+    ):
+        if memory_entries < 1 or max_entries < 1:
+            raise ValueError("Response cache sizes must be at least 1")
+        self.path = path
+        self.memory_entries = memory_entries if path else min(memory_entries, max_entries)
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.evictions = 0
+        # key -> (text, model, tokens_used, created)
+        self._memory: "OrderedDict[str, tuple]" = OrderedDict()
+        # Hits not yet written to the file's last_used, which would
+        # cost a write per hit; flushed before evicting and on close
+        self._touched: dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._db = None
+        if path:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, text TEXT NOT NULL, model TEXT NOT NULL, "
+                "tokens INTEGER NOT NULL, created REAL NOT NULL, last_used REAL NOT NULL)"
+            )
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used)"
+            )
+            self._db.commit()
+
+    def _expired(self, created: float, now: float) -> bool:
+        return self.ttl is not None and now - created > self.ttl
+
+    def get(self, key: str) -> Optional[LLMResponse]:
+        """The cached response for key, or None."""
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if not self._expired(entry[3], now):
+                    self._memory.move_to_end(key)
+                    if self._db is not None:
+                        self._touched[key] = now
+                    return self._response(entry)
+                del self._memory[key]
+                self.evictions += 1
+                if self._db is not None:
+                    self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    self._db.commit()
+                return None
+
+            if self._db is None:
+                return None
+            row = self._db.execute(
+                "SELECT text, model, tokens, created FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if self._expired(row[3], now):
+                self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._db.commit()
+                self.evictions += 1
+                return None
+            self._touched[key] = now
+            self._remember(key, tuple(row))
+            return self._response(row)
+
+    def put(self, key: str, response: LLMResponse) -> None:
+        """Store a successful response."""
+        entry = (response.text, response.model, response.tokens_used, time.time())
+        with self._lock:
+            self._remember(key, entry)
+            if self._db is None:
+                return
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (key, entry[0], entry[1], entry[2], entry[3], entry[3])
+            )
+            over = self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0] - self.max_entries
+            if over > 0:
+                self._flush_touched()
+                self._db.execute(
+                    "DELETE FROM responses WHERE key IN "
+                    "(SELECT key FROM responses ORDER BY last_used LIMIT ?)", (over,)
+                )
+                self.evictions += over
+            self._db.commit()
+
+    def _flush_touched(self) -> None:
+        self._db.executemany(
+            "UPDATE responses SET last_used = ? WHERE key = ?",
+            [(used, key) for key, used in self._touched.items()]
+        )
+        self._touched.clear()
+
+    def _remember(self, key: str, entry: tuple) -> None:
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+            if self._db is None:
+                # Without a file the memory LRU is the whole cache
+                self.evictions += 1
+
+    @staticmethod
+    def _response(entry) -> LLMResponse:
+        return LLMResponse(text=entry[0], success=True, model=entry[1], tokens_used=entry[2])
+
+    def expire(self) -> int:
+        """Remove every entry past its TTL. Returns how many were removed."""
+        if self.ttl is None:
+            return 0
+        cutoff = time.time() - self.ttl
+        with self._lock:
+            stale = [key for key, entry in self._memory.items() if entry[3] < cutoff]
+            for key in stale:
+                del self._memory[key]
+            removed = len(stale)
+            if self._db is not None:
+                removed = self._db.execute(
+                    "DELETE FROM responses WHERE created < ?", (cutoff,)
+                ).rowcount
+                self._db.commit()
+            self.evictions += removed
+            return removed
+
+    def __len__(self) -> int:
+        with self._lock:
+            if self._db is not None:
+                return self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+            return len(self._memory)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._memory.clear()
+            self._touched.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM responses")
+                self._db.commit()
+
+    def close(self) -> None:
+        """Close the SQLite file."""
+        with self._lock:
+            if self._db is not None:
+                self._flush_touched()
+                self._db.commit()
+                self._db.close()
+                self._db = None
+
+
+class CachingLLMClient(LLMClient):
+    """
+    An LLMClient that answers repeated requests from a ResponseCache.
+
+    Attributes:
+        client: The wrapped client, asked on a miss
+        cache: Where responses are kept
+        offline: Never call the client; misses fail
+        cache_any_temperature: Cache requests at temperature > 0 too
+        hits, misses, bypassed: Running totals of lookups
+    """
+
+    def __init__(
+        self,
+        client: LLMClient,
+        cache: Optional[ResponseCache] = None,
+        offline: bool = False,
+        cache_any_temperature: bool = False
+    ):
+        super().__init__(client.config)
+        self.transport = client.transport
+        self.client = client
+        self.cache = cache if cache is not None else ResponseCache()
+        self.offline = offline
+        self.cache_any_temperature = cache_any_temperature
+        self.hits = 0
+        self.misses = 0
+        self.bypassed = 0
+        self._lock = threading.Lock()
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def _key(self, kind: str, payload: dict) -> Optional[str]:
+        """The cache key, or None when the request bypasses the cache."""
+        if self.config.temperature > 0 and not (self.cache_any_temperature or self.offline):
+            self._count("bypassed")
+            return None
+        return request_key(kind, self.config, payload)
+
+    def _lookup(self, key: str) -> Optional[LLMResponse]:
+        start = time.perf_counter()
+        response = self.cache.get(key)
+        if response is None:
+            self._count("misses")
+            return None
+        self._count("hits")
+        response.latency_ms = (time.perf_counter() - start) * 1000
+        return response
+
+    def _store(self, key: str, response: LLMResponse) -> None:
+        if response.success and response.text:
+            self.cache.put(key, response)
+
+    def _fetch(self, key: Optional[str], ask) -> LLMResponse:
+        if key is not None:
+            cached = self._lookup(key)
+            if cached is not None:
+                return cached
+            if self.offline:
+                return LLMResponse.error_response("Offline: response not in cache")
+        response = ask()
+        if key is not None:
+            self._store(key, response)
+        return response
+
+    def check_availability(self) -> bool:
+        """Offline, the cache is the backend; otherwise ask the client."""
+        return self.offline or self.client.check_availability()
+
+    def generate(self, prompt: str, system: Optional[str] = None) -> LLMResponse:
+        """Generate, answering from the cache when possible."""
+        key = self._key("generate", {"prompt": prompt, "system": system})
+        return self._fetch(key, lambda: self.client.generate(prompt, system=system))
+
+    def chat(self, messages: list[dict]) -> LLMResponse:
+        """Chat, answering from the cache when possible."""
+        key = self._key("chat", {"messages": messages})
+        return self._fetch(key, lambda: self.client.chat(messages))
+
+    def chat_stream(self, messages: list[dict]) -> LLMStream:
+        """Stream a chat; a cached reply arrives as a single piece."""
+        return LLMStream(self._stream_pieces_cached(messages))
+
+    def _stream_pieces_cached(self, messages: list[dict]) -> Generator[str, None, LLMResponse]:
+        # Streamed and plain chats get the same reply, so share keys
+        key = self._key("chat", {"messages": messages})
+        if key is not None:
+            cached = self._lookup(key)
+            if cached is None and self.offline:
+                return LLMResponse.error_response("Offline: response not in cache")
+            if cached is not None:
+                cached.first_token_ms = cached.latency_ms
+                yield cached.text
+                return cached
+
+        stream = self.client.chat_stream(messages)
+        try:
+            yield from stream
+        finally:
+            stream.close()
+        if key is not None:
+            self._store(key, stream.response)
+        return stream.response
+
+    def stats(self) -> dict:
+        """Lookup totals and cache size."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "bypassed": self.bypassed,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": len(self.cache),
+            "evictions": self.cache.evictions,
+        }
+
+    def close(self) -> None:
+        """Close the client's connections and the cache file."""
+        self.client.close()
+        self.cache.close()
@@ -10,10 +10,11 @@ import os
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
-from typing import Optional
-import urllib.request
+from typing import Callable, Generator, Iterator, Optional
 import urllib.error
 
+from .transport import PooledTransport
+
 logger = logging.getLogger(__name__)
 
 
@@ -34,6 +35,16 @@ class LLMConfig:
     temperature: float = 0.7
     max_tokens: int = 256
     timeout: int = 30
+    # Keep-alive connection pooling
+    pool_size: int = 4              # Idle connections kept per base URL
+    pool_idle_timeout: float = 60.0  # Seconds before an idle connection is dropped
+    max_retries: int = 2            # Retries after a connection reset
+    retry_backoff: float = 0.1      # Seconds before the first retry, doubling
+    # Response cache
+    cache_path: Optional[str] = None  # SQLite file of cached responses
+    cache_ttl: Optional[float] = None  # Seconds a cached response stays valid
+    cache_any_temperature: bool = False  # Also cache temperature > 0 (recording replays)
+    offline: bool = False           # Answer only from the cache
     system_prompt: str = "You are a character in a noir mystery game. Respond in character."
 
     @classmethod
@@ -50,6 +61,10 @@ class LLMConfig:
             temperature=float(os.environ.get("LLM_TEMPERATURE", "0.7")),
             max_tokens=int(os.environ.get("LLM_MAX_TOKENS", "256")),
             timeout=int(os.environ.get("LLM_TIMEOUT", "30")),
+            cache_path=os.environ.get("LLM_CACHE") or None,
+            cache_ttl=float(os.environ["LLM_CACHE_TTL"]) if os.environ.get("LLM_CACHE_TTL") else None,
+            cache_any_temperature=os.environ.get("LLM_CACHE_ANY_TEMPERATURE", "") == "1",
+            offline=os.environ.get("LLM_OFFLINE", "") == "1",
         )
 
 
@@ -62,6 +77,7 @@ class LLMResponse:
     model: str = ""
     tokens_used: int = 0
     latency_ms: float = 0.0
+    first_token_ms: float = 0.0  # Time to the first streamed piece
 
     @classmethod
     def error_response(cls, error: str) -> "LLMResponse":
@@ -69,12 +85,148 @@ class LLMResponse:
         return cls(text="", success=False, error=error)
 
 
+class LLMStream:
+    """
+    A response delivered in text pieces as the model produces them.
+
+    Iterate for the pieces. Once they run out, response holds the full
+    LLMResponse, with the joined text, token count and timings.
+    """
+
+    def __init__(self, pieces: Iterator[str]):
+        self._pieces = pieces
+        self._parts: list[str] = []
+        self.response: Optional[LLMResponse] = None
+
+    def __iter__(self) -> "LLMStream":
+        return self
+
+    def __next__(self) -> str:
+        try:
+            piece = next(self._pieces)
+        except StopIteration as stop:
+            if self.response is None:
+                self.response = stop.value or LLMResponse(text="".join(self._parts))
+            raise StopIteration
+        self._parts.append(piece)
+        return piece
+
+    def read(self) -> str:
+        """Consume the remaining pieces and return the whole text."""
+        for _ in self:
+            pass
+        return self.response.text
+
+    def close(self) -> None:
+        """Stop early, dropping the rest of the response."""
+        close = getattr(self._pieces, "close", None)
+        if close is not None:
+            close()
+
+
 class LLMClient(ABC):
     """Abstract base class for LLM clients."""
 
     def __init__(self, config: LLMConfig):
         self.config = config
         self._available: Optional[bool] = None
+        self.transport = PooledTransport(
+            pool_size=config.pool_size,
+            idle_timeout=config.pool_idle_timeout,
+            max_retries=config.max_retries,
+            retry_backoff=config.retry_backoff,
+        )
+
+    def _request_json(
+        self,
+        method: str,
+        url: str,
+        payload: Optional[dict] = None,
+        headers: Optional[dict] = None,
+        timeout: Optional[float] = None
+    ) -> dict:
+        """Send a JSON request over the pooled transport and decode the reply."""
+        headers = dict(headers or {})
+        body = None
+        if payload is not None:
+            body = json.dumps(payload).encode("utf-8")
+            headers["Content-Type"] = "application/json"
+        response = self.transport.request(
+            method, url, body=body, headers=headers,
+            timeout=self.config.timeout if timeout is None else timeout
+        )
+        return json.loads(response.body.decode())
+
+    def _stream_pieces(
+        self,
+        url: str,
+        payload: dict,
+        parse_line: Callable[[bytes, dict], str],
+        headers: Optional[dict] = None
+    ) -> Generator[str, None, LLMResponse]:
+        """
+        POST a streaming request and yield the text pieces of the reply.
+
+        parse_line turns one response line into a text piece ("" for
+        none) and may set "model" and "tokens" in the state dict it is
+        given. Errors before the first piece are raised; after it, the
+        partial text is returned as a failed LLMResponse.
+        """
+        import time
+        start = time.time()
+        headers = dict(headers or {})
+        headers["Content-Type"] = "application/json"
+        state = {"model": self.config.model, "tokens": 0}
+        parts = []
+        first_token_ms = 0.0
+        lines = self.transport.stream_lines(
+            "POST", url, body=json.dumps(payload).encode("utf-8"),
+            headers=headers, timeout=self.config.timeout
+        )
+        try:
+            for line in lines:
+                try:
+                    piece = parse_line(line, state)
+                except (urllib.error.URLError, ValueError) as e:
+                    # A bad line is as fatal as a dropped connection
+                    raise urllib.error.URLError(e)
+                if piece:
+                    if not parts:
+                        first_token_ms = (time.time() - start) * 1000
+                    parts.append(piece)
+                    yield piece
+        except urllib.error.URLError as e:
+            if not parts:
+                raise
+            logger.warning("LLM stream interrupted after %d pieces: %s", len(parts), e)
+            return LLMResponse(
+                text="".join(parts),
+                success=False,
+                error=f"Stream interrupted: {e}",
+                model=state["model"],
+                latency_ms=(time.time() - start) * 1000,
+                first_token_ms=first_token_ms
+            )
+        finally:
+            lines.close()
+
+        latency = (time.time() - start) * 1000
+        logger.info(
+            "LLM stream OK model=%s tokens=%d first=%.0fms latency=%.0fms",
+            state["model"], state["tokens"], first_token_ms, latency,
+        )
+        return LLMResponse(
+            text="".join(parts),
+            success=True,
+            model=state["model"],
+            tokens_used=state["tokens"],
+            latency_ms=latency,
+            first_token_ms=first_token_ms
+        )
+
+    def close(self) -> None:
+        """Close pooled connections."""
+        self.transport.close()
 
     @abstractmethod
     def generate(self, prompt: str, system: Optional[str] = None) -> LLMResponse:
@@ -110,6 +262,37 @@ class LLMClient(ABC):
 
         return self.generate(prompt, system=system)
 
+    def chat_many(
+        self, requests: list[list[dict]], max_concurrency: Optional[int] = None
+    ) -> list[LLMResponse]:
+        """
+        Send independent chats concurrently, replies in request order.
+
+        At most max_concurrency (default: the pool size) are in flight,
+        so the batch takes about as long as its slowest reply.
+        """
+        if len(requests) <= 1:
+            return [self.chat(messages) for messages in requests]
+        from .async_client import AsyncLLMClient, run_sync
+        with AsyncLLMClient(self, max_concurrency) as async_client:
+            return run_sync(async_client.chat_many(requests))
+
+    def chat_stream(self, messages: list[dict]) -> LLMStream:
+        """
+        Chat, yielding the reply in pieces as it is generated.
+
+        The default implementation has nothing to stream: it yields the
+        whole chat() reply as one piece.
+        """
+        return LLMStream(self._whole_reply(messages))
+
+    def _whole_reply(self, messages: list[dict]) -> Generator[str, None, LLMResponse]:
+        response = self.chat(messages)
+        response.first_token_ms = response.latency_ms
+        if response.text:
+            yield response.text
+        return response
+
 
 class OllamaClient(LLMClient):
     """Ollama LLM client for local inference."""
@@ -118,11 +301,9 @@ class OllamaClient(LLMClient):
         """Check if Ollama is running and model is available."""
         try:
             url = f"{self.config.base_url}/api/tags"
-            req = urllib.request.Request(url, method="GET")
-            with urllib.request.urlopen(req, timeout=5) as response:
-                data = json.loads(response.read().decode())
-                models = [m.get("name", "").split(":")[0] for m in data.get("models", [])]
-                return self.config.model.split(":")[0] in models or len(models) > 0
+            data = self._request_json("GET", url, timeout=5)
+            models = [m.get("name", "").split(":")[0] for m in data.get("models", [])]
+            return self.config.model.split(":")[0] in models or len(models) > 0
         except Exception:
             return False
 
@@ -146,30 +327,21 @@ class OllamaClient(LLMClient):
             payload["system"] = system
 
         try:
-            data = json.dumps(payload).encode("utf-8")
-            req = urllib.request.Request(
-                url,
-                data=data,
-                headers={"Content-Type": "application/json"},
-                method="POST"
-            )
+            result = self._request_json("POST", url, payload)
+            latency = (time.time() - start) * 1000
+            tokens = result.get("eval_count", 0)
 
-            with urllib.request.urlopen(req, timeout=self.config.timeout) as response:
-                result = json.loads(response.read().decode())
-                latency = (time.time() - start) * 1000
-                tokens = result.get("eval_count", 0)
-
-                logger.info(
-                    "LLM generate OK model=%s tokens=%d latency=%.0fms",
-                    result.get("model", self.config.model), tokens, latency,
-                )
-                return LLMResponse(
-                    text=result.get("response", ""),
-                    success=True,
-                    model=result.get("model", self.config.model),
-                    tokens_used=tokens,
-                    latency_ms=latency
-                )
+            logger.info(
+                "LLM generate OK model=%s tokens=%d latency=%.0fms",
+                result.get("model", self.config.model), tokens, latency,
+            )
+            return LLMResponse(
+                text=result.get("response", ""),
+                success=True,
+                model=result.get("model", self.config.model),
+                tokens_used=tokens,
+                latency_ms=latency
+            )
 
         except urllib.error.URLError as e:
             logger.warning("LLM generate FAIL (URLError): %s", e)
@@ -201,31 +373,22 @@ class OllamaClient(LLMClient):
         }
 
         try:
-            data = json.dumps(payload).encode("utf-8")
-            req = urllib.request.Request(
-                url,
-                data=data,
-                headers={"Content-Type": "application/json"},
-                method="POST"
-            )
+            result = self._request_json("POST", url, payload)
+            latency = (time.time() - start) * 1000
+            tokens = result.get("eval_count", 0)
 
-            with urllib.request.urlopen(req, timeout=self.config.timeout) as response:
-                result = json.loads(response.read().decode())
-                latency = (time.time() - start) * 1000
-                tokens = result.get("eval_count", 0)
-
-                logger.info(
-                    "LLM chat OK model=%s tokens=%d latency=%.0fms",
-                    result.get("model", self.config.model), tokens, latency,
-                )
-                message = result.get("message", {})
-                return LLMResponse(
-                    text=message.get("content", ""),
-                    success=True,
-                    model=result.get("model", self.config.model),
-                    tokens_used=tokens,
-                    latency_ms=latency
-                )
+            logger.info(
+                "LLM chat OK model=%s tokens=%d latency=%.0fms",
+                result.get("model", self.config.model), tokens, latency,
+            )
+            message = result.get("message", {})
+            return LLMResponse(
+                text=message.get("content", ""),
+                success=True,
+                model=result.get("model", self.config.model),
+                tokens_used=tokens,
+                latency_ms=latency
+            )
 
         except (urllib.error.URLError, urllib.error.HTTPError, json.JSONDecodeError) as e:
             logger.warning("Ollama chat endpoint failed (%s), falling back to generate: %s", type(e).__name__, e)
@@ -234,6 +397,28 @@ class OllamaClient(LLMClient):
             logger.error("Unexpected error in Ollama chat: %s: %s", type(e).__name__, e)
             return LLMResponse.error_response(f"Unexpected error: {e}")
 
+    def chat_stream(self, messages: list[dict]) -> LLMStream:
+        """Chat using Ollama's chat endpoint, streaming NDJSON."""
+        return LLMStream(self._chat_pieces(messages))
+
+    def _chat_pieces(self, messages: list[dict]) -> Generator[str, None, LLMResponse]:
+        url = f"{self.config.base_url}/api/chat"
+        payload = {
+            "model": self.config.model,
+            "messages": messages,
+            "stream": True,
+            "options": {
+                "temperature": self.config.temperature,
+                "num_predict": self.config.max_tokens,
+            }
+        }
+
+        try:
+            return (yield from self._stream_pieces(url, payload, _parse_ollama_line))
+        except urllib.error.URLError as e:
+            logger.warning("Ollama chat stream failed (%s), falling back to chat: %s", type(e).__name__, e)
+            return (yield from self._whole_reply(messages))
+
 
 class OpenAIClient(LLMClient):
     """OpenAI API client."""
@@ -252,13 +437,12 @@ class OpenAIClient(LLMClient):
             return False
         try:
             url = f"{self.config.base_url}/models"
-            req = urllib.request.Request(
-                url,
+            response = self.transport.request(
+                "GET", url,
                 headers={"Authorization": f"Bearer {self.config.api_key}"},
-                method="GET"
+                timeout=5
             )
-            with urllib.request.urlopen(req, timeout=5) as response:
-                return response.status == 200
+            return response.status == 200
         except Exception:
             return False
 
@@ -287,39 +471,85 @@ class OpenAIClient(LLMClient):
         }
 
         try:
-            data = json.dumps(payload).encode("utf-8")
-            req = urllib.request.Request(
-                url,
-                data=data,
-                headers={
-                    "Content-Type": "application/json",
-                    "Authorization": f"Bearer {self.config.api_key}"
-                },
-                method="POST"
+            result = self._request_json(
+                "POST", url, payload,
+                headers={"Authorization": f"Bearer {self.config.api_key}"}
             )
+            latency = (time.time() - start) * 1000
+
+            choice = result.get("choices", [{}])[0]
+            message = choice.get("message", {})
+            usage = result.get("usage", {})
+
+            return LLMResponse(
+                text=message.get("content", ""),
+                success=True,
+                model=result.get("model", self.config.model),
+                tokens_used=usage.get("total_tokens", 0),
+                latency_ms=latency
+            )
+
+        except urllib.error.HTTPError as e:
+            return LLMResponse.error_response(f"API error {e.code}: {e.reason}")
+        except Exception as e:
+            return LLMResponse.error_response(f"Error: {e}")
 
-            with urllib.request.urlopen(req, timeout=self.config.timeout) as response:
-                result = json.loads(response.read().decode())
-                latency = (time.time() - start) * 1000
+    def chat_stream(self, messages: list[dict]) -> LLMStream:
+        """Chat using OpenAI API, streaming server-sent events."""
+        return LLMStream(self._chat_pieces(messages))
 
-                choice = result.get("choices", [{}])[0]
-                message = choice.get("message", {})
-                usage = result.get("usage", {})
+    def _chat_pieces(self, messages: list[dict]) -> Generator[str, None, LLMResponse]:
+        if not self.config.api_key:
+            return LLMResponse.error_response("No API key configured")
 
-                return LLMResponse(
-                    text=message.get("content", ""),
-                    success=True,
-                    model=result.get("model", self.config.model),
-                    tokens_used=usage.get("total_tokens", 0),
-                    latency_ms=latency
-                )
+        url = f"{self.config.base_url}/chat/completions"
+        payload = {
+            "model": self.config.model,
+            "messages": messages,
+            "temperature": self.config.temperature,
+            "max_tokens": self.config.max_tokens,
+            "stream": True,
+            "stream_options": {"include_usage": True},
+        }
 
+        try:
+            return (yield from self._stream_pieces(
+                url, payload, _parse_openai_line,
+                headers={"Authorization": f"Bearer {self.config.api_key}"}
+            ))
         except urllib.error.HTTPError as e:
             return LLMResponse.error_response(f"API error {e.code}: {e.reason}")
         except Exception as e:
             return LLMResponse.error_response(f"Error: {e}")
 
 
+def _parse_ollama_line(line: bytes, state: dict) -> str:
+    """One NDJSON chunk from Ollama's /api/chat."""
+    chunk = json.loads(line)
+    if "error" in chunk:
+        raise ValueError(chunk["error"])
+    state["model"] = chunk.get("model", state["model"])
+    if chunk.get("done"):
+        state["tokens"] = chunk.get("eval_count", 0)
+    return chunk.get("message", {}).get("content", "")
+
+
+def _parse_openai_line(line: bytes, state: dict) -> str:
+    """One server-sent event from OpenAI's chat completions."""
+    if not line.startswith(b"data:"):
+        return ""
+    data = line[5:].strip()
+    if data == b"[DONE]":
+        return ""
+    chunk = json.loads(data)
+    state["model"] = chunk.get("model", state["model"])
+    usage = chunk.get("usage")
+    if usage:
+        state["tokens"] = usage.get("total_tokens", 0)
+    choices = chunk.get("choices") or [{}]
+    return (choices[0].get("delta") or {}).get("content") or ""
+
+
 class MockLLMClient(LLMClient):
     """Mock LLM client for testing."""
 
@@ -362,13 +592,28 @@ class MockLLMClient(LLMClient):
 
 
 def create_llm_client(config: Optional[LLMConfig] = None) -> LLMClient:
-    """Create an LLM client based on configuration."""
+    """
+    Create an LLM client based on configuration.
+
+    With cache_path set, or offline, the client is wrapped in a
+    CachingLLMClient.
+    """
     if config is None:
         config = LLMConfig.from_env()
 
     if config.backend == LLMBackend.OLLAMA:
-        return OllamaClient(config)
+        client = OllamaClient(config)
     elif config.backend == LLMBackend.OPENAI:
-        return OpenAIClient(config)
+        client = OpenAIClient(config)
     else:
-        return MockLLMClient(config)
+        client = MockLLMClient(config)
+
+    if config.cache_path or config.offline:
+        from .cache import CachingLLMClient, ResponseCache
+        return CachingLLMClient(
+            client,
+            ResponseCache(config.cache_path, ttl=config.cache_ttl),
+            offline=config.offline,
+            cache_any_temperature=config.cache_any_temperature,
+        )
+    return client
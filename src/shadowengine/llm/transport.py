@@ -0,0 +1,444 @@
+"""
+Pooled HTTP transport for LLM backends.
+
+urllib.request.urlopen opens a new connection for every call, so each
+NPC line paid for TCP (and, for OpenAI, TLS) setup. PooledTransport
+keeps http.client keep-alive connections per scheme, host and port and
+reuses them. Connections idle longer than idle_timeout are dropped
+rather than reused. A request that fails because the connection was
+reset is retried on a fresh connection. If the reset connection came
+from the pool, the server most likely just closed it while idle, so
+the retry goes out at once; resets on fresh connections are retried
+with exponential backoff between attempts.
+
+Like urlopen, the transport honours the HTTP_PROXY, HTTPS_PROXY and
+NO_PROXY environment variables. A plain HTTP request goes to the proxy
+with the full URL as its target. An HTTPS request opens a CONNECT tunnel
+through the proxy, so TLS still runs end to end with the real host.
+
+Errors are raised as urllib.error.URLError (connection problems) and
+urllib.error.HTTPError (status >= 400), the same types urlopen raised,
+so callers handle them as before. Every request is timed into a
+LatencyHistogram, split into connect, first byte and total.
+"""
+
+import base64
+import http.client
+import socket
+import threading
+import time
+import urllib.error
+import urllib.request
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Iterator, Optional
+from urllib.parse import unquote, urlsplit
+
+
+# Connection failures worth retrying on a fresh connection
+RETRYABLE_ERRORS = (
+    ConnectionResetError,
+    ConnectionAbortedError,
+    BrokenPipeError,
+    http.client.RemoteDisconnected,
+    http.client.BadStatusLine,
+)
+
+
+class LatencyHistogram:
+    """Request latencies in fixed millisecond buckets, per phase."""
+
+    PHASES = ("connect", "first_byte", "total")
+    # Bucket upper bounds (ms); the last bucket is everything above
+    BOUNDS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counts = {phase: [0] * (len(self.BOUNDS_MS) + 1) for phase in self.PHASES}
+        self.sums_ms = {phase: 0.0 for phase in self.PHASES}
+
+    def record(self, phase: str, ms: float) -> None:
+        """Add one measurement."""
+        with self._lock:
+            self.counts[phase][bisect_left(self.BOUNDS_MS, ms)] += 1
+            self.sums_ms[phase] += ms
+
+    def percentile(self, phase: str, fraction: float) -> Optional[float]:
+        """
+        Upper bound (ms) of the bucket holding the given fraction.
+
+        Returns None with no measurements, and infinity when the
+        fraction falls above the last bound.
+        """
+        counts = self.counts[phase]
+        total = sum(counts)
+        if not total:
+            return None
+        target = fraction * total
+        running = 0
+        for index, count in enumerate(counts):
+            running += count
+            if running >= target and count:
+                break
+        return self.BOUNDS_MS[index] if index < len(self.BOUNDS_MS) else float("inf")
+
+    def summary(self) -> dict:
+        """Count, mean, p50 and p95 per phase."""
+        result = {}
+        for phase in self.PHASES:
+            count = sum(self.counts[phase])
+            result[phase] = {
+                "count": count,
+                "mean_ms": self.sums_ms[phase] / count if count else 0.0,
+                "p50_ms": self.percentile(phase, 0.5),
+                "p95_ms": self.percentile(phase, 0.95),
+            }
+        return result
+
+
+@dataclass
+class TransportResponse:
+    """A fully read HTTP response."""
+    status: int
+    reason: str
+    headers: dict
+    body: bytes
+
+
+def proxy_for(scheme: str, host: str, port: Optional[int]) -> Optional[str]:
+    """The proxy URL urlopen would use for a host, or None to connect directly."""
+    proxy = urllib.request.getproxies().get(scheme)
+    if not proxy:
+        return None
+    if urllib.request.proxy_bypass(f"{host}:{port}" if port else host):
+        return None
+    return proxy
+
+
+class ConnectionPool:
+    """Idle keep-alive connections to one scheme, host and port."""
+
+    def __init__(self, scheme: str, host: str, port: Optional[int],
+                 size: int, idle_timeout: float, proxy: Optional[str] = None):
+        self.scheme = scheme
+        self.host = host
+        self.port = port
+        self.size = size
+        self.idle_timeout = idle_timeout
+        self.proxy = proxy
+        # Headers for the proxy: on each request over plain HTTP, on the
+        # CONNECT for HTTPS
+        self.proxy_headers: dict = {}
+        if proxy is not None:
+            parts = urlsplit(proxy if "://" in proxy else "http://" + proxy)
+            self._proxy_host = parts.hostname
+            self._proxy_port = parts.port
+            if parts.username is not None:
+                credentials = f"{unquote(parts.username)}:{unquote(parts.password or '')}"
+                self.proxy_headers["Proxy-Authorization"] = (
+                    "Basic " + base64.b64encode(credentials.encode()).decode("ascii")
+                )
+        self._idle: list[tuple[http.client.HTTPConnection, float]] = []
+        self._lock = threading.Lock()
+
+    @property
+    def forwards(self) -> bool:
+        """Whether requests go to a proxy that forwards them (plain HTTP)."""
+        return self.proxy is not None and self.scheme == "http"
+
+    def request_target(self, path: str) -> str:
+        """The request line target: the full URL when forwarding through a proxy."""
+        if not self.forwards:
+            return path
+        netloc = f"{self.host}:{self.port}" if self.port else self.host
+        return f"http://{netloc}{path}"
+
+    def new_connection(self, timeout: float) -> http.client.HTTPConnection:
+        """An unconnected connection to this pool's host, or to its proxy."""
+        if self.proxy is None:
+            if self.scheme == "https":
+                return http.client.HTTPSConnection(self.host, self.port, timeout=timeout)
+            return http.client.HTTPConnection(self.host, self.port, timeout=timeout)
+        if self.scheme == "https":
+            connection = http.client.HTTPSConnection(
+                self._proxy_host, self._proxy_port, timeout=timeout
+            )
+            connection.set_tunnel(self.host, self.port, headers=self.proxy_headers)
+            return connection
+        return http.client.HTTPConnection(self._proxy_host, self._proxy_port, timeout=timeout)
+
+    def acquire(self) -> Optional[http.client.HTTPConnection]:
+        """The most recently used idle connection, or None."""
+        now = time.monotonic()
+        with self._lock:
+            while self._idle:
+                connection, last_used = self._idle.pop()
+                if now - last_used <= self.idle_timeout:
+                    return connection
+                connection.close()
+        return None
+
+    def release(self, connection: http.client.HTTPConnection) -> None:
+        """Keep a connection for reuse, or close it if the pool is full."""
+        with self._lock:
+            if len(self._idle) < self.size:
+                self._idle.append((connection, time.monotonic()))
+                return
+        connection.close()
+
+    def idle_count(self) -> int:
+        """Connections waiting to be reused."""
+        with self._lock:
+            return len(self._idle)
+
+    def close(self) -> None:
+        """Close every idle connection."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for connection, _ in idle:
+            connection.close()
+
+
+class PooledTransport:
+    """
+    Keep-alive HTTP requests, pooled per base URL.
+
+    pool_size caps the idle connections kept per host; more requests
+    can run at once, and the extra connections are closed afterwards.
+    Each host's proxy is looked up from the environment when its pool
+    is created.
+    """
+
+    def __init__(
+        self,
+        pool_size: int = 4,
+        idle_timeout: float = 60.0,
+        max_retries: int = 2,
+        retry_backoff: float = 0.1
+    ):
+        self.pool_size = pool_size
+        self.idle_timeout = idle_timeout
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.histogram = LatencyHistogram()
+        self._pools: dict[tuple[str, str, Optional[int]], ConnectionPool] = {}
+        self._lock = threading.Lock()
+        # Running totals
+        self.connections_opened = 0
+        self.connections_reused = 0
+        self.retries = 0
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def _pool(self, scheme: str, host: str, port: Optional[int]) -> ConnectionPool:
+        key = (scheme, host, port)
+        with self._lock:
+            pool = self._pools.get(key)
+            if pool is None:
+                pool = self._pools[key] = ConnectionPool(
+                    scheme, host, port, self.pool_size, self.idle_timeout,
+                    proxy_for(scheme, host, port),
+                )
+            return pool
+
+    def _target(self, url: str) -> tuple[ConnectionPool, str]:
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise urllib.error.URLError(f"unsupported URL: {url}")
+        try:
+            port = parts.port
+        except ValueError as e:
+            raise urllib.error.URLError(e)
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+        pool = self._pool(parts.scheme, parts.hostname, port)
+        return pool, pool.request_target(path)
+
+    def _open(
+        self,
+        url: str,
+        method: str,
+        body: Optional[bytes],
+        headers: Optional[dict],
+        timeout: float
+    ):
+        """Send a request and read the response headers, retrying resets."""
+        pool, path = self._target(url)
+        if pool.forwards and pool.proxy_headers:
+            headers = {**pool.proxy_headers, **(headers or {})}
+        attempt = 0
+        fresh = False
+        while True:
+            connection = None if fresh else pool.acquire()
+            try:
+                return (pool,) + self._send(
+                    pool, connection, method, path, body, headers or {}, timeout
+                )
+            except RETRYABLE_ERRORS as e:
+                if connection is not None:
+                    # A pooled connection the server dropped while idle;
+                    # retry at once on a new one, without using up an attempt
+                    fresh = True
+                elif attempt >= self.max_retries:
+                    raise urllib.error.URLError(e)
+                else:
+                    time.sleep(self.retry_backoff * (2 ** attempt))
+                    attempt += 1
+                self._count("retries")
+            except OSError as e:
+                raise urllib.error.URLError(e)
+
+    def _send(
+        self,
+        pool: ConnectionPool,
+        connection: Optional[http.client.HTTPConnection],
+        method: str,
+        path: str,
+        body: Optional[bytes],
+        headers: dict,
+        timeout: float
+    ):
+        """Send on a pooled connection, or on a new one when connection is None."""
+        started = time.perf_counter()
+        if connection is None:
+            connection = pool.new_connection(timeout)
+            try:
+                connection.connect()
+                # Small request writes on a kept-alive connection must not
+                # wait on the peer's delayed ACK
+                connection.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            except OSError:
+                connection.close()
+                raise
+            self._count("connections_opened")
+            self.histogram.record("connect", (time.perf_counter() - started) * 1000)
+        else:
+            connection.timeout = timeout
+            if connection.sock is not None:
+                connection.sock.settimeout(timeout)
+            self._count("connections_reused")
+
+        try:
+            connection.request(method, path, body=body, headers=headers)
+            response = connection.getresponse()
+        except BaseException:
+            connection.close()
+            raise
+        self.histogram.record("first_byte", (time.perf_counter() - started) * 1000)
+        return connection, response, started
+
+    def _finish(
+        self,
+        pool: ConnectionPool,
+        connection: http.client.HTTPConnection,
+        response: http.client.HTTPResponse,
+        started: float
+    ) -> None:
+        """Record the total time and hand back a fully read connection."""
+        self.histogram.record("total", (time.perf_counter() - started) * 1000)
+        if response.will_close:
+            connection.close()
+        else:
+            pool.release(connection)
+
+    def _read(self, connection, response, partial: bool = False) -> bytes:
+        """Read the body (or what has arrived of it); a failed read loses the connection."""
+        try:
+            return response.read1(65536) if partial else response.read()
+        except BaseException as e:
+            connection.close()
+            if isinstance(e, (OSError, http.client.HTTPException)):
+                raise urllib.error.URLError(e)
+            raise
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes] = None,
+        headers: Optional[dict] = None,
+        timeout: float = 30
+    ) -> TransportResponse:
+        """
+        Send a request and read the whole response.
+
+        Raises urllib.error.HTTPError for status >= 400 and
+        urllib.error.URLError when no response could be had.
+        """
+        pool, connection, response, started = self._open(url, method, body, headers, timeout)
+        data = self._read(connection, response)
+        self._finish(pool, connection, response, started)
+        if response.status >= 400:
+            raise urllib.error.HTTPError(
+                url, response.status, response.reason, dict(response.getheaders()), None
+            )
+        return TransportResponse(
+            status=response.status,
+            reason=response.reason,
+            headers=dict(response.getheaders()),
+            body=data
+        )
+
+    def stream_lines(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes] = None,
+        headers: Optional[dict] = None,
+        timeout: float = 30
+    ) -> Iterator[bytes]:
+        """
+        Send a request and yield the response body line by line.
+
+        For NDJSON and server-sent events. Blank lines are skipped and
+        line endings removed. The connection goes back to the pool only
+        if the body is read to the end; closing the generator early
+        closes it. Raises like request().
+        """
+        pool, connection, response, started = self._open(url, method, body, headers, timeout)
+        if response.status >= 400:
+            self._read(connection, response)
+            self._finish(pool, connection, response, started)
+            raise urllib.error.HTTPError(
+                url, response.status, response.reason, dict(response.getheaders()), None
+            )
+        finished = False
+        buffer = b""
+        try:
+            while True:
+                # read1 returns as soon as anything arrives, and unlike
+                # readline raises when a chunked body is cut off
+                data = self._read(connection, response, partial=True)
+                if not data:
+                    break
+                *lines, buffer = (buffer + data).split(b"\n")
+                for line in lines:
+                    line = line.rstrip(b"\r")
+                    if line:
+                        yield line
+            if response.length:
+                raise urllib.error.URLError(http.client.IncompleteRead(buffer, response.length))
+            buffer = buffer.rstrip(b"\r")
+            if buffer:
+                yield buffer
+            finished = True
+            self._finish(pool, connection, response, started)
+        finally:
+            if not finished:
+                connection.close()
+
+    def idle_connections(self) -> int:
+        """Idle connections across all pools."""
+        with self._lock:
+            pools = list(self._pools.values())
+        return sum(pool.idle_count() for pool in pools)
+
+    def close(self) -> None:
+        """Close every pooled connection."""
+        with self._lock:
+            pools = list(self._pools.values())
+        for pool in pools:
+            pool.close()
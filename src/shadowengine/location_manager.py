@@ -19,6 +19,7 @@ from .llm.client import LLMClient
 from .llm.validation import safe_parse_json, validate_location_response
 from .world_state import WorldState
 from .generation.location_generator import LocationGenerator
+from .prefetch import PrefetchScheduler
 
 logger = logging.getLogger(__name__)
 
@@ -34,10 +35,12 @@ class LocationManager:
         llm_client: LLMClient,
         world_state: WorldState,
         renderer: Renderer,
+        prefetcher: Optional[PrefetchScheduler] = None,
     ):
         self.llm_client = llm_client
         self.world_state = world_state
         self.renderer = renderer
+        self.prefetcher = prefetcher
         self.location_prompt = LocationPrompt()
         self.location_generator = LocationGenerator(llm_client, world_state)
 
@@ -155,10 +158,56 @@ class LocationManager:
         add_character_fn,
     ) -> None:
         """Generate a new location via LLM and move there."""
-        # Calculate distance
-        current_distance = self.location_distances.get(state.current_location_id, 0)
-        new_distance = current_distance + 1
-        self.location_distances[dest_id] = new_distance
+        messages = self._location_messages(destination_desc, current_location, state)
+        self.location_distances[dest_id] = (
+            self.location_distances.get(state.current_location_id, 0) + 1
+        )
+
+        self.renderer.render_text("Generating new area...")
+
+        # Use the answer generated while the player read the last scene,
+        # if it was asked for exactly this
+        hit, response = (
+            self.prefetcher.take(("location", dest_id), messages)
+            if self.prefetcher is not None else (False, None)
+        )
+        if not hit:
+            response = self.llm_client.chat(messages)
+
+        if response.success:
+            location = self.parse_location_response(
+                response.text, dest_id, destination_desc,
+                current_location, state, add_character_fn,
+            )
+            if location:
+                state.locations[location.id] = location
+                state.environment.register_location(
+                    location.id, is_indoor=not location.is_outdoor
+                )
+                state.current_location_id = location.id
+
+                state.memory.world.record(
+                    event_type=EventType.MOVEMENT,
+                    description=f"Player discovered {location.name}",
+                    location=location.id,
+                    actors=["player"],
+                )
+
+                if config.time_passes_on_action:
+                    state.memory.advance_time(config.time_units_per_action * 2)
+                return
+
+        # Fallback
+        self.create_fallback_location(dest_id, destination_desc, current_location, state)
+
+    def _location_messages(
+        self,
+        destination_desc: str,
+        current_location: Optional[Location],
+        state: 'GameState',
+    ) -> list[dict]:
+        """Build the generation request for a new location, touching nothing."""
+        new_distance = self.location_distances.get(state.current_location_id, 0) + 1
 
         # Build context
         world_context = self.world_state.get_world_context_for_generation("location")
@@ -181,8 +230,6 @@ class LocationManager:
         time_str = state.environment.time.current_period.value if state.environment else "night"
         weather_str = state.environment.weather.get_description() if state.environment else "clear"
 
-        self.renderer.render_text("Generating new area...")
-
         system_prompt = self.location_prompt.get_system_prompt()
         generation_prompt = self.location_prompt.get_generation_prompt(
             current_location=current_location.name if current_location else "unknown",
@@ -196,36 +243,39 @@ class LocationManager:
             inventory=state.inventory,
         )
 
-        response = self.llm_client.chat([
+        return [
             {"role": "system", "content": system_prompt},
             {"role": "user", "content": generation_prompt},
-        ])
+        ]
 
-        if response.success:
-            location = self.parse_location_response(
-                response.text, dest_id, destination_desc,
-                current_location, state, add_character_fn,
-            )
-            if location:
-                state.locations[location.id] = location
-                state.environment.register_location(
-                    location.id, is_indoor=not location.is_outdoor
-                )
-                state.current_location_id = location.id
+    def prefetch_exits(self, state: 'GameState', priority: int = 0) -> list:
+        """
+        Start generating the locations behind this scene's unexplored exits.
 
-                state.memory.world.record(
-                    event_type=EventType.MOVEMENT,
-                    description=f"Player discovered {location.name}",
-                    location=location.id,
-                    actors=["player"],
-                )
+        Only the LLM request runs in the background; the location is
+        built when the player takes the exit. Returns the keys
+        submitted.
+        """
+        current_location = state.locations.get(state.current_location_id)
+        if self.prefetcher is None or current_location is None:
+            return []
 
-                if config.time_passes_on_action:
-                    state.memory.advance_time(config.time_units_per_action * 2)
-                return
-
-        # Fallback
-        self.create_fallback_location(dest_id, destination_desc, current_location, state)
+        keys = []
+        for hotspot in current_location.hotspots:
+            if (
+                hotspot.hotspot_type != HotspotType.EXIT
+                or not hotspot.target_id
+                or hotspot.target_id in state.locations
+                or not (hotspot.visible and hotspot.active)
+            ):
+                continue
+            key = ("location", hotspot.target_id)
+            messages = self._location_messages(hotspot.label, current_location, state)
+            self.prefetcher.submit(
+                key, messages, lambda m=messages: self.llm_client.chat(m), priority
+            )
+            keys.append(key)
+        return keys
 
     def parse_location_response(
         self,
@@ -31,7 +31,7 @@ from .interaction import Hotspot, HotspotType
 from .memory import EventType
 
 if TYPE_CHECKING:
-    from .llm.client import LLMClient
+    from .llm.client import LLMClient, LLMResponse
     from .render import Renderer
 
 logger = logging.getLogger(__name__)
@@ -77,10 +77,18 @@ class NPCAgency:
         )
         self._defended = set(data.get("defended", []))
 
-    def update(self, state, renderer: 'Renderer') -> None:
+    def update(
+        self, state, renderer: 'Renderer', reply: Optional['LLMResponse'] = None,
+    ) -> None:
+        """
+        Called once per exploration tick.
+
+        reply, if given, is the answer to line_request(state), already
+        generated alongside the tick's other lines.
+        """
         if not state.spine or not state.is_running:
             return
-        self._framed_defense(state, renderer)
+        self._framed_defense(state, renderer, reply)
         if state.is_running:
             self._culprit_self_preservation(state, renderer)
 
@@ -250,11 +258,31 @@ class NPCAgency:
     # The framed defend themselves
     # ------------------------------------------------------------------
 
-    def _framed_defense(self, state, renderer: 'Renderer') -> None:
+    def line_request(self, state) -> Optional[list[dict]]:
+        """The chat the next update() will send, or None if no one speaks."""
+        if not state.spine or not state.is_running:
+            return None
+        defense = self._next_defense(state)
+        if defense is None:
+            return None
+        return self._defense_messages(*defense)
+
+    def _framed_defense(
+        self, state, renderer: 'Renderer', reply: Optional['LLMResponse'] = None,
+    ) -> None:
+        defense = self._next_defense(state)
+        if defense is None:
+            return
+        framed, plant_label = defense
+        self._defended.add(framed.id)
+        self._deliver_defense(framed, plant_label, state, renderer, reply)
+
+    def _next_defense(self, state) -> Optional[tuple]:
+        """(framed character, plant label) of the approach due now, if any."""
         now = state.memory.current_time
         location = state.locations.get(state.current_location_id)
         if not location:
-            return
+            return None
 
         for framed_id, frame_time, plant_label in self._known_frames(state):
             if framed_id in self._defended:
@@ -274,9 +302,8 @@ class NPCAgency:
             if not present:
                 continue
 
-            self._defended.add(framed_id)
-            self._deliver_defense(framed, plant_label, state, renderer)
-            return  # one approach per tick
+            return framed, plant_label  # one approach per tick
+        return None
 
     @staticmethod
     def _known_frames(state) -> list[tuple[str, int, str]]:
@@ -294,11 +321,16 @@ class NPCAgency:
                 frames.append((framed_id, discovery.timestamp, label))
         return frames
 
-    def _deliver_defense(self, framed, plant_label: str, state, renderer: 'Renderer') -> None:
+    def _deliver_defense(
+        self, framed, plant_label: str, state, renderer: 'Renderer',
+        reply: Optional['LLMResponse'] = None,
+    ) -> None:
         renderer.render_narration(
             f"{framed.name} crosses the room to you, voice low and urgent."
         )
-        line = self._defense_line(framed, plant_label)
+        if reply is None:
+            reply = self.llm_client.chat(self._defense_messages(framed, plant_label))
+        line = self._defense_line(reply, plant_label)
         renderer.render_narration(f'"{line}"')
 
         alibi_fact = f"alibi_{framed.id}"
@@ -332,8 +364,9 @@ class NPCAgency:
                 trust_change=5,
             )
 
-    def _defense_line(self, framed, plant_label: str) -> str:
-        response = self.llm_client.chat([
+    @staticmethod
+    def _defense_messages(framed, plant_label: str) -> list[dict]:
+        return [
             {
                 "role": "system",
                 "content": (
@@ -349,7 +382,10 @@ class NPCAgency:
                 "role": "user",
                 "content": f"The planted object: {plant_label}",
             },
-        ])
+        ]
+
+    @staticmethod
+    def _defense_line(response: 'LLMResponse', plant_label: str) -> str:
         if response.success and response.text:
             line = response.text.strip().strip('"').strip()
             if line:
@@ -22,6 +22,10 @@ from .social_network import (
     SocialRelation,
     RelationshipDynamics
 )
+from .relation_matrix import MatrixSocialNetwork, SocialRelationView
+from .sharding import ShardedTick
+from .lod import LODTier, LODPolicy, LODScheduler
+from .diffusion import DiffusionRates, RumorDiffusion
 from .propagation_engine import PropagationEngine
 
 __all__ = [
@@ -50,6 +54,14 @@ __all__ = [
     "SocialNetwork",
     "SocialRelation",
     "RelationshipDynamics",
+    "MatrixSocialNetwork",
+    "SocialRelationView",
     # Engine
+    "ShardedTick",
+    "LODTier",
+    "LODPolicy",
+    "LODScheduler",
+    "DiffusionRates",
+    "RumorDiffusion",
     "PropagationEngine",
 ]
@@ -9,8 +9,10 @@ they act.
 from dataclasses import dataclass
 from typing import Optional, Any
 from enum import Enum
+import heapq
+import math
 
-from .npc_memory import NPCMemory
+from .npc_memory import NPCMemory, MemoryDecaySystem
 
 
 class BehaviorType(Enum):
@@ -301,6 +303,186 @@ class MemoryBehaviorMapping:
         return hints
 
 
+def _vector(modifier: BehaviorModifier) -> tuple[float, ...]:
+    """A modifier's fields as a plain tuple, in declaration order."""
+    return (
+        modifier.trusts, modifier.reveals, modifier.cooperates,
+        modifier.fears, modifier.threatens, modifier.respects,
+        modifier.suspicious_of
+    )
+
+
+class RunningBehaviorSum:
+    """
+    One NPC's aggregated behavior modifier as a closed form in time.
+
+    Between prunes, each memory contributes vector * confidence(t) *
+    recency(t), where both factors are linear in t (recency until it hits
+    its 0.1 floor). The sum is kept as polynomial coefficients per field,
+    so evaluating it at a later time costs O(1) per field plus the
+    memories whose recency has since hit the floor.
+
+    aggregate_modifiers clamps after every memory (and
+    get_behavior_from_memory after every tag), which only matters when a
+    running sum could leave [-1, 1] part way through. Fields where that
+    can't happen use the closed form; other fields are summed term by
+    term in memory and tag order. Results match aggregate_modifiers to
+    floating-point rounding.
+    """
+
+    RECENCY_FLOOR = 0.1
+
+    def __init__(self, recency_weight_decay: float, origin: float):
+        self.decay = recency_weight_decay
+        self.origin = origin
+        self.time = origin          # Latest time evaluated or added at
+        self.valid = True           # False once time has run backwards
+        self.count = 0              # Memories added, with or without tags
+        # (summed vector, confidence at origin, confidence rate,
+        #  recency at origin, per-tag vectors if they can clamp)
+        self.terms: list[tuple[
+            tuple[float, ...], float, float, float, Optional[tuple]
+        ]] = []
+        # Young (unfloored) coefficients: k0 - k1 * u + k2 * u**2
+        self._k0 = [0.0] * 7
+        self._k1 = [0.0] * 7
+        self._k2 = [0.0] * 7
+        # Floored coefficients: f0 - f1 * u
+        self._f0 = [0.0] * 7
+        self._f1 = [0.0] * 7
+        # Largest positive and negative totals each field can reach from now on
+        self._pos = [0.0] * 7
+        self._neg = [0.0] * 7
+        # Fields where a single memory's tags can clamp
+        self._ordered = [False] * 7
+        self._floor_heap: list[tuple[float, int]] = []
+
+    def add(
+        self,
+        vectors: list[tuple[float, ...]],
+        confidence: float,
+        rate: float,
+        timestamp: float,
+        now: float
+    ) -> None:
+        """
+        Add a memory's tag vectors (in tag order) at time now.
+
+        confidence is the memory's confidence at now; rate is how much it
+        loses per time unit.
+        """
+        self.count += 1
+        if not vectors:
+            return
+        if now < self.time:
+            self.valid = False
+            return
+        self.time = now
+        vector = [0.0] * 7
+        for v in vectors:
+            for f in range(7):
+                vector[f] += v[f]
+        tags = None
+        if len(vectors) > 1:
+            for f in range(7):
+                pos = sum(v[f] for v in vectors if v[f] > 0) * confidence
+                neg = sum(v[f] for v in vectors if v[f] < 0) * confidence
+                if pos > 1.0 or neg < -1.0:
+                    self._ordered[f] = True
+                    tags = tuple(vectors)
+
+        u_now = now - self.origin
+        a = confidence + rate * u_now
+        b = 1.0 - self.decay * (self.origin - timestamp)
+        index = len(self.terms)
+        vector = tuple(vector)
+        self.terms.append((vector, a, rate, b, tags))
+
+        weight = confidence * max(self.RECENCY_FLOOR, b - self.decay * u_now)
+        for f in range(7):
+            x = vector[f] * weight
+            if x > 0:
+                self._pos[f] += x
+            elif x < 0:
+                self._neg[f] += x
+
+        floor_u = self._floor_time(b)
+        if floor_u <= u_now:
+            self._add_floored(index)
+        else:
+            self._add_young(index, 1.0)
+            heapq.heappush(self._floor_heap, (floor_u, index))
+
+    def _floor_time(self, b: float) -> float:
+        if self.decay <= 0.0:
+            return math.inf
+        return (b - self.RECENCY_FLOOR) / self.decay
+
+    def _add_young(self, index: int, sign: float) -> None:
+        vector, a, r, b, _ = self.terms[index]
+        d = self.decay
+        for f in range(7):
+            v = vector[f] * sign
+            if v:
+                self._k0[f] += v * a * b
+                self._k1[f] += v * (a * d + b * r)
+                self._k2[f] += v * r * d
+
+    def _add_floored(self, index: int) -> None:
+        vector, a, r, _, _ = self.terms[index]
+        for f in range(7):
+            v = vector[f]
+            if v:
+                self._f0[f] += self.RECENCY_FLOOR * v * a
+                self._f1[f] += self.RECENCY_FLOOR * v * r
+
+    def evaluate(self, current_time: float) -> Optional[BehaviorModifier]:
+        """The aggregated modifier at a time, or None if that isn't possible."""
+        if not self.valid or current_time < self.time:
+            return None
+        self.time = current_time
+        u = current_time - self.origin
+        heap = self._floor_heap
+        while heap and heap[0][0] <= u:
+            _, index = heapq.heappop(heap)
+            self._add_young(index, -1.0)
+            self._add_floored(index)
+
+        values = []
+        for f in range(7):
+            pos, neg = self._pos[f], self._neg[f]
+            if not self._ordered[f] and (
+                (pos <= 1.0 and neg >= -1.0) or not pos or not neg
+            ):
+                x = (self._k0[f] - self._k1[f] * u + self._k2[f] * u * u
+                     + self._f0[f] - self._f1[f] * u)
+            else:
+                x = self._sum_in_order(f, u)
+            values.append(max(-1.0, min(1.0, x)))
+        return BehaviorModifier(*values)
+
+    def _sum_in_order(self, f: int, u: float) -> float:
+        """A field's clamped running sum, term by term."""
+        total = 0.0
+        floor = self.RECENCY_FLOOR
+        d = self.decay
+        for vector, a, r, b, tags in self.terms:
+            v = vector[f]
+            if tags is not None:
+                confidence = a - r * u
+                v = 0.0
+                for tag_vector in tags:
+                    x = v + tag_vector[f] * confidence
+                    v = 1.0 if x > 1.0 else -1.0 if x < -1.0 else x
+                x = total + v * max(floor, b - d * u)
+            elif v:
+                x = total + v * (a - r * u) * max(floor, b - d * u)
+            else:
+                continue
+            total = 1.0 if x > 1.0 else -1.0 if x < -1.0 else x
+        return total
+
+
 class MemoryBehaviorSystem:
     """
     High-level system for managing memory-based behavior.
@@ -311,29 +493,111 @@ class MemoryBehaviorSystem:
     def __init__(self):
         self.mapping = MemoryBehaviorMapping()
         self.npc_modifiers: dict[str, BehaviorModifier] = {}
+        # Per-NPC closed-form aggregates, kept between prunes
+        self.running: dict[str, RunningBehaviorSum] = {}
+        # NPCs whose cached modifier lags their running aggregate
+        self._dirty: set[str] = set()
+        self._decay_system = MemoryDecaySystem()
 
     def update_npc_behavior(
         self,
         npc_id: str,
         memories: list[NPCMemory],
-        current_time: float
+        current_time: float,
+        decay_system: Optional[MemoryDecaySystem] = None
     ) -> BehaviorModifier:
         """
         Update NPC behavior based on their memories.
 
+        Recomputes from scratch and starts a running aggregate, so later
+        ticks can use advance_npc_behavior(). decay_system supplies each
+        memory's confidence decay rate.
+
         Returns the aggregated behavior modifier.
         """
         modifier = self.mapping.aggregate_modifiers(memories, current_time)
         self.npc_modifiers[npc_id] = modifier
+        self.track_memories(npc_id, memories, current_time, decay_system)
         return modifier
 
+    def track_memories(
+        self,
+        npc_id: str,
+        memories: list[NPCMemory],
+        current_time: float,
+        decay_system: Optional[MemoryDecaySystem] = None
+    ) -> None:
+        """Start a running aggregate for an NPC's current memories."""
+        decay_system = decay_system or self._decay_system
+        running = RunningBehaviorSum(self.mapping.recency_weight_decay, current_time)
+        for memory in memories:
+            running.add(
+                self._tag_vectors(memory),
+                memory.confidence,
+                decay_system.effective_rate(memory),
+                memory.timestamp,
+                current_time
+            )
+        self.running[npc_id] = running
+        self._dirty.discard(npc_id)
+
+    def advance_npc_behavior(
+        self,
+        npc_id: str,
+        current_time: float,
+        memory_count: Optional[int] = None
+    ) -> Optional[BehaviorModifier]:
+        """
+        Bring an NPC's modifier to current_time from its running aggregate.
+
+        Returns None when the NPC needs a full update_npc_behavior()
+        (no aggregate yet, a memory was pruned since, or memory_count
+        shows memories were added without add_memory_effect()).
+        """
+        running = self.running.get(npc_id)
+        if running is None:
+            return None
+        if memory_count is not None and memory_count != running.count:
+            self.mark_stale(npc_id)
+            return None
+        modifier = running.evaluate(current_time)
+        if modifier is None:
+            self.mark_stale(npc_id)
+            return None
+        self.npc_modifiers[npc_id] = modifier
+        self._dirty.discard(npc_id)
+        return modifier
+
+    def mark_stale(self, npc_id: str) -> None:
+        """Drop an NPC's running aggregate, e.g. after a memory is pruned."""
+        self.running.pop(npc_id, None)
+        self._dirty.discard(npc_id)
+
+    def _tag_vectors(self, memory: NPCMemory) -> list[tuple[float, ...]]:
+        tag_behaviors = self.mapping.tag_behaviors
+        return [
+            _vector(tag_behaviors[tag]["modifier"])
+            for tag in memory.tags if tag in tag_behaviors
+        ]
+
+    def _modifier(self, npc_id: str) -> BehaviorModifier:
+        """Cached modifier, refreshed first if memories were added since."""
+        if npc_id in self._dirty:
+            self._dirty.discard(npc_id)
+            running = self.running.get(npc_id)
+            if running is not None:
+                modifier = running.evaluate(running.time)
+                if modifier is not None:
+                    self.npc_modifiers[npc_id] = modifier
+        return self.npc_modifiers.get(npc_id, BehaviorModifier())
+
     def get_npc_response(
         self,
         npc_id: str,
         context: Optional[str] = None
     ) -> str:
         """Get NPC's behavioral response type."""
-        modifier = self.npc_modifiers.get(npc_id, BehaviorModifier())
+        modifier = self._modifier(npc_id)
         return self.mapping.get_response_type(modifier)
 
     def get_npc_dialogue_hints(
@@ -341,25 +605,42 @@ class MemoryBehaviorSystem:
         npc_id: str
     ) -> dict[str, Any]:
         """Get dialogue hints for an NPC."""
-        modifier = self.npc_modifiers.get(npc_id, BehaviorModifier())
+        modifier = self._modifier(npc_id)
         return self.mapping.get_dialogue_modifiers(modifier)
 
     def will_npc_share(self, npc_id: str) -> bool:
         """Check if NPC will share information."""
-        modifier = self.npc_modifiers.get(npc_id, BehaviorModifier())
+        modifier = self._modifier(npc_id)
         return self.mapping.will_share_information(modifier)
 
     def will_npc_cooperate(self, npc_id: str) -> bool:
         """Check if NPC will cooperate."""
-        modifier = self.npc_modifiers.get(npc_id, BehaviorModifier())
+        modifier = self._modifier(npc_id)
         return self.mapping.will_cooperate(modifier)
 
     def add_memory_effect(
         self,
         npc_id: str,
-        memory: NPCMemory
+        memory: NPCMemory,
+        current_time: Optional[float] = None,
+        decay_rate: float = 0.0
     ) -> None:
-        """Add effect of a single new memory."""
+        """
+        Add effect of a single new memory.
+
+        With current_time (and the memory's confidence decay_rate), the
+        memory joins the NPC's running aggregate and the cached modifier
+        is refreshed when next read. Otherwise, or if the NPC has no
+        aggregate, the memory's modifier is applied directly.
+        """
+        running = self.running.get(npc_id)
+        if running is not None and current_time is not None:
+            running.add(
+                self._tag_vectors(memory), memory.confidence,
+                decay_rate, memory.timestamp, current_time
+            )
+            self._dirty.add(npc_id)
+            return
         _, modifier = self.mapping.get_behavior_from_memory(memory)
         current = self.npc_modifiers.get(npc_id, BehaviorModifier())
         self.npc_modifiers[npc_id] = current.apply(modifier)
@@ -368,6 +649,7 @@ class MemoryBehaviorSystem:
         """Clear modifiers for an NPC."""
         if npc_id in self.npc_modifiers:
             del self.npc_modifiers[npc_id]
+        self.mark_stale(npc_id)
 
     def to_dict(self) -> dict:
         """Serialize behavior system."""
@@ -0,0 +1,148 @@
+"""
+RumorDiffusion - Event-driven gossip between NPCs.
+
+Instead of a caller choosing pairs for simulate_interaction, each tick
+builds a contact graph. NPCs at the same location can talk to each
+other. An NPC can also seek out anyone it would share with (a relation
+with trust > 0 and affinity > -20), wherever they are. Each contact is
+a Poisson process with its own rate, so all of a tick's interactions
+together form one Poisson process with the summed rate. Exponential
+gaps give the event times, and each event picks a contact in
+proportion to its rate. Interactions then run through
+simulate_interaction. There, RumorPropagation's TRIGGER_PROBABILITIES
+decide which interactions pass a rumor on.
+
+Every draw comes from the engine's random.Random, so a seeded engine
+replays the same gossip.
+"""
+
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from typing import Optional, TYPE_CHECKING
+import time
+
+from .rumor import PropagationTrigger
+
+if TYPE_CHECKING:
+    from .propagation_engine import PropagationEngine
+
+
+@dataclass
+class DiffusionRates:
+    """Expected interactions per unit of game time for each contact."""
+    co_located: float = 1.0     # Per pair of NPCs at one location
+    social: float = 0.1         # Per relation its holder would share over
+    co_located_trigger: PropagationTrigger = PropagationTrigger.CONVERSATION
+    social_trigger: PropagationTrigger = PropagationTrigger.GOSSIP
+    # Location -> trigger for talk there (e.g. a bar -> DRINKING)
+    location_triggers: dict[str, PropagationTrigger] = field(default_factory=dict)
+
+
+class RumorDiffusion:
+    """
+    Samples NPC interactions for PropagationEngine each tick.
+
+    Keeps running totals of interactions, rumors passed on, and the
+    seconds spent, for get_throughput().
+    """
+
+    def __init__(self, engine: 'PropagationEngine', rates: Optional[DiffusionRates] = None):
+        self.engine = engine
+        self.rates = rates or DiffusionRates()
+        self.interactions = 0
+        self.rumors_shared = 0
+        self.seconds = 0.0
+
+    def build_contacts(
+        self,
+        npc_locations: dict[str, Optional[str]]
+    ) -> list[tuple[float, str, object, PropagationTrigger]]:
+        """
+        The tick's contacts as (rate, kind, who, trigger).
+
+        kind "location" covers every pair at a location at once, with
+        who the NPCs there; kind "social" is one relation's holder and
+        target as who.
+        """
+        rates = self.rates
+        states = self.engine.npc_states
+        contacts = []
+
+        at: dict[str, list[str]] = {}
+        for npc_id, location in npc_locations.items():
+            if location and npc_id in states:
+                at.setdefault(location, []).append(npc_id)
+        if rates.co_located > 0:
+            for location, npcs in at.items():
+                n = len(npcs)
+                if n >= 2:
+                    trigger = rates.location_triggers.get(
+                        location, rates.co_located_trigger
+                    )
+                    contacts.append(
+                        (rates.co_located * n * (n - 1) / 2, "location", npcs, trigger)
+                    )
+
+        if rates.social > 0:
+            for relation in self.engine.social_network.relations.values():
+                if (relation.from_npc in states and relation.to_npc in states
+                        and relation.will_share_with()):
+                    contacts.append((
+                        rates.social, "social",
+                        (relation.from_npc, relation.to_npc), rates.social_trigger
+                    ))
+        return contacts
+
+    def sample(
+        self,
+        contacts: list[tuple[float, str, object, PropagationTrigger]],
+        dt: float
+    ) -> list[tuple[float, str, str, PropagationTrigger]]:
+        """Draw the (time, speaker, listener, trigger) events of dt."""
+        total = 0.0
+        cumulative = []
+        for rate, *_ in contacts:
+            total += rate
+            cumulative.append(total)
+        if total <= 0 or dt <= 0:
+            return []
+
+        rng = self.engine.rng
+        events = []
+        t = rng.expovariate(total)
+        while t < dt:
+            index = min(bisect_right(cumulative, rng.random() * total), len(contacts) - 1)
+            _, kind, who, trigger = contacts[index]
+            if kind == "location":
+                speaker, listener = rng.sample(who, 2)
+            else:
+                speaker, listener = who
+            events.append((t, speaker, listener, trigger))
+            t += rng.expovariate(total)
+        return events
+
+    def step(self, npc_locations: dict[str, Optional[str]], dt: float) -> dict:
+        """Sample and run one tick of interactions."""
+        started = time.perf_counter()
+        events = self.sample(self.build_contacts(npc_locations), dt)
+        shared = 0
+        for _, speaker, listener, trigger in events:
+            if self.engine.simulate_interaction(speaker, listener, trigger)["rumor_shared"]:
+                shared += 1
+        elapsed = time.perf_counter() - started
+
+        self.interactions += len(events)
+        self.rumors_shared += shared
+        self.seconds += elapsed
+        return {"interactions": len(events), "rumors_shared": shared, "seconds": elapsed}
+
+    def get_throughput(self) -> dict:
+        """Running totals, with interactions per second of wall time."""
+        return {
+            "interactions": self.interactions,
+            "rumors_shared": self.rumors_shared,
+            "seconds": self.seconds,
+            "interactions_per_second": (
+                self.interactions / self.seconds if self.seconds else 0.0
+            ),
+        }
@@ -0,0 +1,151 @@
+"""
+NPC Level of Detail - Simulate distant NPCs less often.
+
+NPCs near the player get a full update every tick. Mid-range NPCs update
+every few ticks with the time they missed folded into one dt. Far NPCs
+are frozen and caught up in a single step when they come back into
+range. Memory decay is linear and evaluated lazily, so catching up over
+a long gap gives the same result as ticking through it.
+"""
+
+from dataclasses import dataclass
+from enum import Enum
+from typing import Optional
+
+
+class LODTier(Enum):
+    """How closely an NPC is simulated."""
+    FULL = "full"           # Every tick
+    REDUCED = "reduced"     # Every few ticks, with aggregated dt
+    FROZEN = "frozen"       # Not until it comes back into range
+
+
+@dataclass
+class LODPolicy:
+    """Distances (in location hops from the player) for each tier."""
+    full_distance: int = 0      # At or below: FULL
+    reduced_distance: int = 2   # At or below: REDUCED; beyond: FROZEN
+    reduced_interval: int = 4   # Ticks between REDUCED updates
+
+    def tier_for_distance(self, distance: Optional[int]) -> LODTier:
+        """Tier for a distance; unknown distances stay at full detail."""
+        if distance is None or distance <= self.full_distance:
+            return LODTier.FULL
+        if distance <= self.reduced_distance:
+            return LODTier.REDUCED
+        return LODTier.FROZEN
+
+
+def location_hops(
+    location: Optional[str],
+    player_location: str,
+    location_distances: dict[str, int]
+) -> Optional[int]:
+    """
+    Estimate hops between an NPC's location and the player's.
+
+    location_distances holds each location's distance from the start
+    (as kept by LocationManager), so the difference is a lower bound on
+    the hops between two locations. Different locations are at least one
+    hop apart. Returns None when either location is unknown.
+    """
+    if not location:
+        return None
+    if location == player_location:
+        return 0
+    here = location_distances.get(player_location)
+    there = location_distances.get(location)
+    if here is None or there is None:
+        return None
+    return max(1, abs(there - here))
+
+
+class LODScheduler:
+    """
+    Decides which NPCs PropagationEngine.update simulates each tick.
+
+    Tracks each NPC's tier and the dt it has not yet been given, and
+    times updates per tier.
+    """
+
+    def __init__(self, policy: Optional[LODPolicy] = None):
+        self.policy = policy or LODPolicy()
+        self.tiers: dict[str, LODTier] = {}
+        self.pending_dt: dict[str, float] = {}
+        self.tick: int = 0
+        # tier -> [NPC updates, seconds]
+        self._timings: dict[LODTier, list] = {tier: [0, 0.0] for tier in LODTier}
+
+    def get_tier(self, npc_id: str) -> LODTier:
+        """Current tier of an NPC (FULL until assigned)."""
+        return self.tiers.get(npc_id, LODTier.FULL)
+
+    def set_tier(self, npc_id: str, tier: LODTier) -> None:
+        """Assign a tier directly."""
+        self.tiers[npc_id] = tier
+
+    def assign_tiers(
+        self,
+        player_location: str,
+        npc_locations: dict[str, Optional[str]],
+        location_distances: dict[str, int]
+    ) -> None:
+        """Assign tiers from NPC locations and LocationManager's distances."""
+        for npc_id, location in npc_locations.items():
+            hops = location_hops(location, player_location, location_distances)
+            self.tiers[npc_id] = self.policy.tier_for_distance(hops)
+
+    def advance(self, npc_ids, dt: float) -> list[tuple[str, float, LODTier]]:
+        """
+        Move time forward and pick the NPCs to update this tick.
+
+        Returns (npc_id, dt to apply, tier) for each NPC due an update.
+        An NPC's slot in the REDUCED cycle is staggered by its order in
+        npc_ids, so mid-range updates spread across ticks.
+        """
+        self.tick += 1
+        interval = max(1, self.policy.reduced_interval)
+        due = []
+        for i, npc_id in enumerate(npc_ids):
+            pending = self.pending_dt.get(npc_id, 0.0) + dt
+            tier = self.tiers.get(npc_id, LODTier.FULL)
+            if tier == LODTier.FULL or (
+                tier == LODTier.REDUCED and (self.tick + i) % interval == 0
+            ):
+                due.append((npc_id, pending, tier))
+                pending = 0.0
+            self.pending_dt[npc_id] = pending
+        return due
+
+    def take_pending(self, npc_id: str) -> float:
+        """Hand back (and clear) the dt an NPC has not been given yet."""
+        pending = self.pending_dt.get(npc_id, 0.0)
+        if pending:
+            self.pending_dt[npc_id] = 0.0
+        return pending
+
+    def record(self, tier: LODTier, seconds: float) -> None:
+        """Add one NPC update's wall time to its tier."""
+        timing = self._timings[tier]
+        timing[0] += 1
+        timing[1] += seconds
+
+    def get_tier_timings(self) -> dict[str, dict]:
+        """NPCs, updates run, and seconds spent per tier."""
+        counts = {tier: 0 for tier in LODTier}
+        for npc_id in self.pending_dt:
+            counts[self.get_tier(npc_id)] += 1
+        return {
+            tier.value: {
+                "npcs": counts[tier],
+                "updates": self._timings[tier][0],
+                "seconds": self._timings[tier][1],
+            }
+            for tier in LODTier
+        }
+
+    def reset_timings(self) -> None:
+        """Zero the per-tier timings."""
+        for timing in self._timings.values():
+            timing[0] = 0
+            timing[1] = 0.0
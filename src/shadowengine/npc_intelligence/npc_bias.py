@@ -230,6 +230,9 @@ class BiasProcessor:
         "curious": ["interesting", "unusual", "investigate"]
     }
 
+    def __init__(self, rng: Optional[random.Random] = None):
+        self.rng = rng or random.Random()
+
     def interpret_event(
         self,
         event: WorldEvent,
@@ -430,7 +433,7 @@ class BiasProcessor:
         )
 
         # Paranoid NPCs add conspiracy tags
-        if bias.paranoid > 0.6 and random.random() < bias.paranoid:
+        if bias.paranoid > 0.6 and self.rng.random() < bias.paranoid:
             memory.add_tag("conspiracy")
             memory.summary = self._add_conspiracy_angle(memory.summary)
 
@@ -454,7 +457,7 @@ class BiasProcessor:
             memory.emotional_weight = min(1.0, memory.emotional_weight + 0.1)
 
         # Greedy NPCs add profit angles
-        if bias.greedy > 0.6 and random.random() < 0.4:
+        if bias.greedy > 0.6 and self.rng.random() < 0.4:
             memory.add_tag("money")
 
         # Self-preserving NPCs might omit certain details
@@ -480,7 +483,7 @@ class BiasProcessor:
             "People are talking... ",
             "Something's not right - ",
         ]
-        return random.choice(prefixes) + summary.lower()
+        return self.rng.choice(prefixes) + summary.lower()
 
     def _dramatize(self, summary: str) -> str:
         """Make summary more dramatic."""
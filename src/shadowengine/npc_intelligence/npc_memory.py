@@ -9,6 +9,10 @@ distorted by bias.
 from dataclasses import dataclass, field
 from typing import Optional
 from enum import Enum
+import bisect
+import heapq
+import math
+import re
 import uuid
 
 
@@ -170,30 +174,52 @@ class MemoryDecaySystem:
         self.base_decay_rate = 0.01
         self.emotional_decay_reduction = 0.5  # 50% slower for emotional
         self.traumatic_decay_reduction = 0.9  # 90% slower for traumatic
+        self.forget_threshold = 0.05  # At or below this, a memory is forgotten
 
-    def decay_memory(self, memory: NPCMemory, dt: float) -> float:
-        """
-        Apply decay to a single memory.
-
-        Returns the new confidence value.
-        """
+    def effective_rate(self, memory: NPCMemory) -> float:
+        """Confidence lost per time unit, given the memory's current traits."""
         # Base decay
-        decay = memory.decay_rate * dt
+        rate = memory.decay_rate
 
         # Emotional memories decay slower
-        decay *= (1.0 - memory.emotional_weight * self.emotional_decay_reduction)
+        rate *= (1.0 - memory.emotional_weight * self.emotional_decay_reduction)
 
         # Traumatic memories barely decay
         if memory.is_traumatic or memory.fear > 0.8:
-            decay *= (1.0 - self.traumatic_decay_reduction)
+            rate *= (1.0 - self.traumatic_decay_reduction)
 
         # High-tag memories decay slower (they're more distinctive)
         if len(memory.tags) > 3:
-            decay *= 0.8
+            rate *= 0.8
+
+        return rate
 
+    def decay_memory(self, memory: NPCMemory, dt: float) -> float:
+        """
+        Apply decay to a single memory.
+
+        Returns the new confidence value.
+        """
+        decay = self.effective_rate(memory) * dt
         memory.confidence = max(0.0, memory.confidence - decay)
         return memory.confidence
 
+    def forget_time(self, memory: NPCMemory, now: float) -> float:
+        """
+        When a memory's confidence will reach the forget threshold.
+
+        Decay is linear, so this is exact as long as the memory's traits
+        don't change. Returns now if it is already forgotten and inf if
+        it never decays.
+        """
+        margin = memory.confidence - self.forget_threshold
+        if margin <= 0.0:
+            return now
+        rate = self.effective_rate(memory)
+        if rate <= 0.0:
+            return math.inf
+        return now + margin / rate
+
     def decay_all_memories(
         self,
         memories: list[NPCMemory],
@@ -203,7 +229,7 @@ class MemoryDecaySystem:
         result = []
         for memory in memories:
             new_confidence = self.decay_memory(memory, dt)
-            if new_confidence > 0.05:  # Threshold for "forgotten"
+            if new_confidence > self.forget_threshold:
                 result.append(memory)
         return result
 
@@ -234,57 +260,515 @@ class MemoryDecaySystem:
         return NPC_MEMORY_CAPACITY.get(npc_type, NPC_MEMORY_CAPACITY["default"])
 
 
+class _MemoryList(list):
+    """
+    A bank's memory list, which notes when it is edited directly.
+
+    The bank keys its decay state and indexes by memory, so an append,
+    removal or replacement made through the list must reach them before
+    they are next used. The bank clears edited once it has caught up.
+    """
+
+    __slots__ = ("edited",)
+
+    def __init__(self, memories=()):
+        super().__init__(memories)
+        self.edited = False
+
+    def _edit(method):
+        def edit(self, *args):
+            self.edited = True
+            return method(self, *args)
+        edit.__name__ = method.__name__
+        return edit
+
+    append = _edit(list.append)
+    extend = _edit(list.extend)
+    insert = _edit(list.insert)
+    remove = _edit(list.remove)
+    pop = _edit(list.pop)
+    clear = _edit(list.clear)
+    reverse = _edit(list.reverse)
+    __setitem__ = _edit(list.__setitem__)
+    __delitem__ = _edit(list.__delitem__)
+    __iadd__ = _edit(list.__iadd__)
+    __imul__ = _edit(list.__imul__)
+    del _edit
+
+    def sort(self, *, key=None, reverse=False):
+        self.edited = True
+        super().sort(key=key, reverse=reverse)
+
+
+class _ShareBucket:
+    """
+    The memories whose share probability is at or above one threshold.
+
+    Share probability only falls as confidence decays, so each member
+    has a time at which it drops out. A min-heap of those times lets a
+    query remove just the memories that have dropped out since the last.
+    """
+
+    def __init__(self, threshold: float, decay_system: MemoryDecaySystem):
+        self.threshold = threshold
+        self.decay_system = decay_system
+        self.members: set[int] = set()
+        # Members in bank order, until membership next changes
+        self.ordered: Optional[list[NPCMemory]] = None
+        self._drop_at: dict[int, float] = {}
+        # (drop_time, sequence, memory); stale entries are skipped
+        self._heap: list[tuple[float, int, NPCMemory]] = []
+        self._sequence = 0
+
+    def add(self, memory: NPCMemory, now: float) -> None:
+        """Add a memory whose confidence is settled to now."""
+        if memory.get_share_probability() < self.threshold:
+            return
+        self.members.add(id(memory))
+        self.ordered = None
+        # Uncapped probability; the 1.0 cap doesn't change when it drops out
+        margin = (
+            memory.emotional_weight * 0.5 +
+            memory.confidence * 0.3 +
+            (memory.fear + memory.anger) * 0.2
+        ) - self.threshold
+        rate = self.decay_system.effective_rate(memory) * 0.3
+        self._push(memory, now + margin / rate if rate > 0.0 else math.inf)
+
+    def _push(self, memory: NPCMemory, drop_at: float) -> None:
+        self._drop_at[id(memory)] = drop_at
+        if drop_at != math.inf:
+            self._sequence += 1
+            heapq.heappush(self._heap, (drop_at, self._sequence, memory))
+
+    def discard(self, key: int) -> None:
+        if key in self.members:
+            self.members.discard(key)
+            self.ordered = None
+        self._drop_at.pop(key, None)
+
+    def expire(self, now: float, settle) -> None:
+        """Drop members whose share probability has fallen below the threshold."""
+        heap = self._heap
+        retry = []
+        while heap and heap[0][0] < now:
+            drop_at, _, memory = heapq.heappop(heap)
+            key = id(memory)
+            if self._drop_at.get(key) != drop_at:
+                continue  # Removed or rescheduled since
+            settle(memory)
+            if memory.get_share_probability() >= self.threshold:
+                # Rounding put the estimate just early; look again later
+                retry.append(memory)
+                continue
+            self.discard(key)
+        for memory in retry:
+            self._push(memory, now)
+
+
 class NPCMemoryBank:
     """
     Complete memory system for a single NPC.
 
     Manages memory storage, decay, retrieval, and capacity limits.
+
+    Decay is lazy: each memory remembers when its confidence was last
+    brought up to date, and reads settle it with the closed-form linear
+    decay. update() only advances the clock and pops memories from a
+    min-heap of forget times, so a tick costs the number of memories
+    forgotten rather than the number held. Memories appended to, removed
+    from or replaced in memories directly are picked up by identity on
+    the next call into the bank. If a memory's confidence or
+    decay traits are changed after it is added, call refresh_memory()
+    so its forget time is recomputed.
+
+    Lookups go through inverted indexes (tag, actor, location, event and
+    summary token), a timestamp-ordered list for recency, and per-threshold
+    buckets of shareable memories. Results come back in the same order as
+    a scan of memories. The indexes follow add_memory, pruning, forgetting,
+    assignment to memories and direct edits to the list, including ones
+    that keep its length; call refresh_memory() after changing a memory's
+    tags, actors, location or summary too.
+
+    Capacity pruning evicts one memory at a time from a min-heap of
+    retention priorities. Priorities only fall as confidence decays, so
+    each entry holds the memory's priority at a horizon PRUNE_HORIZON
+    ahead: a lower bound until then. Eviction pops entries until the
+    bound passes the best exact priority seen, and the heap is rebuilt
+    once the clock passes the horizon. evictions counts memories pruned
+    this way.
     """
 
+    PRUNE_HORIZON = 25.0
+
     def __init__(self, npc_id: str, npc_type: str = "default"):
         self.npc_id = npc_id
         self.npc_type = npc_type
-        self.memories: list[NPCMemory] = []
+        self._memories = _MemoryList()
         self.decay_system = MemoryDecaySystem()
         self.capacity = self.decay_system.get_memory_capacity(npc_type)
         self.current_time: float = 0.0
+        # Time decay has run to; only update() advances it
+        self._clock: float = 0.0
+        # id(memory) -> time its confidence was last settled
+        self._settled_at: dict[int, float] = {}
+        # id(memory) -> its live entry in _forget_heap
+        self._forget_at: dict[int, float] = {}
+        # (forget_time, sequence, memory); stale entries are skipped
+        self._forget_heap: list[tuple[float, int, NPCMemory]] = []
+        self._sequence = 0
+        # Time at which every memory was last settled
+        self._all_settled_at: Optional[float] = None
+        # Lookup indexes: id(memory) -> memory, and position in _memories order
+        self._by_id: dict[int, NPCMemory] = {}
+        self._rank: dict[int, int] = {}
+        self._next_rank = 0
+        self._by_tag: dict[str, set[int]] = {}
+        self._by_actor: dict[str, set[int]] = {}
+        self._by_location: dict[Optional[str], set[int]] = {}
+        self._by_event: dict[Optional[str], set[int]] = {}
+        self._by_token: dict[str, set[int]] = {}
+        self._summaries: dict[int, str] = {}       # Lowercased summaries
+        # (timestamp, -rank, id) in ascending order
+        self._by_time: list[tuple[float, int, int]] = []
+        # Share threshold -> bucket of memories at or above it
+        self._share_buckets: dict[float, _ShareBucket] = {}
+        # (priority at horizon, rank, memory); built at the first prune
+        self._prune_heap: list[tuple[float, int, NPCMemory]] = []
+        self._prune_key: dict[int, float] = {}
+        self._prune_horizon: Optional[float] = None
+        self.evictions = 0
+
+    @property
+    def memories(self) -> list[NPCMemory]:
+        """All remembered memories, with confidence brought up to date."""
+        self._settle_all()
+        return self._memories
+
+    @memories.setter
+    def memories(self, memories: list[NPCMemory]) -> None:
+        self._memories = _MemoryList(memories)
+        self._settled_at.clear()
+        self._forget_at.clear()
+        self._forget_heap.clear()
+        for memory in memories:
+            self._track(memory)
+        self._all_settled_at = self._clock
+        self._rebuild_index()
+
+    def __len__(self) -> int:
+        return len(self._memories)
+
+    # -- Lazy decay -------------------------------------------------------
+
+    def _track(self, memory: NPCMemory) -> None:
+        """Start decaying a memory from now."""
+        key = id(memory)
+        self._settled_at[key] = self._clock
+        forget_at = self.decay_system.forget_time(memory, self._clock)
+        self._forget_at[key] = forget_at
+        if forget_at != math.inf:
+            self._sequence += 1
+            heapq.heappush(self._forget_heap, (forget_at, self._sequence, memory))
+
+    def _untrack(self, memory: NPCMemory) -> None:
+        key = id(memory)
+        self._settled_at.pop(key, None)
+        self._forget_at.pop(key, None)
+
+    def _settle(self, memory: NPCMemory) -> None:
+        """Apply the decay owed since the memory was last settled."""
+        key = id(memory)
+        settled_at = self._settled_at[key]
+        elapsed = self._clock - settled_at
+        if elapsed > 0.0:
+            self.decay_system.decay_memory(memory, elapsed)
+            self._settled_at[key] = self._clock
+
+    def _settle_all(self) -> None:
+        self._sync_index()
+        if self._all_settled_at == self._clock:
+            return
+        for memory in self._memories:
+            self._settle(memory)
+        self._all_settled_at = self._clock
+
+    def refresh_memory(self, memory: NPCMemory) -> None:
+        """
+        Recompute a memory's forget time and index entries after changing it.
+
+        Read the memory through the bank first (so decay up to now is
+        applied), change its confidence, traits, tags, actors, location
+        or summary, then call this.
+        """
+        self._sync_index()
+        self._untrack(memory)
+        self._track(memory)
+        key = id(memory)
+        if key in self._rank:
+            rank = self._rank[key]
+            self._unindex(memory)
+            self._index(memory, rank)
 
     def add_memory(self, memory: NPCMemory) -> None:
         """Add a memory, pruning if over capacity."""
-        self.memories.append(memory)
-        if len(self.memories) > self.capacity:
-            self.memories = self.decay_system.prune_memories(
-                self.memories, self.capacity
-            )
-
-    def update(self, dt: float) -> None:
-        """Update all memories with decay."""
+        self._sync_index()
+        self._memories.append(memory)
+        self._track(memory)
+        self._index(memory)
+        while len(self._memories) > self.capacity:
+            self._remove(self._lowest_priority())
+            self.evictions += 1
+        self._memories.edited = False
+
+    def _remove(self, memory: NPCMemory) -> None:
+        """Drop one held memory from the list, decay tracking and indexes."""
+        # The list is in rank order, so the memory can be found by rank
+        rank = self._rank
+        i = bisect.bisect_left(
+            self._memories, rank[id(memory)], key=lambda m: rank[id(m)]
+        )
+        self._untrack(memory)
+        self._unindex(memory)
+        del self._memories[i]
+
+    # -- Capacity pruning -------------------------------------------------
+
+    def _prune_entry(self, memory: NPCMemory) -> None:
+        """Push a memory's priority at the horizon onto the prune heap."""
+        key = id(memory)
+        self._settle(memory)
+        rate = self.decay_system.effective_rate(memory)
+        confidence = memory.confidence - rate * (self._prune_horizon - self._clock)
+        bound = (
+            memory.get_retention_priority()
+            - 0.3 * (memory.confidence - max(0.0, confidence))
+        )
+        self._prune_key[key] = bound
+        heapq.heappush(self._prune_heap, (bound, self._rank[key], memory))
+
+    def _lowest_priority(self) -> NPCMemory:
+        """
+        The memory prune_memories would drop first: lowest retention
+        priority now, earliest in list order on ties.
+        """
+        if self._prune_horizon is None or self._clock > self._prune_horizon:
+            self._prune_horizon = self._clock + self.PRUNE_HORIZON
+            self._prune_heap = []
+            self._prune_key.clear()
+            for memory in self._memories:
+                self._prune_entry(memory)
+        heap = self._prune_heap
+        popped = []
+        best = None
+        while heap:
+            bound, rank, memory = heap[0]
+            if best is not None and (bound, rank) > best[:2]:
+                break  # Nothing left can be lower
+            heapq.heappop(heap)
+            if self._prune_key.get(id(memory)) != bound:
+                continue  # Evicted, forgotten, or refreshed since
+            popped.append((bound, rank, memory))
+            self._settle(memory)
+            entry = (memory.get_retention_priority(), rank, memory)
+            if best is None or entry[:2] < best[:2]:
+                best = entry
+        for entry in popped:
+            if entry[2] is not best[2]:
+                heapq.heappush(heap, entry)
+        return best[2]
+
+    # -- Lookup indexes ---------------------------------------------------
+
+    _TOKEN = re.compile(r"\w+")
+
+    def _index(self, memory: NPCMemory, rank: Optional[int] = None) -> None:
+        """Add a memory to the lookup indexes, last in order by default."""
+        key = id(memory)
+        if rank is None:
+            rank = self._next_rank
+            self._next_rank += 1
+        self._by_id[key] = memory
+        self._rank[key] = rank
+        for tag in memory.tags:
+            self._by_tag.setdefault(tag, set()).add(key)
+        for actor in memory.actors:
+            self._by_actor.setdefault(actor, set()).add(key)
+        self._by_location.setdefault(memory.location, set()).add(key)
+        self._by_event.setdefault(memory.event_id, set()).add(key)
+        summary = memory.summary.lower()
+        self._summaries[key] = summary
+        for token in self._TOKEN.findall(summary):
+            self._by_token.setdefault(token, set()).add(key)
+        bisect.insort(self._by_time, (memory.timestamp, -rank, key))
+        for bucket in self._share_buckets.values():
+            bucket.add(memory, self._clock)
+        if self._prune_horizon is not None and self._clock <= self._prune_horizon:
+            self._prune_entry(memory)
+
+    def _unindex(self, memory: NPCMemory) -> None:
+        """Remove a memory from the lookup indexes."""
+        key = id(memory)
+        rank = self._rank.pop(key, None)
+        if rank is None:
+            return
+        del self._by_id[key]
+        for tag in memory.tags:
+            self._discard(self._by_tag, tag, key)
+        for actor in memory.actors:
+            self._discard(self._by_actor, actor, key)
+        self._discard(self._by_location, memory.location, key)
+        self._discard(self._by_event, memory.event_id, key)
+        for token in self._TOKEN.findall(self._summaries.pop(key)):
+            self._discard(self._by_token, token, key)
+        entry = (memory.timestamp, -rank, key)
+        i = bisect.bisect_left(self._by_time, entry)
+        if i < len(self._by_time) and self._by_time[i] == entry:
+            del self._by_time[i]
+        for bucket in self._share_buckets.values():
+            bucket.discard(key)
+        self._prune_key.pop(key, None)
+
+    @staticmethod
+    def _discard(index: dict, value, key: int) -> None:
+        keys = index.get(value)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del index[value]
+
+    def _rebuild_index(self) -> None:
+        """Index the memory list from scratch, in its current order."""
+        self._by_id.clear()
+        self._rank.clear()
+        self._next_rank = 0
+        self._by_tag.clear()
+        self._by_actor.clear()
+        self._by_location.clear()
+        self._by_event.clear()
+        self._by_token.clear()
+        self._summaries.clear()
+        self._by_time.clear()
+        self._share_buckets.clear()
+        self._prune_heap = []
+        self._prune_key.clear()
+        self._prune_horizon = None
+        for memory in self._memories:
+            self._index(memory)
+
+    def _sync_index(self) -> None:
+        """Catch up with memories appended, removed or replaced in the list directly."""
+        memories = self._memories
+        if not memories.edited:
+            return
+        memories.edited = False
+        # _by_id holds every tracked memory, so no id here has been reused
+        held = {id(m): m for m in memories}
+        for key, memory in self._by_id.items():
+            if held.get(key) is not memory:
+                self._untrack(memory)
+        for key, memory in held.items():
+            if key not in self._settled_at:
+                self._track(memory)
+        self._rebuild_index()
+
+    def _lookup(self, keys) -> list[NPCMemory]:
+        """Indexed memories in list order, with confidence brought up to date."""
+        if len(keys) * 2 > len(self._memories):
+            # Most of the bank: filtering the list is cheaper than sorting
+            result = [m for m in self._memories if id(m) in keys]
+        else:
+            by_id = self._by_id
+            result = [by_id[key] for key in sorted(keys, key=self._rank.__getitem__)]
+        self._settle_some(result)
+        return result
+
+    def _settle_some(self, memories: list[NPCMemory]) -> None:
+        if self._all_settled_at != self._clock:
+            for memory in memories:
+                self._settle(memory)
+
+    def update(self, dt: float) -> int:
+        """
+        Advance time, forgetting memories whose confidence has run out.
+
+        Returns the number of memories forgotten.
+        """
+        self._sync_index()
         self.current_time += dt
-        self.memories = self.decay_system.decay_all_memories(self.memories, dt)
+        self._clock += dt
+        now = self._clock
+        heap = self._forget_heap
+        forgotten: list[NPCMemory] = []
+        retry = []
+        while heap and heap[0][0] <= now:
+            forget_at, _, memory = heapq.heappop(heap)
+            key = id(memory)
+            if self._forget_at.get(key) != forget_at:
+                continue  # Forgotten, pruned, or rescheduled since
+            self._settle(memory)
+            if memory.confidence > self.decay_system.forget_threshold:
+                # Rounding put the estimate just early; look again next tick
+                retry.append(memory)
+                continue
+            self._untrack(memory)
+            forgotten.append(memory)
+        for memory in retry:
+            self._sequence += 1
+            heapq.heappush(heap, (self._forget_at[id(memory)], self._sequence, memory))
+        if forgotten:
+            if len(forgotten) * 8 < len(self._memories):
+                for memory in forgotten:
+                    self._remove(memory)
+                self._memories.edited = False
+            else:
+                keys = {id(m) for m in forgotten}
+                for memory in forgotten:
+                    self._unindex(memory)
+                self._memories = _MemoryList(
+                    m for m in self._memories if id(m) not in keys
+                )
+        return len(forgotten)
 
     def get_memories_about(self, subject: str) -> list[NPCMemory]:
-        """Get all memories about a subject (by tag or actor)."""
-        return [
-            m for m in self.memories
-            if subject in m.tags or subject in m.actors or subject in m.summary.lower()
-        ]
+        """Get all memories about a subject (by tag, actor, or summary text)."""
+        self._sync_index()
+        keys = set(self._by_tag.get(subject, ()))
+        keys.update(self._by_actor.get(subject, ()))
+        pieces = self._TOKEN.findall(subject)
+        if pieces:
+            # Each word of the subject sits inside one summary token, so
+            # only memories with a token containing the longest word can match
+            piece = max(pieces, key=len)
+            candidates = self._by_token.get(piece, set()).copy()
+            for token, token_keys in self._by_token.items():
+                if piece in token and token != piece:
+                    candidates.update(token_keys)
+        else:
+            candidates = self._rank.keys()
+        summaries = self._summaries
+        keys.update(key for key in candidates if subject in summaries[key])
+        return self._lookup(keys)
 
     def get_memories_at_location(self, location: str) -> list[NPCMemory]:
         """Get all memories at a location."""
-        return [m for m in self.memories if m.location == location]
+        self._sync_index()
+        return self._lookup(self._by_location.get(location, ()))
 
     def get_memories_by_tag(self, tag: str) -> list[NPCMemory]:
         """Get all memories with a specific tag."""
-        return [m for m in self.memories if tag in m.tags]
+        self._sync_index()
+        return self._lookup(self._by_tag.get(tag, ()))
 
     def get_recent_memories(self, count: int = 5) -> list[NPCMemory]:
         """Get most recent memories."""
-        sorted_memories = sorted(
-            self.memories,
-            key=lambda m: m.timestamp,
-            reverse=True
-        )
-        return sorted_memories[:count]
+        self._sync_index()
+        if count <= 0:
+            return []
+        newest = self._by_time[:-count - 1:-1]
+        result = [self._by_id[key] for _, _, key in newest]
+        self._settle_some(result)
+        return result
 
     def get_emotional_memories(self, threshold: float = 0.5) -> list[NPCMemory]:
         """Get memories with high emotional weight."""
@@ -295,10 +779,21 @@ class NPCMemoryBank:
 
     def get_shareable_memories(self, threshold: float = 0.3) -> list[NPCMemory]:
         """Get memories likely to be shared."""
-        return [
-            m for m in self.memories
-            if m.get_share_probability() >= threshold
-        ]
+        self._sync_index()
+        bucket = self._share_buckets.get(threshold)
+        if bucket is None:
+            bucket = _ShareBucket(threshold, self.decay_system)
+            self._settle_all()
+            for memory in self._memories:
+                bucket.add(memory, self._clock)
+            self._share_buckets[threshold] = bucket
+        else:
+            bucket.expire(self._clock, self._settle)
+        if bucket.ordered is None:
+            bucket.ordered = self._lookup(bucket.members)
+        else:
+            self._settle_some(bucket.ordered)
+        return list(bucket.ordered)
 
     def recall_memory(self, memory_id: str) -> Optional[NPCMemory]:
         """Recall a specific memory, slowing its decay."""
@@ -310,14 +805,16 @@ class NPCMemoryBank:
 
     def has_memory_of_event(self, event_id: str) -> bool:
         """Check if NPC has a memory of a specific event."""
-        return any(m.event_id == event_id for m in self.memories)
+        self._sync_index()
+        return event_id in self._by_event
 
     def get_memory_of_event(self, event_id: str) -> Optional[NPCMemory]:
         """Get memory of a specific event."""
-        for memory in self.memories:
-            if memory.event_id == event_id:
-                return memory
-        return None
+        self._sync_index()
+        keys = self._by_event.get(event_id)
+        if not keys:
+            return None
+        return self._lookup([min(keys, key=self._rank.__getitem__)])[0]
 
     def to_dict(self) -> dict:
         """Serialize memory bank."""
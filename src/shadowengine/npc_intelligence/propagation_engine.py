@@ -8,6 +8,7 @@ propagation, behavior updates, and social network dynamics.
 from dataclasses import dataclass
 from typing import Optional, Any
 import random
+import time
 
 from .world_event import WorldEvent
 from .npc_memory import NPCMemory, NPCMemoryBank, MemorySource
@@ -16,6 +17,11 @@ from .rumor import Rumor, RumorPropagation, PropagationTrigger
 from .tile_memory import TileMemory, TileMemoryManager
 from .behavior_mapping import MemoryBehaviorSystem, BehaviorModifier
 from .social_network import SocialNetwork
+from . import relation_matrix
+from .relation_matrix import MatrixSocialNetwork
+from .sharding import ShardedTick
+from .lod import LODPolicy, LODScheduler
+from .diffusion import DiffusionRates, RumorDiffusion
 
 
 @dataclass
@@ -48,10 +54,13 @@ class PropagationEngine:
     - Tile memory updates
     """
 
-    def __init__(self):
+    def __init__(self, seed: Optional[int] = None):
+        # One random source for every chance roll, so a seed replays a run
+        self.rng = random.Random(seed)
+
         # Core systems
-        self.bias_processor = BiasProcessor()
-        self.rumor_propagation = RumorPropagation()
+        self.bias_processor = BiasProcessor(self.rng)
+        self.rumor_propagation = RumorPropagation(self.rng)
         self.behavior_system = MemoryBehaviorSystem()
         self.social_network = SocialNetwork()
         self.tile_manager = TileMemoryManager()
@@ -65,6 +74,128 @@ class PropagationEngine:
         # Time tracking
         self.current_time: float = 0.0
 
+        # Optional sharded behavior aggregation for large populations
+        self.sharded_tick: Optional[ShardedTick] = None
+
+        # Optional level-of-detail scheduling for off-screen NPCs
+        self.lod: Optional[LODScheduler] = None
+
+        # Optional event-driven rumor diffusion
+        self.diffusion: Optional[RumorDiffusion] = None
+
+    def enable_lod(self, policy: Optional[LODPolicy] = None) -> LODScheduler:
+        """
+        Simulate NPCs at a level of detail set by their distance.
+
+        Every NPC stays at full detail until tiers are assigned with
+        assign_lod_tiers() (or lod.set_tier()).
+        """
+        self.lod = LODScheduler(policy)
+        return self.lod
+
+    def disable_lod(self) -> None:
+        """Catch every NPC up and go back to full detail for all."""
+        if self.lod is not None:
+            for state in self.npc_states.values():
+                self._catch_up(state)
+            self.lod = None
+
+    def assign_lod_tiers(
+        self,
+        player_location: str,
+        npc_locations: dict[str, Optional[str]],
+        location_distances: dict[str, int]
+    ) -> None:
+        """
+        Assign LOD tiers from where NPCs are relative to the player.
+
+        location_distances is LocationManager.location_distances. Does
+        nothing unless enable_lod() has been called.
+        """
+        if self.lod is not None:
+            self.lod.assign_tiers(player_location, npc_locations, location_distances)
+
+    def enable_diffusion(self, rates: Optional[DiffusionRates] = None) -> RumorDiffusion:
+        """
+        Let diffuse_rumors() sample who talks to whom each tick.
+
+        Seed the engine (PropagationEngine(seed=...)) to make runs
+        repeatable.
+        """
+        self.diffusion = RumorDiffusion(self, rates)
+        return self.diffusion
+
+    def diffuse_rumors(
+        self,
+        npc_locations: dict[str, Optional[str]],
+        dt: float
+    ) -> dict[str, Any]:
+        """
+        Run dt worth of interactions between NPCs.
+
+        npc_locations maps NPC ids to where they are now (Character
+        state.location). Returns counts of interactions and rumors
+        shared. Does nothing unless enable_diffusion() has been called.
+        """
+        if self.diffusion is None:
+            return {"interactions": 0, "rumors_shared": 0, "seconds": 0.0}
+        return self.diffusion.step(npc_locations, dt)
+
+    def _catch_up(self, state: NPCIntelligenceState) -> None:
+        """Give a reduced or frozen NPC's memories the time they missed."""
+        if self.lod is not None:
+            pending = self.lod.take_pending(state.npc_id)
+            if pending and state.memory_bank.update(pending):
+                self.behavior_system.mark_stale(state.npc_id)
+
+    def _add_memory(self, state: NPCIntelligenceState, memory: NPCMemory) -> None:
+        """Store a memory and fold it into the NPC's behavior."""
+        bank = state.memory_bank
+        count = len(bank)
+        bank.add_memory(memory)
+        if len(bank) != count + 1:
+            # Over capacity: something was pruned, so start over next tick
+            self.behavior_system.mark_stale(state.npc_id)
+            return
+        self.behavior_system.add_memory_effect(
+            state.npc_id, memory, self.current_time,
+            bank.decay_system.effective_rate(memory)
+        )
+
+    def use_sharded_tick(
+        self,
+        workers: int = 1,
+        shard_size: Optional[int] = None
+    ) -> ShardedTick:
+        """
+        Aggregate behavior in shards during update().
+
+        Results are identical to the regular tick. Call
+        close_sharded_tick() when done to shut down any worker processes.
+        """
+        self.close_sharded_tick()
+        if shard_size is None:
+            self.sharded_tick = ShardedTick(workers)
+        else:
+            self.sharded_tick = ShardedTick(workers, shard_size)
+        return self.sharded_tick
+
+    def close_sharded_tick(self) -> None:
+        """Go back to the regular tick."""
+        if self.sharded_tick is not None:
+            self.sharded_tick.close()
+            self.sharded_tick = None
+
+    def use_relation_matrix(self) -> MatrixSocialNetwork:
+        """
+        Keep the social network's relations in NumPy columns.
+
+        Copies the current relations over. Requires NumPy.
+        """
+        if not isinstance(self.social_network, MatrixSocialNetwork):
+            self.social_network = MatrixSocialNetwork.from_network(self.social_network)
+        return self.social_network
+
     def register_npc(
         self,
         npc_id: str,
@@ -119,6 +250,7 @@ class PropagationEngine:
                 self.register_npc(npc_id)
 
             state = self.npc_states[npc_id]
+            self._catch_up(state)
 
             # Form memory using bias processor
             memory = self.bias_processor.form_memory_from_event(
@@ -128,13 +260,10 @@ class PropagationEngine:
                 npc_id=npc_id
             )
 
-            # Add to NPC's memory bank
-            state.memory_bank.add_memory(memory)
+            # Add to NPC's memory bank and update behavior
+            self._add_memory(state, memory)
             memories.append(memory)
 
-            # Update behavior based on new memory
-            self.behavior_system.add_memory_effect(npc_id, memory)
-
             # Update tile memory with memory tags
             tile_mem = self.tile_manager.get_or_create(
                 event.location, event.location_name
@@ -171,6 +300,9 @@ class PropagationEngine:
         if not state_a or not state_b:
             return result
 
+        self._catch_up(state_a)
+        self._catch_up(state_b)
+
         # Record interaction in social network
         self.social_network.record_interaction(
             from_npc=npc_a,
@@ -184,15 +316,12 @@ class PropagationEngine:
         shareable_memories = state_a.memory_bank.get_shareable_memories()
         if shareable_memories:
             # Convert memory to rumor if needed
-            memory_to_share = random.choice(shareable_memories)
+            memory_to_share = self.rng.choice(shareable_memories)
 
             # Check if already a rumor
-            rumor = None
-            existing_rumors = self.rumor_propagation.get_rumors_known_by(npc_a)
-            for r in existing_rumors:
-                if r.origin_memory == memory_to_share.memory_id:
-                    rumor = r
-                    break
+            rumor = self.rumor_propagation.get_rumor_from_memory(
+                memory_to_share.memory_id, npc_a
+            )
 
             if not rumor:
                 rumor = self.rumor_propagation.convert_memory_to_rumor(
@@ -217,7 +346,7 @@ class PropagationEngine:
 
                 # Create memory in recipient from rumor
                 recipient_memory = self._rumor_to_memory(propagated, npc_a, npc_b)
-                state_b.memory_bank.add_memory(recipient_memory)
+                self._add_memory(state_b, recipient_memory)
                 result["memory_shared"] = True
 
                 # Record in social network
@@ -284,19 +413,63 @@ class PropagationEngine:
             "behaviors_updated": 0
         }
 
-        # Update each NPC's memory bank
-        for npc_id, state in self.npc_states.items():
-            old_count = len(state.memory_bank.memories)
-            state.memory_bank.update(dt)
-            result["memories_decayed"] += old_count - len(state.memory_bank.memories)
+        if self.lod is None:
+            due = [(npc_id, dt, None) for npc_id in self.npc_states]
+        else:
+            due = self.lod.advance(list(self.npc_states), dt)
 
-            # Update behavior based on current memories
-            state.behavior_modifier = self.behavior_system.update_npc_behavior(
-                npc_id,
-                state.memory_bank.memories,
+        # Update each due NPC's memory bank and behavior
+        behavior = self.behavior_system
+        rebuild = []
+        for npc_id, npc_dt, tier in due:
+            state = self.npc_states[npc_id]
+            started = time.perf_counter()
+            forgotten = state.memory_bank.update(npc_dt)
+            result["memories_decayed"] += forgotten
+            if forgotten:
+                behavior.mark_stale(npc_id)
+
+            modifier = behavior.advance_npc_behavior(
+                npc_id, self.current_time, len(state.memory_bank)
+            )
+            if modifier is not None:
+                state.behavior_modifier = modifier
+                result["behaviors_updated"] += 1
+            elif self.sharded_tick is None:
+                # Update behavior based on current memories
+                state.behavior_modifier = behavior.update_npc_behavior(
+                    npc_id,
+                    state.memory_bank.memories,
+                    self.current_time,
+                    state.memory_bank.decay_system
+                )
+                result["behaviors_updated"] += 1
+            else:
+                rebuild.append((npc_id, tier))
+            if tier is not None:
+                self.lod.record(tier, time.perf_counter() - started)
+
+        if rebuild:
+            started = time.perf_counter()
+            banks = [self.npc_states[npc_id].memory_bank for npc_id, _ in rebuild]
+            modifiers = self.sharded_tick.compute_modifiers(
+                [npc_id for npc_id, _ in rebuild],
+                banks,
+                behavior.mapping,
                 self.current_time
             )
-            result["behaviors_updated"] += 1
+            for (npc_id, _), bank in zip(rebuild, banks):
+                self.npc_states[npc_id].behavior_modifier = modifiers[npc_id]
+                behavior.track_memories(
+                    npc_id, bank.memories, self.current_time, bank.decay_system
+                )
+            behavior.npc_modifiers.update(modifiers)
+            result["behaviors_updated"] += len(modifiers)
+            if self.lod is not None:
+                # Share the batch's time out by tier
+                share = (time.perf_counter() - started) / len(rebuild)
+                for _, tier in rebuild:
+                    self.lod.record(tier, share)
 
         # Update tile memories
         self.tile_manager.update(dt)
@@ -334,6 +507,7 @@ class PropagationEngine:
         """Get all memories for an NPC."""
         state = self.npc_states.get(npc_id)
         if state:
+            self._catch_up(state)
             return state.memory_bank.memories
         return []
 
@@ -345,6 +519,7 @@ class PropagationEngine:
         """Get NPC's memories about a specific subject."""
         state = self.npc_states.get(npc_id)
         if state:
+            self._catch_up(state)
             return state.memory_bank.get_memories_about(subject)
         return []
 
@@ -363,6 +538,24 @@ class PropagationEngine:
         """Get atmospheric hints at a location."""
         return self.tile_manager.get_all_hints_at(location)
 
+    def get_eviction_counts(self) -> dict[str, dict]:
+        """
+        NPCs, memory capacity, and capacity evictions per NPC type.
+
+        Use this to tune NPC_MEMORY_CAPACITY: types that evict often are
+        losing memories to the cap rather than to decay.
+        """
+        counts: dict[str, dict] = {}
+        for state in self.npc_states.values():
+            bank = state.memory_bank
+            entry = counts.setdefault(
+                state.npc_type,
+                {"npcs": 0, "capacity": bank.capacity, "evictions": 0}
+            )
+            entry["npcs"] += 1
+            entry["evictions"] += bank.evictions
+        return counts
+
     def player_spreads_rumor(
         self,
         target_npc: str,
@@ -381,11 +574,12 @@ class PropagationEngine:
         )
         rumor.add_carrier(target_npc)
 
-        self.rumor_propagation.active_rumors[rumor.rumor_id] = rumor
+        self.rumor_propagation.add_rumor(rumor)
 
         # Create memory in target
         target_state = self.npc_states.get(target_npc)
         if target_state:
+            self._catch_up(target_state)
             memory = NPCMemory(
                 summary=rumor_content,
                 tags=["player_said"],
@@ -394,12 +588,14 @@ class PropagationEngine:
                 source_npc="player",
                 timestamp=self.current_time
             )
-            target_state.memory_bank.add_memory(memory)
+            self._add_memory(target_state, memory)
 
         return rumor
 
     def to_dict(self) -> dict:
         """Serialize engine state."""
+        for state in self.npc_states.values():
+            self._catch_up(state)
         return {
             "npc_states": {
                 npc_id: {
@@ -419,7 +615,9 @@ class PropagationEngine:
             "social_network": self.social_network.to_dict(),
             "tile_manager": self.tile_manager.to_dict(),
             "behavior_system": self.behavior_system.to_dict(),
-            "current_time": self.current_time
+            "current_time": self.current_time,
+            # So a loaded save keeps rolling the same dice
+            "rng_state": _encode_rng_state(self.rng.getstate())
         }
 
     @classmethod
@@ -451,10 +649,13 @@ class PropagationEngine:
             for k, v in data.get("active_rumors", {}).items()
         }
 
-        # Restore other systems
-        engine.social_network = SocialNetwork.from_dict(
-            data.get("social_network", {})
-        )
+        # Restore other systems; a matrix-backed network stays one
+        network_data = data.get("social_network", {})
+        if network_data.get("format") == "matrix" and relation_matrix.NUMPY_AVAILABLE:
+            engine.social_network = MatrixSocialNetwork.from_dict(network_data)
+        else:
+            # Without NumPy the array format reads into plain relations
+            engine.social_network = SocialNetwork.from_dict(network_data)
         engine.tile_manager = TileMemoryManager.from_dict(
             data.get("tile_manager", {})
         )
@@ -462,5 +663,19 @@ class PropagationEngine:
             data.get("behavior_system", {})
         )
         engine.current_time = data.get("current_time", 0.0)
+        if data.get("rng_state") is not None:
+            # Set in place: the bias processor and rumors share this rng
+            engine.rng.setstate(_decode_rng_state(data["rng_state"]))
 
         return engine
+
+
+def _encode_rng_state(state: tuple) -> list:
+    """A random.Random state as JSON-safe lists."""
+    version, internal, gauss_next = state
+    return [version, list(internal), gauss_next]
+
+
+def _decode_rng_state(data: list) -> tuple:
+    version, internal, gauss_next = data
+    return (version, tuple(internal), gauss_next)
@@ -0,0 +1,454 @@
+"""
+MatrixSocialNetwork - SocialNetwork backed by NumPy relation columns.
+
+For large casts, a SocialRelation dataclass per relation makes every
+tick a Python loop and every save a dict per relation. This backend
+stores affinity, trust, respect, fear, tension and type as NumPy
+columns with one entry per relation, next to columns of the from and
+to NPC ordinals: a sparse (coordinate-format) relation matrix. Dense
+NPC x NPC matrices would need 100M cells per metric at 10k NPCs, so
+metric_matrix() builds a dense one only on request.
+
+Relations are handed out as SocialRelationView objects that read and
+write the columns, so callers use them exactly like SocialRelation.
+update() decays tension and finds conflicts and reconciliations with
+array operations, then applies RelationshipDynamics' event rules to
+just the flagged relations. Storylines are array masks as well.
+to_dict() writes one list per column.
+
+NumPy is optional: SocialNetwork.from_dict reads the array format into
+plain relations when it isn't installed.
+"""
+
+from .social_network import (
+    RelationType, SocialEvent, SocialNetwork, SocialRelation
+)
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+
+# Relation types by code
+RELATION_TYPES = tuple(RelationType)
+_TYPE_CODES = {t: code for code, t in enumerate(RELATION_TYPES)}
+
+# Integer metric columns
+METRICS = ("affinity", "trust", "respect", "fear", "tension")
+
+# Per-relation lists, stored only once a relation has some
+DETAIL_FIELDS = (
+    "shared_secrets", "shared_memories", "shared_rumors", "interaction_history"
+)
+
+
+def _metric_property(name: str) -> property:
+    def get(self) -> int:
+        return int(self._matrix._columns[name][self._edge])
+
+    def set(self, value: int) -> None:
+        self._matrix._columns[name][self._edge] = value
+
+    return property(get, set)
+
+
+def _detail_property(name: str) -> property:
+    def get(self) -> list:
+        details = self._matrix._details
+        entry = details.get(self._edge)
+        if entry is None:
+            entry = details[self._edge] = {}
+        return entry.setdefault(name, [])
+
+    def set(self, value: list) -> None:
+        self._matrix._details.setdefault(self._edge, {})[name] = value
+
+    return property(get, set)
+
+
+class SocialRelationView(SocialRelation):
+    """A SocialRelation whose fields live in a MatrixSocialNetwork."""
+
+    def __init__(self, matrix: 'MatrixSocialNetwork', edge: int):
+        object.__setattr__(self, "_matrix", matrix)
+        object.__setattr__(self, "_edge", edge)
+
+    affinity = _metric_property("affinity")
+    trust = _metric_property("trust")
+    respect = _metric_property("respect")
+    fear = _metric_property("fear")
+    tension = _metric_property("tension")
+    shared_secrets = _detail_property("shared_secrets")
+    shared_memories = _detail_property("shared_memories")
+    shared_rumors = _detail_property("shared_rumors")
+    interaction_history = _detail_property("interaction_history")
+
+    @property
+    def relation_id(self) -> str:
+        return self._matrix._relation_ids[self._edge]
+
+    @property
+    def from_npc(self) -> str:
+        return self._matrix._npc_ids[self._matrix._from[self._edge]]
+
+    @property
+    def to_npc(self) -> str:
+        return self._matrix._npc_ids[self._matrix._to[self._edge]]
+
+    @property
+    def relation_type(self) -> RelationType:
+        return RELATION_TYPES[self._matrix._type[self._edge]]
+
+    @relation_type.setter
+    def relation_type(self, value: RelationType) -> None:
+        self._matrix._type[self._edge] = _TYPE_CODES[value]
+
+    @property
+    def last_interaction(self) -> float:
+        return float(self._matrix._last_interaction[self._edge])
+
+    @last_interaction.setter
+    def last_interaction(self, value: float) -> None:
+        self._matrix._last_interaction[self._edge] = value
+
+
+class MatrixSocialNetwork(SocialNetwork):
+    """
+    SocialNetwork with relation metrics in NumPy columns.
+
+    Behaves like SocialNetwork: the same queries, events, storylines and
+    ordering. Assigning relations as a whole copies plain relations into
+    the columns and hands back views.
+    """
+
+    INITIAL_CAPACITY = 64
+
+    def __init__(self):
+        if not NUMPY_AVAILABLE:
+            raise ImportError("NumPy is not installed")
+        self._npc_ids: list[str] = []
+        self._npc_index: dict[str, int] = {}
+        self._relation_ids: list[str] = []
+        self._details: dict[int, dict[str, list]] = {}
+        self._views: list[SocialRelationView] = []
+        self._size = 0
+        self._allocate(self.INITIAL_CAPACITY)
+        super().__init__()
+
+    def _allocate(self, capacity: int) -> None:
+        self._from = np.zeros(capacity, dtype=np.int32)
+        self._to = np.zeros(capacity, dtype=np.int32)
+        self._type = np.zeros(capacity, dtype=np.int8)
+        self._last_interaction = np.zeros(capacity, dtype=np.float64)
+        self._columns = {name: np.zeros(capacity, dtype=np.int16) for name in METRICS}
+
+    def _grow(self) -> None:
+        old = (self._from, self._to, self._type, self._last_interaction, self._columns)
+        self._allocate(len(self._from) * 2)
+        n = self._size
+        self._from[:n] = old[0][:n]
+        self._to[:n] = old[1][:n]
+        self._type[:n] = old[2][:n]
+        self._last_interaction[:n] = old[3][:n]
+        for name in METRICS:
+            self._columns[name][:n] = old[4][name][:n]
+
+    def _ordinal(self, npc_id: str) -> int:
+        index = self._npc_index.get(npc_id)
+        if index is None:
+            index = self._npc_index[npc_id] = len(self._npc_ids)
+            self._npc_ids.append(npc_id)
+        return index
+
+    def _append(
+        self,
+        relation_id: str,
+        from_npc: str,
+        to_npc: str,
+        relation_type: RelationType
+    ) -> SocialRelationView:
+        if self._size == len(self._from):
+            self._grow()
+        edge = self._size
+        self._size += 1
+        self._from[edge] = self._ordinal(from_npc)
+        self._to[edge] = self._ordinal(to_npc)
+        self._type[edge] = _TYPE_CODES[relation_type]
+        self._relation_ids.append(relation_id)
+        view = SocialRelationView(self, edge)
+        self._views.append(view)
+        return view
+
+    # -- SocialNetwork storage hooks ----------------------------------------
+
+    @property
+    def relations(self) -> dict[str, SocialRelation]:
+        """All relations by id, as views."""
+        return self._relations
+
+    @relations.setter
+    def relations(self, relations: dict[str, SocialRelation]) -> None:
+        self._npc_ids.clear()
+        self._npc_index.clear()
+        self._relation_ids.clear()
+        self._details.clear()
+        self._views.clear()
+        self._size = 0
+        self._allocate(max(self.INITIAL_CAPACITY, len(relations)))
+        self._relations = {}
+        self.relation_index = {}
+        self._outgoing.clear()
+        self._incoming.clear()
+        self._order.clear()
+        self._next_order = 0
+        for relation in relations.values():
+            view = self._append(
+                relation.relation_id, relation.from_npc, relation.to_npc,
+                relation.relation_type
+            )
+            for name in METRICS:
+                setattr(view, name, getattr(relation, name))
+            view.last_interaction = relation.last_interaction
+            for name in DETAIL_FIELDS:
+                if getattr(relation, name):
+                    setattr(view, name, list(getattr(relation, name)))
+            self._link(view)
+
+    def _create_relation(
+        self,
+        from_npc: str,
+        to_npc: str,
+        relation_type: RelationType
+    ) -> SocialRelation:
+        view = self._append(
+            SocialRelation(from_npc=from_npc, to_npc=to_npc,
+                           relation_type=relation_type).relation_id,
+            from_npc, to_npc, relation_type
+        )
+        # As SocialRelation.__post_init__ does
+        if relation_type == RelationType.STRANGER:
+            view._update_type()
+        self._link(view)
+        return view
+
+    def _relation_changed(self, relation: SocialRelation) -> None:
+        """Views write straight to the columns; nothing to re-file."""
+
+    def get_friends(self, npc_id: str) -> list[str]:
+        """Get NPCs who are friends with this one."""
+        return [
+            to_npc for to_npc, relation in self._outgoing.get(npc_id, {}).items()
+            if relation.relation_type in self.FRIEND_TYPES
+        ]
+
+    def get_enemies(self, npc_id: str) -> list[str]:
+        """Get NPCs who are enemies of this one."""
+        return [
+            to_npc for to_npc, relation in self._outgoing.get(npc_id, {}).items()
+            if relation.relation_type in self.ENEMY_TYPES
+        ]
+
+    # -- Vectorized dynamics ----------------------------------------------
+
+    def _codes(self, types) -> 'np.ndarray':
+        return np.array([_TYPE_CODES[t] for t in types], dtype=np.int8)
+
+    def update(self, dt: float) -> list[SocialEvent]:
+        """
+        Update social network over time.
+
+        Returns any emergent social events.
+        """
+        self.current_time += dt
+        n = self._size
+        tension = self._columns["tension"][:n]
+        affinity = self._columns["affinity"][:n]
+
+        # Tension naturally decreases over time
+        decay = min(int(dt * 0.1), 100)
+        if decay > 0:
+            np.maximum(tension - decay, 0, out=tension)
+
+        conflict = (tension > 80) & (affinity < 0)
+        reconcile = (
+            (self._type[:n] == _TYPE_CODES[RelationType.ENEMY])
+            & (tension < 20) & (affinity > -70)
+        )
+
+        events = []
+        dynamics = self.dynamics
+        for edge in np.flatnonzero(conflict | reconcile):
+            relation = self._views[edge]
+            if dynamics.check_for_conflict(relation):
+                events.append(self._create_conflict_event(relation))
+            if dynamics.check_for_reconciliation(relation):
+                events.append(self._create_reconciliation_event(relation))
+
+        self.social_events.extend(events)
+        return events
+
+    def get_emergent_storylines(self) -> list[dict]:
+        """
+        Identify emergent storylines from social dynamics.
+
+        Returns narratively interesting situations.
+        """
+        storylines = []
+        n = self._size
+        npc_ids = self._npc_ids
+        sources = self._from[:n]
+        targets = self._to[:n]
+        types = self._type[:n]
+        tension = self._columns["tension"][:n]
+
+        # Friend and enemy lists by ordinal, in edge order like get_friends
+        friends: dict[int, list[int]] = {}
+        enemies: dict[int, list[int]] = {}
+        for stance, stance_types in ((friends, self.FRIEND_TYPES),
+                               (enemies, self.ENEMY_TYPES)):
+            mask = np.isin(types, self._codes(stance_types))
+            for a, b in zip(sources[mask].tolist(), targets[mask].tolist()):
+                stance.setdefault(a, []).append(b)
+
+        # Find love triangles / rivalries, among NPCs with both
+        for npc in friends.keys() & enemies.keys():
+            for friend in friends[npc]:
+                friend_friends = friends.get(friend, ())
+                for enemy in enemies[npc]:
+                    if enemy in friend_friends:
+                        storylines.append({
+                            "type": "friend_of_enemy",
+                            "npcs": [npc_ids[npc], npc_ids[friend], npc_ids[enemy]],
+                            "description": f"{npc_ids[friend]} is caught between "
+                                         f"{npc_ids[npc]} and {npc_ids[enemy]}"
+                        })
+
+        # Find high-tension relationships
+        hot = tension > 70
+        for a, b, value in zip(sources[hot].tolist(), targets[hot].tolist(),
+                               tension[hot].tolist()):
+            storylines.append({
+                "type": "high_tension",
+                "npcs": [npc_ids[a], npc_ids[b]],
+                "tension": value,
+                "description": f"Explosive tension between "
+                             f"{npc_ids[a]} and {npc_ids[b]}"
+            })
+
+        # Find secret alliances (enemies who trust each other)
+        secret = (self._columns["affinity"][:n] < -20) & (self._columns["trust"][:n] > 30)
+        for a, b in zip(sources[secret].tolist(), targets[secret].tolist()):
+            storylines.append({
+                "type": "secret_alliance",
+                "npcs": [npc_ids[a], npc_ids[b]],
+                "description": f"{npc_ids[a]} trusts enemy "
+                             f"{npc_ids[b]} despite animosity"
+            })
+
+        return storylines
+
+    def metric_matrix(self, metric: str) -> 'np.ndarray':
+        """
+        A dense NPC x NPC matrix of one metric, indexed by NPC ordinal.
+
+        Cells without a relation are 0. Ordinals follow npc_ids().
+        """
+        n = self._size
+        npcs = len(self._npc_ids)
+        matrix = np.zeros((npcs, npcs), dtype=np.int16)
+        matrix[self._from[:n], self._to[:n]] = self._columns[metric][:n]
+        return matrix
+
+    def npc_ids(self) -> list[str]:
+        """NPC ids by ordinal."""
+        return list(self._npc_ids)
+
+    # -- Serialization ----------------------------------------------------
+
+    def to_dict(self) -> dict:
+        """Serialize social network as one list per column."""
+        n = self._size
+        data = {
+            "format": "matrix",
+            "npcs": list(self._npc_ids),
+            "relation_ids": list(self._relation_ids),
+            "from": self._from[:n].tolist(),
+            "to": self._to[:n].tolist(),
+            "relation_type": [RELATION_TYPES[code].value for code in self._type[:n]],
+            "last_interaction": self._last_interaction[:n].tolist(),
+            "details": {
+                str(edge): {name: values for name, values in entry.items() if values}
+                for edge, entry in self._details.items()
+                if any(entry.values())
+            },
+            "social_events": self._events_to_dict(),
+            "current_time": self.current_time
+        }
+        for name in METRICS:
+            data[name] = self._columns[name][:n].tolist()
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'MatrixSocialNetwork':
+        """Deserialize either the array format or SocialNetwork's format."""
+        if data.get("format") != "matrix":
+            return cls.from_network(SocialNetwork.from_dict(data))
+        network = cls()
+        n = len(data["relation_ids"])
+        network._allocate(max(cls.INITIAL_CAPACITY, n))
+        network._npc_ids = list(data["npcs"])
+        network._npc_index = {npc: i for i, npc in enumerate(network._npc_ids)}
+        network._relation_ids = list(data["relation_ids"])
+        network._size = n
+        network._from[:n] = data["from"]
+        network._to[:n] = data["to"]
+        network._type[:n] = [
+            _TYPE_CODES[RelationType(value)] for value in data["relation_type"]
+        ]
+        network._last_interaction[:n] = data["last_interaction"]
+        for name in METRICS:
+            network._columns[name][:n] = data[name]
+        network._details = {
+            int(edge): dict(entry) for edge, entry in data.get("details", {}).items()
+        }
+        network._views = [SocialRelationView(network, edge) for edge in range(n)]
+        for view in network._views:
+            network._link(view)
+        network.social_events = [
+            SocialEvent(**e) for e in data.get("social_events", [])
+        ]
+        network.current_time = data.get("current_time", 0.0)
+        return network
+
+    @classmethod
+    def from_network(cls, network: SocialNetwork) -> 'MatrixSocialNetwork':
+        """Copy a SocialNetwork's relations, events and clock."""
+        matrix = cls()
+        matrix.relations = network.relations
+        matrix.social_events = list(network.social_events)
+        matrix.current_time = network.current_time
+        matrix.dynamics = network.dynamics
+        return matrix
+
+
+def relations_from_arrays(data: dict) -> list[SocialRelation]:
+    """Plain SocialRelations from MatrixSocialNetwork.to_dict() output."""
+    npcs = data["npcs"]
+    details = data.get("details", {})
+    relations = []
+    for edge, relation_id in enumerate(data["relation_ids"]):
+        fields = {name: data[name][edge] for name in METRICS}
+        for name, values in details.get(str(edge), {}).items():
+            fields[name] = list(values)
+        relations.append(SocialRelation(
+            relation_id=relation_id,
+            from_npc=npcs[data["from"][edge]],
+            to_npc=npcs[data["to"][edge]],
+            relation_type=RelationType(data["relation_type"][edge]),
+            last_interaction=data["last_interaction"][edge],
+            **fields
+        ))
+    return relations
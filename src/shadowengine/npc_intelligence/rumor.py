@@ -176,6 +176,9 @@ class RumorMutation:
         "alone"
     ]
 
+    def __init__(self, rng: Optional[random.Random] = None):
+        self.rng = rng or random.Random()
+
     def mutate(
         self,
         rumor: Rumor,
@@ -230,13 +233,13 @@ class RumorMutation:
         )
 
         # Random mutations based on probability
-        if random.random() < 0.2:
+        if self.rng.random() < 0.2:
             mutated = self._simplify(mutated)
-        if random.random() < 0.15:
+        if self.rng.random() < 0.15:
             mutated = self._exaggerate(mutated, source_bias)
-        if random.random() < 0.1:
+        if self.rng.random() < 0.1:
             mutated = self._personalize(mutated, source_bias)
-        if random.random() < 0.1:
+        if self.rng.random() < 0.1:
             mutated = self._misattribute(mutated)
 
         return mutated
@@ -251,7 +254,7 @@ class RumorMutation:
                     return claim.lower().replace(old, new).capitalize()
 
         # Paranoid sources add suspicion
-        if bias.paranoid > 0.7 and random.random() < 0.3:
+        if bias.paranoid > 0.7 and self.rng.random() < 0.3:
             if "they" not in claim.lower():
                 return f"Word is, {claim.lower()}"
 
@@ -274,8 +277,8 @@ class RumorMutation:
 
         # Forgetful targets lose details
         if bias.forgetful > 0.5 and len(filtered) > 1:
-            if random.random() < bias.forgetful:
-                filtered.pop(random.randint(0, len(filtered) - 1))
+            if self.rng.random() < bias.forgetful:
+                filtered.pop(self.rng.randint(0, len(filtered) - 1))
 
         return filtered
 
@@ -304,7 +307,7 @@ class RumorMutation:
     def _personalize(self, rumor: Rumor, source_bias: NPCBias) -> Rumor:
         """Add personal connection."""
         if "stranger" in rumor.core_claim.lower():
-            if random.random() < 0.3:
+            if self.rng.random() < 0.3:
                 rumor.details.append("Someone I know was there")
                 rumor.record_mutation("personalized")
         return rumor
@@ -315,7 +318,7 @@ class RumorMutation:
 
         for old, new in self.MISATTRIBUTIONS.items():
             if old in lower_claim:
-                if random.random() < 0.3:
+                if self.rng.random() < 0.3:
                     rumor.core_claim = lower_claim.replace(old, new).capitalize()
                     rumor.distortion += 0.2
                     rumor.record_mutation("misattributed")
@@ -340,6 +343,13 @@ class RumorPropagation:
     Engine for spreading rumors between NPCs.
 
     Handles when and how rumors spread, and applies mutations.
+
+    Keeps reverse indexes (carrier, origin memory, tag, origin location
+    -> rumor ids) next to active_rumors, so per-NPC and per-topic lookups
+    cost the size of the answer rather than the number of rumors. Add
+    and remove rumors through add_rumor/remove_rumor (or add_carrier for
+    a new carrier) to keep them current; assigning active_rumors as a
+    whole rebuilds them.
     """
 
     # Base probabilities by trigger
@@ -353,9 +363,90 @@ class RumorPropagation:
         PropagationTrigger.INTERROGATED: 0.85
     }
 
-    def __init__(self):
-        self.mutation_system = RumorMutation()
-        self.active_rumors: dict[str, Rumor] = {}  # rumor_id -> Rumor
+    def __init__(self, rng: Optional[random.Random] = None):
+        self.rng = rng or random.Random()
+        self.mutation_system = RumorMutation(self.rng)
+        self._rumors: dict[str, Rumor] = {}  # rumor_id -> Rumor
+        # Reverse indexes: key -> rumor ids (dicts as ordered sets)
+        self._by_carrier: dict[str, dict[str, None]] = {}
+        self._by_memory: dict[str, dict[str, None]] = {}
+        self._by_tag: dict[str, dict[str, None]] = {}
+        self._by_location: dict[str, dict[str, None]] = {}
+        # Registration order, so indexed queries list rumors like active_rumors does
+        self._order: dict[str, int] = {}
+        self._next_order = 0
+
+    @property
+    def active_rumors(self) -> dict[str, Rumor]:
+        """Active rumors by id."""
+        return self._rumors
+
+    @active_rumors.setter
+    def active_rumors(self, rumors: dict[str, Rumor]) -> None:
+        self._rumors = {}
+        for index in (self._by_carrier, self._by_memory, self._by_tag, self._by_location):
+            index.clear()
+        self._order.clear()
+        for rumor in rumors.values():
+            self.add_rumor(rumor)
+
+    # -- Index maintenance ------------------------------------------------
+
+    def _index_keys(self, rumor: Rumor) -> list[tuple[dict, str]]:
+        """Every (index, key) pair a rumor is listed under."""
+        keys = [(self._by_carrier, npc_id) for npc_id in rumor.carriers]
+        keys.extend((self._by_tag, tag) for tag in rumor.tags)
+        if rumor.origin_memory:
+            keys.append((self._by_memory, rumor.origin_memory))
+        if rumor.origin_location:
+            keys.append((self._by_location, rumor.origin_location))
+        return keys
+
+    def _unindex(self, rumor: Rumor) -> None:
+        for index, key in self._index_keys(rumor):
+            bucket = index.get(key)
+            if bucket is not None:
+                bucket.pop(rumor.rumor_id, None)
+                if not bucket:
+                    del index[key]
+
+    def add_rumor(self, rumor: Rumor) -> None:
+        """
+        Register a rumor, replacing any rumor with the same id.
+
+        A mutated retelling keeps its rumor id, so re-adding it updates
+        the indexes to the new version.
+        """
+        old = self._rumors.get(rumor.rumor_id)
+        if old is not None:
+            self._unindex(old)
+        else:
+            self._order[rumor.rumor_id] = self._next_order
+            self._next_order += 1
+        self._rumors[rumor.rumor_id] = rumor
+        for index, key in self._index_keys(rumor):
+            index.setdefault(key, {})[rumor.rumor_id] = None
+
+    def remove_rumor(self, rumor_id: str) -> Optional[Rumor]:
+        """Drop a rumor and its index entries; returns it if it was active."""
+        rumor = self._rumors.pop(rumor_id, None)
+        if rumor is not None:
+            self._unindex(rumor)
+            del self._order[rumor_id]
+        return rumor
+
+    def add_carrier(self, rumor: Rumor, npc_id: str) -> None:
+        """Record that an NPC now knows a rumor."""
+        rumor.add_carrier(npc_id)
+        if self._rumors.get(rumor.rumor_id) is rumor:
+            self._by_carrier.setdefault(npc_id, {})[rumor.rumor_id] = None
+
+    def _lookup(self, index: dict[str, dict[str, None]], key: str) -> list[Rumor]:
+        bucket = index.get(key)
+        if not bucket:
+            return []
+        order = self._order
+        return [self._rumors[rumor_id] for rumor_id in sorted(bucket, key=order.__getitem__)]
 
     def should_propagate(
         self,
@@ -375,7 +466,7 @@ class RumorPropagation:
         # Modify by source personality
         base_prob *= source_bias.get_share_probability_modifier()
 
-        return random.random() < min(1.0, base_prob)
+        return self.rng.random() < min(1.0, base_prob)
 
     def select_rumor_to_share(
         self,
@@ -423,9 +514,9 @@ class RumorPropagation:
         # Weighted random selection
         total = sum(w for _, w in weighted)
         if total == 0:
-            return random.choice(source_rumors) if source_rumors else None
+            return self.rng.choice(source_rumors) if source_rumors else None
 
-        r = random.random() * total
+        r = self.rng.random() * total
         cumulative = 0
         for rumor, weight in weighted:
             cumulative += weight
@@ -469,7 +560,7 @@ class RumorPropagation:
         mutated.add_carrier(target_id)
 
         # Update tracking
-        self.active_rumors[mutated.rumor_id] = mutated
+        self.add_rumor(mutated)
 
         return mutated
 
@@ -480,26 +571,40 @@ class RumorPropagation:
     ) -> Rumor:
         """Convert an NPC's memory into a shareable rumor."""
         rumor = Rumor.from_memory(memory, npc_id)
-        self.active_rumors[rumor.rumor_id] = rumor
+        self.add_rumor(rumor)
         return rumor
 
     def get_rumors_by_tag(self, tag: str) -> list[Rumor]:
         """Get all active rumors with a specific tag."""
-        return [r for r in self.active_rumors.values() if r.has_tag(tag)]
+        return self._lookup(self._by_tag, tag)
 
     def get_rumors_about_location(self, location: str) -> list[Rumor]:
         """Get all rumors originating from a location."""
-        return [
-            r for r in self.active_rumors.values()
-            if r.origin_location == location
-        ]
+        return self._lookup(self._by_location, location)
 
     def get_rumors_known_by(self, npc_id: str) -> list[Rumor]:
         """Get all rumors an NPC knows."""
-        return [
-            r for r in self.active_rumors.values()
-            if r.is_carrier(npc_id)
-        ]
+        return self._lookup(self._by_carrier, npc_id)
+
+    def get_rumor_from_memory(
+        self,
+        memory_id: str,
+        npc_id: Optional[str] = None
+    ) -> Optional[Rumor]:
+        """
+        Get the rumor a memory was turned into.
+
+        Args:
+            memory_id: Origin memory ID
+            npc_id: Only consider rumors this NPC carries
+
+        Returns:
+            The first matching rumor, or None
+        """
+        for rumor in self._lookup(self._by_memory, memory_id):
+            if npc_id is None or rumor.is_carrier(npc_id):
+                return rumor
+        return None
 
     def decay_rumors(self, dt: float) -> None:
         """Decay rumors over time — confidence drops, inactive ones are removed."""
@@ -513,4 +618,4 @@ class RumorPropagation:
 
             # Remove very old, inactive rumors
             if not rumor.is_active and rumor.carrier_count < 2:
-                del self.active_rumors[rumor.rumor_id]
+                self.remove_rumor(rumor.rumor_id)
@@ -64,6 +64,9 @@ class SocialRelation:
     # History
     interaction_history: list[dict] = field(default_factory=list)
 
+    # Fields a SocialNetwork indexes relations by
+    _WATCHED = frozenset({"affinity", "trust", "tension", "relation_type"})
+
     def __post_init__(self):
         if not self.relation_id:
             self.relation_id = f"rel_{uuid.uuid4().hex[:12]}"
@@ -72,6 +75,14 @@ class SocialRelation:
         if self.relation_type == RelationType.STRANGER:
             self._update_type()
 
+    def __setattr__(self, name, value) -> None:
+        object.__setattr__(self, name, value)
+        if name in SocialRelation._WATCHED:
+            # Let the owning network re-file this relation
+            network = self.__dict__.get("_network")
+            if network is not None:
+                network._relation_changed(self)
+
     def _update_type(self) -> None:
         """Update relationship type based on metrics."""
         if self.relation_type in [RelationType.FAMILY, RelationType.SUPERIOR,
@@ -277,19 +288,141 @@ class SocialNetwork:
 
     Tracks all relationships and enables querying for social dynamics
     and emergent storylines.
+
+    Relations are kept in per-NPC outgoing and incoming adjacency dicts,
+    so per-NPC queries cost the NPC's degree. Each relation also tells
+    the network when its affinity, trust, tension or type changes, which
+    keeps three filed sets current: the active set (relations update()
+    can still change), and the high-tension and secret-alliance sets
+    that get_emergent_storylines reads. Create relations through
+    get_or_create_relation; assigning relations as a whole rebuilds the
+    indexes.
     """
 
+    FRIEND_TYPES = (RelationType.FRIEND, RelationType.CLOSE_FRIEND, RelationType.ALLY)
+    ENEMY_TYPES = (RelationType.ENEMY, RelationType.RIVAL)
+
     def __init__(self):
         # relation_id -> SocialRelation
-        self.relations: dict[str, SocialRelation] = {}
+        self._relations: dict[str, SocialRelation] = {}
         # (from_npc, to_npc) -> relation_id
         self.relation_index: dict[tuple[str, str], str] = {}
+        # Adjacency: npc -> other npc -> relation, in creation order
+        self._outgoing: dict[str, dict[str, SocialRelation]] = {}
+        self._incoming: dict[str, dict[str, SocialRelation]] = {}
+        # Creation order, so indexed queries list relations like relations does
+        self._order: dict[str, int] = {}
+        self._next_order = 0
+        # Filed sets (relation_id -> relation)
+        self._active: dict[str, SocialRelation] = {}
+        self._high_tension: dict[str, SocialRelation] = {}
+        self._secret_alliances: dict[str, SocialRelation] = {}
+        # relation_id -> "friend" / "enemy", and per-NPC outgoing counts
+        self._stance: dict[str, str] = {}
+        self._friend_count: dict[str, int] = {}
+        self._enemy_count: dict[str, int] = {}
         # Social events history
         self.social_events: list[SocialEvent] = []
         # Dynamics engine
         self.dynamics = RelationshipDynamics()
         self.current_time: float = 0.0
 
+    @property
+    def relations(self) -> dict[str, SocialRelation]:
+        """All relations by id."""
+        return self._relations
+
+    @relations.setter
+    def relations(self, relations: dict[str, SocialRelation]) -> None:
+        for relation in self._relations.values():
+            relation.__dict__.pop("_network", None)
+        self._relations = {}
+        self.relation_index = {}
+        for index in (self._outgoing, self._incoming, self._order, self._active,
+                      self._high_tension, self._secret_alliances, self._stance,
+                      self._friend_count, self._enemy_count):
+            index.clear()
+        self._next_order = 0
+        for relation in relations.values():
+            self._add_relation(relation)
+
+    # -- Index maintenance ------------------------------------------------
+
+    def _add_relation(self, relation: SocialRelation) -> None:
+        self._link(relation)
+        object.__setattr__(relation, "_network", self)
+        self._relation_changed(relation)
+
+    def _link(self, relation: SocialRelation) -> None:
+        """Add a relation to the id, pair, adjacency and order indexes."""
+        rid = relation.relation_id
+        self._relations[rid] = relation
+        self.relation_index[(relation.from_npc, relation.to_npc)] = rid
+        self._outgoing.setdefault(relation.from_npc, {})[relation.to_npc] = relation
+        self._incoming.setdefault(relation.to_npc, {})[relation.from_npc] = relation
+        self._order[rid] = self._next_order
+        self._next_order += 1
+
+    def _create_relation(
+        self,
+        from_npc: str,
+        to_npc: str,
+        relation_type: RelationType
+    ) -> SocialRelation:
+        """Make and index a new relation."""
+        relation = SocialRelation(
+            from_npc=from_npc,
+            to_npc=to_npc,
+            relation_type=relation_type
+        )
+        self._add_relation(relation)
+        return relation
+
+    @staticmethod
+    def _file(index: dict, relation: SocialRelation, member: bool) -> None:
+        if member:
+            index[relation.relation_id] = relation
+        else:
+            index.pop(relation.relation_id, None)
+
+    def _relation_changed(self, relation: SocialRelation) -> None:
+        """Re-file a relation after one of its watched fields changed."""
+        rid = relation.relation_id
+        if rid not in self._order:
+            return  # Still being built
+        # update() can only change relations with tension to decay or
+        # resolve, or enemies that could reconcile
+        self._file(self._active, relation, relation.tension > 0 or (
+            relation.relation_type == RelationType.ENEMY and relation.affinity > -70
+        ))
+        self._file(self._high_tension, relation, relation.tension > 70)
+        self._file(self._secret_alliances, relation,
+                   relation.affinity < -20 and relation.trust > 30)
+
+        if relation.relation_type in self.FRIEND_TYPES:
+            stance = "friend"
+        elif relation.relation_type in self.ENEMY_TYPES:
+            stance = "enemy"
+        else:
+            stance = None
+        old = self._stance.get(rid)
+        if stance != old:
+            if old is not None:
+                self._count_stance(old, relation.from_npc, -1)
+                del self._stance[rid]
+            if stance is not None:
+                self._count_stance(stance, relation.from_npc, 1)
+                self._stance[rid] = stance
+
+    def _count_stance(self, stance: str, npc_id: str, delta: int) -> None:
+        counts = self._friend_count if stance == "friend" else self._enemy_count
+        counts[npc_id] = counts.get(npc_id, 0) + delta
+        if not counts[npc_id]:
+            del counts[npc_id]
+
+    def _in_order(self, relations) -> list[SocialRelation]:
+        return sorted(relations, key=lambda r: self._order[r.relation_id])
+
     def get_or_create_relation(
         self,
         from_npc: str,
@@ -300,19 +433,10 @@ class SocialNetwork:
         key = (from_npc, to_npc)
 
         if key in self.relation_index:
-            return self.relations[self.relation_index[key]]
+            return self._relations[self.relation_index[key]]
 
         # Create new relationship
-        relation = SocialRelation(
-            from_npc=from_npc,
-            to_npc=to_npc,
-            relation_type=initial_type
-        )
-
-        self.relations[relation.relation_id] = relation
-        self.relation_index[key] = relation.relation_id
-
-        return relation
+        return self._create_relation(from_npc, to_npc, initial_type)
 
     def get_relation(
         self,
@@ -322,48 +446,43 @@ class SocialNetwork:
         """Get existing relationship or None."""
         key = (from_npc, to_npc)
         if key in self.relation_index:
-            return self.relations[self.relation_index[key]]
+            return self._relations[self.relation_index[key]]
         return None
 
     def get_all_relations_for(self, npc_id: str) -> list[SocialRelation]:
         """Get all relationships an NPC has (both directions)."""
-        result = []
-        for relation in self.relations.values():
-            if relation.from_npc == npc_id or relation.to_npc == npc_id:
-                result.append(relation)
-        return result
+        found = {
+            r.relation_id: r
+            for index in (self._outgoing, self._incoming)
+            for r in index.get(npc_id, {}).values()
+        }
+        return self._in_order(found.values())
 
     def get_outgoing_relations(self, npc_id: str) -> list[SocialRelation]:
         """Get relationships FROM this NPC."""
-        return [
-            r for r in self.relations.values()
-            if r.from_npc == npc_id
-        ]
+        return list(self._outgoing.get(npc_id, {}).values())
 
     def get_incoming_relations(self, npc_id: str) -> list[SocialRelation]:
         """Get relationships TO this NPC."""
-        return [
-            r for r in self.relations.values()
-            if r.to_npc == npc_id
-        ]
+        return list(self._incoming.get(npc_id, {}).values())
 
     def get_friends(self, npc_id: str) -> list[str]:
         """Get NPCs who are friends with this one."""
-        friends = []
-        for relation in self.get_outgoing_relations(npc_id):
-            if relation.relation_type in [RelationType.FRIEND,
-                                          RelationType.CLOSE_FRIEND,
-                                          RelationType.ALLY]:
-                friends.append(relation.to_npc)
-        return friends
+        if npc_id not in self._friend_count:
+            return []
+        return [
+            to_npc for to_npc, relation in self._outgoing[npc_id].items()
+            if relation.relation_type in self.FRIEND_TYPES
+        ]
 
     def get_enemies(self, npc_id: str) -> list[str]:
         """Get NPCs who are enemies of this one."""
-        enemies = []
-        for relation in self.get_outgoing_relations(npc_id):
-            if relation.relation_type in [RelationType.ENEMY, RelationType.RIVAL]:
-                enemies.append(relation.to_npc)
-        return enemies
+        if npc_id not in self._enemy_count:
+            return []
+        return [
+            to_npc for to_npc, relation in self._outgoing[npc_id].items()
+            if relation.relation_type in self.ENEMY_TYPES
+        ]
 
     def get_trusted_npcs(self, npc_id: str, threshold: int = 30) -> list[str]:
         """Get NPCs this one trusts above threshold."""
@@ -434,7 +553,8 @@ class SocialNetwork:
         self.current_time += dt
         events = []
 
-        for relation in self.relations.values():
+        # Other relations have no tension to decay and can't reconcile
+        for relation in self._in_order(self._active.values()):
             # Decay tension
             self.dynamics.decay_tension(relation, dt)
 
@@ -498,8 +618,10 @@ class SocialNetwork:
         """
         storylines = []
 
-        # Find love triangles / rivalries
-        for npc_id in self._get_all_npcs():
+        # Find love triangles / rivalries, among NPCs with both
+        for npc_id in self._friend_count:
+            if npc_id not in self._enemy_count:
+                continue
             friends = self.get_friends(npc_id)
             enemies = self.get_enemies(npc_id)
 
@@ -516,7 +638,7 @@ class SocialNetwork:
                         })
 
         # Find high-tension relationships
-        for relation in self.relations.values():
+        for relation in self._in_order(self._high_tension.values()):
             if relation.tension > 70:
                 storylines.append({
                     "type": "high_tension",
@@ -527,7 +649,7 @@ class SocialNetwork:
                 })
 
         # Find secret alliances (enemies who trust each other)
-        for relation in self.relations.values():
+        for relation in self._in_order(self._secret_alliances.values()):
             if relation.affinity < -20 and relation.trust > 30:
                 storylines.append({
                     "type": "secret_alliance",
@@ -540,11 +662,7 @@ class SocialNetwork:
 
     def _get_all_npcs(self) -> set[str]:
         """Get all NPCs in the network."""
-        npcs = set()
-        for relation in self.relations.values():
-            npcs.add(relation.from_npc)
-            npcs.add(relation.to_npc)
-        return npcs
+        return set(self._outgoing) | set(self._incoming)
 
     def to_dict(self) -> dict:
         """Serialize social network."""
@@ -554,23 +672,44 @@ class SocialNetwork:
                 f"{k[0]}|{k[1]}": v
                 for k, v in self.relation_index.items()
             },
-            "social_events": [
-                {
-                    "event_id": e.event_id,
-                    "event_type": e.event_type,
-                    "participants": e.participants,
-                    "timestamp": e.timestamp,
-                    "description": e.description,
-                    "consequences": e.consequences
-                }
-                for e in self.social_events
-            ],
+            "social_events": self._events_to_dict(),
             "current_time": self.current_time
         }
 
+    def _events_to_dict(self) -> list[dict]:
+        return [
+            {
+                "event_id": e.event_id,
+                "event_type": e.event_type,
+                "participants": e.participants,
+                "timestamp": e.timestamp,
+                "description": e.description,
+                "consequences": e.consequences
+            }
+            for e in self.social_events
+        ]
+
     @classmethod
     def from_dict(cls, data: dict) -> 'SocialNetwork':
-        """Deserialize social network."""
+        """
+        Deserialize social network.
+
+        Also reads the array format MatrixSocialNetwork writes, into
+        plain relations when NumPy isn't installed.
+        """
+        if data.get("format") == "matrix":
+            from . import relation_matrix
+            if relation_matrix.NUMPY_AVAILABLE:
+                return relation_matrix.MatrixSocialNetwork.from_dict(data)
+            network = cls()
+            network.relations = {
+                r.relation_id: r for r in relation_matrix.relations_from_arrays(data)
+            }
+            network.social_events = [
+                SocialEvent(**e) for e in data.get("social_events", [])
+            ]
+            network.current_time = data.get("current_time", 0.0)
+            return network
         network = cls()
         network.relations = {
             k: SocialRelation.from_dict(v)
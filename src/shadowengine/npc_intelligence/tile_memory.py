@@ -7,7 +7,20 @@ behavior and atmosphere when they visit.
 """
 
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Optional, Union
+
+from ..grid.position import Position, neighbor_offsets
+
+
+# A location is an (x, y) key or a grid Position (its z is ignored)
+Location = Union[tuple[int, int], Position]
+
+
+def location_key(location: Location) -> tuple[int, int]:
+    """Get the (x, y) key tile memories are stored under."""
+    if isinstance(location, Position):
+        return (location.x, location.y)
+    return location
 
 
 @dataclass
@@ -199,6 +212,11 @@ class TileMemoryManager:
 
     Tracks what has happened at each location and provides
     queries for NPC pathfinding and atmosphere.
+
+    Memories are keyed by plain (x, y) tuples. Positions are accepted
+    everywhere a location is, but aren't used as keys: a slotted
+    Position is no smaller than the tuple and hashes in Python, so
+    lookups would be slower.
     """
 
     def __init__(self):
@@ -208,10 +226,11 @@ class TileMemoryManager:
 
     def get_or_create(
         self,
-        location: tuple[int, int],
+        location: Location,
         location_name: str = ""
     ) -> TileMemory:
         """Get tile memory, creating if necessary."""
+        location = location_key(location)
         if location not in self.tile_memories:
             self.tile_memories[location] = TileMemory(
                 location=location,
@@ -229,7 +248,7 @@ class TileMemoryManager:
 
     def record_event(
         self,
-        location: tuple[int, int],
+        location: Location,
         location_name: str,
         event_id: str,
         event_type: str,
@@ -278,9 +297,9 @@ class TileMemoryManager:
 
     def modify_path_for_npc(
         self,
-        path: list[tuple[int, int]],
+        path: list[Location],
         npc_fear_level: float
-    ) -> list[tuple[int, int]]:
+    ) -> list[Location]:
         """
         Modify an NPC's path to avoid dangerous remembered locations.
 
@@ -289,7 +308,7 @@ class TileMemoryManager:
         """
         modified = []
         for pos in path:
-            tile_memory = self.tile_memories.get(pos)
+            tile_memory = self.tile_memories.get(location_key(pos))
             if tile_memory and tile_memory.should_npc_avoid(npc_fear_level):
                 # In a real implementation, would find alternative route
                 # For now, just note that NPC is hesitant
@@ -298,13 +317,33 @@ class TileMemoryManager:
                 modified.append(pos)
         return modified
 
-    def get_all_hints_at(self, location: tuple[int, int]) -> list[str]:
+    def get_all_hints_at(self, location: Location) -> list[str]:
         """Get all atmospheric hints at a location."""
-        tile_memory = self.tile_memories.get(location)
+        tile_memory = self.tile_memories.get(location_key(location))
         if tile_memory:
             return tile_memory.get_atmosphere_hints()
         return []
 
+    def get_neighboring_memories(
+        self,
+        location: Location,
+        include_diagonals: bool = True
+    ) -> list[TileMemory]:
+        """
+        Get memories of the tiles around a location.
+
+        Walks the grid's shared neighbor offsets, so no Positions are
+        created per neighbor.
+        """
+        x, y = location_key(location)
+        memories = self.tile_memories
+        found = []
+        for dx, dy in neighbor_offsets(include_diagonals):
+            tile_memory = memories.get((x + dx, y + dy))
+            if tile_memory is not None:
+                found.append(tile_memory)
+        return found
+
     def to_dict(self) -> dict:
         """Serialize all tile memories."""
         return {
@@ -0,0 +1,227 @@
+"""
+PrefetchScheduler - Speculative LLM generation while the player reads.
+
+New locations and zoom layers used to be generated only once the player
+asked for them, so every step into the unknown waited on the LLM.
+While the player reads a scene, the location and inspection managers
+now submit the generations the player is likely to want next: the
+locations behind unexplored exits, and the first close look at each
+piece of evidence.
+
+Jobs run on a small pool of worker threads, lowest priority value
+first. A job computes only the LLM's answer; nothing touches the world
+in the background. Each job is filed under a key with the request it
+was built from, and the answer is claimed with take() when the player
+actually takes that path. take() hands it over only if the request
+built at that moment is the same one, so the world ends up exactly as
+if the generation had run then. Anything else is cancelled or thrown
+away: pending jobs never run, and the answers of running ones are
+discarded.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Hashable, Optional
+import heapq
+import itertools
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+# Job states
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+CANCELLED = "cancelled"
+
+
+@dataclass
+class PrefetchJob:
+    """One speculative generation."""
+    key: Hashable
+    request: Any                  # What the generation was built from
+    fn: Callable[[], Any]
+    priority: int = 0
+    state: str = PENDING
+    result: Any = None
+    failed: bool = False
+    finished: threading.Event = field(default_factory=threading.Event)
+
+
+class PrefetchScheduler:
+    """
+    Priority-ordered background generation, claimed on use.
+
+    Attributes:
+        workers: Number of worker threads
+        stats: Running totals - submitted, hits, misses, stale,
+            cancelled and failed jobs
+    """
+
+    def __init__(self, workers: int = 1):
+        if workers < 1:
+            raise ValueError("Prefetch needs at least one worker")
+        self.workers = workers
+        self.stats = {
+            "submitted": 0, "hits": 0, "misses": 0,
+            "stale": 0, "cancelled": 0, "failed": 0,
+        }
+        self._jobs: dict[Hashable, PrefetchJob] = {}
+        self._queue: list[tuple[int, int, PrefetchJob]] = []
+        self._order = itertools.count()
+        self._lock = threading.Lock()
+        self._wake = threading.Condition(self._lock)
+        self._closed = False
+        self._threads = [
+            threading.Thread(target=self._work, name=f"prefetch-{i}", daemon=True)
+            for i in range(workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    # ------------------------------------------------------------------
+    # Submitting and claiming
+    # ------------------------------------------------------------------
+
+    def submit(
+        self,
+        key: Hashable,
+        request: Any,
+        fn: Callable[[], Any],
+        priority: int = 0,
+    ) -> None:
+        """
+        Queue fn to run in the background, filed under key.
+
+        Lower priority values run first. Submitting a key that already
+        holds the same request does nothing; a different request
+        replaces the old job.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            existing = self._jobs.get(key)
+            if existing is not None:
+                if existing.request == request and not existing.failed:
+                    return
+                self._cancel(existing)
+            job = PrefetchJob(key=key, request=request, fn=fn, priority=priority)
+            self._jobs[key] = job
+            heapq.heappush(self._queue, (priority, next(self._order), job))
+            self.stats["submitted"] += 1
+            self._wake.notify()
+
+    def take(self, key: Hashable, request: Any) -> tuple[bool, Any]:
+        """
+        Claim the prefetched result for key.
+
+        Returns (True, result) if a job built from an equal request has
+        finished, waiting for it if it is already running. Otherwise
+        returns (False, None), cancelling any job under key, and the
+        caller generates as it would have without prefetching.
+        """
+        with self._lock:
+            job = self._jobs.pop(key, None)
+            if job is None:
+                self.stats["misses"] += 1
+                return False, None
+            if job.request != request:
+                self.stats["stale"] += 1
+                self._cancel(job)
+                return False, None
+            if job.state == PENDING:
+                # Not started: running it here is no slower
+                self.stats["misses"] += 1
+                self._cancel(job)
+                return False, None
+
+        job.finished.wait()
+        with self._lock:
+            if job.failed or job.state == CANCELLED:
+                self.stats["misses"] += 1
+                return False, None
+            self.stats["hits"] += 1
+            return True, job.result
+
+    def cancel(self, key: Hashable) -> bool:
+        """Cancel the job under key. Returns whether there was one."""
+        with self._lock:
+            job = self._jobs.pop(key, None)
+            if job is None:
+                return False
+            self._cancel(job)
+            return True
+
+    def cancel_except(self, keep: set) -> int:
+        """Cancel every job whose key is not in keep. Returns how many."""
+        with self._lock:
+            dropped = [key for key in self._jobs if key not in keep]
+            for key in dropped:
+                self._cancel(self._jobs.pop(key))
+            return len(dropped)
+
+    def pending(self) -> int:
+        """Jobs queued or running."""
+        with self._lock:
+            return sum(1 for job in self._jobs.values() if job.state in (PENDING, RUNNING))
+
+    def has(self, key: Hashable) -> bool:
+        """Whether a job is filed under key."""
+        with self._lock:
+            return key in self._jobs
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Cancel everything and stop the workers."""
+        with self._lock:
+            self._closed = True
+            for job in self._jobs.values():
+                self._cancel(job)
+            self._jobs.clear()
+            self._wake.notify_all()
+        if wait:
+            for thread in self._threads:
+                thread.join()
+
+    # ------------------------------------------------------------------
+    # Internals (call with the lock held)
+    # ------------------------------------------------------------------
+
+    def _cancel(self, job: PrefetchJob) -> None:
+        if job.state in (PENDING, RUNNING):
+            # A running job's result is simply never used
+            if job.state == PENDING:
+                job.finished.set()
+            job.state = CANCELLED
+            self.stats["cancelled"] += 1
+
+    def _next_job(self) -> Optional[PrefetchJob]:
+        with self._lock:
+            while True:
+                while self._queue:
+                    _, _, job = heapq.heappop(self._queue)
+                    if job.state == PENDING:
+                        job.state = RUNNING
+                        return job
+                if self._closed:
+                    return None
+                self._wake.wait()
+
+    def _work(self) -> None:
+        while True:
+            job = self._next_job()
+            if job is None:
+                return
+            try:
+                result, failed = job.fn(), False
+            except Exception as e:
+                logger.warning("Prefetch of %s failed: %s: %s", job.key, type(e).__name__, e)
+                result, failed = None, True
+            with self._lock:
+                job.result = result
+                job.failed = failed
+                if failed:
+                    self.stats["failed"] += 1
+                if job.state == RUNNING:
+                    job.state = DONE
+            job.finished.set()
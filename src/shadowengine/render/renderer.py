@@ -65,6 +65,52 @@ class Renderer:
             print(f'  "{line}"')
         print()
 
+    def render_dialogue_stream(self, speaker: str, pieces, mood: str = "") -> str:
+        """
+        Render dialogue from a character as its text arrives.
+
+        Each word is printed once it is complete, wrapped exactly as
+        render_dialogue would wrap the whole text. Nothing is printed
+        if no text arrives. Returns the full text.
+        """
+        width = self.width - 6
+        received = []
+        pending = ""
+        length = 0         # _word_wrap's running length of the current line
+        line_open = False  # Whether a quoted line has been started
+
+        def put(word: str) -> None:
+            nonlocal length, line_open
+            fits = length + len(word) + 1 <= width
+            if not line_open:
+                print()
+                print(f'{speaker} says {mood}:' if mood else f'{speaker} says:')
+                print()
+                out = f'  "{word}'
+            elif fits:
+                out = f" {word}"
+            else:
+                out = f'"\n  "{word}'
+            print(out, end="", flush=True)
+            length = length + len(word) + 1 if fits else len(word)
+            line_open = True
+
+        for piece in pieces:
+            received.append(piece)
+            pending += piece
+            words = pending.split()
+            # The last word may continue in the next piece
+            pending = words.pop() if pending and not pending[-1].isspace() else ""
+            for word in words:
+                put(word)
+
+        for word in pending.split():
+            put(word)
+        if line_open:
+            print('"')
+            print()
+        return "".join(received)
+
     def render_narration(self, text: str) -> None:
         """Render narrative text (italicized in supporting terminals)."""
         print()
@@ -17,7 +17,7 @@ import logging
 from .interaction import HotspotType
 
 if TYPE_CHECKING:
-    from .llm.client import LLMClient
+    from .llm.client import LLMClient, LLMResponse
     from .render import Renderer
 
 logger = logging.getLogger(__name__)
@@ -54,19 +54,44 @@ class StreetTalk:
             "last_remark_time", -REMARK_COOLDOWN_UNITS
         )
 
-    def update(self, state, renderer: 'Renderer') -> None:
-        """Called once per exploration tick; at most one remark fires."""
+    def update(
+        self, state, renderer: 'Renderer', reply: Optional['LLMResponse'] = None,
+    ) -> None:
+        """
+        Called once per exploration tick; at most one remark fires.
+
+        reply, if given, is the answer to line_request(state), already
+        generated alongside the tick's other lines.
+        """
+        remark = self._next_remark(state)
+        if remark is None:
+            return
+        npc_id, key, text = remark
+        self._voiced.add((npc_id, key))
+        self._last_remark_time = state.memory.current_time
+        self._deliver_remark(state.characters[npc_id], text, renderer, reply)
+
+    def line_request(self, state) -> Optional[list[dict]]:
+        """The chat the next update() will send, or None if it stays quiet."""
+        remark = self._next_remark(state)
+        if remark is None:
+            return None
+        npc_id, _, text = remark
+        return self._remark_messages(state.characters[npc_id], text)
+
+    def _next_remark(self, state) -> Optional[tuple[str, str, str]]:
+        """(npc_id, knowledge key, knowledge) of the remark due now, if any."""
         engine = getattr(state, 'propagation_engine', None)
         if engine is None:
-            return
+            return None
 
         now = state.memory.current_time
         if now - self._last_remark_time < REMARK_COOLDOWN_UNITS:
-            return
+            return None
 
         location = state.locations.get(state.current_location_id)
         if not location:
-            return
+            return None
 
         for hotspot in location.hotspots:
             if (
@@ -80,14 +105,10 @@ class StreetTalk:
             npc_id = hotspot.target_id
             knowledge = self._investigation_knowledge(engine, npc_id)
             for key, text in knowledge:
-                if (npc_id, key) in self._voiced:
-                    continue
-                self._voiced.add((npc_id, key))
-                self._last_remark_time = now
-                self._deliver_remark(
-                    state.characters[npc_id], text, renderer,
-                )
-                return  # one remark per tick, then the street goes quiet
+                if (npc_id, key) not in self._voiced:
+                    # One remark per tick, then the street goes quiet
+                    return npc_id, key, text
+        return None
 
     @staticmethod
     def _investigation_knowledge(engine, npc_id: str) -> list[tuple[str, str]]:
@@ -108,13 +129,19 @@ class StreetTalk:
 
         return found
 
-    def _deliver_remark(self, character, knowledge: str, renderer: 'Renderer') -> None:
+    def _deliver_remark(
+        self, character, knowledge: str, renderer: 'Renderer',
+        reply: Optional['LLMResponse'] = None,
+    ) -> None:
         """One unprompted line, in the NPC's voice."""
-        line = self._generate_line(character, knowledge)
+        if reply is None:
+            reply = self.llm_client.chat(self._remark_messages(character, knowledge))
+        line = self._line_from(reply, knowledge)
         renderer.render_narration(f'{character.name} catches your eye. "{line}"')
 
-    def _generate_line(self, character, knowledge: str) -> str:
-        response = self.llm_client.chat([
+    @staticmethod
+    def _remark_messages(character, knowledge: str) -> list[dict]:
+        return [
             {
                 "role": "system",
                 "content": (
@@ -129,8 +156,10 @@ class StreetTalk:
                 "role": "user",
                 "content": f"What you heard: {knowledge}",
             },
-        ])
+        ]
 
+    @staticmethod
+    def _line_from(response: 'LLMResponse', knowledge: str) -> str:
         if response.success and response.text:
             line = response.text.strip().strip('"').strip()
             if line:
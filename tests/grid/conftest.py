@@ -383,6 +383,55 @@ class GridTestHelpers:
         """Count passable tiles in grid."""
         return len(grid.get_passable_tiles())
 
+    @staticmethod
+    def shortest_path_cost(grid: TileGrid, start: Position, end: Position, entity=None) -> float:
+        """Exact cheapest path cost, by plain Dijkstra over every tile."""
+        import heapq
+        best = {start: 0.0}
+        queue = [(0.0, start.x, start.y, start.z)]
+        while queue:
+            cost, x, y, z = heapq.heappop(queue)
+            position = Position(x, y, z)
+            if position == end:
+                return cost
+            if cost > best.get(position, float('inf')):
+                continue
+            tile = grid.get_tile(x, y, z)
+            for neighbor in grid.get_adjacent(tile, include_diagonals=True):
+                step = calculate_movement_cost(tile, neighbor, entity)
+                if step == float('inf'):
+                    continue
+                total = cost + step
+                if total < best.get(neighbor.position, float('inf')):
+                    best[neighbor.position] = total
+                    p = neighbor.position
+                    heapq.heappush(queue, (total, p.x, p.y, p.z))
+        return float('inf')
+
+    @staticmethod
+    def random_terrain_grid(size: int, seed: int) -> TileGrid:
+        """Seeded map of soil, water and rock."""
+        import random
+        rng = random.Random(seed)
+        grid = TileGrid(width=size, height=size, depth=1)
+        for x in range(size):
+            for y in range(size):
+                roll = rng.random()
+                if roll < 0.15:
+                    terrain = TerrainType.ROCK
+                elif roll < 0.45:
+                    terrain = TerrainType.WATER
+                else:
+                    continue
+                tile = grid.get_tile(x, y, 0)
+                tile.terrain_type = terrain
+                tile.passable = terrain.get_default_properties().get("passable", True)
+        for corner in ((0, 0), (size - 1, size - 1)):
+            tile = grid.get_tile(*corner, 0)
+            tile.terrain_type = TerrainType.SOIL
+            tile.passable = True
+        return grid
+
     @staticmethod
     def get_path_positions(path: list) -> list:
         """Extract positions from path tiles."""
@@ -0,0 +1,134 @@
+"""
+Tests for chunked binary grid save files.
+"""
+
+import pytest
+from shadowengine.grid import (
+    Position, TileGrid, TerrainType, TerrainModifier, Entity, EntityType
+)
+from shadowengine.grid.chunked import ChunkLayout
+
+
+def snapshot(grid):
+    """Cell state that survives a save, as {(x, y, z): (...)}."""
+    cells = {}
+    for tile in grid.all_tiles():
+        pos = tile.position
+        cells[pos.to_tuple()] = (
+            tile.terrain_type, tile.passable, tile.opaque, tile.height,
+            tile.environment.moisture, tile.environment.light_level,
+            tile.environment.temperature, [m.type for m in tile.modifiers],
+            [e.id for e in tile.entities], list(tile.features),
+        )
+    return cells
+
+
+def build_grid(dense):
+    """70x40x2 grid with terrain, an entity, a modifier, and raised ground."""
+    grid = TileGrid(width=70, height=40, depth=2, dense=dense)
+    grid.fill_rect(10, 5, 40, 5, TerrainType.ROCK)
+    grid.fill_rect(65, 35, 69, 39, TerrainType.WATER, z=1)
+    hill = grid.get_tile(50, 20, 0)
+    hill.height = 2.5
+    hill.environment.light_level = 0.1
+    grid.get_tile(3, 3, 0).add_modifier(TerrainModifier(type="wet", intensity=0.6))
+    grid.get_tile(33, 33, 1).environment.temperature = 35.0
+    grid.get_tile(12, 30, 0).features.append("well")
+    grid.place_entity(Entity(id="npc", name="Npc", entity_type=EntityType.CHARACTER),
+                      Position(20, 20, 0))
+    grid.compact()
+    return grid
+
+
+@pytest.fixture(params=[False, True], ids=["sparse", "dense"])
+def saved(request, tmp_path):
+    """A populated grid and the path it was saved to."""
+    grid = build_grid(request.param)
+    path = str(tmp_path / "map.grid")
+    grid.save_binary(path, chunk_size=16)
+    return grid, path
+
+
+class TestChunkLayout:
+    """Tests for chunk geometry."""
+
+    @pytest.mark.unit
+    def test_bounds_are_clipped(self):
+        """Edge chunks are clipped to the grid."""
+        layout = ChunkLayout(70, 40, 2, 16)
+        assert (layout.chunks_x, layout.chunks_y, len(layout)) == (5, 3, 30)
+        assert layout.bounds(layout.chunk_of(69, 39, 1)) == (64, 32, 1, 6, 8)
+        with pytest.raises(ValueError):
+            ChunkLayout(10, 10, 1, 0)
+
+
+class TestBinaryRoundTrip:
+    """Tests for saving and loading."""
+
+    @pytest.mark.unit
+    def test_round_trip(self, saved):
+        """Every cell, entity, and setting survives a save."""
+        grid, path = saved
+        restored = TileGrid.load_binary(path)
+        assert (restored.width, restored.height, restored.depth) == (70, 40, 2)
+        assert restored.dense == grid.dense
+        assert snapshot(restored) == snapshot(grid)
+        assert restored.get_entity("npc").position == Position(20, 20, 0)
+        assert restored.get_entities_in_radius(Position(20, 20, 0), 1)[0].id == "npc"
+
+    @pytest.mark.unit
+    def test_chunks_decode_on_first_touch(self, saved):
+        """Opening decodes nothing; touching a cell decodes its chunk only."""
+        _, path = saved
+        restored = TileGrid.load_binary(path)
+        reader = restored._chunks
+        assert reader.loaded == 0
+        assert restored.get_tile(11, 5, 0).terrain_type == TerrainType.ROCK
+        assert reader.loaded == 1
+        restored.get_tile(12, 6, 0)
+        assert reader.loaded == 1
+
+    @pytest.mark.unit
+    def test_default_chunks_are_skipped(self, saved):
+        """All-default chunks are not written and never need decoding."""
+        grid, path = saved
+        written = grid.save_binary(path, chunk_size=16)
+        assert written < 30
+        restored = TileGrid.load_binary(path)
+        assert restored.get_tile(0, 39, 1).terrain_type == TerrainType.SOIL
+
+    @pytest.mark.unit
+    def test_writes_before_load_are_kept(self, saved):
+        """Writing to an undecoded chunk decodes it first, not after."""
+        _, path = saved
+        restored = TileGrid.load_binary(path)
+        restored.fill_rect(12, 5, 12, 5, TerrainType.SOIL)
+        assert restored.get_terrain_at(12, 5, 0) == TerrainType.SOIL
+        assert restored.get_terrain_at(13, 5, 0) == TerrainType.ROCK
+        restored.load_all_chunks()
+        assert restored.get_terrain_at(12, 5, 0) == TerrainType.SOIL
+
+    @pytest.mark.unit
+    def test_whole_grid_passes_load_everything(self, saved):
+        """Caches built from raw storage see every chunk."""
+        grid, path = saved
+        restored = TileGrid.load_binary(path)
+        field = restored.get_cost_field()
+        assert restored._chunks is None
+        assert field.base == grid.get_cost_field().base
+
+    @pytest.mark.unit
+    def test_eager_load_and_json_path(self, saved):
+        """Eager loading closes the file; JSON serialization still matches."""
+        grid, path = saved
+        restored = TileGrid.load_binary(path, lazy=False)
+        assert restored._chunks is None
+        assert snapshot(TileGrid.from_dict(restored.serialize())) == snapshot(grid)
+
+    @pytest.mark.unit
+    def test_rejects_other_files(self, tmp_path):
+        """Files without the grid header are refused."""
+        path = tmp_path / "not_a_grid"
+        path.write_bytes(b"x" * 64)
+        with pytest.raises(ValueError):
+            TileGrid.load_binary(str(path))
@@ -0,0 +1,176 @@
+"""
+Tests for connected-component labeling of passable cells.
+"""
+
+import random
+
+import pytest
+from shadowengine.grid import (
+    Position, TileGrid, TerrainType, TileEventType, ConnectivityMap, find_path
+)
+from shadowengine.grid import connectivity as connectivity_module
+
+
+def partition(cmap):
+    """Group cells by label, as a set of frozensets of (x, y, z)."""
+    grid = cmap.grid
+    regions = {}
+    for z in range(grid.depth):
+        for y in range(grid.height):
+            for x in range(grid.width):
+                label = cmap.label_at(Position(x, y, z))
+                if label:
+                    regions.setdefault(label, set()).add((x, y, z))
+    return {frozenset(cells) for cells in regions.values()}
+
+
+@pytest.fixture
+def split_grid():
+    """20x10 grid split in two by a full wall at x=10."""
+    grid = TileGrid(width=20, height=10)
+    grid.fill_rect(10, 0, 10, 9, TerrainType.ROCK)
+    return grid
+
+
+class TestLabeling:
+    """Tests for full labeling passes."""
+
+    @pytest.mark.unit
+    def test_wall_splits_regions(self, split_grid):
+        """Cells on either side of a wall get different labels."""
+        cmap = split_grid.get_connectivity()
+        assert cmap.region_count == 2
+        assert cmap.label_at(Position(10, 5, 0)) == 0
+        assert cmap.is_reachable(Position(0, 0, 0), Position(9, 9, 0))
+        assert not cmap.is_reachable(Position(0, 0, 0), Position(15, 5, 0))
+        assert cmap.region_size(Position(3, 3, 0)) == 100
+
+    @pytest.mark.unit
+    def test_diagonal_connectivity(self):
+        """Diagonal gaps connect regions only in 8-connected mode."""
+        grid = TileGrid(width=4, height=4)
+        for x, y in [(1, 0), (0, 1), (2, 3), (3, 2)]:
+            grid.fill_rect(x, y, x, y, TerrainType.ROCK)
+
+        eight = ConnectivityMap(grid)
+        four = ConnectivityMap(grid, diagonal=False)
+        assert eight.is_reachable(Position(0, 0, 0), Position(3, 3, 0))
+        assert not four.is_reachable(Position(0, 0, 0), Position(3, 3, 0))
+        assert find_path(grid, Position(0, 0, 0), Position(3, 3, 0)) is not None
+
+    @pytest.mark.unit
+    def test_levels_are_separate(self):
+        """Regions never span z-levels."""
+        grid = TileGrid(width=5, height=5, depth=2)
+        cmap = grid.get_connectivity()
+        assert cmap.region_count == 2
+        assert not cmap.is_reachable(Position(0, 0, 0), Position(0, 0, 1))
+
+    @pytest.mark.unit
+    def test_impassable_start(self, split_grid):
+        """An impassable start reaches whatever its neighbors reach."""
+        cmap = split_grid.get_connectivity()
+        assert cmap.is_reachable(Position(10, 5, 0), Position(15, 5, 0))
+        assert not cmap.is_reachable(Position(0, 0, 0), Position(10, 5, 0))
+        assert not cmap.is_reachable(Position(0, 0, 0), Position(50, 0, 0))
+
+    @pytest.mark.unit
+    def test_matches_flood_fill(self):
+        """Labels match an independent breadth-first search."""
+        rng = random.Random(3)
+        grid = TileGrid(width=25, height=25)
+        for _ in range(220):
+            x, y = rng.randrange(25), rng.randrange(25)
+            grid.fill_rect(x, y, x, y, TerrainType.ROCK)
+        cmap = ConnectivityMap(grid)
+
+        regions = set()
+        seen = set()
+        for y in range(25):
+            for x in range(25):
+                if (x, y) in seen or not grid.get_tile(x, y, 0).is_passable():
+                    continue
+                region = {(x, y, 0)}
+                seen.add((x, y))
+                queue = [(x, y)]
+                while queue:
+                    cx, cy = queue.pop()
+                    for tile in grid.get_adjacent(grid.get_tile(cx, cy, 0)):
+                        key = (tile.position.x, tile.position.y)
+                        if key not in seen and tile.is_passable():
+                            seen.add(key)
+                            region.add((key[0], key[1], 0))
+                            queue.append(key)
+                regions.add(frozenset(region))
+        assert partition(cmap) == regions
+
+    @pytest.mark.unit
+    def test_numpy_path_matches(self, split_grid):
+        """The NumPy labeling path gives the same regions."""
+        pytest.importorskip("numpy")
+        assert (partition(ConnectivityMap(split_grid, use_numpy=True))
+                == partition(ConnectivityMap(split_grid, use_numpy=False)))
+
+    @pytest.mark.unit
+    def test_numpy_required_when_requested(self, split_grid, monkeypatch):
+        """Asking for NumPy without it installed fails loudly."""
+        monkeypatch.setattr(connectivity_module, "_NUMPY_AVAILABLE", False)
+        with pytest.raises(ImportError):
+            ConnectivityMap(split_grid, use_numpy=True)
+
+
+class TestIncremental:
+    """Tests for incremental relabeling."""
+
+    @pytest.mark.unit
+    def test_opening_door_merges(self, split_grid):
+        """Opening a gap in the wall merges the two regions."""
+        cmap = split_grid.get_connectivity()
+        door = split_grid.get_tile(10, 4, 0)
+        door.terrain_type = TerrainType.SOIL
+        door.passable = True
+        split_grid.emit_event(TileEventType.MODIFIED, door)
+
+        assert cmap.is_reachable(Position(0, 0, 0), Position(15, 5, 0))
+        assert cmap.region_count == 1
+        assert cmap.region_size(Position(0, 0, 0)) == 191
+
+    @pytest.mark.unit
+    def test_closing_door_splits(self, split_grid):
+        """Closing the only gap splits the region again."""
+        split_grid.fill_rect(10, 4, 10, 4, TerrainType.SOIL)
+        cmap = split_grid.get_connectivity()
+        assert cmap.region_count == 1
+
+        split_grid.fill_rect(10, 4, 10, 4, TerrainType.ROCK)
+        assert cmap.region_count == 2
+        assert not cmap.is_reachable(Position(0, 0, 0), Position(15, 5, 0))
+        assert cmap.region_size(Position(15, 5, 0)) == 90
+
+        # A wall that does not disconnect anything keeps the label
+        left = cmap.label_at(Position(0, 0, 0))
+        split_grid.fill_rect(3, 3, 3, 3, TerrainType.ROCK)
+        assert cmap.label_at(Position(0, 0, 0)) == left
+        assert cmap.region_count == 2
+
+    @pytest.mark.unit
+    def test_random_edits_match_rebuild(self):
+        """Any sequence of edits leaves the same partition as a fresh pass."""
+        rng = random.Random(17)
+        grid = TileGrid(width=16, height=16)
+        cmap = grid.get_connectivity()
+        for step in range(300):
+            x, y = rng.randrange(16), rng.randrange(16)
+            terrain = TerrainType.ROCK if rng.random() < 0.55 else TerrainType.SOIL
+            grid.fill_rect(x, y, x, y, terrain)
+            if step % 25 == 0:
+                assert partition(cmap) == partition(ConnectivityMap(grid))
+        assert partition(cmap) == partition(ConnectivityMap(grid))
+
+    @pytest.mark.unit
+    def test_find_path_rejects_early(self, split_grid):
+        """With labels built, indexed find_path skips unreachable searches."""
+        field = split_grid.get_cost_field()
+        split_grid.get_connectivity()
+        assert split_grid.find_path(Position(0, 0, 0), Position(15, 5, 0), cost_field=field) is None
+        assert split_grid.find_path(Position(0, 0, 0), Position(9, 9, 0), cost_field=field)
@@ -0,0 +1,270 @@
+"""
+Tests for the precomputed movement-cost lattice and indexed A*.
+"""
+
+import pytest
+from shadowengine.grid import (
+    Position, Tile, TileGrid, TileEnvironment,
+    TerrainType, TerrainModifier,
+    Entity, EntityType, TileEventType,
+    CostField, find_path, calculate_movement_cost
+)
+from shadowengine.grid.pathfinding import calculate_path_cost
+
+
+def assert_step_matches(grid, field, a, b, entity=None):
+    """Cost field step cost equals calculate_movement_cost."""
+    from_tile = grid.get_tile(*a)
+    to_tile = grid.get_tile(*b)
+    expected = calculate_movement_cost(from_tile, to_tile, entity)
+    actual = field.step_cost(field.index(*a), field.index(*b), entity)
+    if expected == float('inf'):
+        assert actual == float('inf')
+    else:
+        assert actual == pytest.approx(expected)
+
+
+class TestCostFieldCosts:
+    """Tests for per-cell cost terms."""
+
+    @pytest.mark.unit
+    def test_index_roundtrip(self):
+        """Flat indexes map back to coordinates."""
+        field = CostField(TileGrid(width=6, height=4, depth=2))
+        for coords in [(0, 0, 0), (5, 3, 1), (2, 1, 1)]:
+            assert field.coords(field.index(*coords)) == coords
+
+    @pytest.mark.unit
+    def test_default_terrain_costs(self, medium_grid):
+        """Untouched cells match the default tile cost."""
+        field = medium_grid.get_cost_field()
+        assert_step_matches(medium_grid, field, (3, 3, 0), (4, 3, 0))
+        assert_step_matches(medium_grid, field, (3, 3, 0), (4, 4, 0))
+
+    @pytest.mark.unit
+    def test_costs_match_calculate_movement_cost(self, medium_grid):
+        """Environment, height, and modifiers are folded in."""
+        water = medium_grid.get_tile(5, 5, 0)
+        water.terrain_type = TerrainType.WATER
+        dark = medium_grid.get_tile(6, 5, 0)
+        dark.environment.light_level = 0.1
+        dark.height = 2.0
+        wet = medium_grid.get_tile(6, 6, 0)
+        wet.add_modifier(TerrainModifier(type="wet", intensity=1.0))
+        wet.environment.moisture = 0.9
+        rock = medium_grid.get_tile(4, 4, 0)
+        rock.terrain_type = TerrainType.ROCK
+        rock.passable = False
+
+        field = medium_grid.get_cost_field()
+        assert_step_matches(medium_grid, field, (4, 5, 0), (5, 5, 0))
+        assert_step_matches(medium_grid, field, (5, 5, 0), (6, 5, 0))
+        assert_step_matches(medium_grid, field, (5, 5, 0), (6, 6, 0))
+        assert_step_matches(medium_grid, field, (5, 5, 0), (4, 4, 0))
+
+    @pytest.mark.unit
+    def test_entity_profile_layer(self, grid_with_water):
+        """Entity movement modifiers get their own cost layer."""
+        swimmer = Entity(
+            id="swimmer", name="Swimmer", entity_type=EntityType.CREATURE,
+            movement_modifiers={"WATER": 0.5}
+        )
+        field = grid_with_water.get_cost_field()
+        assert_step_matches(grid_with_water, field, (4, 6, 0), (5, 6, 0), swimmer)
+        assert_step_matches(grid_with_water, field, (4, 6, 0), (5, 6, 0))
+
+        other = Entity(
+            id="other", name="Other", entity_type=EntityType.CREATURE,
+            movement_modifiers={"WATER": 0.5}
+        )
+        assert field.layer_for(swimmer) is field.layer_for(other)
+
+    @pytest.mark.unit
+    def test_dense_grid_costs(self):
+        """Cost fields read packed cells of dense grids."""
+        grid = TileGrid(width=10, height=10, dense=True)
+        grid.fill_rect(3, 0, 3, 9, TerrainType.ROCK)
+        grid.fill_rect(5, 0, 6, 9, TerrainType.WATER)
+        field = grid.get_cost_field()
+
+        assert grid.memory_usage()["materialized_tiles"] == 0
+        assert not field.is_enterable(field.index(3, 4))
+        assert_step_matches(grid, field, (4, 4, 0), (5, 4, 0))
+
+
+class TestCostFieldInvalidation:
+    """Tests for keeping the lattice in sync."""
+
+    @pytest.mark.unit
+    def test_event_marks_cell_dirty(self, medium_grid):
+        """Cost events invalidate only the touched cell."""
+        field = medium_grid.get_cost_field()
+        tile = medium_grid.get_tile(8, 8, 0)
+
+        medium_grid.emit_event(TileEventType.FLOODED, tile)
+        tile.environment.moisture = 1.0  # Mutated after the event
+        assert field.dirty_count == 1
+
+        assert_step_matches(medium_grid, field, (7, 8, 0), (8, 8, 0))
+        assert field.dirty_count == 0
+
+    @pytest.mark.unit
+    def test_movement_events_ignored(self, medium_grid, basic_entity):
+        """Entity movement does not dirty the lattice."""
+        field = medium_grid.get_cost_field()
+        medium_grid.place_entity(basic_entity, Position(2, 2, 0))
+        assert field.dirty_count == 0
+
+    @pytest.mark.unit
+    def test_modifier_event_updates_entity_layers(self, medium_grid):
+        """Cached entity layers are refreshed with the base layer."""
+        walker = Entity(
+            id="walker", name="Walker", entity_type=EntityType.CHARACTER,
+            movement_modifiers={"SOIL": 2.0}
+        )
+        field = medium_grid.get_cost_field()
+        field.layer_for(walker)
+
+        tile = medium_grid.get_tile(3, 3, 0)
+        tile.add_modifier(TerrainModifier(type="mossy"))
+        medium_grid.emit_event(TileEventType.MODIFIED, tile)
+
+        assert_step_matches(medium_grid, field, (2, 3, 0), (3, 3, 0), walker)
+
+    @pytest.mark.unit
+    def test_fill_rect_and_set_tile_invalidate(self, medium_grid):
+        """Direct grid writes go through change listeners."""
+        field = medium_grid.get_cost_field()
+        medium_grid.fill_rect(0, 0, 2, 2, TerrainType.ROCK)
+        medium_grid.set_tile(Tile(position=Position(9, 9, 0), terrain_type=TerrainType.WATER))
+        assert field.dirty_count == 10
+
+        assert not field.is_enterable(field.index(1, 1))
+        assert_step_matches(medium_grid, field, (8, 9, 0), (9, 9, 0))
+
+    @pytest.mark.unit
+    def test_notify_tile_changed(self, medium_grid):
+        """Direct tile mutation can be announced explicitly."""
+        field = medium_grid.get_cost_field()
+        tile = medium_grid.get_tile(4, 4, 0)
+        tile.passable = False
+        medium_grid.notify_tile_changed(4, 4, 0)
+        assert not field.is_enterable(field.index(4, 4))
+
+    @pytest.mark.unit
+    def test_detach(self, medium_grid):
+        """Detached fields stop listening."""
+        field = medium_grid.get_cost_field()
+        field.detach()
+        medium_grid.notify_tile_changed(1, 1, 0)
+        assert field.dirty_count == 0
+
+
+class TestIndexedPathfinding:
+    """Tests for find_path over a cost field."""
+
+    @pytest.mark.unit
+    def test_matches_exact_path_cost(self, maze_grid):
+        """Indexed A* finds paths as cheap as the tile-based search."""
+        field = maze_grid.get_cost_field()
+        start, end = Position(0, 0, 0), Position(10, 10, 0)
+
+        exact = find_path(maze_grid, start, end)
+        fast = find_path(maze_grid, start, end, cost_field=field)
+
+        assert fast[0].position == start
+        assert fast[-1].position == end
+        assert calculate_path_cost(fast) == pytest.approx(calculate_path_cost(exact))
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("seed", range(8))
+    def test_optimal_with_cheap_modifiers(self, grid_helpers, seed):
+        """Modifiers below 1 never make the heuristic overestimate."""
+        grid = grid_helpers.random_terrain_grid(16, seed)
+        wader = Entity(
+            id="wader", name="Wader", entity_type=EntityType.CREATURE,
+            movement_modifiers={"SOIL": 0.5, "WATER": 0.1}
+        )
+        start, end = Position(0, 0, 0), Position(15, 15, 0)
+        exact = grid_helpers.shortest_path_cost(grid, start, end, wader)
+
+        path = find_path(grid, start, end, wader, cost_field=grid.get_cost_field())
+
+        if exact == float('inf'):
+            assert path is None
+        else:
+            assert calculate_path_cost(path, wader) == pytest.approx(exact)
+
+    @pytest.mark.unit
+    def test_min_enter_cost(self, grid_with_water):
+        """The heuristic scale is the cheapest step under each layer."""
+        field = grid_with_water.get_cost_field()
+        wader = Entity(
+            id="wader", name="Wader", entity_type=EntityType.CREATURE,
+            movement_modifiers={"SOIL": 0.5, "WATER": 0.1}
+        )
+        assert field.min_enter_cost() == pytest.approx(1.0)
+        assert field.min_enter_cost(wader) == pytest.approx(0.2)  # WATER 2.0 * 0.1
+
+        for x in range(5, 10):
+            for y in range(5, 10):
+                tile = grid_with_water.get_tile(x, y, 0)
+                tile.terrain_type = TerrainType.SOIL
+                grid_with_water.notify_tile_changed(x, y, 0)
+        assert field.min_enter_cost(wader) == pytest.approx(0.5)
+
+    @pytest.mark.unit
+    def test_path_avoids_walls(self, grid_with_obstacles):
+        """Paths never enter impassable cells."""
+        path = grid_with_obstacles.find_path(
+            Position(5, 10, 0), Position(20, 10, 0),
+            cost_field=grid_with_obstacles.get_cost_field()
+        )
+        assert path is not None
+        assert all(t.terrain_type != TerrainType.ROCK for t in path)
+
+    @pytest.mark.unit
+    def test_no_path(self, grid_helpers):
+        """Enclosed destinations are unreachable."""
+        grid = grid_helpers.create_path_grid(10, 10, [
+            (4, 4), (5, 4), (6, 4), (4, 5), (6, 5), (4, 6), (5, 6), (6, 6),
+        ])
+        path = find_path(grid, Position(0, 0, 0), Position(5, 5, 0),
+                         cost_field=grid.get_cost_field())
+        assert path is None
+
+    @pytest.mark.unit
+    def test_edges_of_map(self, small_grid):
+        """Paths along the border never wrap around rows."""
+        path = find_path(small_grid, Position(0, 5, 0), Position(9, 5, 0),
+                         cost_field=small_grid.get_cost_field())
+        assert len(path) == 10
+        for a, b in zip(path, path[1:]):
+            assert a.position.chebyshev_distance(b.position) == 1
+
+    @pytest.mark.unit
+    def test_same_start_and_end(self, small_grid):
+        """Start equal to end yields a single-tile path."""
+        path = find_path(small_grid, Position(3, 3, 0), Position(3, 3, 0),
+                         cost_field=small_grid.get_cost_field())
+        assert [t.position for t in path] == [Position(3, 3, 0)]
+
+    @pytest.mark.unit
+    def test_different_levels(self, multi_level_grid):
+        """Paths never cross z-levels."""
+        path = find_path(multi_level_grid, Position(0, 0, 0), Position(0, 0, 1),
+                         cost_field=multi_level_grid.get_cost_field())
+        assert path is None
+
+    @pytest.mark.unit
+    def test_reflects_invalidated_changes(self, medium_grid):
+        """Walls announced through events reroute later queries."""
+        field = medium_grid.get_cost_field()
+        for y in range(0, 49):
+            tile = medium_grid.get_tile(25, y, 0)
+            tile.terrain_type = TerrainType.ROCK
+            tile.passable = False
+            medium_grid.emit_event(TileEventType.MODIFIED, tile)
+
+        path = find_path(medium_grid, Position(20, 10, 0), Position(30, 10, 0), cost_field=field)
+        assert any(t.position.y == 49 for t in path)
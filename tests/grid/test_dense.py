@@ -0,0 +1,171 @@
+"""
+Tests for the array-backed dense TileGrid storage.
+"""
+
+import pytest
+from shadowengine.grid import (
+    Position, Tile, TileGrid, TileEnvironment,
+    TerrainType, TerrainModifier, FluidType,
+    Entity, EntityType
+)
+from shadowengine.grid.dense import DenseTileStore, is_packable
+
+
+class TestDenseTileStore:
+    """Tests for the packed array store."""
+
+    @pytest.mark.unit
+    def test_index_roundtrip(self):
+        """Flat indexes map back to their coordinates."""
+        store = DenseTileStore(7, 5, 3)
+        for x, y, z in [(0, 0, 0), (6, 4, 2), (3, 2, 1)]:
+            assert store.coords(store.index(x, y, z)) == (x, y, z)
+
+    @pytest.mark.unit
+    def test_defaults_follow_terrain(self):
+        """New cells take the default terrain's properties."""
+        store = DenseTileStore(4, 4, 1, TerrainType.ROCK)
+        tile = store.materialize(store.index(1, 1))
+        assert tile.terrain_type == TerrainType.ROCK
+        assert tile.passable is False
+        assert tile.opaque is True
+        assert tile.position == Position(1, 1, 0)
+
+    @pytest.mark.unit
+    def test_store_and_materialize(self):
+        """Packed fields survive a store/materialize cycle."""
+        store = DenseTileStore(4, 4, 1)
+        tile = Tile(
+            position=Position(2, 3, 0),
+            terrain_type=TerrainType.WATER,
+            height=1.5,
+            environment=TileEnvironment(moisture=0.9, light_level=0.1)
+        )
+        index = store.index(2, 3)
+        store.store(index, tile)
+
+        restored = store.materialize(index)
+        assert restored.terrain_type == TerrainType.WATER
+        assert restored.height == 1.5
+        assert restored.environment.moisture == 0.9
+        assert restored.environment.light_level == 0.1
+
+    @pytest.mark.unit
+    def test_memory_usage(self):
+        """Memory usage scales with cell count."""
+        small = DenseTileStore(10, 10, 1).memory_usage()
+        large = DenseTileStore(20, 20, 1).memory_usage()
+        assert large == small * 4
+
+    @pytest.mark.unit
+    def test_is_packable(self):
+        """Only tiles without unpacked state are packable."""
+        tile = Tile(position=Position(0, 0, 0))
+        assert is_packable(tile)
+
+        tile.add_modifier(TerrainModifier(type="wet"))
+        assert not is_packable(tile)
+
+        hot = Tile(position=Position(0, 0, 0), environment=TileEnvironment(temperature=60.0))
+        assert not is_packable(hot)
+
+        oily = Tile(position=Position(0, 0, 0), environment=TileEnvironment(fluid=FluidType.OIL))
+        assert not is_packable(oily)
+
+
+class TestDenseTileGrid:
+    """Tests for TileGrid in dense mode."""
+
+    @pytest.fixture
+    def dense_grid(self):
+        return TileGrid(width=20, height=20, depth=2, dense=True)
+
+    @pytest.mark.unit
+    def test_no_tiles_until_accessed(self, dense_grid):
+        """Dense grids start with no materialized tiles."""
+        assert dense_grid.memory_usage()["materialized_tiles"] == 0
+        assert dense_grid.memory_usage()["dense_bytes"] > 0
+
+    @pytest.mark.unit
+    def test_get_tile_is_stable(self, dense_grid):
+        """Repeated access returns the same tile object."""
+        tile = dense_grid.get_tile(3, 4, 1)
+        assert tile is dense_grid.get_tile(3, 4, 1)
+        assert tile.position == Position(3, 4, 1)
+
+    @pytest.mark.unit
+    def test_out_of_bounds(self, dense_grid):
+        """Out of bounds access returns None."""
+        assert dense_grid.get_tile(20, 0, 0) is None
+        assert dense_grid.get_terrain_at(-1, 0, 0) is None
+
+    @pytest.mark.unit
+    def test_compact_releases_plain_tiles(self, dense_grid):
+        """Compaction writes tiles back and drops plain ones."""
+        tile = dense_grid.get_tile(5, 5, 0)
+        tile.terrain_type = TerrainType.WOOD
+        tile.height = 2.0
+
+        assert dense_grid.compact() == 1
+        assert dense_grid.memory_usage()["materialized_tiles"] == 0
+
+        restored = dense_grid.get_tile(5, 5, 0)
+        assert restored is not tile
+        assert restored.terrain_type == TerrainType.WOOD
+        assert restored.height == 2.0
+
+    @pytest.mark.unit
+    def test_compact_keeps_tiles_with_entities(self, dense_grid):
+        """Tiles holding entities stay materialized."""
+        entity = Entity(id="crate", name="Crate", entity_type=EntityType.CONTAINER)
+        dense_grid.place_entity(entity, Position(1, 1, 0))
+        tile = dense_grid.get_tile(1, 1, 0)
+
+        dense_grid.compact()
+        assert dense_grid.get_tile(1, 1, 0) is tile
+        assert dense_grid.get_entities_at(Position(1, 1, 0)) == [entity]
+
+    @pytest.mark.unit
+    def test_fill_rect_without_materializing(self, dense_grid):
+        """fill_rect writes directly into the arrays."""
+        count = dense_grid.fill_rect(0, 0, 4, 4, TerrainType.ROCK)
+        assert count == 25
+        assert dense_grid.memory_usage()["materialized_tiles"] == 0
+        assert dense_grid.get_terrain_at(2, 2) == TerrainType.ROCK
+        assert not dense_grid.get_tile(2, 2, 0).is_passable()
+
+    @pytest.mark.unit
+    def test_set_tile(self, dense_grid):
+        """set_tile replaces the cell contents."""
+        tile = Tile(position=Position(7, 7, 1), terrain_type=TerrainType.METAL)
+        assert dense_grid.set_tile(tile)
+        assert dense_grid.get_tile(7, 7, 1) is tile
+        assert dense_grid.get_terrain_at(7, 7, 1) == TerrainType.METAL
+
+    @pytest.mark.unit
+    def test_serialize_roundtrip(self, dense_grid):
+        """Dense grids survive serialization with packed and materialized cells."""
+        dense_grid.fill_rect(0, 0, 2, 2, TerrainType.WATER)
+        dense_grid.get_tile(10, 10, 1).add_modifier(TerrainModifier(type="cracked"))
+
+        data = dense_grid.serialize()
+        assert data["dense"] is True
+        assert len(data["tiles"]) == 10
+
+        restored = TileGrid.from_dict(data)
+        assert restored.dense
+        assert restored.get_terrain_at(1, 1) == TerrainType.WATER
+        assert restored.get_tile(10, 10, 1).has_modifier("cracked")
+        assert restored.memory_usage()["materialized_tiles"] == 1
+
+    @pytest.mark.unit
+    def test_pathfinding_matches_sparse(self):
+        """Paths are identical on dense and sparse grids."""
+        sparse = TileGrid(width=15, height=15)
+        dense = TileGrid(width=15, height=15, dense=True)
+        for grid in (sparse, dense):
+            grid.fill_rect(5, 0, 5, 12, TerrainType.ROCK)
+
+        sparse_path = sparse.find_path(Position(0, 0, 0), Position(14, 0, 0))
+        dense_path = dense.find_path(Position(0, 0, 0), Position(14, 0, 0))
+        assert [t.position for t in sparse_path] == [t.position for t in dense_path]
@@ -273,6 +273,99 @@ class TestEventHistory:
         assert len(history) == 0
 
 
+    @pytest.mark.unit
+    def test_history_is_bounded(self):
+        """Only the newest max_history events are kept."""
+        manager = TileEventManager(max_history=3)
+        tile = Tile(position=Position(0, 0, 0), terrain_type=TerrainType.SOIL)
+        events = [TileEvent(event_type=TileEventType.ENTERED, tile=tile) for _ in range(5)]
+        for event in events:
+            manager.emit(event)
+
+        assert manager.max_history == 3
+        assert manager.get_history() == events[:1:-1]
+
+    @pytest.mark.unit
+    def test_counts_per_type(self):
+        """Counters track every dispatched event, not just retained history."""
+        manager = TileEventManager(max_history=2)
+        tile = Tile(position=Position(0, 0, 0), terrain_type=TerrainType.SOIL)
+        for event_type in [TileEventType.ENTERED] * 4 + [TileEventType.EXITED]:
+            manager.emit(TileEvent(event_type=event_type, tile=tile))
+
+        assert manager.count(TileEventType.ENTERED) == 4
+        assert manager.get_counts() == {TileEventType.ENTERED: 4, TileEventType.EXITED: 1}
+        manager.clear_history()
+        assert manager.get_counts() == {}
+
+
+class TestEventBatching:
+    """Tests for batched, coalesced, and queued dispatch."""
+
+    @pytest.mark.unit
+    def test_batch_defers_and_coalesces(self):
+        """Events are held until the batch ends, one per cell, type, and cause."""
+        manager = TileEventManager()
+        received = []
+        manager.subscribe(TileEventType.FLOODED, received.append)
+        tiles = [Tile(position=Position(x, 0, 0), terrain_type=TerrainType.SOIL) for x in range(3)]
+
+        with manager.batch():
+            for tile in tiles + tiles:
+                manager.emit(TileEvent(event_type=TileEventType.FLOODED, tile=tile))
+            assert received == []
+
+        assert [e.tile for e in received] == tiles
+        assert manager.coalesced == 3
+
+    @pytest.mark.unit
+    def test_batch_handlers_get_lists(self):
+        """Batch handlers get each type's events together; outside a batch, singly."""
+        manager = TileEventManager()
+        batches = []
+        manager.subscribe_batch(TileEventType.DAMAGED, batches.append)
+        tile = Tile(position=Position(0, 0, 0), terrain_type=TerrainType.SOIL)
+        other = Tile(position=Position(1, 0, 0), terrain_type=TerrainType.SOIL)
+
+        with manager.batch():
+            with manager.batch():
+                manager.emit(TileEvent(event_type=TileEventType.DAMAGED, tile=tile))
+            manager.emit(TileEvent(event_type=TileEventType.DAMAGED, tile=other))
+            manager.emit(TileEvent(event_type=TileEventType.FLOODED, tile=other))
+        manager.emit(TileEvent(event_type=TileEventType.DAMAGED, tile=tile))
+
+        assert [len(batch) for batch in batches] == [2, 1]
+        assert manager.unsubscribe(TileEventType.DAMAGED, batches.append)
+
+    @pytest.mark.unit
+    def test_cascades_do_not_recurse(self):
+        """A handler that keeps emitting runs as a loop, in order."""
+        manager = TileEventManager(max_history=10)
+        tile = Tile(position=Position(0, 0, 0), terrain_type=TerrainType.SOIL)
+        seen = []
+
+        def spread(event):
+            step = event.data["step"]
+            seen.append(step)
+            if step < 5000:
+                manager.emit(TileEvent(event_type=TileEventType.FLOODED, tile=tile,
+                                       data={"step": step + 1}))
+
+        manager.subscribe(TileEventType.FLOODED, spread)
+        manager.emit(TileEvent(event_type=TileEventType.FLOODED, tile=tile, data={"step": 0}))
+        assert seen == list(range(5001))
+
+    @pytest.mark.unit
+    def test_grid_batch_events(self, small_grid):
+        """The grid exposes batching over its event manager."""
+        batches = []
+        small_grid.subscribe_to_event_batch(TileEventType.FLOODED, batches.append)
+        with small_grid.batch_events():
+            for x in range(4):
+                small_grid.emit_event(TileEventType.FLOODED, small_grid.get_tile(x, 0))
+        assert [len(batch) for batch in batches] == [4]
+
+
 class TestEventHandlerErrors:
     """Tests for event handler error handling."""
 
@@ -392,6 +485,20 @@ class TestDefaultEventHandlers:
         # Should not raise
         on_tile_damaged(event)
 
+    @pytest.mark.unit
+    def test_on_tile_damaged_emits_follow_ups(self, glass_tile):
+        """Shattering and collapse are announced through the manager."""
+        manager = TileEventManager()
+        manager.subscribe(TileEventType.DAMAGED, lambda e: on_tile_damaged(e, manager))
+        glass_tile.stability = 0.2
+        manager.emit(TileEvent(event_type=TileEventType.DAMAGED, tile=glass_tile,
+                               data={"damage": 50}))
+
+        assert [e.event_type for e in manager.get_history()] == [
+            TileEventType.COLLAPSED, TileEventType.MODIFIED, TileEventType.DAMAGED
+        ]
+        assert not glass_tile.passable
+
     @pytest.mark.unit
     def test_on_tile_flooded(self, basic_tile):
         """Flooding tile updates moisture."""
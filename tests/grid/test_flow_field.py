@@ -0,0 +1,186 @@
+"""
+Tests for flow fields (shared Dijkstra maps) and their cache.
+"""
+
+import pytest
+from shadowengine.grid import (
+    Position, TileGrid, TerrainType, Entity, EntityType, TileEventType,
+    FlowFieldCache, build_flow_field
+)
+from shadowengine.grid.pathfinding import get_reachable_tiles, calculate_path_cost
+
+
+@pytest.fixture
+def walled_grid():
+    """30x30 grid with a wall at x=15 open only at y=28."""
+    grid = TileGrid(width=30, height=30)
+    grid.fill_rect(15, 0, 15, 27, TerrainType.ROCK)
+    return grid
+
+
+class TestFlowField:
+    """Tests for building and reading flow fields."""
+
+    @pytest.mark.unit
+    def test_costs_match_astar(self, walled_grid):
+        """Cost-to-goal equals the A* path cost from each start."""
+        goal = Position(25, 5, 0)
+        field = build_flow_field(walled_grid, [goal])
+        for start in [Position(0, 0, 0), Position(5, 20, 0), Position(20, 20, 0)]:
+            path = walled_grid.find_path(start, goal)
+            assert field.cost_to_goal(start) == pytest.approx(calculate_path_cost(path))
+
+    @pytest.mark.unit
+    def test_following_next_step_reaches_goal(self, walled_grid):
+        """Repeated next_step calls walk an optimal path to the goal."""
+        goal = Position(25, 5, 0)
+        field = build_flow_field(walled_grid, [goal])
+        start = Position(2, 3, 0)
+
+        path = field.path_from(start)
+        assert path[0] == start
+        assert path[-1] == goal
+        assert all(a.is_adjacent_to(b) for a, b in zip(path, path[1:]))
+
+        tiles = [walled_grid.get_tile_at_position(p) for p in path]
+        assert calculate_path_cost(tiles) == pytest.approx(field.cost_to_goal(start))
+        assert field.next_step(goal) is None
+        assert field.is_goal(goal)
+
+    @pytest.mark.unit
+    def test_multiple_goals_pick_nearest(self):
+        """With several goals each cell heads for the cheapest one."""
+        grid = TileGrid(width=20, height=5)
+        exits = [Position(0, 2, 0), Position(19, 2, 0)]
+        field = build_flow_field(grid, exits)
+
+        assert field.path_from(Position(3, 2, 0))[-1] == exits[0]
+        assert field.path_from(Position(16, 2, 0))[-1] == exits[1]
+        assert field.cost_to_goal(Position(3, 2, 0)) == pytest.approx(3.0)
+
+    @pytest.mark.unit
+    def test_unreachable_and_budget(self, walled_grid):
+        """Cells beyond walls or the budget have no next step."""
+        walled_grid.fill_rect(15, 28, 15, 29, TerrainType.ROCK)
+        field = build_flow_field(walled_grid, [Position(25, 5, 0)], max_cost=5)
+
+        assert not field.is_reachable(Position(0, 0, 0))
+        assert field.next_step(Position(0, 0, 0)) is None
+        assert field.path_from(Position(0, 0, 0)) == []
+        assert field.cost_to_goal(Position(25, 12, 0)) == float('inf')
+        assert field.is_reachable(Position(25, 9, 0))
+        assert field.next_step(Position(99, 0, 0)) is None
+
+    @pytest.mark.unit
+    def test_impassable_goals_ignored(self, walled_grid):
+        """Goals that cannot be entered are dropped."""
+        field = build_flow_field(walled_grid, [Position(15, 5, 0)])
+        assert len(field.goals) == 0
+        assert len(field) == 0
+
+    @pytest.mark.unit
+    def test_entity_costs(self):
+        """Entity movement modifiers shape the field."""
+        grid = TileGrid(width=10, height=3)
+        grid.fill_rect(1, 0, 8, 2, TerrainType.WATER)
+        swimmer = Entity(id="s", name="Swimmer", entity_type=EntityType.CHARACTER,
+                         movement_modifiers={"WATER": 0.1})
+        goal = Position(9, 1, 0)
+
+        walker = build_flow_field(grid, [goal])
+        fish = build_flow_field(grid, [goal], entity=swimmer)
+        assert fish.cost_to_goal(Position(0, 1, 0)) < walker.cost_to_goal(Position(0, 1, 0))
+
+
+class TestReachableIndexed:
+    """Tests for get_reachable_tiles over the cost lattice."""
+
+    @pytest.mark.unit
+    def test_matches_tile_search(self, grid_with_water):
+        """Indexed results equal the Tile-based Dijkstra."""
+        start = Position(3, 3, 0)
+        expected = get_reachable_tiles(grid_with_water, start, max_movement=6)
+        actual = get_reachable_tiles(grid_with_water, start, max_movement=6,
+                                     cost_field=grid_with_water.get_cost_field())
+        assert actual.keys() == expected.keys()
+        for pos, cost in expected.items():
+            assert actual[pos] == pytest.approx(cost)
+
+
+class TestFlowFieldCache:
+    """Tests for LRU caching and invalidation."""
+
+    @pytest.mark.unit
+    def test_shared_between_callers(self, walled_grid):
+        """Same goal set returns the same field regardless of order."""
+        a, b = Position(25, 5, 0), Position(20, 20, 0)
+        field = walled_grid.get_flow_field([a, b])
+        assert walled_grid.get_flow_field([b, a]) is field
+        assert walled_grid.get_flow_fields().hits == 1
+
+    @pytest.mark.unit
+    def test_lru_eviction(self, walled_grid):
+        """The least recently used field is evicted at capacity."""
+        cache = FlowFieldCache(walled_grid, capacity=2)
+        first = cache.get([Position(1, 1, 0)])
+        cache.get([Position(2, 2, 0)])
+        assert cache.get([Position(1, 1, 0)]) is first
+        cache.get([Position(3, 3, 0)])
+
+        assert len(cache) == 2
+        assert cache.get([Position(1, 1, 0)]) is first
+        assert cache.misses == 3
+        cache.get([Position(2, 2, 0)])
+        assert cache.misses == 4
+
+    @pytest.mark.unit
+    def test_invalid_capacity(self, walled_grid):
+        """Capacity below one is rejected."""
+        with pytest.raises(ValueError):
+            FlowFieldCache(walled_grid, capacity=0)
+
+    @pytest.mark.unit
+    def test_event_inside_reach_invalidates(self, walled_grid):
+        """A tile event inside the field's reach drops and rebuilds it."""
+        goal = Position(25, 5, 0)
+        field = walled_grid.get_flow_field(goal)
+        before = field.cost_to_goal(Position(0, 0, 0))
+
+        tile = walled_grid.get_tile(15, 28, 0)
+        tile.terrain_type = TerrainType.ROCK
+        tile.passable = False
+        walled_grid.emit_event(TileEventType.COLLAPSED, tile)
+
+        assert not field.valid
+        rebuilt = walled_grid.get_flow_field(goal)
+        assert rebuilt is not field
+        assert rebuilt.cost_to_goal(Position(0, 0, 0)) > before
+
+    @pytest.mark.unit
+    def test_event_outside_reach_keeps_field(self, walled_grid):
+        """Changes the field cannot see leave it cached."""
+        goal = Position(25, 5, 0)
+        field = walled_grid.get_flow_field(goal, max_cost=4)
+
+        tile = walled_grid.get_tile(2, 2, 0)
+        tile.terrain_type = TerrainType.WATER
+        walled_grid.emit_event(TileEventType.FLOODED, tile)
+
+        assert field.valid
+        assert walled_grid.get_flow_field(goal, max_cost=4) is field
+
+    @pytest.mark.unit
+    def test_opening_next_to_reach_invalidates(self):
+        """Opening a cell bordering the reach can extend it."""
+        grid = TileGrid(width=10, height=3)
+        grid.fill_rect(5, 0, 5, 2, TerrainType.ROCK)
+        field = grid.get_flow_field(Position(0, 1, 0))
+        assert not field.is_reachable(Position(9, 1, 0))
+
+        tile = grid.get_tile(5, 1, 0)
+        tile.terrain_type = TerrainType.SOIL
+        tile.passable = True
+        grid.notify_tile_changed(5, 1, 0)
+
+        assert not field.valid
+        assert grid.get_flow_field(Position(0, 1, 0)).is_reachable(Position(9, 1, 0))
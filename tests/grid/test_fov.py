@@ -0,0 +1,173 @@
+"""
+Tests for shadowcasting field of view and its cache.
+"""
+
+import pytest
+from shadowengine.grid import (
+    Position, TileGrid, TerrainType, Entity, EntityType, TileEventType, FieldOfView
+)
+
+
+def make_entity(entity_id, entity_type=EntityType.CHARACTER, **kwargs):
+    return Entity(id=entity_id, name=entity_id, entity_type=entity_type, **kwargs)
+
+
+@pytest.fixture
+def walled_grid():
+    """21x11 grid with a wall at x=10 from y=0 to y=7."""
+    grid = TileGrid(width=21, height=11)
+    grid.fill_rect(10, 0, 10, 7, TerrainType.ROCK)
+    return grid
+
+
+class TestShadowcasting:
+    """Tests for the visible sets themselves."""
+
+    @pytest.mark.unit
+    def test_open_field_sees_full_disc(self):
+        """With nothing opaque every cell in the radius is visible."""
+        grid = TileGrid(width=30, height=30)
+        fov = grid.get_field_of_view()
+        origin = Position(15, 15, 0)
+        expected = [
+            (x, y, 0) for y in range(30) for x in range(30)
+            if (x - 15) ** 2 + (y - 15) ** 2 <= 7.5 ** 2
+        ]
+        assert fov.visible_cells(origin, 7.5) == expected
+
+    @pytest.mark.unit
+    def test_wall_casts_shadow(self, walled_grid):
+        """Cells behind a wall are hidden, the wall itself is seen."""
+        fov = walled_grid.get_field_of_view()
+        origin = Position(5, 5, 0)
+        assert fov.can_see(origin, Position(10, 5, 0), 20)
+        assert not fov.can_see(origin, Position(15, 5, 0), 20)
+        assert not fov.can_see(origin, Position(20, 0, 0), 20)
+        assert fov.can_see(origin, Position(15, 10, 0), 20)
+
+    @pytest.mark.unit
+    def test_agrees_with_line_of_sight_in_open(self, walled_grid):
+        """Clear lines of sight on the origin's side of the wall are visible."""
+        fov = walled_grid.get_field_of_view()
+        origin = walled_grid.get_tile(3, 4, 0)
+        for y in range(11):
+            for x in range(10):
+                target = walled_grid.get_tile(x, y, 0)
+                if walled_grid.has_line_of_sight(origin, target):
+                    assert fov.can_see(origin.position, target.position, 30)
+
+    @pytest.mark.unit
+    def test_glass_and_opaque_entities(self):
+        """Glass is transparent; opaque entities block sight."""
+        grid = TileGrid(width=15, height=5)
+        grid.fill_rect(5, 0, 5, 4, TerrainType.GLASS)
+        fov = grid.get_field_of_view()
+        assert fov.can_see(Position(1, 2, 0), Position(10, 2, 0), 20)
+
+        grid.fill_rect(5, 0, 5, 4, TerrainType.SOIL)
+        for y in range(5):
+            grid.place_entity(make_entity(f"wall{y}", EntityType.FURNITURE, opaque=True),
+                              Position(5, y, 0))
+        assert not fov.can_see(Position(1, 2, 0), Position(10, 2, 0), 20)
+
+    @pytest.mark.unit
+    def test_radius_and_bounds(self, walled_grid):
+        """Radius limits sight; off-grid origins see nothing."""
+        fov = walled_grid.get_field_of_view()
+        assert not fov.can_see(Position(0, 10, 0), Position(5, 10, 0), 4)
+        assert fov.can_see(Position(0, 10, 0), Position(4, 10, 0), 4)
+        assert fov.compute(Position(-1, 0, 0), 5) == frozenset()
+        assert not fov.can_see(Position(0, 10, 0), Position(4, 10, 1), 4)
+
+    @pytest.mark.unit
+    def test_dense_grid(self):
+        """Dense grids read opacity from the packed arrays."""
+        grid = TileGrid(width=21, height=11, dense=True)
+        grid.fill_rect(10, 0, 10, 7, TerrainType.ROCK)
+        fov = grid.get_field_of_view()
+        assert not fov.can_see(Position(5, 5, 0), Position(15, 5, 0), 20)
+        assert grid.memory_usage()["materialized_tiles"] == 0
+
+
+class TestFieldOfViewCache:
+    """Tests for caching and invalidation."""
+
+    @pytest.mark.unit
+    def test_cached_per_origin_and_radius(self, walled_grid):
+        """Repeat lookups hit the cache."""
+        fov = walled_grid.get_field_of_view()
+        first = fov.compute(Position(5, 5, 0), 8)
+        assert fov.compute(Position(5, 5, 0), 8) is first
+        fov.compute(Position(5, 5, 0), 9)
+        assert (fov.hits, fov.misses) == (1, 2)
+
+    @pytest.mark.unit
+    def test_capacity(self, walled_grid):
+        """Old entries are evicted at capacity; bad capacity is rejected."""
+        fov = FieldOfView(walled_grid, capacity=2)
+        for x in range(4):
+            fov.compute(Position(x, 0, 0), 5)
+        assert len(fov) == 2
+        with pytest.raises(ValueError):
+            FieldOfView(walled_grid, capacity=0)
+
+    @pytest.mark.unit
+    def test_opacity_event_invalidates(self, walled_grid):
+        """Opening the wall drops the sets that saw it."""
+        fov = walled_grid.get_field_of_view()
+        origin = Position(5, 5, 0)
+        far_side = Position(15, 5, 0)
+        unrelated = fov.compute(Position(18, 2, 0), 2)
+        assert not fov.can_see(origin, far_side, 20)
+
+        tile = walled_grid.get_tile(10, 5, 0)
+        tile.terrain_type = TerrainType.SOIL
+        tile.opaque = False
+        walled_grid.emit_event(TileEventType.COLLAPSED, tile)
+
+        assert fov.can_see(origin, far_side, 20)
+        assert fov.compute(Position(18, 2, 0), 2) is unrelated
+
+    @pytest.mark.unit
+    def test_non_opacity_event_keeps_cache(self, walled_grid):
+        """Events that leave opacity alone keep cached sets."""
+        fov = walled_grid.get_field_of_view()
+        visible = fov.compute(Position(5, 5, 0), 10)
+        walled_grid.place_entity(make_entity("npc"), Position(6, 5, 0))
+        assert fov.compute(Position(5, 5, 0), 10) is visible
+
+    @pytest.mark.unit
+    def test_direct_change_via_notify(self, walled_grid):
+        """fill_rect reaches the engine through change listeners."""
+        fov = walled_grid.get_field_of_view()
+        assert fov.can_see(Position(5, 5, 0), Position(8, 5, 0), 10)
+        walled_grid.fill_rect(7, 0, 7, 10, TerrainType.ROCK)
+        assert not fov.can_see(Position(5, 5, 0), Position(8, 5, 0), 10)
+
+
+class TestWitnessQueries:
+    """Tests for batch "who can see X" queries."""
+
+    @pytest.mark.unit
+    def test_who_can_see(self, walled_grid):
+        """Observers are filtered by range, z-level, and occlusion."""
+        fov = walled_grid.get_field_of_view()
+        observers = [Position(2, 2, 0), Position(15, 3, 0), Position(8, 9, 0), Position(6, 6, 0)]
+        seen = fov.who_can_see(Position(7, 7, 0), observers, radius=8)
+        assert seen == [Position(2, 2, 0), Position(8, 9, 0), Position(6, 6, 0)]
+
+    @pytest.mark.unit
+    def test_witnesses(self, walled_grid):
+        """Grid entities that can see a cell, excluding the culprit."""
+        culprit = make_entity("culprit")
+        near = make_entity("near")
+        hidden = make_entity("hidden")
+        crate = make_entity("crate", EntityType.CONTAINER)
+        walled_grid.place_entity(culprit, Position(5, 5, 0))
+        walled_grid.place_entity(near, Position(7, 3, 0))
+        walled_grid.place_entity(hidden, Position(13, 4, 0))
+        walled_grid.place_entity(crate, Position(4, 5, 0))
+
+        fov = walled_grid.get_field_of_view()
+        found = fov.witnesses(Position(5, 5, 0), 10, EntityType.CHARACTER, exclude=culprit)
+        assert found == [near]
@@ -0,0 +1,209 @@
+"""
+Tests for hierarchical pathfinding.
+"""
+
+import pytest
+from shadowengine.grid import (
+    Position, TileGrid, TerrainType, TileEventType,
+    Entity, EntityType,
+    PathHierarchy, find_path_hierarchical
+)
+from shadowengine.grid.pathfinding import calculate_path_cost
+
+
+def assert_valid_path(path, start, end):
+    """Path runs start to end in single passable steps."""
+    assert path[0].position == start
+    assert path[-1].position == end
+    for a, b in zip(path, path[1:]):
+        assert a.position.chebyshev_distance(b.position) == 1
+        assert b.is_passable()
+
+
+@pytest.fixture
+def walled_grid():
+    """64x64 grid with walls that force detours through gaps."""
+    grid = TileGrid(width=64, height=64)
+    grid.fill_rect(20, 0, 20, 50, TerrainType.ROCK)
+    grid.fill_rect(40, 13, 40, 63, TerrainType.ROCK)
+    grid.fill_rect(0, 30, 15, 30, TerrainType.ROCK)
+    grid.fill_rect(45, 20, 55, 26, TerrainType.WATER)
+    return grid
+
+
+class TestPathHierarchyStructure:
+    """Tests for the cluster abstraction."""
+
+    @pytest.mark.unit
+    def test_cluster_geometry(self):
+        """Clusters tile the grid, clipping at the edges."""
+        hierarchy = PathHierarchy(TileGrid(width=20, height=10), cluster_size=8)
+        assert (hierarchy.columns, hierarchy.rows) == (3, 2)
+        assert hierarchy.cluster_of(17, 9) == (2, 1, 0)
+        assert hierarchy.cluster_bounds((2, 1, 0)) == (16, 8, 20, 10)
+
+    @pytest.mark.unit
+    def test_invalid_cluster_size(self):
+        """Cluster size must allow at least two cells."""
+        with pytest.raises(ValueError):
+            PathHierarchy(TileGrid(width=10, height=10), cluster_size=1)
+
+    @pytest.mark.unit
+    def test_abstract_graph_size(self, walled_grid):
+        """Open borders produce transitions on both sides."""
+        hierarchy = walled_grid.get_path_hierarchy(cluster_size=16)
+        nodes, edges = hierarchy.abstract_size()
+        assert nodes > 0
+        assert edges > nodes
+
+    @pytest.mark.unit
+    def test_grid_caches_hierarchy(self, walled_grid):
+        """The grid hands out one hierarchy per cluster size."""
+        first = walled_grid.get_path_hierarchy()
+        assert walled_grid.get_path_hierarchy() is first
+        other = walled_grid.get_path_hierarchy(cluster_size=8)
+        assert other is not first
+        assert other.cluster_size == 8
+
+
+class TestHierarchicalPaths:
+    """Tests for find_path_hierarchical."""
+
+    @pytest.mark.unit
+    def test_long_path_is_valid(self, walled_grid):
+        """Long routes are valid tile-by-tile paths."""
+        start, end = Position(2, 2, 0), Position(60, 60, 0)
+        path = find_path_hierarchical(walled_grid, start, end)
+        assert_valid_path(path, start, end)
+
+    @pytest.mark.unit
+    def test_quality_bounded_against_exact(self, walled_grid, grid_helpers):
+        """Hierarchical paths stay close to the optimum."""
+        walled_grid.get_path_hierarchy(cluster_size=8)
+        pairs = [
+            (Position(2, 2, 0), Position(60, 60, 0)),
+            (Position(2, 60, 0), Position(60, 2, 0)),
+            (Position(10, 45, 0), Position(50, 5, 0)),
+        ]
+        for start, end in pairs:
+            exact_cost = grid_helpers.shortest_path_cost(walled_grid, start, end)
+            cost = calculate_path_cost(find_path_hierarchical(walled_grid, start, end))
+            assert exact_cost - 1e-9 <= cost <= exact_cost * 1.25
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("seed", range(4))
+    def test_quality_with_cheap_modifiers(self, grid_helpers, seed):
+        """Modifiers below 1 keep routes valid and near the optimum."""
+        grid = grid_helpers.random_terrain_grid(40, seed)
+        wader = Entity(
+            id="wader", name="Wader", entity_type=EntityType.CREATURE,
+            movement_modifiers={"SOIL": 0.5, "WATER": 0.1}
+        )
+        start, end = Position(0, 0, 0), Position(39, 39, 0)
+        exact_cost = grid_helpers.shortest_path_cost(grid, start, end, wader)
+
+        path = grid.get_path_hierarchy(cluster_size=8).find_path(start, end, wader)
+
+        if exact_cost == float('inf'):
+            assert path is None
+        else:
+            assert_valid_path(path, start, end)
+            cost = calculate_path_cost(path, wader)
+            assert exact_cost - 1e-9 <= cost <= exact_cost * 1.25
+
+    @pytest.mark.unit
+    def test_short_query_is_exact(self, walled_grid, grid_helpers):
+        """Queries between neighboring clusters use the exact search."""
+        start, end = Position(2, 2, 0), Position(12, 9, 0)
+        path = find_path_hierarchical(walled_grid, start, end)
+        exact_cost = grid_helpers.shortest_path_cost(walled_grid, start, end)
+        assert calculate_path_cost(path) == pytest.approx(exact_cost)
+
+    @pytest.mark.unit
+    def test_start_on_entrance(self):
+        """Starting on a transition cell still refines correctly."""
+        grid = TileGrid(width=48, height=8)
+        hierarchy = grid.get_path_hierarchy(cluster_size=8)
+        start, end = Position(7, 4, 0), Position(47, 4, 0)
+        path = hierarchy.find_path(start, end)
+        assert_valid_path(path, start, end)
+
+    @pytest.mark.unit
+    def test_no_path(self):
+        """Sealed-off destinations are unreachable."""
+        grid = TileGrid(width=48, height=48)
+        grid.fill_rect(30, 0, 30, 47, TerrainType.ROCK)
+        assert find_path_hierarchical(grid, Position(1, 1, 0), Position(45, 45, 0)) is None
+
+    @pytest.mark.unit
+    def test_impassable_destination(self, walled_grid):
+        """Impassable destinations are rejected."""
+        assert find_path_hierarchical(walled_grid, Position(1, 1, 0), Position(20, 5, 0)) is None
+
+    @pytest.mark.unit
+    def test_iter_path_is_lazy(self, walled_grid):
+        """Refinement happens as the iterator advances."""
+        hierarchy = walled_grid.get_path_hierarchy(cluster_size=8)
+        tiles = hierarchy.iter_path(Position(2, 2, 0), Position(60, 60, 0))
+        assert next(tiles).position == Position(2, 2, 0)
+        assert list(tiles)[-1].position == Position(60, 60, 0)
+
+    @pytest.mark.unit
+    def test_entity_profile(self, walled_grid):
+        """Entity movement modifiers get their own abstraction."""
+        swimmer = Entity(
+            id="swimmer", name="Swimmer", entity_type=EntityType.CREATURE,
+            movement_modifiers={"WATER": 0.1}
+        )
+        start, end = Position(45, 15, 0), Position(55, 60, 0)
+        path = find_path_hierarchical(walled_grid, start, end, swimmer)
+        assert_valid_path(path, start, end)
+        assert calculate_path_cost(path, swimmer) <= calculate_path_cost(path)
+
+
+class TestHierarchyInvalidation:
+    """Tests for dirty cluster rebuilding."""
+
+    @pytest.mark.unit
+    def test_event_dirties_one_cluster(self, walled_grid):
+        """A tile event only dirties the cluster it lands in."""
+        hierarchy = walled_grid.get_path_hierarchy(cluster_size=16)
+        hierarchy.find_path(Position(2, 2, 0), Position(60, 60, 0))
+
+        tile = walled_grid.get_tile(33, 33, 0)
+        walled_grid.emit_event(TileEventType.COLLAPSED, tile)
+        assert hierarchy.dirty_clusters() == {(2, 2, 0)}
+
+    @pytest.mark.unit
+    def test_rebuild_reroutes(self):
+        """Closing a gap reroutes hierarchical paths."""
+        grid = TileGrid(width=48, height=48)
+        grid.fill_rect(24, 0, 24, 40, TerrainType.ROCK)
+        hierarchy = grid.get_path_hierarchy(cluster_size=8)
+        start, end = Position(2, 2, 0), Position(45, 2, 0)
+
+        before = hierarchy.find_path(start, end)
+        assert any(t.position.y > 40 for t in before)
+
+        for y in range(41, 44):
+            tile = grid.get_tile(24, y, 0)
+            tile.terrain_type = TerrainType.ROCK
+            tile.passable = False
+            grid.emit_event(TileEventType.MODIFIED, tile)
+
+        after = hierarchy.find_path(start, end)
+        assert_valid_path(after, start, end)
+        assert any(t.position.y > 43 for t in after)
+        assert hierarchy.dirty_clusters() == set()
+
+    @pytest.mark.unit
+    def test_fill_rect_invalidates(self):
+        """Direct grid writes dirty the clusters they touch."""
+        grid = TileGrid(width=48, height=48)
+        hierarchy = grid.get_path_hierarchy(cluster_size=8)
+        hierarchy.find_path(Position(1, 1, 0), Position(46, 46, 0))
+
+        grid.fill_rect(0, 20, 46, 20, TerrainType.ROCK)
+        path = hierarchy.find_path(Position(1, 1, 0), Position(46, 46, 0))
+        assert_valid_path(path, Position(1, 1, 0), Position(46, 46, 0))
+        assert any(t.position.x == 47 for t in path)
@@ -287,6 +287,22 @@ class TestPositionAdjacency:
         # 8 planar + 2 vertical + 16 diagonal vertical = 26
         assert len(adjacent) == 26
 
+    @pytest.mark.unit
+    def test_iter_neighbor_coords_matches_positions(self, sample_position):
+        """Coordinate iteration yields the same neighbors in the same order."""
+        for diagonals in (True, False):
+            expected = [p.to_tuple() for p in
+                        sample_position.get_adjacent_positions(include_diagonals=diagonals)]
+            assert list(sample_position.iter_neighbor_coords(diagonals)) == expected
+
+    @pytest.mark.unit
+    def test_neighbor_offsets_are_shared(self):
+        """Offset tables are module constants, not rebuilt per call."""
+        from shadowengine.grid import neighbor_offsets
+        assert neighbor_offsets(True) is neighbor_offsets(True)
+        assert len(neighbor_offsets(True)) == 8
+        assert len(neighbor_offsets(False)) == 4
+
 
 class TestPositionConversion:
     """Position conversion and serialization tests."""
@@ -367,6 +383,27 @@ class TestPositionEquality:
         }
         assert data[Position(1, 1, 0)] == "a"
 
+    @pytest.mark.unit
+    def test_slotted_and_immutable(self):
+        """Positions carry no per-instance dict and cannot be mutated."""
+        pos = Position(1, 2, 3)
+        assert not hasattr(pos, "__dict__")
+        with pytest.raises(AttributeError):
+            pos.x = 5
+
+    @pytest.mark.unit
+    def test_pickle_round_trip(self):
+        """Slotted positions survive pickling."""
+        import pickle
+        pos = pickle.loads(pickle.dumps(Position(4, 5, 6)))
+        assert pos == Position(4, 5, 6)
+        assert hash(pos) == hash(Position(4, 5, 6))
+
+    @pytest.mark.unit
+    def test_not_equal_to_tuple(self):
+        """Positions only compare equal to positions."""
+        assert Position(1, 2, 0) != (1, 2, 0)
+
 
 class TestPositionStringRepresentation:
     """Position string representation tests."""
@@ -0,0 +1,241 @@
+"""
+Tests for the entity spatial hash and the affordance index.
+"""
+
+import pytest
+from shadowengine.grid import (
+    Position, TileGrid, TerrainType, TerrainModifier,
+    Entity, EntityType, TileEventType, SpatialHash
+)
+from shadowengine.grid.spatial import disc_spans
+
+
+def make_entity(entity_id, entity_type=EntityType.CHARACTER, **kwargs):
+    return Entity(id=entity_id, name=entity_id, entity_type=entity_type, **kwargs)
+
+
+@pytest.fixture
+def crowd_grid():
+    """64x64 grid with characters and items scattered on a lattice."""
+    grid = TileGrid(width=64, height=64, depth=2)
+    for i in range(0, 64, 6):
+        for j in range(0, 64, 9):
+            kind = EntityType.CHARACTER if (i + j) % 2 else EntityType.ITEM
+            grid.place_entity(make_entity(f"e{i}_{j}", kind), Position(i, j, 0))
+    return grid
+
+
+def brute_within(grid, center, radius, entity_type=None):
+    return sorted(
+        e.id for e in grid.get_all_entities()
+        if e.position.z == center.z
+        and center.distance_to(e.position, include_z=False) <= radius
+        and (entity_type is None or e.entity_type == entity_type)
+    )
+
+
+class TestSpatialHash:
+    """Tests for bucketed entity lookups."""
+
+    @pytest.mark.unit
+    def test_invalid_bucket_size(self):
+        """Bucket size below one is rejected."""
+        with pytest.raises(ValueError):
+            SpatialHash(bucket_size=0)
+
+    @pytest.mark.unit
+    def test_within_matches_brute_force(self, crowd_grid):
+        """Radius queries return exactly the entities in range."""
+        for center, radius in [(Position(10, 10, 0), 7.5), (Position(0, 0, 0), 20),
+                               (Position(63, 40, 0), 3), (Position(30, 30, 1), 50)]:
+            found = crowd_grid.get_entities_in_radius(center, radius)
+            assert sorted(e.id for e in found) == brute_within(crowd_grid, center, radius)
+
+    @pytest.mark.unit
+    def test_within_skips_only_buckets_outside_the_disc(self, crowd_grid):
+        """Corner buckets are skipped without losing entities near bucket edges."""
+        for x in range(0, 64, 7):
+            for y in range(0, 64, 5):
+                center = Position(x, y, 0)
+                for radius in (0, 1, 4.5, 8, 13.7):
+                    found = crowd_grid.get_entities_in_radius(center, radius)
+                    assert sorted(e.id for e in found) == brute_within(crowd_grid, center, radius)
+
+    @pytest.mark.unit
+    def test_within_sorted_and_filtered(self, crowd_grid):
+        """Results come nearest first and honour the type filter."""
+        center = Position(20, 20, 0)
+        found = crowd_grid.get_entities_in_radius(center, 15, EntityType.ITEM)
+        distances = [center.distance_to(e.position) for e in found]
+        assert distances == sorted(distances)
+        assert all(e.entity_type == EntityType.ITEM for e in found)
+        assert sorted(e.id for e in found) == brute_within(crowd_grid, center, 15, EntityType.ITEM)
+
+    @pytest.mark.unit
+    def test_nearest(self, crowd_grid):
+        """Nearest lookup matches a full scan."""
+        for center in [Position(31, 33, 0), Position(2, 61, 0), Position(63, 0, 0)]:
+            for entity_type in (None, EntityType.CHARACTER, EntityType.ITEM):
+                expected = min(
+                    (e for e in crowd_grid.get_all_entities()
+                     if entity_type is None or e.entity_type == entity_type),
+                    key=lambda e: (center.distance_to(e.position), e.id)
+                )
+                assert crowd_grid.find_nearest_entity(center, entity_type) is expected
+
+    @pytest.mark.unit
+    def test_nearest_limits(self, crowd_grid):
+        """max_radius, exclude, and empty z-levels are respected."""
+        me = crowd_grid.get_entity("e6_9")
+        other = crowd_grid.find_nearest_entity(me.position, exclude=me)
+        assert other is not me
+        assert crowd_grid.find_nearest_entity(Position(3, 4, 0), max_radius=1) is None
+        assert crowd_grid.find_nearest_entity(Position(3, 4, 1)) is None
+
+    @pytest.mark.unit
+    def test_follows_move_and_remove(self, crowd_grid):
+        """Moving and removing entities keeps the hash in sync."""
+        mover = crowd_grid.get_entity("e0_0")
+        assert crowd_grid.move_entity(mover, Position(50, 50, 1))
+        assert mover in crowd_grid.get_entities_in_radius(Position(50, 50, 1), 0)
+        assert mover not in crowd_grid.get_entities_in_radius(Position(0, 0, 0), 2)
+
+        crowd_grid.remove_entity(mover)
+        assert crowd_grid.get_entities_in_radius(Position(50, 50, 1), 5) == []
+
+    @pytest.mark.unit
+    def test_in_rect(self, crowd_grid):
+        """Rectangle queries include corners."""
+        found = crowd_grid.get_entities_in_rect(18, 27, 6, 9)
+        assert sorted(e.id for e in found) == ["e12_18", "e12_27", "e12_9", "e18_18",
+                                               "e18_27", "e18_9", "e6_18", "e6_27", "e6_9"]
+
+    @pytest.mark.unit
+    def test_rebuilt_on_load(self, crowd_grid):
+        """Deserialized grids index their entities."""
+        restored = TileGrid.from_dict(crowd_grid.serialize())
+        center = Position(25, 25, 0)
+        assert (sorted(e.id for e in restored.get_entities_in_radius(center, 12))
+                == brute_within(crowd_grid, center, 12))
+
+
+class TestGetInRadius:
+    """get_in_radius keeps its results after the span rewrite."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("radius", [0, 1, 1.5, 2.9, 5, 7.3])
+    def test_matches_distance_check(self, radius):
+        grid = TileGrid(width=12, height=12)
+        center = Position(2, 9, 0)
+        expected = [
+            (x, y) for x in range(12) for y in range(12)
+            if center.distance_to(Position(x, y, 0), include_z=False) <= radius
+            and (x, y) != (2, 9)
+        ]
+        tiles = grid.get_in_radius(center, radius)
+        assert [(t.position.x, t.position.y) for t in tiles] == expected
+
+    @pytest.mark.unit
+    def test_reuses_materialized_tiles(self):
+        """Tiles already in the grid come back as the same objects."""
+        grid = TileGrid(width=12, height=12)
+        tile = grid.get_tile(5, 6, 0)
+        tiles = grid.get_in_radius(Position(5, 5, 0), 1.5)
+        assert tile in tiles
+        assert all(t is grid.get_tile(*t.position.to_tuple()) for t in tiles)
+
+    @pytest.mark.unit
+    def test_disc_spans_match_distance(self):
+        for radius in (0, 0.5, 1, 2.5, 6.2):
+            cells = {(dx, dy) for dx, span in disc_spans(radius) for dy in range(-span, span + 1)}
+            reach = int(radius) + 1
+            assert cells == {
+                (dx, dy) for dx in range(-reach, reach + 1) for dy in range(-reach, reach + 1)
+                if dx * dx + dy * dy <= radius * radius
+            }
+
+
+class TestAffordanceIndex:
+    """Tests for the incremental affordance index."""
+
+    @pytest.mark.unit
+    def test_matches_full_scan(self):
+        """Indexed lookups equal find_tiles_with_affordance."""
+        grid = TileGrid(width=30, height=30)
+        grid.fill_rect(3, 3, 8, 8, TerrainType.WATER)
+        grid.fill_rect(20, 0, 20, 29, TerrainType.ROCK)
+        index = grid.get_affordance_index()
+
+        for affordance in ("swimmable", "mineable", "diggable", "flying"):
+            scan = grid.find_tiles(lambda t: affordance in t.get_affordances())
+            expected = [t.position.to_tuple() for t in scan]
+            assert index.cells_with(affordance) == expected
+
+    @pytest.mark.unit
+    def test_find_tiles_with_affordance_sees_tile_api_changes(self):
+        """Changes made through a tile's own API show up without a notify."""
+        grid = TileGrid(width=20, height=20)
+        grid.get_affordance_index()
+        grid.get_tile(4, 4).add_modifier(TerrainModifier(type="wet", intensity=1.0))
+        grid.get_tile(3, 3).environment.moisture = 0.9
+
+        tiles = grid.find_tiles_with_affordance("slippery")
+
+        assert [t.position.to_tuple() for t in tiles] == [(3, 3, 0), (4, 4, 0)]
+
+    @pytest.mark.unit
+    def test_rect_query(self):
+        """Rectangle queries only return cells inside the rectangle."""
+        grid = TileGrid(width=30, height=30)
+        grid.fill_rect(3, 3, 8, 8, TerrainType.WATER)
+        tiles = grid.find_affordance_in_rect("swimmable", 0, 0, 4, 5)
+        assert [t.position.to_tuple() for t in tiles] == [
+            (3, 3, 0), (4, 3, 0), (3, 4, 0), (4, 4, 0), (3, 5, 0), (4, 5, 0)
+        ]
+        assert len(grid.find_affordance_in_rect("diggable", 0, 0, 4, 5)) == 30 - 6
+
+    @pytest.mark.unit
+    def test_updates_from_events(self):
+        """Tile events re-derive the touched cell."""
+        grid = TileGrid(width=10, height=10)
+        index = grid.get_affordance_index()
+
+        tile = grid.get_tile(4, 4, 0)
+        tile.add_modifier(TerrainModifier(type="overgrown"))
+        grid.emit_event(TileEventType.MODIFIED, tile)
+        assert index.affordances_at(4, 4) == frozenset(tile.get_affordances())
+        assert index.cells_with("hideable") == [(4, 4, 0)]
+
+        tile.modifiers.clear()
+        grid.emit_event(TileEventType.MODIFIED, tile)
+        assert index.affordances_at(4, 4) == index.default_affordances
+
+    @pytest.mark.unit
+    def test_updates_from_entities(self):
+        """Entities entering and leaving a tile change its affordances."""
+        grid = TileGrid(width=10, height=10)
+        index = grid.get_affordance_index()
+        ladder = make_entity("ladder", EntityType.FURNITURE, own_affordances={"climbable"})
+
+        grid.place_entity(ladder, Position(2, 2, 0))
+        assert index.cells_with("climbable") == [(2, 2, 0)]
+        grid.move_entity(ladder, Position(7, 3, 0))
+        assert index.cells_with("climbable") == [(7, 3, 0)]
+        grid.remove_entity(ladder)
+        assert index.cells_with("climbable") == []
+
+    @pytest.mark.unit
+    def test_updates_from_direct_changes(self):
+        """set_tile, fill_rect and notify_tile_changed reach the index."""
+        grid = TileGrid(width=10, height=10, dense=True)
+        index = grid.get_affordance_index()
+
+        grid.fill_rect(0, 0, 1, 1, TerrainType.WATER)
+        assert len(index.cells_with("swimmable")) == 4
+        assert grid.memory_usage()["materialized_tiles"] == 0
+
+        tile = grid.get_tile(0, 0, 0)
+        tile.terrain_type = TerrainType.SOIL
+        grid.notify_tile_changed(0, 0, 0)
+        assert len(index.cells_with("swimmable")) == 3
+        assert (0, 0, 0) in index.cells_with("diggable")
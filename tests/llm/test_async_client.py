@@ -0,0 +1,170 @@
+"""Tests for AsyncLLMClient and concurrent fan-out."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from shadowengine.llm import (
+    AsyncLLMClient,
+    CachingLLMClient,
+    LLMBackend,
+    LLMConfig,
+    LLMResponse,
+    MockLLMClient,
+    run_sync,
+)
+
+
+class SlowClient(MockLLMClient):
+    """Mock that takes delay seconds per reply and tracks calls in flight."""
+
+    def __init__(self, delay: float = 0.05, **config):
+        super().__init__(LLMConfig(backend=LLMBackend.MOCK, **config))
+        self.delay = delay
+        self.in_flight = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def generate(self, prompt, system=None):
+        with self._lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        try:
+            time.sleep(self.delay)
+            if "fail" in prompt:
+                raise RuntimeError("backend fell over")
+            return LLMResponse(text=f"re: {prompt.split(': ')[1].split(chr(10))[0]}",
+                               success=True, model="mock")
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+def ask(text: str) -> list[dict]:
+    return [{"role": "user", "content": text}]
+
+
+class TestAsyncLLMClient:
+    """Tests for the coroutine interface."""
+
+    def test_single_calls(self):
+        """Test chat, generate and availability as coroutines."""
+        async def main():
+            async with AsyncLLMClient(SlowClient(delay=0)) as client:
+                return (
+                    await client.chat(ask("hello")),
+                    await client.generate("User: there"),
+                    await client.check_availability(),
+                )
+
+        chat, generate, available = asyncio.run(main())
+        assert chat.text == "re: hello"
+        assert generate.text == "re: there"
+        assert available
+
+    def test_chat_many_runs_concurrently_in_order(self):
+        """Test a batch takes about one reply's time, replies in order."""
+        client = AsyncLLMClient(SlowClient(delay=0.1), max_concurrency=4)
+        start = time.perf_counter()
+        replies = asyncio.run(client.chat_many([ask(f"q{i}") for i in range(4)]))
+        elapsed = time.perf_counter() - start
+        client.close()
+
+        assert [r.text for r in replies] == ["re: q0", "re: q1", "re: q2", "re: q3"]
+        assert elapsed < 0.3
+
+    def test_concurrency_is_bounded(self):
+        """Test no more than max_concurrency requests are in flight."""
+        backend = SlowClient(delay=0.02)
+        with AsyncLLMClient(backend, max_concurrency=2) as client:
+            replies = asyncio.run(client.chat_many([ask(f"q{i}") for i in range(6)]))
+
+        assert len(replies) == 6
+        assert backend.peak == 2
+
+    def test_default_concurrency_is_pool_size(self):
+        """Test every request in flight can reuse a pooled connection."""
+        with AsyncLLMClient(SlowClient(pool_size=3)) as client:
+            assert client.max_concurrency == 3
+
+    def test_failure_does_not_lose_the_batch(self):
+        """Test a raising request becomes a failed response."""
+        with AsyncLLMClient(SlowClient(delay=0)) as client:
+            replies = asyncio.run(client.chat_many([ask("ok"), ask("fail"), ask("fine")]))
+
+        assert [r.success for r in replies] == [True, False, True]
+        assert "backend fell over" in replies[1].error
+
+    def test_generate_many(self):
+        """Test independent generations fan out too."""
+        with AsyncLLMClient(SlowClient(delay=0)) as client:
+            replies = asyncio.run(client.generate_many([("User: a", None), ("User: b", "sys")]))
+        assert [r.text for r in replies] == ["re: a", "re: b"]
+
+    def test_chat_stream(self):
+        """Test a stream arrives as async pieces."""
+        backend = MockLLMClient(LLMConfig(backend=LLMBackend.MOCK))
+        backend.default_response = "Rain on the glass."
+
+        async def main():
+            with AsyncLLMClient(backend) as client:
+                return [piece async for piece in client.chat_stream(ask("weather?"))]
+
+        assert "".join(asyncio.run(main())) == "Rain on the glass."
+
+    def test_rejects_zero_concurrency(self):
+        with pytest.raises(ValueError):
+            AsyncLLMClient(SlowClient(), max_concurrency=0)
+
+
+class TestSyncFacade:
+    """Tests for LLMClient.chat_many and run_sync."""
+
+    def test_chat_many_from_sync_code(self):
+        """Test existing synchronous callers get the fan-out."""
+        backend = SlowClient(delay=0.1)
+        start = time.perf_counter()
+        replies = backend.chat_many([ask("a"), ask("b"), ask("c")])
+        elapsed = time.perf_counter() - start
+
+        assert [r.text for r in replies] == ["re: a", "re: b", "re: c"]
+        assert elapsed < 0.25
+        assert backend.peak == 3
+
+    def test_single_request_stays_on_the_calling_thread(self):
+        """Test nothing is spun up for a batch of one."""
+        backend = SlowClient(delay=0)
+        assert [r.text for r in backend.chat_many([ask("solo")])] == ["re: solo"]
+        assert backend.chat_many([]) == []
+
+    def test_chat_many_goes_through_the_cache(self):
+        """Test a cached client answers repeats in a batch from the cache."""
+        client = CachingLLMClient(SlowClient(delay=0, temperature=0.0))
+        client.chat(ask("a"))
+
+        replies = client.chat_many([ask("a"), ask("b")])
+
+        assert [r.text for r in replies] == ["re: a", "re: b"]
+        assert client.hits == 1
+        assert client.misses == 2
+
+    def test_run_sync_inside_running_loop(self):
+        """Test the facade still works when called from async code."""
+        async def answer():
+            return 42
+
+        async def main():
+            return run_sync(answer())
+
+        assert asyncio.run(main()) == 42
+
+    def test_run_sync_propagates_errors(self):
+        async def boom():
+            raise KeyError("missing")
+
+        async def main():
+            return run_sync(boom())
+
+        with pytest.raises(KeyError):
+            asyncio.run(main())
@@ -0,0 +1,203 @@
+"""Tests for the content-addressed LLM response cache."""
+
+import time
+
+import pytest
+from shadowengine.llm import (
+    CachingLLMClient,
+    LLMBackend,
+    LLMConfig,
+    LLMResponse,
+    MockLLMClient,
+    ResponseCache,
+    create_llm_client,
+)
+
+
+MESSAGES = [
+    {"role": "system", "content": "You are a bartender."},
+    {"role": "user", "content": "Where were you last night?"},
+]
+
+
+def mock_client(temperature: float = 0.0) -> MockLLMClient:
+    client = MockLLMClient(LLMConfig(backend=LLMBackend.MOCK, temperature=temperature))
+    client.default_response = "Behind the bar."
+    return client
+
+
+class TestResponseCache:
+    """Tests for the LRU and SQLite store."""
+
+    def test_memory_lru_eviction(self):
+        """Test the least recently used entry goes first."""
+        cache = ResponseCache(max_entries=2)
+        cache.put("a", LLMResponse(text="A"))
+        cache.put("b", LLMResponse(text="B"))
+        assert cache.get("a").text == "A"
+        cache.put("c", LLMResponse(text="C"))
+
+        assert cache.get("b") is None
+        assert cache.get("a").text == "A"
+        assert cache.evictions == 1
+        assert len(cache) == 2
+
+    def test_persists_across_instances(self, tmp_path):
+        """Test entries written to the file survive reopening it."""
+        path = str(tmp_path / "responses.db")
+        cache = ResponseCache(path)
+        cache.put("a", LLMResponse(text="A", model="llama3.2", tokens_used=3))
+        cache.close()
+
+        reopened = ResponseCache(path)
+        response = reopened.get("a")
+        assert response.text == "A"
+        assert response.model == "llama3.2"
+        assert response.tokens_used == 3
+        reopened.close()
+
+    def test_file_evicts_least_recently_used(self, tmp_path):
+        """Test the file keeps max_entries, dropping the least recently used."""
+        cache = ResponseCache(str(tmp_path / "responses.db"), memory_entries=1, max_entries=2)
+        cache.put("a", LLMResponse(text="A"))
+        time.sleep(0.01)
+        cache.put("b", LLMResponse(text="B"))
+        time.sleep(0.01)
+        cache.get("a")  # From the file, since memory holds only "b"
+        time.sleep(0.01)
+        cache.put("c", LLMResponse(text="C"))
+
+        assert cache.get("b") is None
+        assert cache.get("a").text == "A"
+        assert len(cache) == 2
+
+    def test_ttl(self, tmp_path):
+        """Test entries past their TTL are dropped."""
+        cache = ResponseCache(str(tmp_path / "responses.db"), ttl=0.05)
+        cache.put("a", LLMResponse(text="A"))
+        cache.put("b", LLMResponse(text="B"))
+        assert cache.get("a").text == "A"
+        time.sleep(0.1)
+
+        assert cache.get("a") is None
+        assert cache.expire() == 1
+        assert len(cache) == 0
+
+    def test_invalid_sizes(self):
+        """Test sizes below one are rejected."""
+        with pytest.raises(ValueError):
+            ResponseCache(max_entries=0)
+
+
+class TestCachingLLMClient:
+    """Tests for the caching wrapper."""
+
+    def test_repeat_is_a_hit(self):
+        """Test a repeated request is answered from the cache."""
+        inner = mock_client()
+        client = CachingLLMClient(inner)
+
+        first = client.chat(MESSAGES)
+        second = client.chat(MESSAGES)
+
+        assert first.text == second.text == "Behind the bar."
+        assert len(inner.call_history) == 1
+        assert client.stats()["hits"] == 1
+        assert client.stats()["misses"] == 1
+        assert client.stats()["hit_rate"] == 0.5
+
+    def test_normalized_key(self):
+        """Test whitespace and extra message fields don't change the key."""
+        inner = mock_client()
+        client = CachingLLMClient(inner)
+        client.chat(MESSAGES)
+
+        variant = [dict(m, content=m["content"] + "  \r\n", name="x") for m in MESSAGES]
+        client.chat(variant)
+        client.generate("Where were you last night?")
+
+        assert client.hits == 1
+        assert len(inner.call_history) == 2  # generate is keyed apart from chat
+
+    def test_nonzero_temperature_bypasses(self):
+        """Test sampled requests skip the cache unless opted in."""
+        inner = mock_client(temperature=0.7)
+        client = CachingLLMClient(inner)
+        client.chat(MESSAGES)
+        client.chat(MESSAGES)
+
+        assert len(inner.call_history) == 2
+        assert client.bypassed == 2
+
+        opted_in = CachingLLMClient(mock_client(temperature=0.7), cache_any_temperature=True)
+        opted_in.chat(MESSAGES)
+        opted_in.chat(MESSAGES)
+        assert opted_in.hits == 1
+
+    def test_failures_not_cached(self):
+        """Test failed responses are asked again."""
+        inner = mock_client()
+        inner.default_response = ""
+        client = CachingLLMClient(inner)
+        client.chat(MESSAGES)
+        client.chat(MESSAGES)
+
+        assert client.misses == 2
+        assert len(client.cache) == 0
+
+    def test_stream_shares_cache_with_chat(self):
+        """Test a streamed reply is cached and a cached chat streams."""
+        inner = mock_client()
+        client = CachingLLMClient(inner)
+
+        assert client.chat_stream(MESSAGES).read() == "Behind the bar."
+        assert client.chat(MESSAGES).text == "Behind the bar."
+        stream = client.chat_stream(MESSAGES)
+        assert list(stream) == ["Behind the bar."]
+        assert stream.response.success
+        assert len(inner.call_history) == 1
+
+    def test_offline_replay(self, tmp_path):
+        """Test a recorded run replays from the file without the backend."""
+        path = str(tmp_path / "responses.db")
+        recorder = CachingLLMClient(mock_client(temperature=0.7), ResponseCache(path),
+                                    cache_any_temperature=True)
+        recorder.chat(MESSAGES)
+        recorder.close()
+
+        backend = mock_client(temperature=0.7)
+        replay = CachingLLMClient(backend, ResponseCache(path), offline=True)
+
+        assert replay.is_available
+        assert replay.chat(MESSAGES).text == "Behind the bar."
+        missing = replay.chat([{"role": "user", "content": "Something new"}])
+        assert not missing.success
+        assert "offline" in missing.error.lower()
+        assert list(replay.chat_stream([{"role": "user", "content": "Also new"}])) == []
+        assert backend.call_history == []
+
+    def test_create_from_config(self, tmp_path):
+        """Test create_llm_client wraps the client when a cache is configured."""
+        config = LLMConfig(backend=LLMBackend.MOCK, cache_path=str(tmp_path / "c.db"),
+                           cache_ttl=60.0, cache_any_temperature=True)
+        client = create_llm_client(config)
+
+        assert isinstance(client, CachingLLMClient)
+        assert isinstance(client.client, MockLLMClient)
+        assert client.cache.ttl == 60.0
+        assert client.cache_any_temperature
+        assert not isinstance(create_llm_client(LLMConfig(backend=LLMBackend.MOCK)),
+                              CachingLLMClient)
+        client.close()
+
+    def test_config_from_env(self, monkeypatch, tmp_path):
+        """Test the cache settings are read from the environment."""
+        monkeypatch.setenv("LLM_CACHE", str(tmp_path / "c.db"))
+        monkeypatch.setenv("LLM_CACHE_TTL", "3600")
+        monkeypatch.setenv("LLM_OFFLINE", "1")
+        config = LLMConfig.from_env()
+
+        assert config.cache_path == str(tmp_path / "c.db")
+        assert config.cache_ttl == 3600.0
+        assert config.offline
+        assert not config.cache_any_temperature
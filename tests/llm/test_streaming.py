@@ -0,0 +1,242 @@
+"""Tests for streamed chat replies, against a local stub server."""
+
+import json
+import threading
+import urllib.error
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from shadowengine.llm import (
+    LLMConfig,
+    LLMBackend,
+    LLMStream,
+    MockLLMClient,
+    OllamaClient,
+    OpenAIClient,
+    PooledTransport,
+)
+
+
+PIECES = ["Who's", " asking", ", detective", "?"]
+
+
+class StreamingHandler(BaseHTTPRequestHandler):
+    """Streams replies like Ollama (NDJSON) and OpenAI (SSE), chunked."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def _start(self, status: int, content_type: str) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+    def _chunk(self, data: bytes) -> None:
+        self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+        self.wfile.flush()
+
+    def _end(self) -> None:
+        self.wfile.write(b"0\r\n\r\n")
+
+    def _reply(self, payload: dict) -> None:
+        body = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        request = json.loads(self.rfile.read(length) or b"{}")
+        server = self.server
+        server.requests.append((self.path, request))
+
+        if not request.get("stream"):
+            self._reply({"model": request["model"], "eval_count": 2,
+                         "message": {"role": "assistant", "content": "Not streamed."}})
+            return
+        if server.stream_status != 200:
+            body = b'{"error": "streaming unavailable"}'
+            self.send_response(server.stream_status)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+
+        if self.path == "/api/chat":
+            self._start(200, "application/x-ndjson")
+            for index, piece in enumerate(PIECES):
+                self._chunk(json.dumps({"model": request["model"], "done": False,
+                                        "message": {"role": "assistant", "content": piece}}).encode() + b"\n")
+                if server.drop_after is not None and index + 1 == server.drop_after:
+                    self.close_connection = True
+                    return
+            self._chunk(json.dumps({"model": request["model"], "done": True,
+                                    "message": {"role": "assistant", "content": ""},
+                                    "eval_count": len(PIECES)}).encode() + b"\n")
+        else:
+            self._start(200, "text/event-stream")
+            self._chunk(b": keep-alive comment\n\n")
+            for piece in PIECES:
+                event = {"model": request["model"], "choices": [{"delta": {"content": piece}}]}
+                self._chunk(b"data: " + json.dumps(event).encode() + b"\n\n")
+            usage = {"model": request["model"], "choices": [], "usage": {"total_tokens": 12}}
+            self._chunk(b"data: " + json.dumps(usage).encode() + b"\n\n")
+            self._chunk(b"data: [DONE]\n\n")
+        self._end()
+
+
+@pytest.fixture
+def stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StreamingHandler)
+    server.daemon_threads = True
+    server.requests = []
+    server.stream_status = 200
+    server.drop_after = None
+    thread = threading.Thread(target=server.serve_forever, args=(0.01,), daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def base_url(server) -> str:
+    return f"http://127.0.0.1:{server.server_address[1]}"
+
+
+MESSAGES = [{"role": "user", "content": "Hello"}]
+
+
+class TestOllamaStreaming:
+    """Tests for Ollama NDJSON streaming."""
+
+    def test_yields_pieces(self, stub_server):
+        """Test pieces arrive in order and the response is filled in."""
+        client = OllamaClient(LLMConfig(base_url=base_url(stub_server)))
+
+        stream = client.chat_stream(MESSAGES)
+        assert list(stream) == PIECES
+
+        response = stream.response
+        assert response.success
+        assert response.text == "".join(PIECES)
+        assert response.tokens_used == len(PIECES)
+        assert 0 < response.first_token_ms <= response.latency_ms
+        assert stub_server.requests[0][1]["stream"] is True
+
+    def test_connection_reused_after_full_read(self, stub_server):
+        """Test a stream read to the end returns its connection to the pool."""
+        client = OllamaClient(LLMConfig(base_url=base_url(stub_server)))
+
+        client.chat_stream(MESSAGES).read()
+        client.chat_stream(MESSAGES).read()
+
+        assert client.transport.connections_opened == 1
+
+    def test_close_early_drops_connection(self, stub_server):
+        """Test stopping a stream early closes rather than pools it."""
+        client = OllamaClient(LLMConfig(base_url=base_url(stub_server)))
+
+        stream = client.chat_stream(MESSAGES)
+        assert next(stream) == PIECES[0]
+        stream.close()
+
+        assert client.transport.idle_connections() == 0
+
+    def test_falls_back_before_first_piece(self, stub_server):
+        """Test a failed stream request falls back to a plain chat."""
+        stub_server.stream_status = 404
+        client = OllamaClient(LLMConfig(base_url=base_url(stub_server)))
+
+        stream = client.chat_stream(MESSAGES)
+
+        assert list(stream) == ["Not streamed."]
+        assert stream.response.success
+        assert [request["stream"] for _, request in stub_server.requests] == [True, False]
+
+    def test_interrupted_keeps_partial_text(self, stub_server):
+        """Test a stream cut off midway returns what arrived, as a failure."""
+        stub_server.drop_after = 2
+        client = OllamaClient(LLMConfig(base_url=base_url(stub_server)))
+
+        stream = client.chat_stream(MESSAGES)
+
+        assert list(stream) == PIECES[:2]
+        assert not stream.response.success
+        assert stream.response.text == "".join(PIECES[:2])
+        assert "interrupted" in stream.response.error.lower()
+
+
+class TestOpenAIStreaming:
+    """Tests for OpenAI server-sent event streaming."""
+
+    def _client(self, server, api_key="test"):
+        return OpenAIClient(LLMConfig(
+            backend=LLMBackend.OPENAI, model="gpt-4o-mini",
+            base_url=base_url(server) + "/v1", api_key=api_key
+        ))
+
+    def test_yields_pieces(self, stub_server):
+        """Test deltas are yielded and usage is picked up."""
+        stream = self._client(stub_server).chat_stream(MESSAGES)
+
+        assert list(stream) == PIECES
+        assert stream.response.text == "".join(PIECES)
+        assert stream.response.tokens_used == 12
+        assert stream.response.model == "gpt-4o-mini"
+        assert stub_server.requests[0][1]["stream_options"] == {"include_usage": True}
+
+    def test_http_error(self, stub_server):
+        """Test an error status ends the stream with an error response."""
+        stub_server.stream_status = 401
+        stream = self._client(stub_server).chat_stream(MESSAGES)
+
+        assert list(stream) == []
+        assert not stream.response.success
+        assert "401" in stream.response.error
+
+    def test_no_api_key(self, stub_server):
+        """Test no request is made without a key."""
+        stream = self._client(stub_server, api_key=None).chat_stream(MESSAGES)
+
+        assert stream.read() == ""
+        assert not stream.response.success
+        assert stub_server.requests == []
+
+
+class TestDefaultStreaming:
+    """Tests for backends without native streaming."""
+
+    def test_mock_yields_whole_reply(self):
+        """Test the default chat_stream yields chat() as one piece."""
+        client = MockLLMClient(LLMConfig(backend=LLMBackend.MOCK))
+        stream = client.chat_stream(MESSAGES)
+
+        assert list(stream) == [client.default_response]
+        assert stream.response.first_token_ms == stream.response.latency_ms
+
+    def test_plain_iterator(self):
+        """Test an LLMStream over plain pieces builds its own response."""
+        stream = LLMStream(iter(["a", "b"]))
+
+        assert stream.read() == "ab"
+        assert stream.response.success
+
+
+class TestStreamLines:
+    """Tests for line streaming in the transport."""
+
+    def test_http_error_raised(self, stub_server):
+        """Test an error status raises HTTPError before any line."""
+        stub_server.stream_status = 500
+        transport = PooledTransport()
+
+        with pytest.raises(urllib.error.HTTPError):
+            next(transport.stream_lines("POST", base_url(stub_server) + "/api/chat",
+                                        body=b'{"model": "m", "stream": true}'))
+        assert transport.idle_connections() == 1
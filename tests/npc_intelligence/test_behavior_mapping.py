@@ -1,11 +1,12 @@
 """Tests for MemoryBehaviorMapping system."""
 
 import pytest
+from dataclasses import astuple
 from src.shadowengine.npc_intelligence.behavior_mapping import (
     BehaviorType, BehaviorModifier, MemoryBehaviorMapping,
     MemoryBehaviorSystem, MEMORY_TAG_BEHAVIORS
 )
-from src.shadowengine.npc_intelligence.npc_memory import NPCMemory
+from src.shadowengine.npc_intelligence.npc_memory import NPCMemory, NPCMemoryBank
 
 
 class TestBehaviorModifier:
@@ -329,3 +330,95 @@ class TestMemoryBehaviorSystem:
         assert len(restored.npc_modifiers) == 2
         assert restored.npc_modifiers["npc_001"].trusts == 0.5
         assert restored.npc_modifiers["npc_002"].fears == 0.3
+
+
+class TestIncrementalBehavior:
+    """Tests for running behavior aggregates."""
+
+    def _bank(self, memories):
+        bank = NPCMemoryBank("npc_001", "default")
+        for memory in memories:
+            bank.add_memory(memory)
+        return bank
+
+    def test_advance_matches_full_recompute(self):
+        """Test advancing a running aggregate matches aggregate_modifiers."""
+        system = MemoryBehaviorSystem()
+        bank = self._bank([
+            NPCMemory(tags=["player_helpful"], confidence=0.9, timestamp=0.0),
+            NPCMemory(tags=["player_threatening", "danger"], confidence=0.8,
+                      timestamp=5.0, emotional_weight=0.9),
+            NPCMemory(tags=["mob_involved"], confidence=0.6, timestamp=8.0),
+        ])
+        system.update_npc_behavior("npc_001", bank.memories, 10.0, bank.decay_system)
+
+        now = 10.0
+        for _ in range(30):
+            bank.update(2.0)
+            now += 2.0
+            modifier = system.advance_npc_behavior("npc_001", now)
+            expected = system.mapping.aggregate_modifiers(bank.memories, now)
+            assert astuple(modifier) == pytest.approx(astuple(expected), abs=1e-9)
+
+    def test_advance_handles_clamping_fields(self):
+        """Test fields that clamp part way through still match."""
+        system = MemoryBehaviorSystem()
+        memories = [
+            NPCMemory(tags=["player_helpful", "player_trustworthy"], confidence=1.0,
+                      timestamp=float(i)) for i in range(4)
+        ] + [NPCMemory(tags=["mob_involved"], confidence=1.0, timestamp=4.0)]
+        bank = self._bank(memories)
+        system.update_npc_behavior("npc_001", bank.memories, 5.0, bank.decay_system)
+
+        bank.update(40.0)
+        modifier = system.advance_npc_behavior("npc_001", 45.0)
+        expected = system.mapping.aggregate_modifiers(bank.memories, 45.0)
+
+        assert astuple(modifier) == pytest.approx(astuple(expected), abs=1e-9)
+
+    def test_advance_handles_per_tag_clamping(self):
+        """Test a memory whose own tags clamp stays on the running aggregate."""
+        system = MemoryBehaviorSystem()
+        bank = self._bank([
+            NPCMemory(tags=["mob_involved", "conspiracy", "cops_watching"],
+                      confidence=1.0, timestamp=0.0),
+            NPCMemory(tags=["player_trustworthy"], confidence=0.9, timestamp=1.0),
+        ])
+        system.update_npc_behavior("npc_001", bank.memories, 0.0, bank.decay_system)
+
+        for now in (10.0, 30.0, 60.0):
+            bank.update(now - bank.current_time)
+            modifier = system.advance_npc_behavior("npc_001", now, len(bank))
+            expected = system.mapping.aggregate_modifiers(bank.memories, now)
+
+            assert modifier is not None
+            assert astuple(modifier) == pytest.approx(astuple(expected), abs=1e-9)
+
+    def test_advance_without_aggregate(self):
+        """Test advancing an untracked NPC asks for a full update."""
+        system = MemoryBehaviorSystem()
+
+        assert system.advance_npc_behavior("npc_001", 10.0) is None
+
+    def test_mark_stale_forces_recompute(self):
+        """Test a pruned NPC needs a full update again."""
+        system = MemoryBehaviorSystem()
+        system.update_npc_behavior(
+            "npc_001", [NPCMemory(tags=["player_helpful"], timestamp=0.0)], 1.0
+        )
+
+        system.mark_stale("npc_001")
+
+        assert system.advance_npc_behavior("npc_001", 2.0) is None
+
+    def test_add_memory_effect_marks_dirty(self):
+        """Test a tracked memory is folded in when the modifier is next read."""
+        system = MemoryBehaviorSystem()
+        system.update_npc_behavior("npc_001", [], 10.0)
+        memory = NPCMemory(tags=["player_threatening"], confidence=1.0, timestamp=10.0)
+
+        system.add_memory_effect("npc_001", memory, current_time=10.0)
+        hints = system.get_npc_dialogue_hints("npc_001")
+
+        assert hints["tone"] == "fearful"
+        assert system.npc_modifiers["npc_001"].fears > 0
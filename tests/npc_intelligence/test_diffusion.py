@@ -0,0 +1,140 @@
+"""Tests for event-driven rumor diffusion."""
+
+import pytest
+from src.shadowengine.npc_intelligence.propagation_engine import PropagationEngine
+from src.shadowengine.npc_intelligence.world_event import WorldEvent, WitnessType
+from src.shadowengine.npc_intelligence.rumor import PropagationTrigger
+from src.shadowengine.npc_intelligence.diffusion import DiffusionRates
+
+
+LOCATIONS = {"a": "bar", "b": "bar", "c": "bar", "d": "docks", "e": "docks", "f": "pier"}
+
+
+def gossiping_town(seed: int, rates: DiffusionRates = None) -> PropagationEngine:
+    """Engine whose NPCs know about a shooting and can spread it."""
+    engine = PropagationEngine(seed=seed)
+    for npc_id in LOCATIONS:
+        engine.register_npc(npc_id, "gossip")
+    event = WorldEvent(
+        id="evt_shooting",
+        event_type="violence",
+        location=(3, 4),
+        location_name="bar",
+        actors=["stranger", "victim"],
+        notability=0.9
+    )
+    event.add_witness("a", WitnessType.DIRECT)
+    event.add_witness("d", WitnessType.DIRECT)
+    engine.process_event(event)
+    engine.enable_diffusion(rates)
+    return engine
+
+
+def rumor_state(engine: PropagationEngine) -> list:
+    return sorted(
+        (r.core_claim, tuple(sorted(r.carriers)), round(r.confidence, 6))
+        for r in engine.rumor_propagation.active_rumors.values()
+    )
+
+
+class TestContacts:
+    """Tests for the per-tick contact graph."""
+
+    def test_co_located_pairs_and_social_edges(self):
+        """Test locations cover their pairs and trusting relations count."""
+        engine = gossiping_town(1, DiffusionRates(
+            co_located=0.5, social=0.2,
+            location_triggers={"bar": PropagationTrigger.DRINKING}
+        ))
+        trusted = engine.social_network.get_or_create_relation("f", "a")
+        trusted.modify_trust(20)
+        engine.social_network.get_or_create_relation("a", "f").modify_trust(-10)
+        engine.social_network.get_or_create_relation("f", "outsider").modify_trust(20)
+
+        contacts = engine.diffusion.build_contacts({**LOCATIONS, "outsider": "pier"})
+
+        by_kind = {(kind, trigger): (rate, who) for rate, kind, who, trigger in contacts}
+        assert by_kind[("location", PropagationTrigger.DRINKING)] == \
+            (pytest.approx(1.5), ["a", "b", "c"])
+        assert by_kind[("location", PropagationTrigger.CONVERSATION)] == \
+            (pytest.approx(0.5), ["d", "e"])
+        assert by_kind[("social", PropagationTrigger.GOSSIP)] == \
+            (pytest.approx(0.2), ("f", "a"))
+        assert len(contacts) == 3
+
+    def test_interaction_count_is_poisson(self):
+        """Test the number of interactions averages rate * dt."""
+        engine = PropagationEngine(seed=3)
+        engine.enable_diffusion()
+        contacts = [(2.0, "location", ["a", "b"], PropagationTrigger.CONVERSATION),
+                    (1.0, "social", ("c", "a"), PropagationTrigger.GOSSIP)]
+
+        events = engine.diffusion.sample(contacts, 1000.0)
+
+        assert len(events) == pytest.approx(3000, abs=200)
+        assert [t for t, *_ in events] == sorted(t for t, *_ in events)
+        social = sum(1 for event in events if event[1] == "c")
+        assert social / len(events) == pytest.approx(1 / 3, abs=0.05)
+
+    def test_no_contacts_no_events(self):
+        """Test a tick without contacts samples nothing."""
+        engine = PropagationEngine(seed=3)
+        engine.enable_diffusion()
+
+        assert engine.diffusion.sample([], 5.0) == []
+        assert engine.diffuse_rumors({"a": "bar"}, 5.0)["interactions"] == 0
+
+
+class TestDiffusion:
+    """Tests for running diffusion through the engine."""
+
+    def test_rumors_spread(self):
+        """Test co-located NPCs pick the rumor up over time."""
+        engine = gossiping_town(7)
+
+        for _ in range(20):
+            engine.update(1.0)
+            engine.diffuse_rumors(LOCATIONS, 1.0)
+
+        carriers = set()
+        for rumor in engine.rumor_propagation.active_rumors.values():
+            carriers.update(rumor.carriers)
+        assert {"b", "c", "e"} & carriers
+        assert "f" not in carriers  # Alone at the pier, with no relations
+
+    def test_seed_replays_gossip(self):
+        """Test two engines with one seed produce the same gossip."""
+        runs = []
+        for _ in range(2):
+            engine = gossiping_town(42)
+            results = [engine.diffuse_rumors(LOCATIONS, 2.0) for _ in range(10)]
+            runs.append((
+                [(r["interactions"], r["rumors_shared"]) for r in results],
+                rumor_state(engine)
+            ))
+
+        assert runs[0] == runs[1]
+        assert sum(n for n, _ in runs[0][0]) > 0
+
+    def test_throughput(self):
+        """Test totals and interactions per second accumulate."""
+        engine = gossiping_town(5)
+        first = engine.diffuse_rumors(LOCATIONS, 3.0)
+        second = engine.diffuse_rumors(LOCATIONS, 3.0)
+
+        report = engine.diffusion.get_throughput()
+
+        assert report["interactions"] == first["interactions"] + second["interactions"]
+        assert report["rumors_shared"] == first["rumors_shared"] + second["rumors_shared"]
+        assert report["interactions_per_second"] == pytest.approx(
+            report["interactions"] / report["seconds"]
+        )
+
+    def test_disabled_does_nothing(self):
+        """Test diffuse_rumors is a no-op until enabled."""
+        engine = PropagationEngine()
+        engine.register_npc("a")
+        engine.register_npc("b")
+
+        assert engine.diffuse_rumors({"a": "bar", "b": "bar"}, 10.0)["interactions"] == 0
+        assert engine.social_network.relations == {}
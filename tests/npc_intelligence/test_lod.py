@@ -0,0 +1,132 @@
+"""Tests for NPC level-of-detail scheduling."""
+
+import pytest
+from src.shadowengine.npc_intelligence.propagation_engine import PropagationEngine
+from src.shadowengine.npc_intelligence.npc_memory import NPCMemory
+from src.shadowengine.npc_intelligence.lod import (
+    LODTier, LODPolicy, LODScheduler, location_hops
+)
+
+
+DISTANCES = {"bar": 0, "docks": 1, "alley": 2, "pier": 4}
+
+
+def engine_with_memories(npc_ids):
+    engine = PropagationEngine()
+    for npc_id in npc_ids:
+        bank = engine.register_npc(npc_id).memory_bank
+        bank.add_memory(NPCMemory(
+            memory_id=f"{npc_id}_mem",
+            confidence=0.9,
+            decay_rate=0.02,
+            tags=["danger"],
+        ))
+    return engine
+
+
+class TestTierAssignment:
+    """Tests for distance-based tiers."""
+
+    def test_location_hops(self):
+        """Hops come from the difference in distance from the start."""
+        assert location_hops("bar", "bar", DISTANCES) == 0
+        assert location_hops("docks", "bar", DISTANCES) == 1
+        assert location_hops("pier", "docks", DISTANCES) == 3
+        assert location_hops("docks", "docks_north", DISTANCES) is None
+        assert location_hops("", "bar", DISTANCES) is None
+
+    def test_policy_tiers(self):
+        """Near is full, mid-range reduced, far frozen, unknown full."""
+        policy = LODPolicy(full_distance=0, reduced_distance=2)
+        assert policy.tier_for_distance(0) == LODTier.FULL
+        assert policy.tier_for_distance(2) == LODTier.REDUCED
+        assert policy.tier_for_distance(3) == LODTier.FROZEN
+        assert policy.tier_for_distance(None) == LODTier.FULL
+
+    def test_engine_assigns_tiers(self):
+        """assign_lod_tiers uses NPC locations and location distances."""
+        engine = engine_with_memories(["a", "b", "c"])
+        engine.enable_lod()
+        engine.assign_lod_tiers("bar", {"a": "bar", "b": "alley", "c": "pier"}, DISTANCES)
+
+        assert engine.lod.get_tier("a") == LODTier.FULL
+        assert engine.lod.get_tier("b") == LODTier.REDUCED
+        assert engine.lod.get_tier("c") == LODTier.FROZEN
+
+
+class TestScheduling:
+    """Tests for reduced and frozen updates."""
+
+    def test_reduced_npcs_get_aggregated_dt(self):
+        """A reduced NPC is updated once per interval with the summed dt."""
+        scheduler = LODScheduler(LODPolicy(reduced_interval=3))
+        scheduler.set_tier("mid", LODTier.REDUCED)
+
+        applied = []
+        for _ in range(6):
+            applied.extend(dt for npc, dt, _ in scheduler.advance(["mid"], 1.0))
+
+        assert applied == [3.0, 3.0]
+
+    def test_frozen_npc_catches_up_exactly(self):
+        """Coming back into range gives the same memories as full detail."""
+        full = engine_with_memories(["npc"])
+        lod = engine_with_memories(["npc"])
+        lod.enable_lod()
+        lod.lod.set_tier("npc", LODTier.FROZEN)
+
+        for _ in range(10):
+            full.update(2.0)
+            lod.update(2.0)
+        assert lod.npc_states["npc"].memory_bank._clock == 0.0
+
+        lod.lod.set_tier("npc", LODTier.FULL)
+        full.update(2.0)
+        lod.update(2.0)
+
+        expected = full.get_npc_memories("npc")[0].confidence
+        assert lod.get_npc_memories("npc")[0].confidence == pytest.approx(expected)
+        assert (lod.npc_states["npc"].behavior_modifier.to_dict()
+                == pytest.approx(full.npc_states["npc"].behavior_modifier.to_dict()))
+
+    def test_new_memories_on_frozen_npc_are_not_overdecayed(self):
+        """A frozen NPC is caught up before it forms a new memory."""
+        engine = engine_with_memories(["npc"])
+        engine.enable_lod()
+        engine.lod.set_tier("npc", LODTier.FROZEN)
+        for _ in range(5):
+            engine.update(1.0)
+
+        engine.player_spreads_rumor("npc", "The docks are rigged", 1.0)
+        engine.lod.set_tier("npc", LODTier.FULL)
+        engine.update(1.0)
+
+        said = [m for m in engine.get_npc_memories("npc") if "player_said" in m.tags][0]
+        trusting = engine.npc_states["npc"].bias.trusting
+        assert said.confidence > trusting - 0.02
+
+    def test_tier_timings(self):
+        """Per-tier timings count NPCs and updates."""
+        engine = engine_with_memories(["a", "b", "c"])
+        engine.enable_lod(LODPolicy(reduced_interval=2))
+        engine.assign_lod_tiers("bar", {"a": "bar", "b": "docks", "c": "pier"}, DISTANCES)
+        for _ in range(4):
+            engine.update(1.0)
+
+        timings = engine.lod.get_tier_timings()
+        assert timings["full"]["npcs"] == 1 and timings["full"]["updates"] == 4
+        assert timings["reduced"]["updates"] == 2
+        assert timings["frozen"]["updates"] == 0
+        assert timings["full"]["seconds"] >= 0.0
+
+    def test_save_catches_up_pending_time(self):
+        """Serializing applies time frozen NPCs have not been given."""
+        engine = engine_with_memories(["npc"])
+        engine.enable_lod()
+        engine.lod.set_tier("npc", LODTier.FROZEN)
+        for _ in range(3):
+            engine.update(1.0)
+
+        restored = PropagationEngine.from_dict(engine.to_dict())
+
+        assert restored.get_npc_memories("npc")[0].confidence < 0.9
@@ -396,3 +396,262 @@ class TestNPCMemoryBank:
         assert restored.npc_type == bank.npc_type
         assert len(restored.memories) == 2
         assert restored.current_time == 500.0
+
+
+class TestLazyDecay:
+    """Lazy memory decay against the eager decay_all_memories path."""
+
+    def make_memories(self, count, seed=7):
+        import random
+        rng = random.Random(seed)
+        return [
+            NPCMemory(
+                memory_id=f"mem_{i}",
+                confidence=rng.uniform(0.05, 1.0),
+                decay_rate=rng.choice([0.0, 0.01, 0.05, 0.2]),
+                emotional_weight=rng.random(),
+                fear=rng.random(),
+                tags=["t"] * rng.randrange(6),
+            )
+            for i in range(count)
+        ]
+
+    def test_matches_eager_decay(self):
+        """Survivors and their confidence match eager decay tick by tick."""
+        system = MemoryDecaySystem()
+        eager = self.make_memories(60)
+        bank = NPCMemoryBank("npc_001", "mob_boss")
+        bank.capacity = 100
+        for memory in self.make_memories(60):
+            bank.add_memory(memory)
+
+        for tick in range(200):
+            dt = 0.5 + (tick % 3)
+            eager = system.decay_all_memories(eager, dt)
+            bank.update(dt)
+            if tick % 10 == 0:
+                lazy = bank.memories
+                assert [m.memory_id for m in lazy] == [m.memory_id for m in eager]
+                for mine, theirs in zip(lazy, eager):
+                    assert mine.confidence == pytest.approx(theirs.confidence)
+
+    def test_update_reports_forgotten_count(self):
+        """update() returns how many memories were forgotten."""
+        bank = NPCMemoryBank("npc_001")
+        bank.add_memory(NPCMemory(confidence=0.1, decay_rate=0.1))
+        bank.add_memory(NPCMemory(confidence=1.0, decay_rate=0.0))
+
+        assert bank.update(dt=0.1) == 0
+        assert bank.update(dt=1.0) == 1
+        assert len(bank) == 1
+
+    def test_update_leaves_unexpired_memories_alone(self):
+        """Ticks don't touch memories that aren't due to be forgotten."""
+        bank = NPCMemoryBank("npc_001")
+        memory = NPCMemory(confidence=1.0, decay_rate=0.1, emotional_weight=0.0)
+        bank.add_memory(memory)
+
+        bank.update(dt=2.0)
+        assert memory.confidence == 1.0  # Not settled yet
+        assert bank.memories[0].confidence == pytest.approx(0.8)
+
+    def test_refresh_memory_reschedules_forgetting(self):
+        """Raising confidence after adding pushes the forget time back."""
+        bank = NPCMemoryBank("npc_001")
+        memory = NPCMemory(confidence=0.1, decay_rate=0.1)
+        bank.add_memory(memory)
+        bank.update(dt=0.2)
+
+        bank.memories[0].confidence = 1.0
+        bank.refresh_memory(memory)
+        bank.update(dt=1.0)
+
+        assert bank.memories == [memory]
+
+    def test_direct_list_edits_then_update(self):
+        """Removing and appending through the list keeps forgetting right."""
+        bank = NPCMemoryBank("npc_001")
+        doomed = NPCMemory(memory_id="doomed", confidence=0.1, decay_rate=0.1)
+        kept = NPCMemory(memory_id="kept", confidence=1.0, decay_rate=0.0)
+        bank.add_memory(doomed)
+        bank.add_memory(kept)
+        bank.update(dt=0.2)
+
+        memories = bank.memories
+        memories.remove(doomed)
+        fading = NPCMemory(memory_id="fading", confidence=0.15, decay_rate=0.1)
+        memories.append(fading)
+        assert bank.update(dt=1.0) == 0  # doomed is gone, fading started now
+
+        assert bank.update(dt=1.0) == 1
+        assert [m.memory_id for m in bank.memories] == ["kept"]
+
+    def test_replacing_in_place_then_update(self):
+        """A memory swapped in at the same length is tracked from then on."""
+        bank = NPCMemoryBank("npc_001")
+        for i in range(4):
+            bank.add_memory(NPCMemory(memory_id=f"mem_{i}", decay_rate=0.0))
+
+        bank.memories[1] = NPCMemory(memory_id="new", confidence=0.1, decay_rate=0.1)
+        del bank.memories[3]
+        bank.memories.insert(0, NPCMemory(memory_id="first", decay_rate=0.0))
+
+        assert bank.update(dt=2.0) == 1
+        assert [m.memory_id for m in bank.memories] == ["first", "mem_0", "mem_2"]
+
+    def test_setting_current_time_does_not_decay(self):
+        """Only update() advances decay, as with eager decay."""
+        bank = NPCMemoryBank("npc_001")
+        bank.add_memory(NPCMemory(confidence=1.0, decay_rate=0.1))
+        bank.current_time = 500.0
+
+        assert bank.memories[0].confidence == 1.0
+
+
+class TestMemoryIndexes:
+    """Indexed bank lookups against plain scans of the memory list."""
+
+    WORDS = ["docks", "dock", "the", "body", "shot", "gun", "rain", "alley"]
+
+    def make_memory(self, rng, i):
+        return NPCMemory(
+            memory_id=f"mem_{i}",
+            event_id=f"evt_{rng.randrange(10)}",
+            summary=" ".join(rng.choice(self.WORDS) for _ in range(4)).title(),
+            tags=rng.sample(["danger", "water", "death", "crime"], rng.randrange(3)),
+            actors=rng.sample(["vinnie", "rosa", "player"], rng.randrange(3)),
+            location=rng.choice(["docks", "bar", None]),
+            timestamp=float(rng.randrange(20)),
+            confidence=rng.uniform(0.1, 1.0),
+            decay_rate=rng.choice([0.0, 0.01, 0.05]),
+            emotional_weight=rng.random() * 0.6,
+            fear=rng.random() * 0.5,
+        )
+
+    def assert_matches_scan(self, bank):
+        memories = list(bank.memories)
+        ids = lambda found: [m.memory_id for m in found]
+        for subject in ["danger", "vinnie", "dock", "the docks", "s th", "", "!"]:
+            expected = [
+                m for m in memories
+                if subject in m.tags or subject in m.actors or subject in m.summary.lower()
+            ]
+            assert ids(bank.get_memories_about(subject)) == ids(expected)
+        for location in ["docks", "bar", None]:
+            expected = [m for m in memories if m.location == location]
+            assert ids(bank.get_memories_at_location(location)) == ids(expected)
+        expected = [m for m in memories if "death" in m.tags]
+        assert ids(bank.get_memories_by_tag("death")) == ids(expected)
+        for count in (0, 3, 100):
+            expected = sorted(memories, key=lambda m: m.timestamp, reverse=True)[:count]
+            assert ids(bank.get_recent_memories(count)) == ids(expected)
+        for threshold in (0.3, 0.5):
+            expected = [m for m in memories if m.get_share_probability() >= threshold]
+            assert ids(bank.get_shareable_memories(threshold)) == ids(expected)
+        for event_id in ("evt_1", "evt_4", "evt_missing"):
+            expected = next((m for m in memories if m.event_id == event_id), None)
+            assert bank.get_memory_of_event(event_id) is expected
+            assert bank.has_memory_of_event(event_id) == (expected is not None)
+
+    def test_lookups_match_scans(self):
+        """Indexes stay in sync through adds, pruning, decay and forgetting."""
+        import random
+        rng = random.Random(11)
+        bank = NPCMemoryBank("npc_001", "civilian")
+        for i in range(60):
+            bank.add_memory(self.make_memory(rng, i))
+            if i % 4 == 0:
+                bank.update(rng.uniform(0.0, 5.0))
+            if i % 7 == 0:
+                self.assert_matches_scan(bank)
+        for _ in range(10):
+            bank.update(3.0)
+            self.assert_matches_scan(bank)
+
+    def test_lookups_follow_assignment_and_direct_appends(self):
+        """Assigning or appending to memories is picked up by lookups."""
+        import random
+        rng = random.Random(5)
+        bank = NPCMemoryBank("npc_001")
+        bank.memories = [self.make_memory(rng, i) for i in range(8)]
+        self.assert_matches_scan(bank)
+
+        bank.memories.append(self.make_memory(rng, 8))
+        self.assert_matches_scan(bank)
+
+    def test_lookups_follow_in_place_edits(self):
+        """Edits that keep the list's length don't leave stale results."""
+        import random
+        rng = random.Random(9)
+        bank = NPCMemoryBank("npc_001")
+        for i in range(12):
+            bank.add_memory(self.make_memory(rng, i))
+        self.assert_matches_scan(bank)  # Builds the share buckets too
+
+        bank.memories[3] = NPCMemory(
+            memory_id="swapped", summary="Vinnie at the docks", tags=["death"],
+            actors=["vinnie"], location="docks", timestamp=50.0, event_id="evt_4",
+            emotional_weight=1.0,
+        )
+        self.assert_matches_scan(bank)
+        assert "swapped" in [m.memory_id for m in bank.get_memories_by_tag("death")]
+
+        memories = bank.memories
+        memories.remove(memories[0])
+        memories.append(self.make_memory(rng, 12))
+        self.assert_matches_scan(bank)
+
+        memories.reverse()
+        self.assert_matches_scan(bank)
+
+    def test_refresh_memory_reindexes(self):
+        """Changing a memory's tags and summary takes effect after refresh."""
+        bank = NPCMemoryBank("npc_001")
+        memory = NPCMemory(summary="Quiet night", tags=["calm"])
+        bank.add_memory(memory)
+
+        memory.summary = "Shots at the docks"
+        memory.add_tag("danger")
+        bank.refresh_memory(memory)
+
+        assert bank.get_memories_about("docks") == [memory]
+        assert bank.get_memories_by_tag("danger") == [memory]
+        assert bank.get_memories_about("quiet") == []
+
+
+class TestCapacityPruning:
+    """Heap eviction against prune_memories on the settled list."""
+
+    def test_evicts_what_prune_memories_would(self):
+        """Each insert over capacity drops prune_memories' lowest memory."""
+        import random
+        rng = random.Random(2)
+        bank = NPCMemoryBank("npc_001", "civilian")
+        system = MemoryDecaySystem()
+        for i in range(300):
+            before = list(bank.memories)
+            memory = NPCMemory(
+                memory_id=f"mem_{i}",
+                confidence=rng.uniform(0.1, 1.0),
+                decay_rate=rng.choice([0.0, 0.01, 0.05]),
+                emotional_weight=rng.random(),
+                fear=rng.random() * 0.5,
+                source=rng.choice(list(MemorySource)),
+            )
+            bank.add_memory(memory)
+            expected = system.prune_memories(before + [memory], bank.capacity)
+            assert {m.memory_id for m in bank.memories} == {m.memory_id for m in expected}
+            bank.update(rng.uniform(0.0, 8.0))
+
+    def test_eviction_keeps_list_order(self):
+        """Evicting one memory leaves the others in insertion order."""
+        bank = NPCMemoryBank("npc_001")
+        bank.capacity = 3
+        for i, confidence in enumerate([0.9, 0.2, 0.8, 0.7]):
+            bank.add_memory(NPCMemory(
+                memory_id=f"mem_{i}", confidence=confidence, emotional_weight=0.0
+            ))
+
+        assert [m.memory_id for m in bank.memories] == ["mem_0", "mem_2", "mem_3"]
+        assert bank.evictions == 1
+        assert bank.get_memories_about("mem_1") == []
@@ -213,6 +213,38 @@ class TestPropagationEngine:
 
         assert state.memory_bank.memories[0].confidence < 1.0
 
+    def test_update_behavior_matches_full_recompute(self):
+        """Test incremental behavior tracks memories added between ticks."""
+        engine = PropagationEngine()
+        engine.register_npc("witness_001")
+        engine.update(dt=1.0)
+
+        for i in range(3):
+            event = WorldEvent(
+                id=f"evt_{i}",
+                event_type="violence",
+                timestamp=engine.current_time,
+                location=(10, 20),
+                location_name="dark_alley",
+                actors=["attacker", "victim"],
+                notability=0.8
+            )
+            event.add_witness("witness_001", WitnessType.DIRECT)
+            engine.process_event(event)
+            engine.update(dt=3.0)
+
+        state = engine.get_npc_state("witness_001")
+        from src.shadowengine.npc_intelligence.npc_memory import NPCMemory
+        state.memory_bank.add_memory(NPCMemory(tags=["player_helpful"], timestamp=engine.current_time))
+        engine.update(dt=3.0)
+
+        expected = engine.behavior_system.mapping.aggregate_modifiers(
+            state.memory_bank.memories, engine.current_time
+        )
+        assert state.behavior_modifier.fears == pytest.approx(expected.fears)
+        assert state.behavior_modifier.trusts == pytest.approx(expected.trusts)
+        assert state.behavior_modifier.trusts > 0
+
     def test_update_updates_social_network(self):
         """Test that update processes social network."""
         engine = PropagationEngine()
@@ -314,6 +346,22 @@ class TestPropagationEngine:
 
         assert len(hints) > 0
 
+    def test_get_eviction_counts(self):
+        """Test capacity evictions are counted per NPC type."""
+        from src.shadowengine.npc_intelligence.npc_memory import NPCMemory
+        engine = PropagationEngine()
+        engine.register_npc("civ_001", "civilian")
+        engine.register_npc("civ_002", "civilian")
+        engine.register_npc("boss_001", "mob_boss")
+
+        bank = engine.get_npc_state("civ_001").memory_bank
+        for _ in range(bank.capacity + 4):
+            bank.add_memory(NPCMemory())
+
+        counts = engine.get_eviction_counts()
+        assert counts["civilian"] == {"npcs": 2, "capacity": 10, "evictions": 4}
+        assert counts["mob_boss"]["evictions"] == 0
+
     def test_player_spreads_rumor(self):
         """Test player spreading rumor."""
         engine = PropagationEngine()
@@ -357,6 +405,17 @@ class TestPropagationEngine:
         assert len(restored.get_npc_state("npc_001").memory_bank.memories) == 1
         assert restored.tile_manager.tile_memories[(5, 5)].danger_rating == 0.6
 
+    def test_serialization_keeps_rng_state(self):
+        """A restored engine rolls the same numbers the original would."""
+        import json
+        engine = PropagationEngine(seed=3)
+        engine.rng.random()
+
+        restored = PropagationEngine.from_dict(json.loads(json.dumps(engine.to_dict())))
+
+        assert [restored.rng.random() for _ in range(3)] == [engine.rng.random() for _ in range(3)]
+        assert restored.bias_processor.rng is restored.rng
+
 
 class TestIntegrationScenarios:
     """Integration tests for realistic scenarios."""
@@ -0,0 +1,196 @@
+"""Tests for the NumPy relation-matrix social network."""
+
+import random
+
+import pytest
+from src.shadowengine.npc_intelligence import relation_matrix
+from src.shadowengine.npc_intelligence.social_network import (
+    RelationType, SocialNetwork, SocialRelation
+)
+from src.shadowengine.npc_intelligence.propagation_engine import PropagationEngine
+
+np = pytest.importorskip("numpy")
+
+from src.shadowengine.npc_intelligence.relation_matrix import (  # noqa: E402
+    MatrixSocialNetwork, SocialRelationView
+)
+
+
+INTERACTIONS = ["helped", "betrayed", "threatened", "insulted", "praised",
+                "competed", "confided_in", "lied_to", "saved"]
+
+
+def build(network: SocialNetwork, seed: int = 7, npcs: int = 12,
+          interactions: int = 150) -> SocialNetwork:
+    """Drive a network with a seeded mix of interactions."""
+    rng = random.Random(seed)
+    ids = [f"npc_{i:02d}" for i in range(npcs)]
+    for step in range(interactions):
+        a, b = rng.sample(ids, 2)
+        network.record_interaction(a, b, rng.choice(INTERACTIONS), float(step),
+                                   bidirectional=rng.random() < 0.7)
+    network.get_or_create_relation(ids[0], ids[1], RelationType.FAMILY)
+    return network
+
+
+def relation_state(network: SocialNetwork) -> list[dict]:
+    return [r.to_dict() for r in network.relations.values()]
+
+
+def storyline_key(storylines: list[dict]) -> list:
+    return sorted((s["type"], tuple(s["npcs"])) for s in storylines)
+
+
+class TestSocialRelationView:
+    """Tests for relations backed by matrix columns."""
+
+    def test_view_reads_and_writes_columns(self):
+        """Test a view behaves like a SocialRelation."""
+        network = MatrixSocialNetwork()
+        relation = network.get_or_create_relation("a", "b")
+
+        assert isinstance(relation, SocialRelationView)
+        assert isinstance(relation, SocialRelation)
+        relation.modify_affinity(60)
+        relation.modify_tension(30)
+        relation.add_shared_rumor("rumor_1")
+
+        assert relation.affinity == 60
+        assert relation.relation_type == RelationType.FRIEND
+        assert network.get_relation("a", "b").tension == 30
+        assert network.metric_matrix("affinity")[0, 1] == 60
+        assert relation.to_dict()["shared_rumors"] == ["rumor_1"]
+
+    def test_grows_past_initial_capacity(self):
+        """Test edges keep their values when the columns grow."""
+        network = MatrixSocialNetwork()
+        count = MatrixSocialNetwork.INITIAL_CAPACITY * 3
+        for i in range(count):
+            network.get_or_create_relation("hub", f"npc_{i}").modify_trust(i % 50)
+
+        assert len(network.relations) == count
+        assert [network.get_relation("hub", f"npc_{i}").trust
+                for i in range(count)] == [i % 50 for i in range(count)]
+
+
+class TestMatrixEquivalence:
+    """The matrix backend must match SocialNetwork exactly."""
+
+    def test_same_relations_after_interactions(self):
+        """Test interactions leave identical relation state."""
+        plain = build(SocialNetwork())
+        matrix = build(MatrixSocialNetwork())
+
+        assert [r["relation_type"] for r in relation_state(plain)] == \
+            [r["relation_type"] for r in relation_state(matrix)]
+        for a, b in zip(relation_state(plain), relation_state(matrix)):
+            a.pop("relation_id"), b.pop("relation_id")
+            assert a == b
+
+    def test_update_matches(self):
+        """Test ticks produce the same events and state."""
+        plain = build(SocialNetwork())
+        matrix = MatrixSocialNetwork.from_network(plain)
+        reference = SocialNetwork.from_dict(plain.to_dict())
+
+        for dt in (5.0, 50.0, 120.0, 400.0, 3.0):
+            expected = reference.update(dt)
+            actual = matrix.update(dt)
+            assert [(e.event_type, e.participants) for e in actual] == \
+                [(e.event_type, e.participants) for e in expected]
+
+        assert relation_state(matrix) == relation_state(reference)
+
+    def test_conflict_and_reconciliation(self):
+        """Test flagged relations get the parent's events."""
+        matrix = MatrixSocialNetwork()
+        hot = matrix.get_or_create_relation("a", "b")
+        hot.affinity = -30
+        hot.tension = 95
+        cold = matrix.get_or_create_relation("c", "d", RelationType.ENEMY)
+        cold.affinity = -40
+
+        events = matrix.update(1.0)
+
+        assert [e.event_type for e in events] == ["conflict", "reconciliation"]
+        assert hot.tension == 50
+        assert cold.relation_type == RelationType.RIVAL
+
+    def test_storylines_match(self):
+        """Test storylines and queries agree with SocialNetwork."""
+        plain = build(SocialNetwork(), seed=3, npcs=8, interactions=300)
+        matrix = MatrixSocialNetwork.from_network(plain)
+
+        assert storyline_key(matrix.get_emergent_storylines()) == \
+            storyline_key(plain.get_emergent_storylines())
+        for npc in plain._get_all_npcs():
+            assert matrix.get_friends(npc) == plain.get_friends(npc)
+            assert matrix.get_enemies(npc) == plain.get_enemies(npc)
+            assert [r.relation_id for r in matrix.get_all_relations_for(npc)] == \
+                [r.relation_id for r in plain.get_all_relations_for(npc)]
+
+
+class TestMatrixSerialization:
+    """Tests for the array save format."""
+
+    def test_round_trip(self):
+        """Test to_dict/from_dict keeps every relation and event."""
+        matrix = build(MatrixSocialNetwork())
+        matrix.update(500.0)
+        data = matrix.to_dict()
+
+        assert data["format"] == "matrix"
+        restored = SocialNetwork.from_dict(data)
+
+        assert isinstance(restored, MatrixSocialNetwork)
+        assert relation_state(restored) == relation_state(matrix)
+        assert len(restored.social_events) == len(matrix.social_events)
+        assert restored.current_time == matrix.current_time
+
+    def test_loads_without_numpy(self, monkeypatch):
+        """Test the array format loads into plain relations."""
+        matrix = build(MatrixSocialNetwork())
+        data = matrix.to_dict()
+        monkeypatch.setattr(relation_matrix, "NUMPY_AVAILABLE", False)
+
+        restored = SocialNetwork.from_dict(data)
+
+        assert type(restored) is SocialNetwork
+        assert relation_state(restored) == relation_state(matrix)
+
+    def test_reads_plain_format(self):
+        """Test MatrixSocialNetwork loads SocialNetwork saves."""
+        plain = build(SocialNetwork())
+
+        restored = MatrixSocialNetwork.from_dict(plain.to_dict())
+
+        assert relation_state(restored) == relation_state(plain)
+
+    def test_engine_switch(self):
+        """Test the engine keeps its relations when switching backends."""
+        engine = PropagationEngine()
+        build(engine.social_network)
+        before = relation_state(engine.social_network)
+
+        network = engine.use_relation_matrix()
+
+        assert engine.social_network is network
+        assert isinstance(network, MatrixSocialNetwork)
+        assert relation_state(network) == before
+        restored = PropagationEngine.from_dict(engine.to_dict())
+        assert isinstance(restored.social_network, MatrixSocialNetwork)
+        assert relation_state(restored.social_network) == before
+
+    def test_engine_round_trip_without_numpy(self, monkeypatch):
+        """Test a matrix engine save loads into plain relations without NumPy."""
+        engine = PropagationEngine()
+        build(engine.social_network)
+        engine.use_relation_matrix()
+        before = relation_state(engine.social_network)
+        data = engine.to_dict()
+        monkeypatch.setattr(relation_matrix, "NUMPY_AVAILABLE", False)
+
+        restored = PropagationEngine.from_dict(data)
+
+        assert type(restored.social_network) is SocialNetwork
+        assert relation_state(restored.social_network) == before
@@ -420,3 +420,81 @@ class TestRumorPropagation:
 
         # Low confidence rumor should become inactive but not removed (has carriers)
         assert not propagation.active_rumors["rum_1"].is_active
+
+
+class TestRumorIndexes:
+    """Tests for the reverse indexes kept by RumorPropagation."""
+
+    def make_memory(self, memory_id="mem_1", location="tavern"):
+        return NPCMemory(
+            memory_id=memory_id,
+            event_id="evt_001",
+            summary="Someone robbed the till",
+            tags=["crime"],
+            confidence=0.9,
+            location=location
+        )
+
+    def test_indexes_follow_conversion_and_spread(self):
+        """New rumors and new carriers are indexed as they happen."""
+        propagation = RumorPropagation()
+        rumor = propagation.convert_memory_to_rumor(self.make_memory(), "npc_a")
+
+        assert propagation.get_rumors_known_by("npc_a") == [rumor]
+        assert propagation.get_rumors_by_tag("crime") == [rumor]
+        assert propagation.get_rumors_about_location("tavern") == [rumor]
+        assert propagation.get_rumor_from_memory("mem_1", "npc_a") is rumor
+        assert propagation.get_rumor_from_memory("mem_1", "npc_b") is None
+
+        mutated = None
+        while mutated is None:
+            mutated = propagation.propagate(
+                rumor=rumor,
+                source_id="npc_a",
+                source_bias=NPCBias(talkative=1.0),
+                target_id="npc_b",
+                target_bias=NPCBias(trusting=0.8),
+                trigger=PropagationTrigger.GOSSIP,
+                current_time=100.0
+            )
+        assert propagation.get_rumors_known_by("npc_b") == [mutated]
+        assert propagation.get_rumors_known_by("npc_a") == [mutated]
+        assert propagation.get_rumor_from_memory("mem_1") is mutated
+
+        propagation.add_carrier(mutated, "npc_c")
+        assert propagation.get_rumors_known_by("npc_c") == [mutated]
+
+    def test_queries_keep_registration_order(self):
+        """Indexed queries list rumors in the order they were added."""
+        propagation = RumorPropagation()
+        first = propagation.convert_memory_to_rumor(self.make_memory("m1"), "npc_b")
+        second = propagation.convert_memory_to_rumor(self.make_memory("m2"), "npc_a")
+        propagation.add_carrier(first, "npc_a")
+
+        assert propagation.get_rumors_known_by("npc_a") == [first, second]
+        assert propagation.get_rumors_by_tag("crime") == [first, second]
+
+    def test_removed_rumors_leave_indexes(self):
+        """Decayed rumors disappear from every lookup."""
+        propagation = RumorPropagation()
+        rumor = propagation.convert_memory_to_rumor(self.make_memory(), "npc_a")
+        rumor.confidence = 0.05
+
+        propagation.decay_rumors(dt=1.0)
+
+        assert rumor.rumor_id not in propagation.active_rumors
+        assert propagation.get_rumors_known_by("npc_a") == []
+        assert propagation.get_rumors_by_tag("crime") == []
+        assert propagation.get_rumor_from_memory("mem_1") is None
+        assert propagation._by_location == {}
+
+    def test_assigning_active_rumors_rebuilds_indexes(self):
+        """Replacing active_rumors wholesale drops the old entries."""
+        propagation = RumorPropagation()
+        propagation.convert_memory_to_rumor(self.make_memory(), "npc_a")
+        propagation.active_rumors = {
+            "rum_9": Rumor(rumor_id="rum_9", carriers={"npc_z"}, tags=["ghost"]),
+        }
+
+        assert propagation.get_rumors_known_by("npc_a") == []
+        assert [r.rumor_id for r in propagation.get_rumors_by_tag("ghost")] == ["rum_9"]
@@ -0,0 +1,106 @@
+"""Tests for sharded behavior aggregation."""
+
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from src.shadowengine.npc_intelligence.propagation_engine import PropagationEngine
+from src.shadowengine.npc_intelligence.npc_memory import NPCMemory
+from src.shadowengine.npc_intelligence.behavior_mapping import MEMORY_TAG_BEHAVIORS
+from src.shadowengine.npc_intelligence.sharding import (
+    ShardedTick, build_tag_table, pack_shard
+)
+
+
+TAGS = list(MEMORY_TAG_BEHAVIORS) + ["weather", "gossip"]
+
+
+def build_engine(npcs=40, seed=5):
+    """Engine whose NPCs hold a random mix of tagged memories."""
+    rng = random.Random(seed)
+    engine = PropagationEngine()
+    for i in range(npcs):
+        state = engine.register_npc(f"npc_{i}")
+        for _ in range(rng.randrange(12)):
+            state.memory_bank.add_memory(NPCMemory(
+                confidence=rng.uniform(0.2, 1.0),
+                timestamp=rng.uniform(-5.0, 0.0),
+                tags=rng.sample(TAGS, rng.randrange(4)),
+            ))
+    return engine
+
+
+def modifiers(engine):
+    return {npc_id: state.behavior_modifier for npc_id, state in engine.npc_states.items()}
+
+
+class TestPacking:
+    """Tests for the columnar shard format."""
+
+    def test_pack_skips_unmapped_memories(self):
+        """Memories with no mapped tag are left out of the columns."""
+        engine = PropagationEngine()
+        bank = engine.register_npc("npc_0").memory_bank
+        bank.add_memory(NPCMemory(tags=["weather"]))
+        bank.add_memory(NPCMemory(tags=["danger", "weather", "crime"]))
+        codes, vectors = build_tag_table(engine.behavior_system.mapping)
+
+        npc_offsets, confidence, _, tag_offsets, tags = pack_shard([bank], codes)
+
+        assert list(npc_offsets) == [0, 1]
+        assert len(confidence) == 1
+        assert list(tags) == [codes["danger"], codes["crime"]]
+        assert list(tag_offsets) == [0, 2]
+
+
+class TestShardedTick:
+    """Sharded ticks against the regular tick."""
+
+    @pytest.mark.parametrize("shard_size", [1, 7, 500])
+    def test_matches_regular_tick(self, shard_size):
+        """Modifiers are identical whatever the shard size."""
+        regular = build_engine()
+        sharded = build_engine()
+        sharded.use_sharded_tick(shard_size=shard_size)
+
+        for _ in range(3):
+            expected = regular.update(1.0)
+            actual = sharded.update(1.0)
+            assert actual["behaviors_updated"] == expected["behaviors_updated"]
+            assert modifiers(sharded) == modifiers(regular)
+        assert (sharded.behavior_system.npc_modifiers
+                == regular.behavior_system.npc_modifiers)
+
+    def test_pool_results_merge_in_npc_order(self):
+        """Results from an executor are merged deterministically."""
+        regular = build_engine()
+        regular.update(1.0)
+        sharded = build_engine()
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            sharded.sharded_tick = ShardedTick(workers=3, shard_size=4, executor=pool)
+            sharded.update(1.0)
+
+        assert list(modifiers(sharded)) == list(modifiers(regular))
+        assert modifiers(sharded) == modifiers(regular)
+
+    def test_process_pool(self):
+        """Shards run on worker processes and shut down cleanly."""
+        regular = build_engine(npcs=10)
+        regular.update(1.0)
+        sharded = build_engine(npcs=10)
+        tick = sharded.use_sharded_tick(workers=2, shard_size=3)
+        try:
+            sharded.update(1.0)
+        finally:
+            sharded.close_sharded_tick()
+
+        assert tick._executor is None
+        assert sharded.sharded_tick is None
+        assert modifiers(sharded) == modifiers(regular)
+
+    def test_rejects_bad_settings(self):
+        """Worker and shard counts must be positive."""
+        with pytest.raises(ValueError):
+            ShardedTick(workers=0)
+        with pytest.raises(ValueError):
+            ShardedTick(shard_size=0)
@@ -444,3 +444,101 @@ class TestSocialNetwork:
 
         assert len(restored.relations) == 2
         assert restored.current_time == 500.0
+
+
+class TestSocialNetworkIndexes:
+    """Adjacency and filed-set lookups against scans of relations."""
+
+    NPCS = [f"npc_{i}" for i in range(8)]
+    EVENTS = ["helped", "betrayed", "threatened", "insulted", "praised", "confided_in"]
+
+    def build(self, seed):
+        import random
+        rng = random.Random(seed)
+        network = SocialNetwork()
+        for _ in range(120):
+            a, b = rng.sample(self.NPCS, 2)
+            network.record_interaction(a, b, rng.choice(self.EVENTS), 0.0)
+            if rng.random() < 0.2:
+                relation = network.get_or_create_relation(a, b)
+                relation.tension = rng.randrange(101)
+                relation.trust = rng.randrange(-100, 101)
+        return network
+
+    def scan_update(self, network, dt):
+        """update() as a scan over every relation."""
+        network.current_time += dt
+        events = []
+        for relation in network.relations.values():
+            network.dynamics.decay_tension(relation, dt)
+            if network.dynamics.check_for_conflict(relation):
+                events.append(network._create_conflict_event(relation))
+            if network.dynamics.check_for_reconciliation(relation):
+                events.append(network._create_reconciliation_event(relation))
+        return events
+
+    def test_queries_match_scans(self):
+        """Per-NPC queries list the same relations, in the same order."""
+        network = self.build(3)
+        relations = list(network.relations.values())
+        for npc in self.NPCS + ["nobody"]:
+            assert network.get_outgoing_relations(npc) == [
+                r for r in relations if r.from_npc == npc
+            ]
+            assert network.get_incoming_relations(npc) == [
+                r for r in relations if r.to_npc == npc
+            ]
+            assert network.get_all_relations_for(npc) == [
+                r for r in relations if npc in (r.from_npc, r.to_npc)
+            ]
+            assert network.get_friends(npc) == [
+                r.to_npc for r in relations
+                if r.from_npc == npc and r.relation_type in SocialNetwork.FRIEND_TYPES
+            ]
+            assert network.get_enemies(npc) == [
+                r.to_npc for r in relations
+                if r.from_npc == npc and r.relation_type in SocialNetwork.ENEMY_TYPES
+            ]
+
+    def test_update_matches_scan(self):
+        """Ticking only active relations gives the same events and state."""
+        network = self.build(5)
+        reference = SocialNetwork.from_dict(network.to_dict())
+        for tick in range(40):
+            dt = 12.0 if tick % 3 else 1.0
+            events = network.update(dt)
+            expected = self.scan_update(reference, dt)
+            assert [(e.event_type, e.participants) for e in events] == [
+                (e.event_type, e.participants) for e in expected
+            ]
+            assert [r.to_dict() for r in network.relations.values()] == [
+                r.to_dict() for r in reference.relations.values()
+            ]
+
+    def test_storylines_follow_threshold_crossings(self):
+        """Storylines appear and disappear as relations cross thresholds."""
+        network = SocialNetwork()
+        relation = network.get_or_create_relation("npc_a", "npc_b")
+
+        relation.tension = 75
+        assert [s["type"] for s in network.get_emergent_storylines()] == ["high_tension"]
+
+        relation.tension = 10
+        relation.affinity = -40
+        relation.trust = 50
+        assert [s["type"] for s in network.get_emergent_storylines()] == ["secret_alliance"]
+
+        relation.trust = 0
+        assert network.get_emergent_storylines() == []
+
+    def test_assigning_relations_rebuilds_indexes(self):
+        """Replacing relations wholesale re-files every relation."""
+        network = self.build(7)
+        restored = SocialNetwork()
+        restored.relations = network.relations
+
+        for npc in self.NPCS:
+            assert restored.get_friends(npc) == network.get_friends(npc)
+        assert len(restored.get_emergent_storylines()) == len(
+            network.get_emergent_storylines()
+        )
@@ -4,6 +4,7 @@ import pytest
 from src.shadowengine.npc_intelligence.tile_memory import (
     TileMemory, TileMemoryManager
 )
+from src.shadowengine.grid.position import Position
 
 
 class TestTileMemory:
@@ -288,6 +289,26 @@ class TestTileMemoryManager:
 
         assert len(hints) > 0
 
+    def test_position_locations(self):
+        """Grid positions address the same memories as (x, y) keys."""
+        manager = TileMemoryManager()
+        manager.get_or_create(Position(3, 4, 1)).danger_rating = 0.7
+
+        assert manager.get_or_create((3, 4)).danger_rating == 0.7
+        assert manager.get_all_hints_at(Position(3, 4)) == manager.get_all_hints_at((3, 4))
+        assert list(manager.tile_memories) == [(3, 4)]
+
+    def test_get_neighboring_memories(self):
+        """Neighbor lookups only return remembered tiles around a location."""
+        manager = TileMemoryManager()
+        for location in [(4, 5), (6, 6), (5, 5), (9, 9)]:
+            manager.get_or_create(location)
+
+        around = manager.get_neighboring_memories(Position(5, 5))
+        assert {m.location for m in around} == {(4, 5), (6, 6)}
+        cardinal = manager.get_neighboring_memories((5, 5), include_diagonals=False)
+        assert [m.location for m in cardinal] == [(4, 5)]
+
     def test_get_all_hints_at_empty_location(self):
         """Test getting hints at empty location."""
         manager = TileMemoryManager()
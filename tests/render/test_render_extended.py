@@ -396,3 +396,50 @@ class TestRendererSettingsMenu:
         with patch("builtins.input", side_effect=EOFError):
             result = r.render_settings_menu([])
         assert result == "back"
+
+
+class TestRendererDialogueStream:
+    """Tests for rendering dialogue as it arrives."""
+
+    TEXT = ("The rain never stops in this town, detective, and neither do "
+            "the lies people tell about where they were last night.")
+
+    def test_matches_render_dialogue(self, capsys):
+        """Streamed output is identical to rendering the whole text."""
+        import random
+        from src.shadowengine.render.renderer import Renderer
+
+        r = Renderer(width=40, height=24)
+        r.render_dialogue("Joe", self.TEXT, "nervously")
+        expected = capsys.readouterr().out
+
+        rng = random.Random(7)
+        for _ in range(20):
+            cuts = sorted(rng.sample(range(1, len(self.TEXT)), 12))
+            pieces = [self.TEXT[a:b] for a, b in zip([0] + cuts, cuts + [len(self.TEXT)])]
+            assert r.render_dialogue_stream("Joe", iter(pieces), "nervously") == self.TEXT
+            assert capsys.readouterr().out == expected
+
+    def test_words_printed_before_stream_ends(self, capsys):
+        """Complete words are on screen before later pieces arrive."""
+        from src.shadowengine.render.renderer import Renderer
+
+        r = Renderer(width=80, height=24)
+        seen = []
+
+        def pieces():
+            yield "Who's "
+            seen.append(capsys.readouterr().out)
+            yield "asking?"
+
+        r.render_dialogue_stream("Joe", pieces())
+        assert seen[0].endswith("\"Who's")
+        assert "asking?" in capsys.readouterr().out
+
+    def test_empty_stream_prints_nothing(self, capsys):
+        """Nothing, not even the header, is shown for an empty stream."""
+        from src.shadowengine.render.renderer import Renderer
+
+        r = Renderer(width=80, height=24)
+        assert r.render_dialogue_stream("Joe", iter(["", "  "])) == "  "
+        assert capsys.readouterr().out == ""
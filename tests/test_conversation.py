@@ -248,6 +248,47 @@ class TestShowDialogue:
         conv_mgr.renderer.render_dialogue.assert_called_once_with("Joe", "Hello.", "")
 
 
+class TestStreamedDialogue:
+    """Test dialogue shown as the LLM streams it."""
+
+    @pytest.fixture
+    def streaming_mgr(self, mock_renderer, mock_dialogue_handler):
+        mock_renderer.render_dialogue_stream.side_effect = (
+            lambda speaker, pieces, mood="": "".join(pieces)
+        )
+        return ConversationManager(
+            renderer=mock_renderer,
+            dialogue_handler=mock_dialogue_handler,
+            stream_dialogue=True,
+        )
+
+    def test_show_dialogue_stream_returns_text(self, streaming_mgr, bartender):
+        text = streaming_mgr.show_dialogue(bartender, iter(["Hello ", "there."]), "nervously")
+
+        assert text == "Hello there."
+        streaming_mgr.renderer.render_dialogue_stream.assert_called_once()
+        streaming_mgr.renderer.render_dialogue.assert_not_called()
+
+    def test_free_dialogue_streams_and_records(self, streaming_mgr, state, bartender):
+        streaming_mgr.dialogue_handler.stream_response.return_value = iter(["The rain ", "never stops."])
+
+        streaming_mgr.handle_free_dialogue(bartender, "weather?", state)
+
+        streaming_mgr.dialogue_handler.generate_response.assert_not_called()
+        streaming_mgr.renderer.render_dialogue.assert_not_called()
+        history = state.world_state.generation_memory.get_npc_dialogue_history("bartender")
+        assert "The rain never stops." in history
+
+    def test_empty_stream_shows_fallback(self, streaming_mgr, state, bartender):
+        streaming_mgr.dialogue_handler.stream_response.return_value = iter([])
+
+        streaming_mgr.handle_free_dialogue(bartender, "something obscure", state)
+
+        streaming_mgr.renderer.render_dialogue.assert_called_once()
+        args = streaming_mgr.renderer.render_dialogue.call_args[0]
+        assert "not sure" in args[1] or "don't have" in args[1]
+
+
 class TestMemoryRecording:
     """Test that conversation interactions are recorded in CharacterMemory."""
 
@@ -8,7 +8,9 @@ from src.shadowengine.character import Character, Archetype
 from src.shadowengine.memory.character_memory import (
     CharacterMemory, Belief, BeliefConfidence, PlayerInteraction,
 )
-from src.shadowengine.llm.client import MockLLMClient, LLMConfig, LLMBackend, LLMResponse
+from src.shadowengine.llm.client import (
+    MockLLMClient, LLMConfig, LLMBackend, LLMResponse, LLMStream,
+)
 
 
 @pytest.fixture
@@ -337,6 +339,64 @@ class TestCleanResponse:
         assert result == "Hello there."
 
 
+class TestStreamResponse:
+    """Test streamed responses and stream cleaning."""
+
+    @pytest.mark.parametrize("text", [
+        "Joe: Hello there.",
+        "  joe:   Hello there.  ",
+        "Hello there.",
+        "Jo",
+        "Joe:",
+        "Joe:   ",
+        "Joey: not a prefix",
+        "   ",
+        "",
+        "Line one.\n\nLine two.\n",
+    ])
+    def test_clean_stream_matches_clean_response(self, text):
+        import random
+        rng = random.Random(text)
+        expected = DialogueHandler._clean_response(text, "Joe")
+        for _ in range(25):
+            cuts = sorted(rng.sample(range(len(text) + 1), min(len(text) + 1, 4)))
+            pieces = [text[a:b] for a, b in zip([0] + cuts, cuts + [len(text)])]
+            shown = list(DialogueHandler._clean_stream(iter(pieces), "Joe"))
+            assert "".join(shown) == expected
+            assert all(shown)
+
+    def test_clean_stream_yields_before_end(self):
+        def pieces():
+            yield "Joe: I was "
+            pieces.reached_end = True
+            yield "here all night."
+        pieces.reached_end = False
+
+        stream = DialogueHandler._clean_stream(pieces(), "Joe")
+        assert next(stream) == "I was"
+        assert not pieces.reached_end
+
+    def test_stream_response(self, handler, bartender):
+        handler.llm_client.default_response = "Joe: I was here all night.  "
+
+        stream = handler.stream_response(character=bartender, player_input="Where were you?")
+
+        assert "".join(stream) == "I was here all night."
+        assert stream.response.success
+        assert stream.response.text == "I was here all night."
+
+    def test_stream_response_uses_same_prompt(self, handler, bartender):
+        handler.llm_client = MagicMock()
+        handler.llm_client.chat.return_value = LLMResponse(text="Hi.", success=True)
+        handler.generate_response(character=bartender, player_input="Hello")
+        handler.llm_client.chat_stream.return_value = LLMStream(iter(["Hi."]))
+
+        handler.stream_response(character=bartender, player_input="Hello").read()
+
+        assert (handler.llm_client.chat_stream.call_args[0][0]
+                == handler.llm_client.chat.call_args[0][0])
+
+
 class TestBuildIntelligenceContext:
     """Test _build_intelligence_context formats NPC intelligence into prompt text."""
 
@@ -327,6 +327,20 @@ class TestStreetTalk:
         game.street_talk.update(game.state, game.renderer)  # second remark
         assert "Word travels" in capsys.readouterr().out
 
+    def test_prepared_reply_is_spoken(self, capsys):
+        game = self._game_with_knowledge(
+            summaries=["Player scrutinized the Oak Desk very closely"],
+        )
+        messages = game.street_talk.line_request(game.state)
+        assert "Oak Desk" in messages[1]["content"]
+        assert game.street_talk.line_request(game.state) == messages  # Nothing voiced yet
+
+        capsys.readouterr()
+        reply = LLMResponse(text="Desks keep secrets, gumshoe.", success=True)
+        game.street_talk.update(game.state, game.renderer, reply)
+        assert "Desks keep secrets, gumshoe." in capsys.readouterr().out
+        assert game.street_talk.line_request(game.state) is None  # Cooldown
+
     def test_mundane_knowledge_stays_quiet(self, capsys):
         game = self._game_with_knowledge(
             summaries=["The weather turned cold last night"],
@@ -313,3 +313,55 @@ class TestFramedDefense:
         # Player stays in room1; Eddie is in room2
         agency_tick(game)
         assert "alibi_barfly" not in game.state.memory.player.discoveries
+
+    def test_line_request_matches_the_defense_due(self):
+        game = make_game()
+        self._frame_barfly(game)
+        game.state.memory.advance_time(FRAMED_DEFENSE_DELAY_UNITS + 1)
+        assert game.npc_agency.line_request(game.state) is None  # Eddie isn't here
+
+        game.state.current_location_id = "room2"
+        messages = game.npc_agency.line_request(game.state)
+        assert "Eddie the Barfly" in messages[0]["content"]
+        assert "Monogrammed Handkerchief" in messages[1]["content"]
+        assert "alibi_barfly" not in game.state.memory.player.discoveries  # Nothing delivered
+
+    def test_prepared_reply_is_spoken(self, capsys):
+        game = make_game()
+        self._frame_barfly(game)
+        game.state.memory.advance_time(FRAMED_DEFENSE_DELAY_UNITS + 1)
+        game.state.current_location_id = "room2"
+        capsys.readouterr()
+
+        reply = LLMResponse(text="I was at the Blue Moon all night.", success=True)
+        game.npc_agency.update(game.state, game.renderer, reply)
+
+        assert "I was at the Blue Moon all night." in capsys.readouterr().out
+        assert "alibi_barfly" in game.state.memory.player.discoveries
+
+    def test_tick_generates_lines_together(self, capsys):
+        game = make_game()
+        self._frame_barfly(game)
+        game.state.memory.advance_time(FRAMED_DEFENSE_DELAY_UNITS + 1)
+        game.state.current_location_id = "room2"
+
+        remark = [{"role": "user", "content": "A remark."}]
+        game.street_talk.line_request = lambda state: remark
+        batches = []
+
+        def chat_many(requests):
+            batches.append(requests)
+            return [LLMResponse(text=f"Line {i}.", success=True) for i in range(len(requests))]
+
+        game.llm_client.chat_many = chat_many
+        replies = game._tick_replies()
+
+        assert len(batches) == 1
+        assert batches[0][0] is remark
+        assert "Eddie the Barfly" in batches[0][1][0]["content"]
+        assert [r.text for r in replies] == ["Line 0.", "Line 1."]
+
+    def test_tick_with_one_line_due_leaves_it_to_the_component(self):
+        game = make_game()
+        game.llm_client.chat_many = lambda requests: pytest.fail("no fan-out for one line")
+        assert game._tick_replies() == [None, None]
@@ -0,0 +1,248 @@
+"""Tests for PrefetchScheduler and speculative location / layer generation."""
+
+import json
+import threading
+import time
+
+import pytest
+
+from src.shadowengine.prefetch import PrefetchScheduler
+from src.shadowengine.game import Game
+from src.shadowengine.config import GameConfig
+from src.shadowengine.interaction import Hotspot, HotspotType
+from src.shadowengine.inspection import ZoomLevel
+from src.shadowengine.render import Location
+from src.shadowengine.llm.client import MockLLMClient, LLMConfig, LLMBackend
+
+
+def wait_idle(scheduler: PrefetchScheduler, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while scheduler.pending() and time.monotonic() < deadline:
+        time.sleep(0.005)
+    assert not scheduler.pending()
+
+
+@pytest.fixture
+def scheduler():
+    s = PrefetchScheduler(workers=1)
+    yield s
+    s.shutdown()
+
+
+def block_worker(scheduler: PrefetchScheduler) -> threading.Event:
+    """Occupy the single worker until the returned event is set."""
+    release, started = threading.Event(), threading.Event()
+
+    def hold():
+        started.set()
+        release.wait(5)
+
+    scheduler.submit("blocker", None, hold, priority=-1)
+    started.wait(5)
+    return release
+
+
+class TestPrefetchScheduler:
+    """Test ordering, claiming and cancellation."""
+
+    def test_runs_lowest_priority_first(self, scheduler):
+        order = []
+        release = block_worker(scheduler)
+        for priority in (2, 0, 1):
+            scheduler.submit(priority, None, lambda p=priority: order.append(p), priority)
+        release.set()
+        wait_idle(scheduler)
+
+        assert order == [0, 1, 2]
+
+    def test_take_returns_result(self, scheduler):
+        scheduler.submit("k", "request", lambda: "answer")
+        wait_idle(scheduler)
+
+        assert scheduler.take("k", "request") == (True, "answer")
+        assert scheduler.take("k", "request") == (False, None)  # Claimed once
+        assert scheduler.stats["hits"] == 1
+
+    def test_take_waits_for_running_job(self, scheduler):
+        started = threading.Event()
+
+        def slow():
+            started.set()
+            time.sleep(0.05)
+            return "answer"
+
+        scheduler.submit("k", "request", slow)
+        started.wait(5)
+        assert scheduler.take("k", "request") == (True, "answer")
+
+    def test_stale_request_is_a_miss(self, scheduler):
+        scheduler.submit("k", "old request", lambda: "answer")
+        wait_idle(scheduler)
+
+        assert scheduler.take("k", "new request") == (False, None)
+        assert scheduler.stats["stale"] == 1
+
+    def test_cancelled_job_never_runs(self, scheduler):
+        ran = []
+        release = block_worker(scheduler)
+        scheduler.submit("a", None, lambda: ran.append("a"))
+        scheduler.submit("b", None, lambda: ran.append("b"))
+
+        assert scheduler.cancel("a")
+        assert scheduler.cancel_except({"b"}) == 1  # The blocker
+        release.set()
+        wait_idle(scheduler)
+
+        assert ran == ["b"]
+        assert scheduler.stats["cancelled"] == 2
+
+    def test_pending_job_taken_is_a_miss(self, scheduler):
+        ran = []
+        release = block_worker(scheduler)
+        scheduler.submit("k", "request", lambda: ran.append("k"))
+
+        assert scheduler.take("k", "request") == (False, None)
+        release.set()
+        wait_idle(scheduler)
+        assert ran == []
+
+    def test_resubmitting_same_request_is_ignored(self, scheduler):
+        calls = []
+        scheduler.submit("k", "request", lambda: calls.append(1))
+        scheduler.submit("k", "request", lambda: calls.append(2))
+        wait_idle(scheduler)
+
+        assert calls == [1]
+        assert scheduler.stats["submitted"] == 1
+
+    def test_failed_job_is_a_miss(self, scheduler):
+        def boom():
+            raise RuntimeError("backend down")
+
+        scheduler.submit("k", "request", boom)
+        wait_idle(scheduler)
+
+        assert scheduler.take("k", "request") == (False, None)
+        assert scheduler.stats["failed"] == 1
+
+    def test_needs_a_worker(self):
+        with pytest.raises(ValueError):
+            PrefetchScheduler(workers=0)
+
+
+LOCATION_JSON = json.dumps({
+    "id": "fire_escape", "name": "Fire Escape",
+    "description": "Rusted iron stairs cling to the brick.",
+    "location_type": "alley", "is_outdoor": True,
+    "ambient": "Rain drums on the rails.",
+    "hotspots": [], "npcs": [], "connections": {},
+})
+MEDIUM_JSON = json.dumps({
+    "description": "Dried mud on the sole holds a partial tread.",
+    "detail_hooks": ["the tread"],
+    "discovery": None,
+})
+
+
+def make_game() -> Game:
+    """A game with prefetching, one unexplored exit and one piece of evidence."""
+    game = Game(GameConfig(prefetch_workers=1))
+    llm = MockLLMClient(LLMConfig(backend=LLMBackend.MOCK))
+    llm.set_response("Fire Escape", LOCATION_JSON)
+    llm.set_response("ARM'S LENGTH", MEDIUM_JSON)
+    game.llm_client = llm
+    game.location_manager.llm_client = llm
+    game.inspection_manager.detail_handler.llm_client = llm
+
+    room = Location(id="room", name="Back Room", description="A cramped back room.")
+    room.add_hotspot(Hotspot(
+        id="hs_window", label="Fire Escape", hotspot_type=HotspotType.EXIT,
+        position=(5, 5), description="A window onto the fire escape.",
+        target_id="fire_escape",
+    ))
+    room.add_hotspot(Hotspot(
+        id="hs_boot", label="Muddy Boot", hotspot_type=HotspotType.EVIDENCE,
+        position=(10, 10), description="A boot caked in mud.",
+    ))
+    game.add_location(room)
+    game.set_start_location("room")
+    return game
+
+
+class TestSpeculativeGeneration:
+    """Test managers prefetch, and commit only when the path is taken."""
+
+    def test_prefetched_location_used_on_move(self):
+        game = make_game()
+        game._prefetch()
+        wait_idle(game.prefetcher)
+        calls = len(game.llm_client.call_history)
+
+        # Nothing is committed until the player moves
+        assert "fire_escape" not in game.state.locations
+        assert "fire_escape" not in game.state.world_state.locations
+
+        exit_hotspot = game.current_location.get_hotspot_by_label("Fire Escape")
+        game.location_manager.handle_go(
+            exit_hotspot, game.current_location, game.state, game.config, game.add_character,
+        )
+
+        assert game.state.current_location_id == "fire_escape"
+        assert "fire_escape" in game.state.world_state.locations
+        assert len(game.llm_client.call_history) == calls
+        assert game.prefetcher.stats["hits"] == 1
+        game.prefetcher.shutdown()
+
+    def test_changed_state_regenerates(self):
+        game = make_game()
+        game._prefetch()
+        wait_idle(game.prefetcher)
+        calls = len(game.llm_client.call_history)
+        game.state.inventory.append("crowbar")  # The location prompt lists inventory
+
+        exit_hotspot = game.current_location.get_hotspot_by_label("Fire Escape")
+        game.location_manager.handle_go(
+            exit_hotspot, game.current_location, game.state, game.config, game.add_character,
+        )
+
+        assert game.state.current_location_id == "fire_escape"
+        assert len(game.llm_client.call_history) == calls + 1
+        assert game.prefetcher.stats["stale"] == 1
+        game.prefetcher.shutdown()
+
+    def test_prefetched_layer_used_on_zoom(self):
+        game = make_game()
+        keys = game.inspection_manager.prefetch_layers(game.state)
+        wait_idle(game.prefetcher)
+        calls = len(game.llm_client.call_history)
+
+        assert keys == [("layer", "hs_boot", ZoomLevel.MEDIUM.value)]
+        assert "insp_hs_boot" not in game.inspection_manager.engine.objects
+
+        game.renderer.wait_for_key = lambda prompt="": None
+        game.inspection_manager.handle("look closer at the boot", game.state, game.config)
+
+        obj = game.inspection_manager.engine.objects["insp_hs_boot"]
+        assert "partial tread" in obj.get_layer(ZoomLevel.MEDIUM).description
+        assert len(game.llm_client.call_history) == calls
+        game.prefetcher.shutdown()
+
+    def test_moving_on_cancels_old_speculation(self):
+        game = make_game()
+        release = block_worker(game.prefetcher)
+        game._prefetch()
+        assert game.prefetcher.has(("location", "fire_escape"))
+
+        game.state.current_location_id = "elsewhere"
+        game.add_location(Location(id="elsewhere", name="Elsewhere", description="Empty."))
+        game._prefetch()
+        release.set()
+
+        assert not game.prefetcher.has(("location", "fire_escape"))
+        assert game.prefetcher.stats["cancelled"] >= 2
+        game.prefetcher.shutdown()
+
+    def test_off_by_default(self):
+        game = Game()
+        assert game.prefetcher is None
+        assert game.location_manager.prefetch_exits(game.state) == []
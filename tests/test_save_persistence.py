@@ -236,6 +236,18 @@ class TestSaveRoundTrip:
         assert any("removed the Black Box" in e.description for e in events)
         assert any("planted" in e.description.lower() for e in events)
 
+    def test_npc_dice_resume_after_load(self, tmp_path):
+        """Bias and rumor rolls pick up where the saved game left off."""
+        game = make_game()
+        evolve_world(game)
+        fresh = save_and_reload(game, tmp_path)
+
+        expected = [game.state.propagation_engine.rng.random() for _ in range(5)]
+        engine = fresh.state.propagation_engine
+        assert [engine.rng.random() for _ in range(5)] == expected
+        assert engine.bias_processor.rng is engine.rng
+        assert engine.rumor_propagation.rng is engine.rng
+
     def test_game_continues_after_load(self, tmp_path):
         """The loaded world is playable: zoom deeper on restored layers."""
         game = make_game()
@@ -300,3 +312,16 @@ class TestSaveCompatibilityAndSafety:
         game.renderer.render_error = lambda text: outputs.append(text)
         run(game, "load")
         assert any("No save file found" in o for o in outputs)
+
+
+class TestSeededGames:
+
+    def test_seed_replays_npc_dice(self):
+        """new_game(seed) fixes the propagation engine's bias and rumor rolls."""
+        def rolls(seed):
+            game = Game()
+            game.new_game(seed=seed)
+            return [game.state.propagation_engine.rng.random() for _ in range(5)]
+
+        assert rolls(11) == rolls(11)
+        assert rolls(11) != rolls(12)